@@ -1,54 +1,123 @@
 __version__ = "0.3.18"
 
-from .resources.Dispute import Dispute
-from .resources.IPAccount import IPAccount
-from .resources.IPAsset import IPAsset
-from .resources.License import License
-from .resources.Royalty import Royalty
-from .resources.WIP import WIP
-from .story_client import StoryClient
-from .types.common import AccessPermission
-from .types.resource.Group import (
-    ClaimReward,
-    ClaimRewardsResponse,
-    CollectRoyaltiesResponse,
-)
-from .types.resource.IPAsset import (
-    BatchMintAndRegisterIPInput,
-    BatchMintAndRegisterIPResponse,
-    LicenseTermsDataInput,
-    LinkDerivativeResponse,
-    MintedNFT,
-    MintNFT,
-    RegisterAndAttachAndDistributeRoyaltyTokensResponse,
-    RegisterDerivativeIPAndAttachAndDistributeRoyaltyTokensResponse,
-    RegisterDerivativeIpAssetResponse,
-    RegisteredIP,
-    RegisterIpAssetResponse,
-    RegisterPILTermsAndAttachResponse,
-    RegistrationResponse,
-    RegistrationWithRoyaltyVaultAndLicenseTermsResponse,
-    RegistrationWithRoyaltyVaultResponse,
-)
-from .types.resource.License import LicenseTermsInput, LicenseTermsOverride
-from .types.resource.Royalty import NativeRoyaltyPolicy, RoyaltyShareInput
-from .utils.constants import (
-    DEFAULT_FUNCTION_SELECTOR,
-    MAX_ROYALTY_TOKEN,
-    ROYALTY_POLICY_LAP_ADDRESS,
-    ROYALTY_POLICY_LRP_ADDRESS,
-    WIP_TOKEN_ADDRESS,
-    ZERO_ADDRESS,
-    ZERO_FUNC,
-    ZERO_HASH,
-)
-from .utils.derivative_data import DerivativeDataInput
-from .utils.ip_metadata import IPMetadataInput
-from .utils.licensing_config_data import LicensingConfig
-from .utils.pil_flavor import PILFlavor, PILFlavorError
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_story_client import AsyncStoryClient
+    from .resources.Dispute import Dispute
+    from .resources.IPAccount import IPAccount
+    from .resources.IPAsset import IPAsset
+    from .resources.License import License
+    from .resources.Royalty import Royalty
+    from .resources.WIP import WIP
+    from .story_client import StoryClient
+    from .types.common import AccessPermission
+    from .types.resource.Group import (
+        ClaimReward,
+        ClaimRewardsResponse,
+        CollectRoyaltiesResponse,
+    )
+    from .types.resource.IPAsset import (
+        BatchMintAndRegisterIPInput,
+        BatchMintAndRegisterIPResponse,
+        LicenseTermsDataInput,
+        LinkDerivativeResponse,
+        MintedNFT,
+        MintNFT,
+        RegisterAndAttachAndDistributeRoyaltyTokensResponse,
+        RegisterDerivativeIPAndAttachAndDistributeRoyaltyTokensResponse,
+        RegisterDerivativeIpAssetResponse,
+        RegisteredIP,
+        RegisterIpAssetResponse,
+        RegisterPILTermsAndAttachResponse,
+        RegistrationResponse,
+        RegistrationWithRoyaltyVaultAndLicenseTermsResponse,
+        RegistrationWithRoyaltyVaultResponse,
+    )
+    from .types.resource.License import LicenseTermsInput, LicenseTermsOverride
+    from .types.resource.Royalty import NativeRoyaltyPolicy, RoyaltyShareInput
+    from .utils.constants import (
+        DEFAULT_FUNCTION_SELECTOR,
+        MAX_ROYALTY_TOKEN,
+        ROYALTY_POLICY_LAP_ADDRESS,
+        ROYALTY_POLICY_LRP_ADDRESS,
+        WIP_TOKEN_ADDRESS,
+        ZERO_ADDRESS,
+        ZERO_FUNC,
+        ZERO_HASH,
+    )
+    from .utils.derivative_data import DerivativeDataInput
+    from .utils.ip_metadata import IPMetadataInput
+    from .utils.licensing_config_data import LicensingConfig
+    from .utils.pil_flavor import PILFlavor, PILFlavorError
+
+# Public names are imported on first access (PEP 562), so importing the package
+# does not pull in web3 and every resource module up front.
+_LAZY_IMPORTS = {
+    "AsyncStoryClient": ".async_story_client",
+    "Dispute": ".resources.Dispute",
+    "IPAccount": ".resources.IPAccount",
+    "IPAsset": ".resources.IPAsset",
+    "License": ".resources.License",
+    "Royalty": ".resources.Royalty",
+    "WIP": ".resources.WIP",
+    "StoryClient": ".story_client",
+    "AccessPermission": ".types.common",
+    "ClaimReward": ".types.resource.Group",
+    "ClaimRewardsResponse": ".types.resource.Group",
+    "CollectRoyaltiesResponse": ".types.resource.Group",
+    "BatchMintAndRegisterIPInput": ".types.resource.IPAsset",
+    "BatchMintAndRegisterIPResponse": ".types.resource.IPAsset",
+    "LicenseTermsDataInput": ".types.resource.IPAsset",
+    "LinkDerivativeResponse": ".types.resource.IPAsset",
+    "MintedNFT": ".types.resource.IPAsset",
+    "MintNFT": ".types.resource.IPAsset",
+    "RegisterAndAttachAndDistributeRoyaltyTokensResponse": ".types.resource.IPAsset",
+    "RegisterDerivativeIPAndAttachAndDistributeRoyaltyTokensResponse": ".types.resource.IPAsset",
+    "RegisterDerivativeIpAssetResponse": ".types.resource.IPAsset",
+    "RegisteredIP": ".types.resource.IPAsset",
+    "RegisterIpAssetResponse": ".types.resource.IPAsset",
+    "RegisterPILTermsAndAttachResponse": ".types.resource.IPAsset",
+    "RegistrationResponse": ".types.resource.IPAsset",
+    "RegistrationWithRoyaltyVaultAndLicenseTermsResponse": ".types.resource.IPAsset",
+    "RegistrationWithRoyaltyVaultResponse": ".types.resource.IPAsset",
+    "LicenseTermsInput": ".types.resource.License",
+    "LicenseTermsOverride": ".types.resource.License",
+    "NativeRoyaltyPolicy": ".types.resource.Royalty",
+    "RoyaltyShareInput": ".types.resource.Royalty",
+    "DEFAULT_FUNCTION_SELECTOR": ".utils.constants",
+    "MAX_ROYALTY_TOKEN": ".utils.constants",
+    "ROYALTY_POLICY_LAP_ADDRESS": ".utils.constants",
+    "ROYALTY_POLICY_LRP_ADDRESS": ".utils.constants",
+    "WIP_TOKEN_ADDRESS": ".utils.constants",
+    "ZERO_ADDRESS": ".utils.constants",
+    "ZERO_FUNC": ".utils.constants",
+    "ZERO_HASH": ".utils.constants",
+    "DerivativeDataInput": ".utils.derivative_data",
+    "IPMetadataInput": ".utils.ip_metadata",
+    "LicensingConfig": ".utils.licensing_config_data",
+    "PILFlavor": ".utils.pil_flavor",
+    "PILFlavorError": ".utils.pil_flavor",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "StoryClient",
+    "AsyncStoryClient",
     "IPAsset",
     "License",
     "Royalty",
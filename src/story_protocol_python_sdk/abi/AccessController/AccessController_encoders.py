@@ -0,0 +1,45 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_setAllPermissions(ipAccount, signer, permission) -> bytes:
+    """Encode the calldata of ``setAllPermissions(address,address,uint8)``."""
+    return encode_call(
+        b"\xb3\xd7\x71\x47",
+        ("address", "address", "uint8"),
+        None,
+        (ipAccount, signer, permission),
+    )
+
+
+def encode_setBatchTransientPermissions(permissions) -> bytes:
+    """Encode the calldata of ``setBatchTransientPermissions((address,address,address,bytes4,uint8)[])``."""
+    return encode_call(
+        b"\xcf\x07\x10\x44",
+        ("(address,address,address,bytes4,uint8)[]",),
+        (
+            (
+                "array",
+                (
+                    "tuple",
+                    (
+                        ("ipAccount", None),
+                        ("signer", None),
+                        ("to", None),
+                        ("func", "bytes"),
+                        ("permission", None),
+                    ),
+                ),
+            ),
+        ),
+        (permissions,),
+    )
+
+
+def encode_setTransientPermission(ipAccount, signer, to, func, permission) -> bytes:
+    """Encode the calldata of ``setTransientPermission(address,address,address,bytes4,uint8)``."""
+    return encode_call(
+        b"\x62\x64\xec\xf7",
+        ("address", "address", "address", "bytes4", "uint8"),
+        (None, None, None, "bytes", None),
+        (ipAccount, signer, to, func, permission),
+    )
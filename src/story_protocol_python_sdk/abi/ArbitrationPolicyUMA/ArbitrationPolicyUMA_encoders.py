@@ -0,0 +1,51 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_disputeIdToAssertionId(disputeId) -> bytes:
+    """Encode the calldata of ``disputeIdToAssertionId(uint256)``."""
+    return encode_call(
+        b"\xd7\x20\xa1\x7d",
+        ("uint256",),
+        None,
+        (disputeId,),
+    )
+
+
+def encode_maxBonds(token) -> bytes:
+    """Encode the calldata of ``maxBonds(address)``."""
+    return encode_call(
+        b"\xdf\xaa\xef\x8c",
+        ("address",),
+        None,
+        (token,),
+    )
+
+
+def encode_maxLiveness() -> bytes:
+    """Encode the calldata of ``maxLiveness()``."""
+    return encode_call(
+        b"\x6a\x03\x45\x33",
+        (),
+        None,
+        (),
+    )
+
+
+def encode_minLiveness() -> bytes:
+    """Encode the calldata of ``minLiveness()``."""
+    return encode_call(
+        b"\x8a\x92\x4d\xf6",
+        (),
+        None,
+        (),
+    )
+
+
+def encode_oov3() -> bytes:
+    """Encode the calldata of ``oov3()``."""
+    return encode_call(
+        b"\x21\xd0\x6b\xfd",
+        (),
+        None,
+        (),
+    )
@@ -1,40 +1,12 @@
-import json
-import os
-
 from web3 import Web3
 
+from story_protocol_python_sdk.utils.contract_registry import get_contract
+
 
 class DerivativeWorkflowsClient:
-    def __init__(self, web3: Web3):
+    def __init__(self, web3: Web3, chain_id: int | None = None):
         self.web3 = web3
-        # Assuming config.json is located at the root of the project
-        config_path = os.path.abspath(
-            os.path.join(
-                os.path.dirname(__file__), "..", "..", "scripts", "config.json"
-            )
-        )
-        with open(config_path, "r") as config_file:
-            config = json.load(config_file)
-        contract_address = None
-        for contract in config["contracts"]:
-            if contract["contract_name"] == "DerivativeWorkflows":
-                contract_address = contract["contract_address"]
-                break
-        if not contract_address:
-            raise ValueError(
-                "Contract address for DerivativeWorkflows not found in config.json"
-            )
-        abi_path = os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "..",
-            "abi",
-            "jsons",
-            "DerivativeWorkflows.json",
-        )
-        with open(abi_path, "r") as abi_file:
-            abi = json.load(abi_file)
-        self.contract = self.web3.eth.contract(address=contract_address, abi=abi)
+        self.contract = get_contract(web3, "DerivativeWorkflows", chain_id)
 
     def mintAndRegisterIpAndMakeDerivative(
         self, spgNftContract, derivData, ipMetadata, recipient, allowDuplicates
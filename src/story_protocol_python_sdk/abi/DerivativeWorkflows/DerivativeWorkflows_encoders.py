@@ -0,0 +1,187 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_mintAndRegisterIpAndMakeDerivative(
+    spgNftContract, derivData, ipMetadata, recipient, allowDuplicates
+) -> bytes:
+    """Encode the calldata of ``mintAndRegisterIpAndMakeDerivative(address,(address[],address,uint256[],bytes,uint256,uint32,uint32),(string,bytes32,string,bytes32),address,bool)``."""
+    return encode_call(
+        b"\xc0\xc5\x6b\x62",
+        (
+            "address",
+            "(address[],address,uint256[],bytes,uint256,uint32,uint32)",
+            "(string,bytes32,string,bytes32)",
+            "address",
+            "bool",
+        ),
+        (
+            None,
+            (
+                "tuple",
+                (
+                    ("parentIpIds", None),
+                    ("licenseTemplate", None),
+                    ("licenseTermsIds", None),
+                    ("royaltyContext", "bytes"),
+                    ("maxMintingFee", None),
+                    ("maxRts", None),
+                    ("maxRevenueShare", None),
+                ),
+            ),
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            None,
+            None,
+        ),
+        (spgNftContract, derivData, ipMetadata, recipient, allowDuplicates),
+    )
+
+
+def encode_mintAndRegisterIpAndMakeDerivativeWithLicenseTokens(
+    spgNftContract,
+    licenseTokenIds,
+    royaltyContext,
+    maxRts,
+    ipMetadata,
+    recipient,
+    allowDuplicates,
+) -> bytes:
+    """Encode the calldata of ``mintAndRegisterIpAndMakeDerivativeWithLicenseTokens(address,uint256[],bytes,uint32,(string,bytes32,string,bytes32),address,bool)``."""
+    return encode_call(
+        b"\x03\x90\x19\x04",
+        (
+            "address",
+            "uint256[]",
+            "bytes",
+            "uint32",
+            "(string,bytes32,string,bytes32)",
+            "address",
+            "bool",
+        ),
+        (
+            None,
+            None,
+            "bytes",
+            None,
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            None,
+            None,
+        ),
+        (
+            spgNftContract,
+            licenseTokenIds,
+            royaltyContext,
+            maxRts,
+            ipMetadata,
+            recipient,
+            allowDuplicates,
+        ),
+    )
+
+
+def encode_registerIpAndMakeDerivative(
+    nftContract, tokenId, derivData, ipMetadata, sigMetadataAndRegister
+) -> bytes:
+    """Encode the calldata of ``registerIpAndMakeDerivative(address,uint256,(address[],address,uint256[],bytes,uint256,uint32,uint32),(string,bytes32,string,bytes32),(address,uint256,bytes))``."""
+    return encode_call(
+        b"\xf2\x6c\xa9\xe9",
+        (
+            "address",
+            "uint256",
+            "(address[],address,uint256[],bytes,uint256,uint32,uint32)",
+            "(string,bytes32,string,bytes32)",
+            "(address,uint256,bytes)",
+        ),
+        (
+            None,
+            None,
+            (
+                "tuple",
+                (
+                    ("parentIpIds", None),
+                    ("licenseTemplate", None),
+                    ("licenseTermsIds", None),
+                    ("royaltyContext", "bytes"),
+                    ("maxMintingFee", None),
+                    ("maxRts", None),
+                    ("maxRevenueShare", None),
+                ),
+            ),
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            ("tuple", (("signer", None), ("deadline", None), ("signature", "bytes"))),
+        ),
+        (nftContract, tokenId, derivData, ipMetadata, sigMetadataAndRegister),
+    )
+
+
+def encode_registerIpAndMakeDerivativeWithLicenseTokens(
+    nftContract,
+    tokenId,
+    licenseTokenIds,
+    royaltyContext,
+    maxRts,
+    ipMetadata,
+    sigMetadataAndRegister,
+) -> bytes:
+    """Encode the calldata of ``registerIpAndMakeDerivativeWithLicenseTokens(address,uint256,uint256[],bytes,uint32,(string,bytes32,string,bytes32),(address,uint256,bytes))``."""
+    return encode_call(
+        b"\x8d\xb4\x5c\x39",
+        (
+            "address",
+            "uint256",
+            "uint256[]",
+            "bytes",
+            "uint32",
+            "(string,bytes32,string,bytes32)",
+            "(address,uint256,bytes)",
+        ),
+        (
+            None,
+            None,
+            None,
+            "bytes",
+            None,
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            ("tuple", (("signer", None), ("deadline", None), ("signature", "bytes"))),
+        ),
+        (
+            nftContract,
+            tokenId,
+            licenseTokenIds,
+            royaltyContext,
+            maxRts,
+            ipMetadata,
+            sigMetadataAndRegister,
+        ),
+    )
@@ -0,0 +1,61 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_cancelDispute(disputeId, data) -> bytes:
+    """Encode the calldata of ``cancelDispute(uint256,bytes)``."""
+    return encode_call(
+        b"\xc8\x44\x82\x5d",
+        ("uint256", "bytes"),
+        (None, "bytes"),
+        (disputeId, data),
+    )
+
+
+def encode_raiseDispute(targetIpId, disputeEvidenceHash, targetTag, data) -> bytes:
+    """Encode the calldata of ``raiseDispute(address,bytes32,bytes32,bytes)``."""
+    return encode_call(
+        b"\x6a\x5d\xef\x7f",
+        ("address", "bytes32", "bytes32", "bytes"),
+        (None, "bytes", "bytes", "bytes"),
+        (targetIpId, disputeEvidenceHash, targetTag, data),
+    )
+
+
+def encode_resolveDispute(disputeId, data) -> bytes:
+    """Encode the calldata of ``resolveDispute(uint256,bytes)``."""
+    return encode_call(
+        b"\x44\x71\xfa\xbc",
+        ("uint256", "bytes"),
+        (None, "bytes"),
+        (disputeId, data),
+    )
+
+
+def encode_tagIfRelatedIpInfringed(ipIdToTag, infringerDisputeId) -> bytes:
+    """Encode the calldata of ``tagIfRelatedIpInfringed(address,uint256)``."""
+    return encode_call(
+        b"\xe7\xb6\x6a\x64",
+        ("address", "uint256"),
+        None,
+        (ipIdToTag, infringerDisputeId),
+    )
+
+
+def encode_isIpTagged(ipId) -> bytes:
+    """Encode the calldata of ``isIpTagged(address)``."""
+    return encode_call(
+        b"\x13\xf4\x6c\x42",
+        ("address",),
+        None,
+        (ipId,),
+    )
+
+
+def encode_isWhitelistedDisputeTag(tag) -> bytes:
+    """Encode the calldata of ``isWhitelistedDisputeTag(bytes32)``."""
+    return encode_call(
+        b"\xda\xb8\x3d\x29",
+        ("bytes32",),
+        ("bytes",),
+        (tag,),
+    )
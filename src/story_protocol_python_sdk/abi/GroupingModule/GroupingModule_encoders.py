@@ -0,0 +1,61 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_addIp(groupIpId, ipIds, maxAllowedRewardShare) -> bytes:
+    """Encode the calldata of ``addIp(address,address[],uint256)``."""
+    return encode_call(
+        b"\x0e\xc2\x87\x99",
+        ("address", "address[]", "uint256"),
+        None,
+        (groupIpId, ipIds, maxAllowedRewardShare),
+    )
+
+
+def encode_claimReward(groupId, token, ipIds) -> bytes:
+    """Encode the calldata of ``claimReward(address,address,address[])``."""
+    return encode_call(
+        b"\x7c\x7d\x48\x09",
+        ("address", "address", "address[]"),
+        None,
+        (groupId, token, ipIds),
+    )
+
+
+def encode_collectRoyalties(groupId, token) -> bytes:
+    """Encode the calldata of ``collectRoyalties(address,address)``."""
+    return encode_call(
+        b"\x62\xce\xb4\x8a",
+        ("address", "address"),
+        None,
+        (groupId, token),
+    )
+
+
+def encode_registerGroup(groupPool) -> bytes:
+    """Encode the calldata of ``registerGroup(address)``."""
+    return encode_call(
+        b"\x9a\xdb\x6c\x6a",
+        ("address",),
+        None,
+        (groupPool,),
+    )
+
+
+def encode_removeIp(groupIpId, ipIds) -> bytes:
+    """Encode the calldata of ``removeIp(address,address[])``."""
+    return encode_call(
+        b"\x88\xe5\xa6\x4b",
+        ("address", "address[]"),
+        None,
+        (groupIpId, ipIds),
+    )
+
+
+def encode_getClaimableReward(groupId, token, ipIds) -> bytes:
+    """Encode the calldata of ``getClaimableReward(address,address,address[])``."""
+    return encode_call(
+        b"\x17\xbc\xdf\xb4",
+        ("address", "address", "address[]"),
+        None,
+        (groupId, token, ipIds),
+    )
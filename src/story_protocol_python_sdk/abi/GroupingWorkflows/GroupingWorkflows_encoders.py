@@ -0,0 +1,253 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_collectRoyaltiesAndClaimReward(
+    groupIpId, currencyTokens, memberIpIds
+) -> bytes:
+    """Encode the calldata of ``collectRoyaltiesAndClaimReward(address,address[],address[])``."""
+    return encode_call(
+        b"\xac\x6c\x0b\x40",
+        ("address", "address[]", "address[]"),
+        None,
+        (groupIpId, currencyTokens, memberIpIds),
+    )
+
+
+def encode_mintAndRegisterIpAndAttachLicenseAndAddToGroup(
+    spgNftContract,
+    groupId,
+    recipient,
+    maxAllowedRewardShare,
+    licensesData,
+    ipMetadata,
+    sigAddToGroup,
+    allowDuplicates,
+) -> bytes:
+    """Encode the calldata of ``mintAndRegisterIpAndAttachLicenseAndAddToGroup(address,address,address,uint256,(address,uint256,(bool,uint256,address,bytes,uint32,bool,uint32,address))[],(string,bytes32,string,bytes32),(address,uint256,bytes),bool)``."""
+    return encode_call(
+        b"\xd4\x38\xea\x13",
+        (
+            "address",
+            "address",
+            "address",
+            "uint256",
+            "(address,uint256,(bool,uint256,address,bytes,uint32,bool,uint32,address))[]",
+            "(string,bytes32,string,bytes32)",
+            "(address,uint256,bytes)",
+            "bool",
+        ),
+        (
+            None,
+            None,
+            None,
+            None,
+            (
+                "array",
+                (
+                    "tuple",
+                    (
+                        ("licenseTemplate", None),
+                        ("licenseTermsId", None),
+                        (
+                            "licensingConfig",
+                            (
+                                "tuple",
+                                (
+                                    ("isSet", None),
+                                    ("mintingFee", None),
+                                    ("licensingHook", None),
+                                    ("hookData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("disabled", None),
+                                    ("expectMinimumGroupRewardShare", None),
+                                    ("expectGroupRewardPool", None),
+                                ),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            ("tuple", (("signer", None), ("deadline", None), ("signature", "bytes"))),
+            None,
+        ),
+        (
+            spgNftContract,
+            groupId,
+            recipient,
+            maxAllowedRewardShare,
+            licensesData,
+            ipMetadata,
+            sigAddToGroup,
+            allowDuplicates,
+        ),
+    )
+
+
+def encode_registerGroupAndAttachLicense(groupPool, licenseData) -> bytes:
+    """Encode the calldata of ``registerGroupAndAttachLicense(address,(address,uint256,(bool,uint256,address,bytes,uint32,bool,uint32,address)))``."""
+    return encode_call(
+        b"\xde\xb9\xa8\xd1",
+        (
+            "address",
+            "(address,uint256,(bool,uint256,address,bytes,uint32,bool,uint32,address))",
+        ),
+        (
+            None,
+            (
+                "tuple",
+                (
+                    ("licenseTemplate", None),
+                    ("licenseTermsId", None),
+                    (
+                        "licensingConfig",
+                        (
+                            "tuple",
+                            (
+                                ("isSet", None),
+                                ("mintingFee", None),
+                                ("licensingHook", None),
+                                ("hookData", "bytes"),
+                                ("commercialRevShare", None),
+                                ("disabled", None),
+                                ("expectMinimumGroupRewardShare", None),
+                                ("expectGroupRewardPool", None),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+        ),
+        (groupPool, licenseData),
+    )
+
+
+def encode_registerGroupAndAttachLicenseAndAddIps(
+    groupPool, ipIds, maxAllowedRewardShare, licenseData
+) -> bytes:
+    """Encode the calldata of ``registerGroupAndAttachLicenseAndAddIps(address,address[],uint256,(address,uint256,(bool,uint256,address,bytes,uint32,bool,uint32,address)))``."""
+    return encode_call(
+        b"\x95\x4c\x44\xce",
+        (
+            "address",
+            "address[]",
+            "uint256",
+            "(address,uint256,(bool,uint256,address,bytes,uint32,bool,uint32,address))",
+        ),
+        (
+            None,
+            None,
+            None,
+            (
+                "tuple",
+                (
+                    ("licenseTemplate", None),
+                    ("licenseTermsId", None),
+                    (
+                        "licensingConfig",
+                        (
+                            "tuple",
+                            (
+                                ("isSet", None),
+                                ("mintingFee", None),
+                                ("licensingHook", None),
+                                ("hookData", "bytes"),
+                                ("commercialRevShare", None),
+                                ("disabled", None),
+                                ("expectMinimumGroupRewardShare", None),
+                                ("expectGroupRewardPool", None),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+        ),
+        (groupPool, ipIds, maxAllowedRewardShare, licenseData),
+    )
+
+
+def encode_registerIpAndAttachLicenseAndAddToGroup(
+    nftContract,
+    tokenId,
+    groupId,
+    maxAllowedRewardShare,
+    licensesData,
+    ipMetadata,
+    sigMetadataAndAttachAndConfig,
+    sigAddToGroup,
+) -> bytes:
+    """Encode the calldata of ``registerIpAndAttachLicenseAndAddToGroup(address,uint256,address,uint256,(address,uint256,(bool,uint256,address,bytes,uint32,bool,uint32,address))[],(string,bytes32,string,bytes32),(address,uint256,bytes),(address,uint256,bytes))``."""
+    return encode_call(
+        b"\xd0\x1d\x65\xfe",
+        (
+            "address",
+            "uint256",
+            "address",
+            "uint256",
+            "(address,uint256,(bool,uint256,address,bytes,uint32,bool,uint32,address))[]",
+            "(string,bytes32,string,bytes32)",
+            "(address,uint256,bytes)",
+            "(address,uint256,bytes)",
+        ),
+        (
+            None,
+            None,
+            None,
+            None,
+            (
+                "array",
+                (
+                    "tuple",
+                    (
+                        ("licenseTemplate", None),
+                        ("licenseTermsId", None),
+                        (
+                            "licensingConfig",
+                            (
+                                "tuple",
+                                (
+                                    ("isSet", None),
+                                    ("mintingFee", None),
+                                    ("licensingHook", None),
+                                    ("hookData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("disabled", None),
+                                    ("expectMinimumGroupRewardShare", None),
+                                    ("expectGroupRewardPool", None),
+                                ),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            ("tuple", (("signer", None), ("deadline", None), ("signature", "bytes"))),
+            ("tuple", (("signer", None), ("deadline", None), ("signature", "bytes"))),
+        ),
+        (
+            nftContract,
+            tokenId,
+            groupId,
+            maxAllowedRewardShare,
+            licensesData,
+            ipMetadata,
+            sigMetadataAndAttachAndConfig,
+            sigAddToGroup,
+        ),
+    )
@@ -0,0 +1,77 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_execute(to, value, data, operation) -> bytes:
+    """Encode the calldata of ``execute(address,uint256,bytes,uint8)``."""
+    return encode_call(
+        b"\x51\x94\x54\x47",
+        ("address", "uint256", "bytes", "uint8"),
+        (None, None, "bytes", None),
+        (to, value, data, operation),
+    )
+
+
+def encode_execute2(to, value, data) -> bytes:
+    """Encode the calldata of ``execute(address,uint256,bytes)``."""
+    return encode_call(
+        b"\xb6\x1d\x27\xf6",
+        ("address", "uint256", "bytes"),
+        (None, None, "bytes"),
+        (to, value, data),
+    )
+
+
+def encode_executeBatch(calls, operation) -> bytes:
+    """Encode the calldata of ``executeBatch((address,uint256,bytes)[],uint8)``."""
+    return encode_call(
+        b"\xa7\x42\x5c\xdb",
+        ("(address,uint256,bytes)[]", "uint8"),
+        (
+            (
+                "array",
+                ("tuple", (("target", None), ("value", None), ("data", "bytes"))),
+            ),
+            None,
+        ),
+        (calls, operation),
+    )
+
+
+def encode_executeWithSig(to, value, data, signer, deadline, signature) -> bytes:
+    """Encode the calldata of ``executeWithSig(address,uint256,bytes,address,uint256,bytes)``."""
+    return encode_call(
+        b"\xbf\xf5\x71\xef",
+        ("address", "uint256", "bytes", "address", "uint256", "bytes"),
+        (None, None, "bytes", None, None, "bytes"),
+        (to, value, data, signer, deadline, signature),
+    )
+
+
+def encode_owner() -> bytes:
+    """Encode the calldata of ``owner()``."""
+    return encode_call(
+        b"\x8d\xa5\xcb\x5b",
+        (),
+        None,
+        (),
+    )
+
+
+def encode_state() -> bytes:
+    """Encode the calldata of ``state()``."""
+    return encode_call(
+        b"\xc1\x9d\x93\xfb",
+        (),
+        None,
+        (),
+    )
+
+
+def encode_token() -> bytes:
+    """Encode the calldata of ``token()``."""
+    return encode_call(
+        b"\xfc\x0c\x54\x6a",
+        (),
+        None,
+        (),
+    )
@@ -0,0 +1,41 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_register(chainid, tokenContract, tokenId) -> bytes:
+    """Encode the calldata of ``register(uint256,address,uint256)``."""
+    return encode_call(
+        b"\xfc\xa2\x47\xac",
+        ("uint256", "address", "uint256"),
+        None,
+        (chainid, tokenContract, tokenId),
+    )
+
+
+def encode_ipId(chainId, tokenContract, tokenId) -> bytes:
+    """Encode the calldata of ``ipId(uint256,address,uint256)``."""
+    return encode_call(
+        b"\xd2\x6b\xb8\x3f",
+        ("uint256", "address", "uint256"),
+        None,
+        (chainId, tokenContract, tokenId),
+    )
+
+
+def encode_isRegistered(id) -> bytes:
+    """Encode the calldata of ``isRegistered(address)``."""
+    return encode_call(
+        b"\xc3\xc5\xa5\x47",
+        ("address",),
+        None,
+        (id,),
+    )
+
+
+def encode_isRegisteredGroup(groupId) -> bytes:
+    """Encode the calldata of ``isRegisteredGroup(address)``."""
+    return encode_call(
+        b"\x51\xee\xe2\x76",
+        ("address",),
+        None,
+        (groupId,),
+    )
@@ -0,0 +1,31 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_balanceOf(account) -> bytes:
+    """Encode the calldata of ``balanceOf(address)``."""
+    return encode_call(
+        b"\x70\xa0\x82\x31",
+        ("address",),
+        None,
+        (account,),
+    )
+
+
+def encode_claimableRevenue(claimer, token) -> bytes:
+    """Encode the calldata of ``claimableRevenue(address,address)``."""
+    return encode_call(
+        b"\x22\x2c\xa4\x81",
+        ("address", "address"),
+        None,
+        (claimer, token),
+    )
+
+
+def encode_ipId() -> bytes:
+    """Encode the calldata of ``ipId()``."""
+    return encode_call(
+        b"\x19\x37\xdf\xc8",
+        (),
+        None,
+        (),
+    )
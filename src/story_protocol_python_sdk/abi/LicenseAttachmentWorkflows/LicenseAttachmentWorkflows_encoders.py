@@ -0,0 +1,245 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_mintAndRegisterIpAndAttachPILTerms(
+    spgNftContract, recipient, ipMetadata, licenseTermsData, allowDuplicates
+) -> bytes:
+    """Encode the calldata of ``mintAndRegisterIpAndAttachPILTerms(address,address,(string,bytes32,string,bytes32),((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string),(bool,uint256,address,bytes,uint32,bool,uint32,address))[],bool)``."""
+    return encode_call(
+        b"\x2c\x24\xa7\x02",
+        (
+            "address",
+            "address",
+            "(string,bytes32,string,bytes32)",
+            "((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string),(bool,uint256,address,bytes,uint32,bool,uint32,address))[]",
+            "bool",
+        ),
+        (
+            None,
+            None,
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            (
+                "array",
+                (
+                    "tuple",
+                    (
+                        (
+                            "terms",
+                            (
+                                "tuple",
+                                (
+                                    ("transferable", None),
+                                    ("royaltyPolicy", None),
+                                    ("defaultMintingFee", None),
+                                    ("expiration", None),
+                                    ("commercialUse", None),
+                                    ("commercialAttribution", None),
+                                    ("commercializerChecker", None),
+                                    ("commercializerCheckerData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("commercialRevCeiling", None),
+                                    ("derivativesAllowed", None),
+                                    ("derivativesAttribution", None),
+                                    ("derivativesApproval", None),
+                                    ("derivativesReciprocal", None),
+                                    ("derivativeRevCeiling", None),
+                                    ("currency", None),
+                                    ("uri", None),
+                                ),
+                            ),
+                        ),
+                        (
+                            "licensingConfig",
+                            (
+                                "tuple",
+                                (
+                                    ("isSet", None),
+                                    ("mintingFee", None),
+                                    ("licensingHook", None),
+                                    ("hookData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("disabled", None),
+                                    ("expectMinimumGroupRewardShare", None),
+                                    ("expectGroupRewardPool", None),
+                                ),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+            None,
+        ),
+        (spgNftContract, recipient, ipMetadata, licenseTermsData, allowDuplicates),
+    )
+
+
+def encode_multicall(data) -> bytes:
+    """Encode the calldata of ``multicall(bytes[])``."""
+    return encode_call(
+        b"\xac\x96\x50\xd8",
+        ("bytes[]",),
+        (("array", "bytes"),),
+        (data,),
+    )
+
+
+def encode_registerIpAndAttachPILTerms(
+    nftContract, tokenId, ipMetadata, licenseTermsData, sigMetadataAndAttachAndConfig
+) -> bytes:
+    """Encode the calldata of ``registerIpAndAttachPILTerms(address,uint256,(string,bytes32,string,bytes32),((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string),(bool,uint256,address,bytes,uint32,bool,uint32,address))[],(address,uint256,bytes))``."""
+    return encode_call(
+        b"\xba\x3c\x9c\xc5",
+        (
+            "address",
+            "uint256",
+            "(string,bytes32,string,bytes32)",
+            "((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string),(bool,uint256,address,bytes,uint32,bool,uint32,address))[]",
+            "(address,uint256,bytes)",
+        ),
+        (
+            None,
+            None,
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            (
+                "array",
+                (
+                    "tuple",
+                    (
+                        (
+                            "terms",
+                            (
+                                "tuple",
+                                (
+                                    ("transferable", None),
+                                    ("royaltyPolicy", None),
+                                    ("defaultMintingFee", None),
+                                    ("expiration", None),
+                                    ("commercialUse", None),
+                                    ("commercialAttribution", None),
+                                    ("commercializerChecker", None),
+                                    ("commercializerCheckerData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("commercialRevCeiling", None),
+                                    ("derivativesAllowed", None),
+                                    ("derivativesAttribution", None),
+                                    ("derivativesApproval", None),
+                                    ("derivativesReciprocal", None),
+                                    ("derivativeRevCeiling", None),
+                                    ("currency", None),
+                                    ("uri", None),
+                                ),
+                            ),
+                        ),
+                        (
+                            "licensingConfig",
+                            (
+                                "tuple",
+                                (
+                                    ("isSet", None),
+                                    ("mintingFee", None),
+                                    ("licensingHook", None),
+                                    ("hookData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("disabled", None),
+                                    ("expectMinimumGroupRewardShare", None),
+                                    ("expectGroupRewardPool", None),
+                                ),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+            ("tuple", (("signer", None), ("deadline", None), ("signature", "bytes"))),
+        ),
+        (
+            nftContract,
+            tokenId,
+            ipMetadata,
+            licenseTermsData,
+            sigMetadataAndAttachAndConfig,
+        ),
+    )
+
+
+def encode_registerPILTermsAndAttach(
+    ipId, licenseTermsData, sigAttachAndConfig
+) -> bytes:
+    """Encode the calldata of ``registerPILTermsAndAttach(address,((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string),(bool,uint256,address,bytes,uint32,bool,uint32,address))[],(address,uint256,bytes))``."""
+    return encode_call(
+        b"\xd4\x85\xe2\xb1",
+        (
+            "address",
+            "((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string),(bool,uint256,address,bytes,uint32,bool,uint32,address))[]",
+            "(address,uint256,bytes)",
+        ),
+        (
+            None,
+            (
+                "array",
+                (
+                    "tuple",
+                    (
+                        (
+                            "terms",
+                            (
+                                "tuple",
+                                (
+                                    ("transferable", None),
+                                    ("royaltyPolicy", None),
+                                    ("defaultMintingFee", None),
+                                    ("expiration", None),
+                                    ("commercialUse", None),
+                                    ("commercialAttribution", None),
+                                    ("commercializerChecker", None),
+                                    ("commercializerCheckerData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("commercialRevCeiling", None),
+                                    ("derivativesAllowed", None),
+                                    ("derivativesAttribution", None),
+                                    ("derivativesApproval", None),
+                                    ("derivativesReciprocal", None),
+                                    ("derivativeRevCeiling", None),
+                                    ("currency", None),
+                                    ("uri", None),
+                                ),
+                            ),
+                        ),
+                        (
+                            "licensingConfig",
+                            (
+                                "tuple",
+                                (
+                                    ("isSet", None),
+                                    ("mintingFee", None),
+                                    ("licensingHook", None),
+                                    ("hookData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("disabled", None),
+                                    ("expectMinimumGroupRewardShare", None),
+                                    ("expectGroupRewardPool", None),
+                                ),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+            ("tuple", (("signer", None), ("deadline", None), ("signature", "bytes"))),
+        ),
+        (ipId, licenseTermsData, sigAttachAndConfig),
+    )
@@ -0,0 +1,51 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_exists(licenseTemplate, licenseTermsId) -> bytes:
+    """Encode the calldata of ``exists(address,uint256)``."""
+    return encode_call(
+        b"\xed\x29\x33\xed",
+        ("address", "uint256"),
+        None,
+        (licenseTemplate, licenseTermsId),
+    )
+
+
+def encode_getLicensingConfig(ipId, licenseTemplate, licenseTermsId) -> bytes:
+    """Encode the calldata of ``getLicensingConfig(address,address,uint256)``."""
+    return encode_call(
+        b"\x6e\x4d\x4d\x19",
+        ("address", "address", "uint256"),
+        None,
+        (ipId, licenseTemplate, licenseTermsId),
+    )
+
+
+def encode_getRoyaltyPercent(ipId, licenseTemplate, licenseTermsId) -> bytes:
+    """Encode the calldata of ``getRoyaltyPercent(address,address,uint256)``."""
+    return encode_call(
+        b"\x81\xdd\xf5\x2a",
+        ("address", "address", "uint256"),
+        None,
+        (ipId, licenseTemplate, licenseTermsId),
+    )
+
+
+def encode_hasDerivativeIps(parentIpId) -> bytes:
+    """Encode the calldata of ``hasDerivativeIps(address)``."""
+    return encode_call(
+        b"\x86\xf1\x28\x0c",
+        ("address",),
+        None,
+        (parentIpId,),
+    )
+
+
+def encode_hasIpAttachedLicenseTerms(ipId, licenseTemplate, licenseTermsId) -> bytes:
+    """Encode the calldata of ``hasIpAttachedLicenseTerms(address,address,uint256)``."""
+    return encode_call(
+        b"\x72\x48\x02\x47",
+        ("address", "address", "uint256"),
+        None,
+        (ipId, licenseTemplate, licenseTermsId),
+    )
@@ -0,0 +1,21 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_getTotalTokensByLicensor(licensorIpId) -> bytes:
+    """Encode the calldata of ``getTotalTokensByLicensor(address)``."""
+    return encode_call(
+        b"\x23\x21\x1d\xcd",
+        ("address",),
+        None,
+        (licensorIpId,),
+    )
+
+
+def encode_ownerOf(tokenId) -> bytes:
+    """Encode the calldata of ``ownerOf(uint256)``."""
+    return encode_call(
+        b"\x63\x52\x21\x1e",
+        ("uint256",),
+        None,
+        (tokenId,),
+    )
@@ -0,0 +1,150 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_attachLicenseTerms(ipId, licenseTemplate, licenseTermsId) -> bytes:
+    """Encode the calldata of ``attachLicenseTerms(address,address,uint256)``."""
+    return encode_call(
+        b"\x2a\x41\x30\xc0",
+        ("address", "address", "uint256"),
+        None,
+        (ipId, licenseTemplate, licenseTermsId),
+    )
+
+
+def encode_mintLicenseTokens(
+    licensorIpId,
+    licenseTemplate,
+    licenseTermsId,
+    amount,
+    receiver,
+    royaltyContext,
+    maxMintingFee,
+    maxRevenueShare,
+) -> bytes:
+    """Encode the calldata of ``mintLicenseTokens(address,address,uint256,uint256,address,bytes,uint256,uint32)``."""
+    return encode_call(
+        b"\x02\xbf\x96\xa5",
+        (
+            "address",
+            "address",
+            "uint256",
+            "uint256",
+            "address",
+            "bytes",
+            "uint256",
+            "uint32",
+        ),
+        (None, None, None, None, None, "bytes", None, None),
+        (
+            licensorIpId,
+            licenseTemplate,
+            licenseTermsId,
+            amount,
+            receiver,
+            royaltyContext,
+            maxMintingFee,
+            maxRevenueShare,
+        ),
+    )
+
+
+def encode_registerDerivative(
+    childIpId,
+    parentIpIds,
+    licenseTermsIds,
+    licenseTemplate,
+    royaltyContext,
+    maxMintingFee,
+    maxRts,
+    maxRevenueShare,
+) -> bytes:
+    """Encode the calldata of ``registerDerivative(address,address[],uint256[],address,bytes,uint256,uint32,uint32)``."""
+    return encode_call(
+        b"\x4a\x4d\x56\xc5",
+        (
+            "address",
+            "address[]",
+            "uint256[]",
+            "address",
+            "bytes",
+            "uint256",
+            "uint32",
+            "uint32",
+        ),
+        (None, None, None, None, "bytes", None, None, None),
+        (
+            childIpId,
+            parentIpIds,
+            licenseTermsIds,
+            licenseTemplate,
+            royaltyContext,
+            maxMintingFee,
+            maxRts,
+            maxRevenueShare,
+        ),
+    )
+
+
+def encode_registerDerivativeWithLicenseTokens(
+    childIpId, licenseTokenIds, royaltyContext, maxRts
+) -> bytes:
+    """Encode the calldata of ``registerDerivativeWithLicenseTokens(address,uint256[],bytes,uint32)``."""
+    return encode_call(
+        b"\x93\x8b\x7b\x7a",
+        ("address", "uint256[]", "bytes", "uint32"),
+        (None, None, "bytes", None),
+        (childIpId, licenseTokenIds, royaltyContext, maxRts),
+    )
+
+
+def encode_setLicensingConfig(
+    ipId, licenseTemplate, licenseTermsId, licensingConfig
+) -> bytes:
+    """Encode the calldata of ``setLicensingConfig(address,address,uint256,(bool,uint256,address,bytes,uint32,bool,uint32,address))``."""
+    return encode_call(
+        b"\xb3\x3f\x67\x3e",
+        (
+            "address",
+            "address",
+            "uint256",
+            "(bool,uint256,address,bytes,uint32,bool,uint32,address)",
+        ),
+        (
+            None,
+            None,
+            None,
+            (
+                "tuple",
+                (
+                    ("isSet", None),
+                    ("mintingFee", None),
+                    ("licensingHook", None),
+                    ("hookData", "bytes"),
+                    ("commercialRevShare", None),
+                    ("disabled", None),
+                    ("expectMinimumGroupRewardShare", None),
+                    ("expectGroupRewardPool", None),
+                ),
+            ),
+        ),
+        (ipId, licenseTemplate, licenseTermsId, licensingConfig),
+    )
+
+
+def encode_predictMintingLicenseFee(
+    licensorIpId, licenseTemplate, licenseTermsId, amount, receiver, royaltyContext
+) -> bytes:
+    """Encode the calldata of ``predictMintingLicenseFee(address,address,uint256,uint256,address,bytes)``."""
+    return encode_call(
+        b"\xc9\x18\xf3\xf2",
+        ("address", "address", "uint256", "uint256", "address", "bytes"),
+        (None, None, None, None, None, "bytes"),
+        (
+            licensorIpId,
+            licenseTemplate,
+            licenseTermsId,
+            amount,
+            receiver,
+            royaltyContext,
+        ),
+    )
@@ -0,0 +1,21 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_transfer(to, value) -> bytes:
+    """Encode the calldata of ``transfer(address,uint256)``."""
+    return encode_call(
+        b"\xa9\x05\x9c\xbb",
+        ("address", "uint256"),
+        None,
+        (to, value),
+    )
+
+
+def encode_balanceOf(account) -> bytes:
+    """Encode the calldata of ``balanceOf(address)``."""
+    return encode_call(
+        b"\x70\xa0\x82\x31",
+        ("address",),
+        None,
+        (account,),
+    )
@@ -0,0 +1,11 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_isRegistered(moduleAddress) -> bytes:
+    """Encode the calldata of ``isRegistered(address)``."""
+    return encode_call(
+        b"\xc3\xc5\xa5\x47",
+        ("address",),
+        None,
+        (moduleAddress,),
+    )
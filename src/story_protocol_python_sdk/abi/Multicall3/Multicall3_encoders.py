@@ -0,0 +1,42 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_aggregate3(calls) -> bytes:
+    """Encode the calldata of ``aggregate3((address,bool,bytes)[])``."""
+    return encode_call(
+        b"\x82\xad\x56\xcb",
+        ("(address,bool,bytes)[]",),
+        (
+            (
+                "array",
+                (
+                    "tuple",
+                    (("target", None), ("allowFailure", None), ("callData", "bytes")),
+                ),
+            ),
+        ),
+        (calls,),
+    )
+
+
+def encode_aggregate3Value(calls) -> bytes:
+    """Encode the calldata of ``aggregate3Value((address,bool,uint256,bytes)[])``."""
+    return encode_call(
+        b"\x17\x4d\xea\x71",
+        ("(address,bool,uint256,bytes)[]",),
+        (
+            (
+                "array",
+                (
+                    "tuple",
+                    (
+                        ("target", None),
+                        ("allowFailure", None),
+                        ("value", None),
+                        ("callData", "bytes"),
+                    ),
+                ),
+            ),
+        ),
+        (calls,),
+    )
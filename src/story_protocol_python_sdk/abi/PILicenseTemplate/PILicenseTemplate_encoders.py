@@ -0,0 +1,91 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_registerLicenseTerms(terms) -> bytes:
+    """Encode the calldata of ``registerLicenseTerms((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string))``."""
+    return encode_call(
+        b"\x6e\x1b\x8d\x90",
+        (
+            "(bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string)",
+        ),
+        (
+            (
+                "tuple",
+                (
+                    ("transferable", None),
+                    ("royaltyPolicy", None),
+                    ("defaultMintingFee", None),
+                    ("expiration", None),
+                    ("commercialUse", None),
+                    ("commercialAttribution", None),
+                    ("commercializerChecker", None),
+                    ("commercializerCheckerData", "bytes"),
+                    ("commercialRevShare", None),
+                    ("commercialRevCeiling", None),
+                    ("derivativesAllowed", None),
+                    ("derivativesAttribution", None),
+                    ("derivativesApproval", None),
+                    ("derivativesReciprocal", None),
+                    ("derivativeRevCeiling", None),
+                    ("currency", None),
+                    ("uri", None),
+                ),
+            ),
+        ),
+        (terms,),
+    )
+
+
+def encode_exists(licenseTermsId) -> bytes:
+    """Encode the calldata of ``exists(uint256)``."""
+    return encode_call(
+        b"\x4f\x55\x8e\x79",
+        ("uint256",),
+        None,
+        (licenseTermsId,),
+    )
+
+
+def encode_getLicenseTerms(selectedLicenseTermsId) -> bytes:
+    """Encode the calldata of ``getLicenseTerms(uint256)``."""
+    return encode_call(
+        b"\xd1\x90\x8a\x9c",
+        ("uint256",),
+        None,
+        (selectedLicenseTermsId,),
+    )
+
+
+def encode_getLicenseTermsId(terms) -> bytes:
+    """Encode the calldata of ``getLicenseTermsId((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string))``."""
+    return encode_call(
+        b"\x60\x2f\x6b\x9b",
+        (
+            "(bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string)",
+        ),
+        (
+            (
+                "tuple",
+                (
+                    ("transferable", None),
+                    ("royaltyPolicy", None),
+                    ("defaultMintingFee", None),
+                    ("expiration", None),
+                    ("commercialUse", None),
+                    ("commercialAttribution", None),
+                    ("commercializerChecker", None),
+                    ("commercializerCheckerData", "bytes"),
+                    ("commercialRevShare", None),
+                    ("commercialRevCeiling", None),
+                    ("derivativesAllowed", None),
+                    ("derivativesAttribution", None),
+                    ("derivativesApproval", None),
+                    ("derivativesReciprocal", None),
+                    ("derivativeRevCeiling", None),
+                    ("currency", None),
+                    ("uri", None),
+                ),
+            ),
+        ),
+        (terms,),
+    )
@@ -0,0 +1,93 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_createCollection(spgNftInitParams) -> bytes:
+    """Encode the calldata of ``createCollection((string,string,string,string,uint32,uint256,address,address,address,bool,bool))``."""
+    return encode_call(
+        b"\xe8\x0f\xe5\x2f",
+        (
+            "(string,string,string,string,uint32,uint256,address,address,address,bool,bool)",
+        ),
+        (
+            (
+                "tuple",
+                (
+                    ("name", None),
+                    ("symbol", None),
+                    ("baseURI", None),
+                    ("contractURI", None),
+                    ("maxSupply", None),
+                    ("mintFee", None),
+                    ("mintFeeToken", None),
+                    ("mintFeeRecipient", None),
+                    ("owner", None),
+                    ("mintOpen", None),
+                    ("isPublicMinting", None),
+                ),
+            ),
+        ),
+        (spgNftInitParams,),
+    )
+
+
+def encode_mintAndRegisterIp(
+    spgNftContract, recipient, ipMetadata, allowDuplicates
+) -> bytes:
+    """Encode the calldata of ``mintAndRegisterIp(address,address,(string,bytes32,string,bytes32),bool)``."""
+    return encode_call(
+        b"\xf1\xc4\x2a\x22",
+        ("address", "address", "(string,bytes32,string,bytes32)", "bool"),
+        (
+            None,
+            None,
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            None,
+        ),
+        (spgNftContract, recipient, ipMetadata, allowDuplicates),
+    )
+
+
+def encode_multicall(data) -> bytes:
+    """Encode the calldata of ``multicall(bytes[])``."""
+    return encode_call(
+        b"\xac\x96\x50\xd8",
+        ("bytes[]",),
+        (("array", "bytes"),),
+        (data,),
+    )
+
+
+def encode_registerIp(nftContract, tokenId, ipMetadata, sigMetadata) -> bytes:
+    """Encode the calldata of ``registerIp(address,uint256,(string,bytes32,string,bytes32),(address,uint256,bytes))``."""
+    return encode_call(
+        b"\x4e\x8c\x46\x24",
+        (
+            "address",
+            "uint256",
+            "(string,bytes32,string,bytes32)",
+            "(address,uint256,bytes)",
+        ),
+        (
+            None,
+            None,
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            ("tuple", (("signer", None), ("deadline", None), ("signature", "bytes"))),
+        ),
+        (nftContract, tokenId, ipMetadata, sigMetadata),
+    )
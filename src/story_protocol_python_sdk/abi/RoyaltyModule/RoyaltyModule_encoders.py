@@ -0,0 +1,41 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_payRoyaltyOnBehalf(receiverIpId, payerIpId, token, amount) -> bytes:
+    """Encode the calldata of ``payRoyaltyOnBehalf(address,address,address,uint256)``."""
+    return encode_call(
+        b"\xd2\x57\x7f\x3b",
+        ("address", "address", "address", "uint256"),
+        None,
+        (receiverIpId, payerIpId, token, amount),
+    )
+
+
+def encode_ipRoyaltyVaults(ipId) -> bytes:
+    """Encode the calldata of ``ipRoyaltyVaults(address)``."""
+    return encode_call(
+        b"\x7a\x11\x2e\x79",
+        ("address",),
+        None,
+        (ipId,),
+    )
+
+
+def encode_isWhitelistedRoyaltyPolicy(royaltyPolicy) -> bytes:
+    """Encode the calldata of ``isWhitelistedRoyaltyPolicy(address)``."""
+    return encode_call(
+        b"\x96\x46\x78\x14",
+        ("address",),
+        None,
+        (royaltyPolicy,),
+    )
+
+
+def encode_isWhitelistedRoyaltyToken(token) -> bytes:
+    """Encode the calldata of ``isWhitelistedRoyaltyToken(address)``."""
+    return encode_call(
+        b"\x92\x6e\x04\xfd",
+        ("address",),
+        None,
+        (token,),
+    )
@@ -0,0 +1,11 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_transferToVault(ipId, ancestorIpId, token) -> bytes:
+    """Encode the calldata of ``transferToVault(address,address,address)``."""
+    return encode_call(
+        b"\xb6\xa9\x2a\x53",
+        ("address", "address", "address"),
+        None,
+        (ipId, ancestorIpId, token),
+    )
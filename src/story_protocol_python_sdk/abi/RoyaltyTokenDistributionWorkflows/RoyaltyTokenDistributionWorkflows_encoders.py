@@ -0,0 +1,292 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_distributeRoyaltyTokens(
+    ipId, royaltyShares, sigApproveRoyaltyTokens
+) -> bytes:
+    """Encode the calldata of ``distributeRoyaltyTokens(address,(address,uint32)[],(address,uint256,bytes))``."""
+    return encode_call(
+        b"\x2d\xb2\x40\x15",
+        ("address", "(address,uint32)[]", "(address,uint256,bytes)"),
+        (
+            None,
+            ("array", ("tuple", (("recipient", None), ("percentage", None)))),
+            ("tuple", (("signer", None), ("deadline", None), ("signature", "bytes"))),
+        ),
+        (ipId, royaltyShares, sigApproveRoyaltyTokens),
+    )
+
+
+def encode_mintAndRegisterIpAndAttachPILTermsAndDistributeRoyaltyTokens(
+    spgNftContract,
+    recipient,
+    ipMetadata,
+    licenseTermsData,
+    royaltyShares,
+    allowDuplicates,
+) -> bytes:
+    """Encode the calldata of ``mintAndRegisterIpAndAttachPILTermsAndDistributeRoyaltyTokens(address,address,(string,bytes32,string,bytes32),((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string),(bool,uint256,address,bytes,uint32,bool,uint32,address))[],(address,uint32)[],bool)``."""
+    return encode_call(
+        b"\xdc\x3f\x68\x5a",
+        (
+            "address",
+            "address",
+            "(string,bytes32,string,bytes32)",
+            "((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string),(bool,uint256,address,bytes,uint32,bool,uint32,address))[]",
+            "(address,uint32)[]",
+            "bool",
+        ),
+        (
+            None,
+            None,
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            (
+                "array",
+                (
+                    "tuple",
+                    (
+                        (
+                            "terms",
+                            (
+                                "tuple",
+                                (
+                                    ("transferable", None),
+                                    ("royaltyPolicy", None),
+                                    ("defaultMintingFee", None),
+                                    ("expiration", None),
+                                    ("commercialUse", None),
+                                    ("commercialAttribution", None),
+                                    ("commercializerChecker", None),
+                                    ("commercializerCheckerData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("commercialRevCeiling", None),
+                                    ("derivativesAllowed", None),
+                                    ("derivativesAttribution", None),
+                                    ("derivativesApproval", None),
+                                    ("derivativesReciprocal", None),
+                                    ("derivativeRevCeiling", None),
+                                    ("currency", None),
+                                    ("uri", None),
+                                ),
+                            ),
+                        ),
+                        (
+                            "licensingConfig",
+                            (
+                                "tuple",
+                                (
+                                    ("isSet", None),
+                                    ("mintingFee", None),
+                                    ("licensingHook", None),
+                                    ("hookData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("disabled", None),
+                                    ("expectMinimumGroupRewardShare", None),
+                                    ("expectGroupRewardPool", None),
+                                ),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+            ("array", ("tuple", (("recipient", None), ("percentage", None)))),
+            None,
+        ),
+        (
+            spgNftContract,
+            recipient,
+            ipMetadata,
+            licenseTermsData,
+            royaltyShares,
+            allowDuplicates,
+        ),
+    )
+
+
+def encode_mintAndRegisterIpAndMakeDerivativeAndDistributeRoyaltyTokens(
+    spgNftContract, recipient, ipMetadata, derivData, royaltyShares, allowDuplicates
+) -> bytes:
+    """Encode the calldata of ``mintAndRegisterIpAndMakeDerivativeAndDistributeRoyaltyTokens(address,address,(string,bytes32,string,bytes32),(address[],address,uint256[],bytes,uint256,uint32,uint32),(address,uint32)[],bool)``."""
+    return encode_call(
+        b"\x5d\xe0\xda\x3f",
+        (
+            "address",
+            "address",
+            "(string,bytes32,string,bytes32)",
+            "(address[],address,uint256[],bytes,uint256,uint32,uint32)",
+            "(address,uint32)[]",
+            "bool",
+        ),
+        (
+            None,
+            None,
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            (
+                "tuple",
+                (
+                    ("parentIpIds", None),
+                    ("licenseTemplate", None),
+                    ("licenseTermsIds", None),
+                    ("royaltyContext", "bytes"),
+                    ("maxMintingFee", None),
+                    ("maxRts", None),
+                    ("maxRevenueShare", None),
+                ),
+            ),
+            ("array", ("tuple", (("recipient", None), ("percentage", None)))),
+            None,
+        ),
+        (
+            spgNftContract,
+            recipient,
+            ipMetadata,
+            derivData,
+            royaltyShares,
+            allowDuplicates,
+        ),
+    )
+
+
+def encode_registerIpAndAttachPILTermsAndDeployRoyaltyVault(
+    nftContract, tokenId, ipMetadata, licenseTermsData, sigMetadataAndAttachAndConfig
+) -> bytes:
+    """Encode the calldata of ``registerIpAndAttachPILTermsAndDeployRoyaltyVault(address,uint256,(string,bytes32,string,bytes32),((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string),(bool,uint256,address,bytes,uint32,bool,uint32,address))[],(address,uint256,bytes))``."""
+    return encode_call(
+        b"\xfe\x00\x82\xdc",
+        (
+            "address",
+            "uint256",
+            "(string,bytes32,string,bytes32)",
+            "((bool,address,uint256,uint256,bool,bool,address,bytes,uint32,uint256,bool,bool,bool,bool,uint256,address,string),(bool,uint256,address,bytes,uint32,bool,uint32,address))[]",
+            "(address,uint256,bytes)",
+        ),
+        (
+            None,
+            None,
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            (
+                "array",
+                (
+                    "tuple",
+                    (
+                        (
+                            "terms",
+                            (
+                                "tuple",
+                                (
+                                    ("transferable", None),
+                                    ("royaltyPolicy", None),
+                                    ("defaultMintingFee", None),
+                                    ("expiration", None),
+                                    ("commercialUse", None),
+                                    ("commercialAttribution", None),
+                                    ("commercializerChecker", None),
+                                    ("commercializerCheckerData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("commercialRevCeiling", None),
+                                    ("derivativesAllowed", None),
+                                    ("derivativesAttribution", None),
+                                    ("derivativesApproval", None),
+                                    ("derivativesReciprocal", None),
+                                    ("derivativeRevCeiling", None),
+                                    ("currency", None),
+                                    ("uri", None),
+                                ),
+                            ),
+                        ),
+                        (
+                            "licensingConfig",
+                            (
+                                "tuple",
+                                (
+                                    ("isSet", None),
+                                    ("mintingFee", None),
+                                    ("licensingHook", None),
+                                    ("hookData", "bytes"),
+                                    ("commercialRevShare", None),
+                                    ("disabled", None),
+                                    ("expectMinimumGroupRewardShare", None),
+                                    ("expectGroupRewardPool", None),
+                                ),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+            ("tuple", (("signer", None), ("deadline", None), ("signature", "bytes"))),
+        ),
+        (
+            nftContract,
+            tokenId,
+            ipMetadata,
+            licenseTermsData,
+            sigMetadataAndAttachAndConfig,
+        ),
+    )
+
+
+def encode_registerIpAndMakeDerivativeAndDeployRoyaltyVault(
+    nftContract, tokenId, ipMetadata, derivData, sigMetadataAndRegister
+) -> bytes:
+    """Encode the calldata of ``registerIpAndMakeDerivativeAndDeployRoyaltyVault(address,uint256,(string,bytes32,string,bytes32),(address[],address,uint256[],bytes,uint256,uint32,uint32),(address,uint256,bytes))``."""
+    return encode_call(
+        b"\xc9\xfb\xf8\xc7",
+        (
+            "address",
+            "uint256",
+            "(string,bytes32,string,bytes32)",
+            "(address[],address,uint256[],bytes,uint256,uint32,uint32)",
+            "(address,uint256,bytes)",
+        ),
+        (
+            None,
+            None,
+            (
+                "tuple",
+                (
+                    ("ipMetadataURI", None),
+                    ("ipMetadataHash", "bytes"),
+                    ("nftMetadataURI", None),
+                    ("nftMetadataHash", "bytes"),
+                ),
+            ),
+            (
+                "tuple",
+                (
+                    ("parentIpIds", None),
+                    ("licenseTemplate", None),
+                    ("licenseTermsIds", None),
+                    ("royaltyContext", "bytes"),
+                    ("maxMintingFee", None),
+                    ("maxRts", None),
+                    ("maxRevenueShare", None),
+                ),
+            ),
+            ("tuple", (("signer", None), ("deadline", None), ("signature", "bytes"))),
+        ),
+        (nftContract, tokenId, ipMetadata, derivData, sigMetadataAndRegister),
+    )
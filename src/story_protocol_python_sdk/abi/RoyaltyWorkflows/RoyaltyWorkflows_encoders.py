@@ -0,0 +1,23 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_claimAllRevenue(
+    ancestorIpId, claimer, childIpIds, royaltyPolicies, currencyTokens
+) -> bytes:
+    """Encode the calldata of ``claimAllRevenue(address,address,address[],address[],address[])``."""
+    return encode_call(
+        b"\xc4\x48\x51\x99",
+        ("address", "address", "address[]", "address[]", "address[]"),
+        None,
+        (ancestorIpId, claimer, childIpIds, royaltyPolicies, currencyTokens),
+    )
+
+
+def encode_multicall(data) -> bytes:
+    """Encode the calldata of ``multicall(bytes[])``."""
+    return encode_call(
+        b"\xac\x96\x50\xd8",
+        ("bytes[]",),
+        (("array", "bytes"),),
+        (data,),
+    )
@@ -0,0 +1,21 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_mintFee() -> bytes:
+    """Encode the calldata of ``mintFee()``."""
+    return encode_call(
+        b"\x13\x96\x6d\xb5",
+        (),
+        None,
+        (),
+    )
+
+
+def encode_mintFeeToken() -> bytes:
+    """Encode the calldata of ``mintFeeToken()``."""
+    return encode_call(
+        b"\xc4\xc6\x90\x33",
+        (),
+        None,
+        (),
+    )
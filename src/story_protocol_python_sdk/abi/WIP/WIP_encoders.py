@@ -0,0 +1,71 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_approve(spender, amount) -> bytes:
+    """Encode the calldata of ``approve(address,uint256)``."""
+    return encode_call(
+        b"\x09\x5e\xa7\xb3",
+        ("address", "uint256"),
+        None,
+        (spender, amount),
+    )
+
+
+def encode_deposit() -> bytes:
+    """Encode the calldata of ``deposit()``."""
+    return encode_call(
+        b"\xd0\xe3\x0d\xb0",
+        (),
+        None,
+        (),
+    )
+
+
+def encode_transfer(to, amount) -> bytes:
+    """Encode the calldata of ``transfer(address,uint256)``."""
+    return encode_call(
+        b"\xa9\x05\x9c\xbb",
+        ("address", "uint256"),
+        None,
+        (to, amount),
+    )
+
+
+def encode_transferFrom(from_address, to, amount) -> bytes:
+    """Encode the calldata of ``transferFrom(address,address,uint256)``."""
+    return encode_call(
+        b"\x23\xb8\x72\xdd",
+        ("address", "address", "uint256"),
+        None,
+        (from_address, to, amount),
+    )
+
+
+def encode_withdraw(value) -> bytes:
+    """Encode the calldata of ``withdraw(uint256)``."""
+    return encode_call(
+        b"\x2e\x1a\x7d\x4d",
+        ("uint256",),
+        None,
+        (value,),
+    )
+
+
+def encode_allowance(owner, spender) -> bytes:
+    """Encode the calldata of ``allowance(address,address)``."""
+    return encode_call(
+        b"\xdd\x62\xed\x3e",
+        ("address", "address"),
+        None,
+        (owner, spender),
+    )
+
+
+def encode_balanceOf(owner) -> bytes:
+    """Encode the calldata of ``balanceOf(address)``."""
+    return encode_call(
+        b"\x70\xa0\x82\x31",
+        ("address",),
+        None,
+        (owner,),
+    )
@@ -0,0 +1,21 @@
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+
+
+def encode_withdraw(value) -> bytes:
+    """Encode the calldata of ``withdraw(uint256)``."""
+    return encode_call(
+        b"\x2e\x1a\x7d\x4d",
+        ("uint256",),
+        None,
+        (value,),
+    )
+
+
+def encode_balanceOf(owner) -> bytes:
+    """Encode the calldata of ``balanceOf(address)``."""
+    return encode_call(
+        b"\x70\xa0\x82\x31",
+        ("address",),
+        None,
+        (owner,),
+    )
@@ -0,0 +1,303 @@
+# src/story_protocol_python_sdk/async_story_client.py
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from story_protocol_python_sdk.utils.constants import SUPPORTED_CHAIN_IDS
+
+if TYPE_CHECKING:
+    from web3 import AsyncWeb3
+
+    from story_protocol_python_sdk.resources.AsyncDispute import AsyncDispute
+    from story_protocol_python_sdk.resources.AsyncGroup import AsyncGroup
+    from story_protocol_python_sdk.resources.AsyncIPAccount import AsyncIPAccount
+    from story_protocol_python_sdk.resources.AsyncIPAsset import AsyncIPAsset
+    from story_protocol_python_sdk.resources.AsyncLicense import AsyncLicense
+    from story_protocol_python_sdk.resources.AsyncNFTClient import AsyncNFTClient
+    from story_protocol_python_sdk.resources.AsyncPermission import AsyncPermission
+    from story_protocol_python_sdk.resources.AsyncRoyalty import AsyncRoyalty
+    from story_protocol_python_sdk.resources.AsyncWIP import AsyncWIP
+    from story_protocol_python_sdk.utils.gas_estimator import GasEstimateCache
+    from story_protocol_python_sdk.utils.ip_id_derivation import IpIdDeriver
+    from story_protocol_python_sdk.utils.retry_policy import RetryPolicy
+    from story_protocol_python_sdk.utils.write_once_cache import WriteOnceCache
+
+
+class AsyncStoryClient:
+    """
+    An asyncio client for Story Protocol built on an ``AsyncWeb3``.
+
+    Resource methods are coroutines, so one event loop can drive many reads
+    and writes at once::
+
+        client = AsyncStoryClient(AsyncWeb3(AsyncHTTPProvider(rpc_url)), account, 1315)
+        results = await asyncio.gather(
+            *(client.IPAsset.register(nft_contract, token_id) for token_id in token_ids)
+        )
+
+    Concurrent writes from the account get consecutive nonces from a local
+    nonce manager, and their receipts are collected by one polling task per
+    web3 instance instead of one poller per transaction.
+
+    :param web3 AsyncWeb3: An instance of AsyncWeb3.
+    :param account: The account to use for transactions.
+    :param chain_id int: The ID of the blockchain network.
+    """
+
+    def __init__(self, web3: AsyncWeb3, account, chain_id: int):
+        """
+        Initialize the AsyncStoryClient with the given web3 instance, account, and chain ID.
+
+        :param web3 AsyncWeb3: An instance of AsyncWeb3.
+        :param account: The account to use for transactions.
+        :param chain_id int: The ID of the blockchain network.
+        :raises ValueError: If web3 or account is not provided.
+        """
+        if not web3 or not account:
+            raise ValueError("web3 and account must be provided")
+
+        if chain_id not in SUPPORTED_CHAIN_IDS:
+            raise ValueError("only support story devnet")
+
+        self.web3 = web3
+        self.account = account
+        self.chain_id = chain_id
+
+        self._ip_asset: AsyncIPAsset | None = None
+        self._license: AsyncLicense | None = None
+        self._royalty: AsyncRoyalty | None = None
+        self._ip_account: AsyncIPAccount | None = None
+        self._permission: AsyncPermission | None = None
+        self._nft_client: AsyncNFTClient | None = None
+        self._dispute: AsyncDispute | None = None
+        self._wip: AsyncWIP | None = None
+        self._group: AsyncGroup | None = None
+
+    @property
+    def IPAsset(self) -> AsyncIPAsset:
+        """
+        Access the IPAsset resource.
+
+        :return AsyncIPAsset: An instance of AsyncIPAsset.
+        """
+        if self._ip_asset is None:
+            from story_protocol_python_sdk.resources.AsyncIPAsset import AsyncIPAsset
+
+            self._ip_asset = AsyncIPAsset(self.web3, self.account, self.chain_id)
+        return self._ip_asset
+
+    @property
+    def License(self) -> AsyncLicense:
+        """
+        Access the License resource.
+
+        :return AsyncLicense: An instance of AsyncLicense.
+        """
+        if self._license is None:
+            from story_protocol_python_sdk.resources.AsyncLicense import AsyncLicense
+
+            self._license = AsyncLicense(self.web3, self.account, self.chain_id)
+        return self._license
+
+    @property
+    def Royalty(self) -> AsyncRoyalty:
+        """
+        Access the Royalty resource.
+
+        :return AsyncRoyalty: An instance of AsyncRoyalty.
+        """
+        if self._royalty is None:
+            from story_protocol_python_sdk.resources.AsyncRoyalty import AsyncRoyalty
+
+            self._royalty = AsyncRoyalty(self.web3, self.account, self.chain_id)
+        return self._royalty
+
+    @property
+    def IPAccount(self) -> AsyncIPAccount:
+        """
+        Access the IPAccount resource.
+
+        :return AsyncIPAccount: An instance of AsyncIPAccount.
+        """
+        if self._ip_account is None:
+            from story_protocol_python_sdk.resources.AsyncIPAccount import (
+                AsyncIPAccount,
+            )
+
+            self._ip_account = AsyncIPAccount(self.web3, self.account, self.chain_id)
+        return self._ip_account
+
+    @property
+    def Permission(self) -> AsyncPermission:
+        """
+        Access the Permission resource.
+
+        :return AsyncPermission: An instance of AsyncPermission.
+        """
+        if self._permission is None:
+            from story_protocol_python_sdk.resources.AsyncPermission import (
+                AsyncPermission,
+            )
+
+            self._permission = AsyncPermission(self.web3, self.account, self.chain_id)
+        return self._permission
+
+    @property
+    def NFTClient(self) -> AsyncNFTClient:
+        """
+        Access the NFTClient resource.
+
+        :return AsyncNFTClient: An instance of AsyncNFTClient.
+        """
+        if self._nft_client is None:
+            from story_protocol_python_sdk.resources.AsyncNFTClient import (
+                AsyncNFTClient,
+            )
+
+            self._nft_client = AsyncNFTClient(self.web3, self.account, self.chain_id)
+        return self._nft_client
+
+    @property
+    def Dispute(self) -> AsyncDispute:
+        """
+        Access the Dispute resource.
+
+        :return AsyncDispute: An instance of AsyncDispute.
+        """
+        if self._dispute is None:
+            from story_protocol_python_sdk.resources.AsyncDispute import AsyncDispute
+
+            self._dispute = AsyncDispute(self.web3, self.account, self.chain_id)
+        return self._dispute
+
+    @property
+    def WIP(self) -> AsyncWIP:
+        """
+        Access the WIP resource.
+
+        :return AsyncWIP: An instance of AsyncWIP.
+        """
+        if self._wip is None:
+            from story_protocol_python_sdk.resources.AsyncWIP import AsyncWIP
+
+            self._wip = AsyncWIP(self.web3, self.account, self.chain_id)
+        return self._wip
+
+    @property
+    def Group(self) -> AsyncGroup:
+        """
+        Access the Group resource.
+
+        :return AsyncGroup: An instance of AsyncGroup.
+        """
+        if self._group is None:
+            from story_protocol_python_sdk.resources.AsyncGroup import AsyncGroup
+
+            self._group = AsyncGroup(self.web3, self.account, self.chain_id)
+        return self._group
+
+    def enable_gas_estimate_cache(
+        self, margin: float | None = None
+    ) -> GasEstimateCache:
+        """
+        Skip gas estimation for calls whose shape was mined before, using the
+        largest recorded gas usage plus a safety margin as the gas limit.
+
+        :param margin float: [Optional] The safety margin over the recorded usage. Default is 0.2.
+        :return GasEstimateCache: The cache, shared by every client on this web3 instance.
+        """
+        from story_protocol_python_sdk.utils.gas_estimator import (
+            DEFAULT_GAS_MARGIN,
+            enable_gas_estimate_cache,
+        )
+
+        return enable_gas_estimate_cache(
+            self.web3, DEFAULT_GAS_MARGIN if margin is None else margin
+        )
+
+    def enable_write_once_cache(
+        self, negative_ttl: float = 30.0, max_size: int = 65536
+    ) -> WriteOnceCache:
+        """
+        Memoize reads whose answer never changes once set: royalty vault
+        addresses and IP account tokens. Unset answers, such as a vault that
+        is not deployed yet, are read again after ``negative_ttl`` seconds.
+        Mint fee tokens are kept for a minute, since the collection owner can
+        change them.
+
+        :param negative_ttl float: [Optional] Seconds an unset answer is kept. Default is 30.
+        :param max_size int: [Optional] The most answers kept. Default is 65536.
+        :return WriteOnceCache: The cache, shared by every client on this web3 instance.
+        """
+        from story_protocol_python_sdk.utils.write_once_cache import (
+            enable_write_once_cache,
+        )
+
+        return enable_write_once_cache(self.web3, negative_ttl, max_size)
+
+    async def enable_ip_id_derivation(self) -> IpIdDeriver:
+        """
+        Derive IP IDs offline instead of asking the IP asset registry for
+        each NFT. The registry parameters are read, and checked against one
+        on-chain IP ID, once.
+
+        :return IpIdDeriver: The deriver, shared by every client of this chain on this web3 instance.
+        """
+        from story_protocol_python_sdk.utils.ip_id_derivation import (
+            async_enable_ip_id_derivation,
+        )
+
+        return await async_enable_ip_id_derivation(self.web3, self.chain_id)
+
+    def set_retry_policy(self, policy: RetryPolicy | None) -> None:
+        """
+        Set how every write reacts to send errors and to transactions that
+        stay pending, unless a write gives its own ``retryPolicy`` option.
+
+        :param policy RetryPolicy: The policy, or None for the default one.
+        """
+        from story_protocol_python_sdk.utils.retry_policy import set_retry_policy
+
+        set_retry_policy(self.web3, policy)
+
+    async def get_balance(self, address: str) -> int:
+        """
+        Get the native token (IP) balance of the specified address.
+
+        :param address str: The address to query the balance for.
+        :return int: The native token balance of the specified address in wei.
+        :raises ValueError: If the address is invalid.
+        """
+        if not address:
+            raise ValueError("Address must be provided")
+
+        if not self.web3.is_address(address):
+            raise ValueError(f"Invalid address format: {address}")
+
+        return await self.web3.eth.get_balance(self.web3.to_checksum_address(address))
+
+    async def get_balances(self, addresses: list[str]) -> list[int]:
+        """
+        Get the native token (IP) balances of many addresses concurrently.
+
+        :param addresses list[str]: The addresses to query the balances for.
+        :return list[int]: The balances in wei, in the order of ``addresses``.
+        :raises ValueError: If an address is invalid.
+        """
+        return list(
+            await asyncio.gather(*(self.get_balance(address) for address in addresses))
+        )
+
+    async def get_wallet_balance(self) -> int:
+        """
+        Get the native token (IP) balance of the current wallet.
+
+        :return int: The native token balance of the current wallet in wei.
+        :raises ValueError: If no account is found.
+        """
+        if not self.account or not hasattr(self.account, "address"):
+            raise ValueError("No account found in wallet")
+
+        return await self.get_balance(self.account.address)
@@ -0,0 +1,213 @@
+"""Module for managing disputes over an AsyncWeb3."""
+
+import asyncio
+from functools import cached_property
+
+from eth_abi.abi import encode
+from web3 import AsyncWeb3, Web3
+
+from story_protocol_python_sdk.abi.ArbitrationPolicyUMA.ArbitrationPolicyUMA_client import (
+    ArbitrationPolicyUMAClient,
+)
+from story_protocol_python_sdk.abi.DisputeModule.DisputeModule_client import (
+    DisputeModuleClient,
+)
+from story_protocol_python_sdk.resources.AsyncWIP import AsyncWIP
+from story_protocol_python_sdk.resources.Dispute import Dispute
+from story_protocol_python_sdk.utils.async_transaction_utils import (
+    async_build_and_send_transaction,
+)
+from story_protocol_python_sdk.utils.constants import WIP_TOKEN_ADDRESS
+from story_protocol_python_sdk.utils.contract_registry import get_contract_at
+from story_protocol_python_sdk.utils.ipfs import convert_cid_to_hash_ipfs
+
+
+class AsyncDispute:
+    """
+    A class to manage disputes on Story Protocol, the async counterpart of
+    :class:`Dispute`.
+
+    :param web3 AsyncWeb3: An instance of AsyncWeb3.
+    :param account: The account to use for transactions.
+    :param chain_id int: The ID of the blockchain network.
+    """
+
+    def __init__(self, web3: AsyncWeb3, account, chain_id: int):
+        self.web3 = web3
+        self.account = account
+        self.chain_id = chain_id
+
+    @cached_property
+    def dispute_module_client(self) -> DisputeModuleClient:
+        return DisputeModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def arbitration_policy_uma_client(self) -> ArbitrationPolicyUMAClient:
+        return ArbitrationPolicyUMAClient(self.web3, self.chain_id)
+
+    @cached_property
+    def wip(self) -> AsyncWIP:
+        return AsyncWIP(self.web3, self.account, self.chain_id)
+
+    # Validation and receipt parsing make no network calls, exactly as in
+    # Dispute.
+    _validate_address = Dispute._validate_address
+    _parse_tx_dispute_raised_event = Dispute._parse_tx_dispute_raised_event
+
+    async def raise_dispute(
+        self,
+        target_ip_id: str,
+        target_tag: str,
+        cid: str,
+        liveness: int,
+        bond: int,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Raises a dispute on a given IP ID.
+
+        :param target_ip_id str: The IP ID being disputed.
+        :param target_tag str: The tag to be applied to the IP.
+        :param cid str: The IPFS CID containing dispute evidence.
+        :param liveness int: The liveness period for the dispute.
+        :param bond int: The bond amount for the dispute.
+        :param tx_options dict: [Optional] Transaction options.
+        :return dict: A dictionary containing the transaction hash and dispute ID.
+        """
+        try:
+            target_ip_id = self._validate_address(target_ip_id)
+            tag_bytes = self.web3.to_hex(text=target_tag).ljust(66, "0")
+
+            is_whitelisted, min_liveness, max_liveness, max_bonds = (
+                await asyncio.gather(
+                    self.dispute_module_client.isWhitelistedDisputeTag(tag_bytes),
+                    self.arbitration_policy_uma_client.minLiveness(),
+                    self.arbitration_policy_uma_client.maxLiveness(),
+                    self.arbitration_policy_uma_client.maxBonds(
+                        token=self.web3.to_checksum_address(WIP_TOKEN_ADDRESS)
+                    ),
+                )
+            )
+            if not is_whitelisted:
+                raise ValueError(f"The target tag {target_tag} is not whitelisted.")
+            if liveness < min_liveness or liveness > max_liveness:
+                raise ValueError(
+                    f"Liveness must be between {min_liveness} and {max_liveness}."
+                )
+            if bond > max_bonds:
+                raise ValueError(f"Bond must be less than {max_bonds}.")
+
+            await self.wip.deposit(amount=bond)
+
+            response = await async_build_and_send_transaction(
+                self.web3,
+                self.account,
+                self.dispute_module_client.build_raiseDispute_transaction,
+                target_ip_id,
+                convert_cid_to_hash_ipfs(cid),
+                tag_bytes,
+                encode(
+                    ["uint64", "address", "uint256"],
+                    [liveness, WIP_TOKEN_ADDRESS, bond],
+                ),
+                tx_options=tx_options,
+            )
+
+            dispute_id = self._parse_tx_dispute_raised_event(response["tx_receipt"])
+
+            return {
+                "tx_hash": response["tx_hash"],
+                "dispute_id": dispute_id if dispute_id else None,
+            }
+
+        except Exception as e:
+            raise ValueError(f"Failed to raise dispute: {str(e)}")
+
+    async def cancel_dispute(
+        self, dispute_id: int, data: str = "0x", tx_options: dict | None = None
+    ) -> dict:
+        """
+        Cancels an ongoing dispute.
+
+        :param dispute_id int: The ID of the dispute to cancel.
+        :param data str: [Optional] Additional data for the cancellation.
+        :param tx_options dict: [Optional] Transaction options.
+        :return dict: A dictionary containing the transaction hash.
+        """
+        try:
+            response = await async_build_and_send_transaction(
+                self.web3,
+                self.account,
+                self.dispute_module_client.build_cancelDispute_transaction,
+                dispute_id,
+                data,
+                tx_options=tx_options,
+            )
+
+            return {"tx_hash": response["tx_hash"]}
+
+        except Exception as e:
+            raise ValueError(f"Failed to cancel dispute: {str(e)}")
+
+    async def resolve_dispute(
+        self, dispute_id: int, data: str, tx_options: dict | None = None
+    ) -> dict:
+        """
+        Resolves a dispute after it has been judged.
+
+        :param dispute_id int: The ID of the dispute to resolve.
+        :param data str: The resolution data.
+        :param tx_options dict: [Optional] Transaction options.
+        :return dict: A dictionary containing the transaction hash.
+        """
+        try:
+            response = await async_build_and_send_transaction(
+                self.web3,
+                self.account,
+                self.dispute_module_client.build_resolveDispute_transaction,
+                dispute_id,
+                data,
+                tx_options=tx_options,
+            )
+
+            return {"tx_hash": response["tx_hash"]}
+
+        except Exception as e:
+            raise ValueError(f"Failed to resolve dispute: {str(e)}")
+
+    async def dispute_id_to_assertion_id(self, dispute_id: int) -> str:
+        """
+        Converts a dispute ID to its corresponding assertion ID.
+
+        :param dispute_id int: The dispute ID to convert.
+        :return str: The corresponding assertion ID as a hex string.
+        :raises ValueError: If there is an error during the conversion.
+        """
+        try:
+            return await self.arbitration_policy_uma_client.disputeIdToAssertionId(
+                dispute_id
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to convert dispute ID to assertion ID: {str(e)}")
+
+    async def get_assertion_bond(self, assertion_id: str) -> int:
+        """
+        Get the bond amount for a given assertion ID.
+
+        :param assertion_id str: The ID of the assertion.
+        :return int: The bond amount.
+        """
+        try:
+            oov3_contract = get_contract_at(
+                self.web3,
+                "ASSERTION_ABI",
+                Web3.to_checksum_address(
+                    await self.arbitration_policy_uma_client.oov3()
+                ),
+            )
+            assertion_data = await oov3_contract.functions.getAssertion(
+                assertion_id
+            ).call()
+            return assertion_data[9]
+        except Exception as e:
+            raise ValueError(f"Failed to get assertion details: {str(e)}")
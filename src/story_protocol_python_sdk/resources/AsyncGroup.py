@@ -0,0 +1,251 @@
+"""Module for managing groups over an AsyncWeb3."""
+
+import asyncio
+from functools import cached_property
+
+from ens.ens import Address
+from web3 import AsyncWeb3
+
+from story_protocol_python_sdk.abi.DisputeModule.DisputeModule_client import (
+    DisputeModuleClient,
+)
+from story_protocol_python_sdk.abi.GroupingModule.GroupingModule_client import (
+    GroupingModuleClient,
+)
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import (
+    IPAssetRegistryClient,
+)
+from story_protocol_python_sdk.abi.LicenseRegistry.LicenseRegistry_client import (
+    LicenseRegistryClient,
+)
+from story_protocol_python_sdk.abi.LicenseToken.LicenseToken_client import (
+    LicenseTokenClient,
+)
+from story_protocol_python_sdk.resources.Group import Group
+from story_protocol_python_sdk.types.common import RevShareType
+from story_protocol_python_sdk.utils.async_transaction_utils import (
+    async_build_and_send_transaction,
+)
+from story_protocol_python_sdk.utils.validation import get_revenue_share
+
+
+class AsyncGroup:
+    """
+    A class to manage groups on Story Protocol, the async counterpart of
+    :class:`Group`.
+
+    :param web3 AsyncWeb3: An instance of AsyncWeb3.
+    :param account: The account to use for transactions.
+    :param chain_id int: The ID of the blockchain network.
+    """
+
+    def __init__(self, web3: AsyncWeb3, account, chain_id: int):
+        self.web3 = web3
+        self.account = account
+        self.chain_id = chain_id
+
+    @cached_property
+    def grouping_module_client(self) -> GroupingModuleClient:
+        return GroupingModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def ip_asset_registry_client(self) -> IPAssetRegistryClient:
+        return IPAssetRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def dispute_module_client(self) -> DisputeModuleClient:
+        return DisputeModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def license_registry_client(self) -> LicenseRegistryClient:
+        return LicenseRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def license_token_client(self) -> LicenseTokenClient:
+        return LicenseTokenClient(self.web3, self.chain_id)
+
+    # Receipts are parsed without network calls, exactly as in Group.
+    _parse_tx_ip_group_registered_event = Group._parse_tx_ip_group_registered_event
+
+    async def register_group(
+        self, group_pool: str, tx_options: dict | None = None
+    ) -> dict:
+        """
+        Registers a Group IPA.
+
+        :param group_pool str: The address of the group pool.
+        :param tx_options dict: [Optional] The transaction options.
+        :return dict: A dictionary with the transaction hash and group ID.
+        """
+        try:
+            if not self.web3.is_address(group_pool):
+                raise ValueError(f'Address "{group_pool}" is invalid.')
+
+            response = await async_build_and_send_transaction(
+                self.web3,
+                self.account,
+                self.grouping_module_client.build_registerGroup_transaction,
+                group_pool,
+                tx_options=tx_options,
+            )
+
+            group_id = self._parse_tx_ip_group_registered_event(response["tx_receipt"])
+
+            return {"tx_hash": response["tx_hash"], "group_id": group_id}
+
+        except Exception as e:
+            raise ValueError(f"Failed to register group: {str(e)}")
+
+    async def add_ips_to_group(
+        self,
+        group_ip_id: str,
+        ip_ids: list,
+        max_allowed_reward_share_percentage: int = 100,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Add IPs to an existing group IP.
+
+        The dispute and group checks of every IP are sent concurrently.
+
+        :param group_ip_id str: The ID of the group IP.
+        :param ip_ids list: List of IP IDs to add to the group.
+        :param max_allowed_reward_share_percentage int: [Optional] Maximum allowed reward share percentage (0-100). Default is 100.
+        :param tx_options dict: [Optional] The transaction options.
+        :return dict: A dictionary with the transaction hash.
+        """
+        try:
+            if not self.web3.is_address(group_ip_id):
+                raise ValueError(f'Group IP ID "{group_ip_id}" is invalid.')
+
+            for ip_id in ip_ids:
+                if not self.web3.is_address(ip_id):
+                    raise ValueError(f'IP ID "{ip_id}" is invalid.')
+
+            is_group_tagged, *checks = await asyncio.gather(
+                self.dispute_module_client.isIpTagged(group_ip_id),
+                *(self.dispute_module_client.isIpTagged(ip_id) for ip_id in ip_ids),
+                *(
+                    self.ip_asset_registry_client.isRegisteredGroup(ip_id)
+                    for ip_id in ip_ids
+                ),
+            )
+            if is_group_tagged:
+                raise ValueError(
+                    f'Disputed group cannot add IP: group "{group_ip_id}" is tagged by dispute module.'
+                )
+            is_tagged, is_group = checks[: len(ip_ids)], checks[len(ip_ids) :]
+            for ip_id, ip_is_tagged, ip_is_group in zip(ip_ids, is_tagged, is_group):
+                if ip_is_tagged:
+                    raise ValueError(
+                        f'Cannot add disputed IP to group: IP "{ip_id}" is tagged by dispute module.'
+                    )
+                if ip_is_group:
+                    raise ValueError(
+                        f'Cannot add group to group: IP "{ip_id}" is a registered group.'
+                    )
+
+            response = await async_build_and_send_transaction(
+                self.web3,
+                self.account,
+                self.grouping_module_client.build_addIp_transaction,
+                group_ip_id,
+                ip_ids,
+                get_revenue_share(
+                    max_allowed_reward_share_percentage,
+                    type=RevShareType.MAX_ALLOWED_REWARD_SHARE,
+                ),
+                tx_options=tx_options,
+            )
+
+            result = {"tx_hash": response["tx_hash"]}
+            if "tx_receipt" in response:
+                result["tx_receipt"] = response["tx_receipt"]
+            return result
+
+        except Exception as e:
+            raise ValueError(f"Failed to add IP to group: {str(e)}")
+
+    async def remove_ips_from_group(
+        self,
+        group_ip_id: str,
+        ip_ids: list,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Remove IPs from a group IP.
+
+        :param group_ip_id str: The ID of the group IP.
+        :param ip_ids list: List of IP IDs to remove from the group.
+        :param tx_options dict: [Optional] The transaction options.
+        :return dict: A dictionary with the transaction hash.
+        """
+        try:
+            if not self.web3.is_address(group_ip_id):
+                raise ValueError(f'Group IP ID "{group_ip_id}" is invalid.')
+
+            for ip_id in ip_ids:
+                if not self.web3.is_address(ip_id):
+                    raise ValueError(f'IP ID "{ip_id}" is invalid.')
+
+            has_derivative_ips, total_tokens = await asyncio.gather(
+                self.license_registry_client.hasDerivativeIps(group_ip_id),
+                self.license_token_client.getTotalTokensByLicensor(group_ip_id),
+            )
+            if has_derivative_ips:
+                raise ValueError(
+                    f'Group frozen: group "{group_ip_id}" has derivative IPs and cannot remove members.'
+                )
+            if total_tokens > 0:
+                raise ValueError(
+                    f'Group frozen: group "{group_ip_id}" has already minted license tokens and cannot remove members.'
+                )
+
+            response = await async_build_and_send_transaction(
+                self.web3,
+                self.account,
+                self.grouping_module_client.build_removeIp_transaction,
+                group_ip_id,
+                ip_ids,
+                tx_options=tx_options,
+            )
+
+            result = {"tx_hash": response["tx_hash"]}
+            if "tx_receipt" in response:
+                result["tx_receipt"] = response["tx_receipt"]
+            return result
+
+        except Exception as e:
+            raise ValueError(f"Failed to remove IPs from group: {str(e)}")
+
+    async def get_claimable_reward(
+        self,
+        group_ip_id: Address,
+        currency_token: Address,
+        member_ip_ids: list[Address],
+    ) -> list[int]:
+        """
+        Returns the available reward for each IP in the group.
+
+        :param group_ip_id Address: The ID of the group IP.
+        :param currency_token Address: The address of the currency (revenue) token to check.
+        :param member_ip_ids list[Address]: The IDs of the member IPs to check claimable rewards for.
+        :return list[int]: A list of claimable reward amounts corresponding to each member IP ID.
+        """
+        try:
+            if not self.web3.is_address(group_ip_id):
+                raise ValueError(f"Invalid group IP ID: {group_ip_id}")
+            if not self.web3.is_address(currency_token):
+                raise ValueError(f"Invalid currency token: {currency_token}")
+            for ip_id in member_ip_ids:
+                if not self.web3.is_address(ip_id):
+                    raise ValueError(f"Invalid member IP ID: {ip_id}")
+
+            return await self.grouping_module_client.getClaimableReward(
+                groupId=group_ip_id,
+                token=currency_token,
+                ipIds=member_ip_ids,
+            )
+
+        except Exception as e:
+            raise ValueError(f"Failed to get claimable rewards: {str(e)}")
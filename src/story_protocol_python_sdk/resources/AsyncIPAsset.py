@@ -0,0 +1,275 @@
+"""Module for registering IP Assets over an AsyncWeb3."""
+
+from functools import cached_property
+
+from ens.ens import HexStr
+from web3 import AsyncWeb3, Web3
+
+from story_protocol_python_sdk.abi.CoreMetadataModule.CoreMetadataModule_client import (
+    CoreMetadataModuleClient,
+)
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import (
+    IPAssetRegistryClient,
+)
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_encoders import (
+    encode_register,
+)
+from story_protocol_python_sdk.abi.RegistrationWorkflows.RegistrationWorkflows_client import (
+    RegistrationWorkflowsClient,
+)
+from story_protocol_python_sdk.abi.RegistrationWorkflows.RegistrationWorkflows_encoders import (
+    encode_registerIp,
+)
+from story_protocol_python_sdk.abi.RoyaltyModule.RoyaltyModule_client import (
+    RoyaltyModuleClient,
+)
+from story_protocol_python_sdk.resources.IPAsset import IPAsset
+from story_protocol_python_sdk.types.common import AccessPermission
+from story_protocol_python_sdk.utils.async_transaction_utils import (
+    async_build_and_send_transaction,
+)
+from story_protocol_python_sdk.utils.constants import ZERO_HASH
+from story_protocol_python_sdk.utils.ip_id_derivation import get_ip_id_deriver
+from story_protocol_python_sdk.utils.ip_metadata import is_initial_ip_metadata
+from story_protocol_python_sdk.utils.sign import Sign
+
+
+class AsyncIPAsset:
+    """
+    AsyncIPAsset registers IP Assets with Story Protocol, the async
+    counterpart of :class:`IPAsset`.
+
+    :param web3 AsyncWeb3: An instance of AsyncWeb3.
+    :param account: The account to use for transactions.
+    :param chain_id int: The ID of the blockchain network.
+    """
+
+    def __init__(self, web3: AsyncWeb3, account, chain_id: int):
+        self.web3 = web3
+        self.account = account
+        self.chain_id = chain_id
+
+    @cached_property
+    def ip_asset_registry_client(self) -> IPAssetRegistryClient:
+        return IPAssetRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def registration_workflows_client(self) -> RegistrationWorkflowsClient:
+        return RegistrationWorkflowsClient(self.web3, self.chain_id)
+
+    @cached_property
+    def core_metadata_module_client(self) -> CoreMetadataModuleClient:
+        return CoreMetadataModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def royalty_module_client(self) -> RoyaltyModuleClient:
+        return RoyaltyModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def sign_util(self) -> Sign:
+        return Sign(self.web3, self.chain_id, self.account)
+
+    # Receipts are parsed and recipients validated without network calls,
+    # exactly as in IPAsset.
+    _parse_tx_ip_registered_event = IPAsset._parse_tx_ip_registered_event
+    _validate_recipient = IPAsset._validate_recipient
+    get_royalty_vault_address_by_ip_id = IPAsset.get_royalty_vault_address_by_ip_id
+
+    async def _get_ip_id(self, token_contract: str, token_id: int) -> str:
+        """
+        Get the IP ID for a given token.
+
+        :param token_contract str: The NFT contract address.
+        :param token_id int: The token identifier.
+        :return str: The IP ID.
+        """
+        deriver = get_ip_id_deriver(self.web3, self.chain_id)
+        if deriver is not None:
+            return deriver.ip_id(self.chain_id, token_contract, token_id)
+        return await self.ip_asset_registry_client.ipId(
+            self.chain_id, token_contract, token_id
+        )
+
+    async def is_registered(self, ip_id: str) -> bool:
+        """
+        Check if an IP is registered.
+
+        :param ip_id str: The IP ID to check.
+        :return bool: True if registered, False otherwise.
+        :raises ValueError: If the ip_id is empty or has invalid format.
+        """
+        if not ip_id:
+            raise ValueError("is_registered: ip_id is required")
+
+        if not self.web3.is_address(ip_id):
+            raise ValueError(f"is_registered: invalid IP ID address format: {ip_id}")
+
+        return await self.ip_asset_registry_client.isRegistered(
+            self.web3.to_checksum_address(ip_id)
+        )
+
+    async def register(
+        self,
+        nft_contract: str,
+        token_id: int,
+        ip_metadata: dict | None = None,
+        deadline: int | None = None,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Register an NFT as IP, creating a corresponding IP record.
+
+        :param nft_contract str: The address of the NFT.
+        :param token_id int: The token identifier of the NFT.
+        :param ip_metadata dict: [Optional] Metadata for the IP.
+            :param ip_metadata_uri str: [Optional] Metadata URI for the IP.
+            :param ip_metadata_hash str: [Optional] Metadata hash for the IP.
+            :param nft_metadata_uri str: [Optional] Metadata URI for the NFT.
+            :param nft_metadata_hash str: [Optional] Metadata hash for the NFT.
+        :param deadline int: [Optional] Signature deadline in seconds. (default: 1000 seconds)
+        :param tx_options dict: [Optional] Transaction options.
+            :param encodedTxDataOnly bool: [Optional] If True, return only encoded transaction data without sending.
+        :return dict: Dictionary with the transaction hash and IP ID, or the encoded transaction data, whether it carries metadata and the IP ID if encodedTxDataOnly is True.
+        """
+        try:
+            tx_options = tx_options or {}
+            encoded_tx_data_only = tx_options.get("encodedTxDataOnly", False)
+
+            ip_id = await self._get_ip_id(nft_contract, token_id)
+            if not encoded_tx_data_only and await self.is_registered(ip_id):
+                return {"tx_hash": None, "ip_id": ip_id}
+
+            nft_contract = self.web3.to_checksum_address(nft_contract)
+            if not is_initial_ip_metadata(ip_metadata) and ip_metadata:
+                metadata = {
+                    "ipMetadataURI": ip_metadata.get("ip_metadata_uri", ""),
+                    "ipMetadataHash": ip_metadata.get("ip_metadata_hash", ZERO_HASH),
+                    "nftMetadataURI": ip_metadata.get("nft_metadata_uri", ""),
+                    "nftMetadataHash": ip_metadata.get("nft_metadata_hash", ZERO_HASH),
+                }
+                calculated_deadline = self.sign_util.get_deadline(deadline=deadline)
+                signature_response = self.sign_util.get_permission_signature(
+                    ip_id=ip_id,
+                    deadline=calculated_deadline,
+                    state=self.web3.to_bytes(hexstr=HexStr(ZERO_HASH)),
+                    permissions=[
+                        {
+                            "ipId": ip_id,
+                            "signer": self.registration_workflows_client.contract.address,
+                            "to": self.core_metadata_module_client.contract.address,
+                            "func": "setAll(address,string,bytes32,bytes32)",
+                            "permission": AccessPermission.ALLOW,
+                        }
+                    ],
+                )
+                sig_metadata = {
+                    "signer": self.web3.to_checksum_address(self.account.address),
+                    "deadline": calculated_deadline,
+                    "signature": signature_response["signature"],
+                }
+
+                if encoded_tx_data_only:
+                    encoded_data = Web3.to_hex(
+                        encode_registerIp(
+                            nft_contract, token_id, metadata, sig_metadata
+                        )
+                    )
+                    return {
+                        "encoded_tx_data": encoded_data,
+                        "has_metadata": True,
+                        "ip_id": ip_id,
+                    }
+
+                response = await async_build_and_send_transaction(
+                    self.web3,
+                    self.account,
+                    self.registration_workflows_client.build_registerIp_transaction,
+                    nft_contract,
+                    token_id,
+                    metadata,
+                    sig_metadata,
+                    tx_options=tx_options,
+                )
+            else:
+                if encoded_tx_data_only:
+                    encoded_data = Web3.to_hex(
+                        encode_register(self.chain_id, nft_contract, token_id)
+                    )
+                    return {
+                        "encoded_tx_data": encoded_data,
+                        "has_metadata": False,
+                        "ip_id": ip_id,
+                    }
+
+                response = await async_build_and_send_transaction(
+                    self.web3,
+                    self.account,
+                    self.ip_asset_registry_client.build_register_transaction,
+                    self.chain_id,
+                    nft_contract,
+                    token_id,
+                    tx_options=tx_options,
+                )
+
+            ip_registered = self._parse_tx_ip_registered_event(response["tx_receipt"])[
+                0
+            ]
+
+            return {"tx_hash": response["tx_hash"], "ip_id": ip_registered["ip_id"]}
+
+        except Exception as e:
+            raise ValueError(f"Failed to register IP: {str(e)}")
+
+    async def mint_and_register_ip(
+        self,
+        spg_nft_contract: str,
+        recipient: str | None = None,
+        ip_metadata: dict | None = None,
+        allow_duplicates: bool = True,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Mint an NFT from a SPGNFT collection and register it with metadata as an IP.
+
+        :param spg_nft_contract str: The address of the SPGNFT collection.
+        :param recipient str: [Optional] The address of the recipient of the minted NFT,
+            default value is your wallet address.
+        :param ip_metadata dict: [Optional] The desired metadata for the newly minted NFT
+            and newly registered IP.
+        :param allow_duplicates bool: Set to true to allow minting an NFT with a duplicate
+            metadata hash.
+        :param tx_options dict: [Optional] The transaction options.
+        :return dict: A dictionary with the transaction hash, IP ID and token ID.
+        """
+        try:
+            ip_metadata = ip_metadata or {}
+            metadata = {
+                "ipMetadataURI": ip_metadata.get("ip_metadata_uri", ""),
+                "ipMetadataHash": ip_metadata.get("ip_metadata_hash", ZERO_HASH),
+                "nftMetadataURI": ip_metadata.get("nft_metadata_uri", ""),
+                "nftMetadataHash": ip_metadata.get("nft_metadata_hash", ZERO_HASH),
+            }
+
+            response = await async_build_and_send_transaction(
+                self.web3,
+                self.account,
+                self.registration_workflows_client.build_mintAndRegisterIp_transaction,
+                spg_nft_contract,
+                self._validate_recipient(recipient),
+                metadata,
+                allow_duplicates,
+                tx_options=tx_options,
+            )
+
+            ip_registered = self._parse_tx_ip_registered_event(response["tx_receipt"])[
+                0
+            ]
+
+            return {
+                "tx_hash": response["tx_hash"],
+                "ip_id": ip_registered["ip_id"],
+                "token_id": ip_registered["token_id"],
+            }
+
+        except Exception as e:
+            raise ValueError(f"Failed to mint and register IP: {str(e)}")
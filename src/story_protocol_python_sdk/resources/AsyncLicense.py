@@ -0,0 +1,408 @@
+"""Module for managing licenses over an AsyncWeb3."""
+
+import asyncio
+from dataclasses import asdict, replace
+from functools import cached_property
+
+from ens.ens import Address, HexStr
+from web3 import AsyncWeb3, Web3
+
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import (
+    IPAssetRegistryClient,
+)
+from story_protocol_python_sdk.abi.LicenseRegistry.LicenseRegistry_client import (
+    LicenseRegistryClient,
+)
+from story_protocol_python_sdk.abi.LicensingModule.LicensingModule_client import (
+    LicensingModuleClient,
+)
+from story_protocol_python_sdk.abi.PILicenseTemplate.PILicenseTemplate_client import (
+    PILicenseTemplateClient,
+)
+from story_protocol_python_sdk.abi.RoyaltyModule.RoyaltyModule_client import (
+    RoyaltyModuleClient,
+)
+from story_protocol_python_sdk.resources.License import License
+from story_protocol_python_sdk.types.common import RevShareType
+from story_protocol_python_sdk.types.resource.License import LicenseTermsInput
+from story_protocol_python_sdk.utils.async_transaction_utils import (
+    async_build_and_send_transaction,
+)
+from story_protocol_python_sdk.utils.constants import ZERO_ADDRESS
+from story_protocol_python_sdk.utils.license_terms_cache import get_license_terms_cache
+from story_protocol_python_sdk.utils.licensing_config_data import (
+    LicensingConfig,
+    LicensingConfigData,
+)
+from story_protocol_python_sdk.utils.pil_flavor import PILFlavor
+from story_protocol_python_sdk.utils.util import convert_dict_keys_to_camel_case
+from story_protocol_python_sdk.utils.validation import (
+    get_revenue_share,
+    validate_address,
+)
+
+
+class AsyncLicense:
+    """
+    A class to manage licenses on Story Protocol, the async counterpart of
+    :class:`License`.
+
+    :param web3 AsyncWeb3: An instance of AsyncWeb3.
+    :param account: The account to use for transactions.
+    :param chain_id int: The ID of the blockchain network.
+    """
+
+    def __init__(self, web3: AsyncWeb3, account, chain_id: int):
+        self.web3 = web3
+        self.account = account
+        self.chain_id = chain_id
+
+    @cached_property
+    def license_template_client(self) -> PILicenseTemplateClient:
+        return PILicenseTemplateClient(self.web3, self.chain_id)
+
+    @cached_property
+    def license_registry_client(self) -> LicenseRegistryClient:
+        return LicenseRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def licensing_module_client(self) -> LicensingModuleClient:
+        return LicensingModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def ip_asset_registry_client(self) -> IPAssetRegistryClient:
+        return IPAssetRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def royalty_module_client(self) -> RoyaltyModuleClient:
+        return RoyaltyModuleClient(self.web3, self.chain_id)
+
+    # Receipts are parsed without network calls, exactly as in License.
+    _parse_tx_license_terms_registered_event = (
+        License._parse_tx_license_terms_registered_event
+    )
+    _parse_tx_license_tokens_minted_event = (
+        License._parse_tx_license_tokens_minted_event
+    )
+
+    async def register_pil_terms(
+        self,
+        transferable: bool,
+        royalty_policy: str,
+        default_minting_fee: int,
+        expiration: int,
+        commercial_use: bool,
+        commercial_attribution: bool,
+        commercializer_checker: str,
+        commercializer_checker_data: HexStr,
+        commercial_rev_share: int,
+        commercial_rev_ceiling: int,
+        derivatives_allowed: bool,
+        derivatives_attribution: bool,
+        derivatives_approval: bool,
+        derivatives_reciprocal: bool,
+        derivative_rev_ceiling: int,
+        currency: str,
+        uri: str,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Registers new license terms and returns the ID of the newly registered license terms.
+
+        Takes the same arguments as :meth:`License.register_pil_terms`.
+
+        :return dict: A dictionary with the transaction hash and license terms ID.
+        """
+        license_terms = PILFlavor.validate_license_terms(
+            LicenseTermsInput(
+                transferable=transferable,
+                royalty_policy=royalty_policy,
+                default_minting_fee=default_minting_fee,
+                expiration=expiration,
+                commercial_use=commercial_use,
+                commercial_attribution=commercial_attribution,
+                commercializer_checker=commercializer_checker,
+                commercializer_checker_data=commercializer_checker_data,
+                commercial_rev_share=commercial_rev_share,
+                commercial_rev_ceiling=commercial_rev_ceiling,
+                derivatives_allowed=derivatives_allowed,
+                derivatives_attribution=derivatives_attribution,
+                derivatives_approval=derivatives_approval,
+                derivatives_reciprocal=derivatives_reciprocal,
+                derivative_rev_ceiling=derivative_rev_ceiling,
+                currency=currency,
+                uri=uri,
+            )
+        )
+        license_terms = replace(
+            license_terms,
+            commercial_rev_share=get_revenue_share(license_terms.commercial_rev_share),
+        )
+        if (
+            license_terms.royalty_policy != ZERO_ADDRESS
+            and not await self.royalty_module_client.isWhitelistedRoyaltyPolicy(
+                license_terms.royalty_policy
+            )
+        ):
+            raise ValueError("The royalty_policy is not whitelisted.")
+
+        if (
+            license_terms.currency != ZERO_ADDRESS
+            and not await self.royalty_module_client.isWhitelistedRoyaltyToken(
+                license_terms.currency
+            )
+        ):
+            raise ValueError("The currency is not whitelisted.")
+
+        camel_case_license_terms = convert_dict_keys_to_camel_case(
+            asdict(license_terms)
+        )
+        cache = get_license_terms_cache(self.web3)
+        license_template = self.license_template_client.contract.address
+        license_terms_id = (
+            cache.get_terms_id(license_template, camel_case_license_terms)
+            if cache is not None
+            else None
+        )
+        if license_terms_id is None:
+            license_terms_id = await self.license_template_client.getLicenseTermsId(
+                camel_case_license_terms
+            )
+            if cache is not None:
+                cache.put(license_template, license_terms_id, camel_case_license_terms)
+        if (license_terms_id is not None) and (license_terms_id != 0):
+            return {"license_terms_id": license_terms_id}
+
+        response = await async_build_and_send_transaction(
+            self.web3,
+            self.account,
+            self.license_template_client.build_registerLicenseTerms_transaction,
+            camel_case_license_terms,
+            tx_options=tx_options,
+        )
+        return {
+            "tx_hash": response["tx_hash"],
+            "license_terms_id": self._parse_tx_license_terms_registered_event(
+                response["tx_receipt"]
+            ),
+        }
+
+    async def attach_license_terms(
+        self,
+        ip_id: str,
+        license_template: str,
+        license_terms_id: int,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Attaches license terms to an IP.
+
+        :param ip_id str: The address of the IP to which the license terms are attached.
+        :param license_template str: The address of the license template.
+        :param license_terms_id int: The ID of the license terms.
+        :param tx_options dict: [Optional] The transaction options.
+        :return dict: A dictionary with the transaction hash.
+        """
+        if not Web3.is_address(license_template):
+            raise ValueError(f'Address "{license_template}" is invalid.')
+
+        is_registered, is_existed, is_attached_license_terms = await asyncio.gather(
+            self.ip_asset_registry_client.isRegistered(ip_id),
+            self.license_registry_client.exists(license_template, license_terms_id),
+            self.license_registry_client.hasIpAttachedLicenseTerms(
+                ip_id, license_template, license_terms_id
+            ),
+        )
+        if not is_registered:
+            raise ValueError(f"The IP with id {ip_id} is not registered.")
+        if not is_existed:
+            raise ValueError(f"License terms id {license_terms_id} do not exist.")
+        if is_attached_license_terms:
+            raise ValueError(
+                f"License terms id {license_terms_id} is already attached to the IP with id {ip_id}."
+            )
+
+        response = await async_build_and_send_transaction(
+            self.web3,
+            self.account,
+            self.licensing_module_client.build_attachLicenseTerms_transaction,
+            ip_id,
+            license_template,
+            license_terms_id,
+            tx_options=tx_options,
+        )
+
+        return {"tx_hash": response["tx_hash"]}
+
+    async def mint_license_tokens(
+        self,
+        licensor_ip_id: str,
+        license_template: str,
+        license_terms_id: int,
+        amount: int,
+        receiver: str,
+        max_minting_fee: int = 0,
+        max_revenue_share: int = 100,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Mints license tokens for the license terms attached to an IP.
+
+        :param licensor_ip_id str: The licensor IP ID.
+        :param license_template str: The address of the license template.
+        :param license_terms_id int: The ID of the license terms within the license template.
+        :param amount int: The amount of license tokens to mint.
+        :param receiver str: The address of the receiver.
+        :param max_minting_fee int: [Optional] The maximum minting fee that the caller is willing to pay. If set to 0 then no limit. (default: 0)
+        :param max_revenue_share int: [Optional] The maximum revenue share percentage allowed for minting the License Tokens. (default: 100)
+        :param tx_options dict: [Optional] The transaction options.
+        :return dict: A dictionary with the transaction hash and the license token IDs.
+        """
+        validate_address(license_template)
+        validate_address(receiver)
+        is_registered, is_existed, is_attached_license_terms = await asyncio.gather(
+            self.ip_asset_registry_client.isRegistered(licensor_ip_id),
+            self.license_template_client.exists(license_terms_id),
+            self.license_registry_client.hasIpAttachedLicenseTerms(
+                licensor_ip_id, license_template, license_terms_id
+            ),
+        )
+        if not is_registered:
+            raise ValueError(
+                f"The licensor IP with id {licensor_ip_id} is not registered."
+            )
+        if not is_existed:
+            raise ValueError(f"License terms id {license_terms_id} do not exist.")
+        if not is_attached_license_terms:
+            raise ValueError(
+                f"License terms id {license_terms_id} is not attached to the IP with id {licensor_ip_id}."
+            )
+
+        response = await async_build_and_send_transaction(
+            self.web3,
+            self.account,
+            self.licensing_module_client.build_mintLicenseTokens_transaction,
+            licensor_ip_id,
+            license_template,
+            license_terms_id,
+            amount,
+            receiver,
+            ZERO_ADDRESS,  # Zero address for royalty context
+            max_minting_fee,
+            get_revenue_share(max_revenue_share, RevShareType.MAX_REVENUE_SHARE),
+            tx_options=tx_options,
+        )
+
+        return {
+            "tx_hash": response["tx_hash"],
+            "license_token_ids": self._parse_tx_license_tokens_minted_event(
+                response["tx_receipt"]
+            ),
+        }
+
+    async def get_license_terms(self, selected_license_terms_id: int) -> dict:
+        """
+        Gets License Terms of the given ID.
+
+        :param selected_license_terms_id int: The ID of the license terms to retrieve.
+        :return dict: An object containing all of the selected license terms.
+        """
+        try:
+            cache = get_license_terms_cache(self.web3)
+            if cache is None:
+                return await self.license_template_client.getLicenseTerms(
+                    selected_license_terms_id
+                )
+            license_template = self.license_template_client.contract.address
+            license_terms = cache.get_terms(license_template, selected_license_terms_id)
+            if license_terms is None:
+                license_terms = await self.license_template_client.getLicenseTerms(
+                    selected_license_terms_id
+                )
+                cache.put(license_template, selected_license_terms_id, license_terms)
+            return license_terms
+        except Exception as e:
+            raise ValueError(f"Failed to get license terms: {str(e)}")
+
+    async def predict_minting_license_fee(
+        self,
+        licensor_ip_id: str,
+        license_terms_id: int,
+        amount: int,
+        license_template: str | None = None,
+        receiver: str | None = None,
+    ) -> dict:
+        """
+        Pre-compute the minting license fee for the given IP and license terms.
+
+        :param licensor_ip_id str: The IP ID of the licensor.
+        :param license_terms_id int: The ID of the license terms.
+        :param amount int: The amount of license tokens to mint.
+        :param license_template str: [Optional] The address of the license template, default is Programmable IP License.
+        :param receiver str: [Optional] The address of the receiver, default is your wallet address.
+        :return dict: A dictionary containing the currency token and token amount.
+        """
+        try:
+            is_registered, is_existed = await asyncio.gather(
+                self.ip_asset_registry_client.isRegistered(licensor_ip_id),
+                self.license_template_client.exists(license_terms_id),
+            )
+            if not is_registered:
+                raise ValueError(
+                    f"The licensor IP with id {licensor_ip_id} is not registered."
+                )
+            if not is_existed:
+                raise ValueError(f"License terms id {license_terms_id} does not exist.")
+
+            response = await self.licensing_module_client.predictMintingLicenseFee(
+                self.web3.to_checksum_address(licensor_ip_id),
+                (
+                    self.web3.to_checksum_address(license_template)
+                    if license_template
+                    else self.license_template_client.contract.address
+                ),
+                license_terms_id,
+                amount,
+                (
+                    self.web3.to_checksum_address(receiver)
+                    if receiver
+                    else self.account.address
+                ),
+                ZERO_ADDRESS,  # Zero address for royalty context
+            )
+
+            return {"currency": response[0], "amount": response[1]}
+
+        except Exception as e:
+            raise ValueError(f"Failed to predict minting license fee: {str(e)}")
+
+    async def get_licensing_config(
+        self,
+        ip_id: Address,
+        license_terms_id: int,
+        license_template: Address | None = None,
+    ) -> LicensingConfig:
+        """
+        Gets the licensing configuration for a specific license terms of an IP.
+
+        :param ip_id Address: The address of the IP for which the configuration is being retrieved.
+        :param license_terms_id int: The ID of the license terms within the license template.
+        :param license_template Address: [Optional] The address of the license template.
+        :return LicensingConfig: A dictionary containing the licensing configuration.
+        """
+        try:
+            validate_address(ip_id)
+
+            if license_template is None:
+                license_template = self.license_template_client.contract.address
+            else:
+                validate_address(license_template)
+
+            licensing_config = await self.license_registry_client.getLicensingConfig(
+                ip_id, license_template, license_terms_id
+            )
+
+            return LicensingConfigData.from_tuple(licensing_config)
+
+        except Exception as e:
+            raise ValueError(f"Failed to get licensing config: {str(e)}")
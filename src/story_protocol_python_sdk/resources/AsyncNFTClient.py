@@ -0,0 +1,142 @@
+"""Module for creating SPG NFT collections over an AsyncWeb3."""
+
+from web3 import AsyncWeb3
+
+from story_protocol_python_sdk.abi.RegistrationWorkflows.RegistrationWorkflows_client import (
+    RegistrationWorkflowsClient,
+)
+from story_protocol_python_sdk.abi.SPGNFTImpl.SPGNFTImpl_client import SPGNFTImplClient
+from story_protocol_python_sdk.resources.NFTClient import NFTClient
+from story_protocol_python_sdk.utils.async_transaction_utils import (
+    async_build_and_send_transaction,
+)
+from story_protocol_python_sdk.utils.constants import ZERO_ADDRESS
+from story_protocol_python_sdk.utils.write_once_cache import (
+    MINT_FEE_TOKEN_TTL,
+    async_cached_read,
+)
+
+
+class AsyncNFTClient:
+    """
+    AsyncNFTClient handles the creation of SPG NFT collections, the async
+    counterpart of :class:`NFTClient`.
+
+    :param web3 AsyncWeb3: An instance of AsyncWeb3.
+    :param account: The account to use for transactions.
+    :param chain_id int: The ID of the blockchain network.
+    """
+
+    def __init__(self, web3: AsyncWeb3, account, chain_id: int):
+        self.web3 = web3
+        self.account = account
+        self.chain_id = chain_id
+
+        self.registration_workflows_client = RegistrationWorkflowsClient(web3, chain_id)
+
+    async def create_nft_collection(
+        self,
+        name: str,
+        symbol: str,
+        is_public_minting: bool,
+        mint_open: bool,
+        mint_fee_recipient: str,
+        contract_uri: str,
+        base_uri: str = "",
+        max_supply: int | None = None,
+        mint_fee: int | None = None,
+        mint_fee_token: str | None = None,
+        owner: str | None = None,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Creates a new SPG NFT Collection.
+
+        :param name str: The name of the collection.
+        :param symbol str: The symbol of the collection.
+        :param is_public_minting bool: If true, anyone can mint from the collection. If false, only addresses with minter role can mint.
+        :param mint_open bool: Whether the collection is open for minting on creation.
+        :param mint_fee_recipient str: The address to receive mint fees.
+        :param contract_uri str: The contract URI for the collection. Follows ERC-7572 standard.
+        :param base_uri str: [Optional] The base URI for the collection. If not empty, tokenURI will be either baseURI + token ID or baseURI + nftMetadataURI.
+        :param max_supply int: [Optional] The maximum supply of the collection.
+        :param mint_fee int: [Optional] The cost to mint a token.
+        :param mint_fee_token str: [Optional] The token to mint.
+        :param owner str: [Optional] The owner of the collection.
+        :param tx_options dict: [Optional] The transaction options.
+        :return dict: A dictionary with the transaction hash and collection address.
+        """
+        if mint_fee is not None and (
+            mint_fee < 0 or not self.web3.is_address(mint_fee_token or "")
+        ):
+            raise ValueError(
+                "Invalid mint fee token address, mint fee is greater than 0."
+            )
+
+        spg_nft_init_params = {
+            "name": name,
+            "symbol": symbol,
+            "baseURI": base_uri or "",
+            "maxSupply": max_supply if max_supply is not None else 2**32 - 1,
+            "mintFee": mint_fee if mint_fee is not None else 0,
+            "mintFeeToken": (
+                mint_fee_token if mint_fee_token is not None else ZERO_ADDRESS
+            ),
+            "owner": owner if owner else self.account.address,
+            "mintFeeRecipient": self.web3.to_checksum_address(mint_fee_recipient),
+            "mintOpen": mint_open,
+            "isPublicMinting": is_public_minting,
+            "contractURI": contract_uri,
+        }
+
+        response = await async_build_and_send_transaction(
+            self.web3,
+            self.account,
+            self.registration_workflows_client.build_createCollection_transaction,
+            spg_nft_init_params,
+            tx_options=tx_options,
+        )
+
+        collection_address = self._parse_tx_collection_created_event(
+            response["tx_receipt"]
+        )
+
+        return {"tx_hash": response["tx_hash"], "nft_contract": collection_address}
+
+    # Receipts are parsed without network calls, exactly as in NFTClient.
+    _parse_tx_collection_created_event = NFTClient._parse_tx_collection_created_event
+
+    async def get_mint_fee_token(self, nft_contract: str) -> str:
+        """
+        Returns the current mint fee token of the collection.
+
+        :param nft_contract str: The address of the NFT contract.
+        :return str: The address of the mint fee token.
+        """
+        try:
+            spg_nft_client = SPGNFTImplClient(
+                self.web3, contract_address=self.web3.to_checksum_address(nft_contract)
+            )
+            return await async_cached_read(
+                self.web3,
+                ("mintFeeToken", spg_nft_client.contract.address),
+                spg_nft_client.mintFeeToken,
+                positive_ttl=MINT_FEE_TOKEN_TTL,
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to get mint fee token: {str(e)}")
+
+    async def get_mint_fee(self, nft_contract: str) -> int:
+        """
+        Returns the current mint fee of the collection.
+
+        :param nft_contract str: The address of the NFT contract.
+        :return int: The mint fee amount.
+        """
+        try:
+            spg_nft_client = SPGNFTImplClient(
+                self.web3, contract_address=self.web3.to_checksum_address(nft_contract)
+            )
+            return await spg_nft_client.mintFee()
+        except Exception as e:
+            raise ValueError(f"Failed to get mint fee: {str(e)}")
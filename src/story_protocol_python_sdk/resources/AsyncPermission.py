@@ -0,0 +1,149 @@
+"""Module for managing IP account permissions over an AsyncWeb3."""
+
+from functools import cached_property
+
+from web3 import AsyncWeb3, Web3
+
+from story_protocol_python_sdk.abi.AccessController.AccessController_client import (
+    AccessControllerClient,
+)
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import (
+    IPAssetRegistryClient,
+)
+from story_protocol_python_sdk.resources.AsyncIPAccount import AsyncIPAccount
+from story_protocol_python_sdk.types.common import AccessPermission
+from story_protocol_python_sdk.utils.constants import DEFAULT_FUNCTION_SELECTOR
+from story_protocol_python_sdk.utils.validation import validate_address
+
+
+class AsyncPermission:
+    """
+    A class to manage permissions for IP accounts, the async counterpart of
+    :class:`Permission`.
+
+    :param web3 AsyncWeb3: An instance of AsyncWeb3.
+    :param account: The account to use for transactions.
+    :param chain_id int: The ID of the blockchain network.
+    """
+
+    def __init__(self, web3: AsyncWeb3, account, chain_id: int):
+        self.web3 = web3
+        self.account = account
+        self.chain_id = chain_id
+
+    @cached_property
+    def ip_asset_registry_client(self) -> IPAssetRegistryClient:
+        return IPAssetRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def access_controller_client(self) -> AccessControllerClient:
+        return AccessControllerClient(self.web3, self.chain_id)
+
+    @cached_property
+    def ip_account(self) -> AsyncIPAccount:
+        return AsyncIPAccount(self.web3, self.account, self.chain_id)
+
+    async def set_permission(
+        self,
+        ip_id: str,
+        signer: str,
+        to: str,
+        permission: AccessPermission,
+        func: str = DEFAULT_FUNCTION_SELECTOR,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Sets the permission for a specific function call.
+
+        :param ip_id str: The IP ID of the IP account that grants the permission for `signer`.
+        :param signer str: The address that can call `to` on behalf of the `ip_id`.
+        :param to str: The address that can be called by the `signer`.
+        :param permission `AccessPermission`: The new permission level.
+        :param func str: [Optional] The function selector string of `to` that can be called by the `signer` on behalf of the `ipAccount`.
+        :param tx_options dict: [Optional] The transaction options.
+        :return dict: A dictionary with the transaction hash.
+        """
+        try:
+            validate_address(signer)
+            validate_address(to)
+
+            await self._check_is_registered(ip_id)
+
+            data = self.access_controller_client.contract.encode_abi(
+                abi_element_identifier="setPermission",
+                args=[
+                    self.web3.to_checksum_address(ip_id),
+                    self.web3.to_checksum_address(signer),
+                    self.web3.to_checksum_address(to),
+                    Web3.keccak(text=func)[:4] if func else b"\x00\x00\x00\x00",
+                    permission.value,
+                ],
+            )
+
+            response = await self.ip_account.execute(
+                to=self.access_controller_client.contract.address,
+                value=0,
+                ip_id=ip_id,
+                data=data,
+                tx_options=tx_options,
+            )
+
+            return {"tx_hash": response["tx_hash"]}
+
+        except Exception as e:
+            raise Exception(f"Failed to set permission for IP {ip_id}: {str(e)}")
+
+    async def set_all_permissions(
+        self,
+        ip_id: str,
+        signer: str,
+        permission: AccessPermission,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Sets permission to a signer for all functions across all modules.
+
+        :param ip_id str: The IP ID of the IP account that grants the permission.
+        :param signer str: The address that will receive the permissions.
+        :param permission `AccessPermission`: The new permission level.
+        :param tx_options dict: [Optional] The transaction options.
+        :return dict: A dictionary with the transaction hash.
+        """
+        try:
+            validate_address(signer)
+
+            await self._check_is_registered(ip_id)
+
+            data = self.access_controller_client.contract.encode_abi(
+                abi_element_identifier="setAllPermissions",
+                args=[
+                    self.web3.to_checksum_address(ip_id),
+                    self.web3.to_checksum_address(signer),
+                    permission.value,
+                ],
+            )
+
+            response = await self.ip_account.execute(
+                to=self.access_controller_client.contract.address,
+                value=0,
+                ip_id=ip_id,
+                data=data,
+                tx_options=tx_options,
+            )
+
+            return {"tx_hash": response["tx_hash"]}
+
+        except Exception as e:
+            raise Exception(
+                f"Failed to set all permissions for IP {ip_id} and signer {signer}: {str(e)}"
+            )
+
+    async def _check_is_registered(self, ip_id: str) -> None:
+        """
+        Check if an IP is registered.
+
+        :param ip_id str: The IP ID to check.
+        :raises ValueError: If the IP is not registered.
+        """
+        if not await self.ip_asset_registry_client.isRegistered(ip_id):
+            raise ValueError(f"IP id with {ip_id} is not registered.")
@@ -0,0 +1,200 @@
+"""Module for claiming and paying royalties over an AsyncWeb3."""
+
+import asyncio
+from copy import copy
+from functools import cached_property
+
+from web3 import AsyncWeb3
+
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import (
+    IPAssetRegistryClient,
+)
+from story_protocol_python_sdk.abi.IpRoyaltyVaultImpl.IpRoyaltyVaultImpl_client import (
+    IpRoyaltyVaultImplClient,
+)
+from story_protocol_python_sdk.abi.RoyaltyModule.RoyaltyModule_client import (
+    RoyaltyModuleClient,
+)
+from story_protocol_python_sdk.abi.RoyaltyPolicyLAP.RoyaltyPolicyLAP_client import (
+    RoyaltyPolicyLAPClient,
+)
+from story_protocol_python_sdk.abi.RoyaltyPolicyLRP.RoyaltyPolicyLRP_client import (
+    RoyaltyPolicyLRPClient,
+)
+from story_protocol_python_sdk.utils.async_transaction_utils import (
+    async_build_and_send_transaction,
+)
+from story_protocol_python_sdk.utils.constants import ZERO_ADDRESS
+from story_protocol_python_sdk.utils.contract_registry import get_contract_at
+from story_protocol_python_sdk.utils.write_once_cache import async_cached_read
+
+
+class AsyncRoyalty:
+    """
+    A class to claim and pay royalties on Story Protocol, the async
+    counterpart of :class:`Royalty`.
+
+    :param web3 AsyncWeb3: An instance of AsyncWeb3.
+    :param account: The account to use for transactions.
+    :param chain_id int: The ID of the blockchain network.
+    """
+
+    def __init__(self, web3: AsyncWeb3, account, chain_id: int):
+        self.web3 = web3
+        self.account = account
+        self.chain_id = chain_id
+
+    @cached_property
+    def ip_asset_registry_client(self) -> IPAssetRegistryClient:
+        return IPAssetRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def royalty_module_client(self) -> RoyaltyModuleClient:
+        return RoyaltyModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def royalty_policy_lap_client(self) -> RoyaltyPolicyLAPClient:
+        return RoyaltyPolicyLAPClient(self.web3, self.chain_id)
+
+    @cached_property
+    def royalty_policy_lrp_client(self) -> RoyaltyPolicyLRPClient:
+        return RoyaltyPolicyLRPClient(self.web3, self.chain_id)
+
+    async def get_royalty_vault_address(self, ip_id: str) -> str:
+        """
+        Get the royalty vault address for a given IP ID.
+
+        :param ip_id str: The IP ID.
+        :return str: The respective royalty vault address.
+        """
+
+        async def read_vault_address() -> str:
+            is_registered, vault_address = await asyncio.gather(
+                self.ip_asset_registry_client.isRegistered(ip_id),
+                self.royalty_module_client.ipRoyaltyVaults(ip_id),
+            )
+            if not is_registered:
+                raise ValueError(f"The IP with id {ip_id} is not registered.")
+            return vault_address
+
+        return await async_cached_read(
+            self.web3,
+            ("ipRoyaltyVaults", ip_id.lower()),
+            read_vault_address,
+            is_set=lambda vault_address: vault_address != ZERO_ADDRESS,
+        )
+
+    async def claimable_revenue(
+        self, royalty_vault_ip_id: str, claimer: str, token: str
+    ) -> int:
+        """
+        Calculates the amount of revenue token claimable by a token holder.
+
+        :param royalty_vault_ip_id str: The id of the royalty vault.
+        :param claimer str: The address of the royalty token holder.
+        :param token str: The revenue token to claim.
+        :return int: The claimable revenue amount.
+        """
+        proxy_address = await self.get_royalty_vault_address(royalty_vault_ip_id)
+        ip_royalty_vault_client = IpRoyaltyVaultImplClient(
+            self.web3, contract_address=proxy_address
+        )
+
+        return await ip_royalty_vault_client.claimableRevenue(
+            claimer=claimer, token=token
+        )
+
+    async def pay_royalty_on_behalf(
+        self,
+        receiver_ip_id: str,
+        payer_ip_id: str,
+        token: str,
+        amount: int,
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Allows the function caller to pay royalties to the receiver IP asset on behalf of the payer IP asset.
+
+        :param receiver_ip_id str: The IP ID that receives the royalties.
+        :param payer_ip_id str: The ID of the IP asset that pays the royalties.
+        :param token str: The token to use to pay the royalties.
+        :param amount int: The amount to pay.
+        :param tx_options dict: [Optional] The transaction options.
+        :return dict: A dictionary with the transaction hash.
+        """
+        is_receiver_registered, is_payer_registered = await asyncio.gather(
+            self.ip_asset_registry_client.isRegistered(receiver_ip_id),
+            self.ip_asset_registry_client.isRegistered(payer_ip_id),
+        )
+        if not is_receiver_registered:
+            raise ValueError(
+                f"The receiver IP with id {receiver_ip_id} is not registered."
+            )
+        if not is_payer_registered:
+            raise ValueError(f"The payer IP with id {payer_ip_id} is not registered.")
+
+        response = await async_build_and_send_transaction(
+            self.web3,
+            self.account,
+            self.royalty_module_client.build_payRoyaltyOnBehalf_transaction,
+            receiver_ip_id,
+            payer_ip_id,
+            token,
+            amount,
+            tx_options=tx_options,
+        )
+
+        return {"tx_hash": response["tx_hash"]}
+
+    async def transfer_to_vault(
+        self,
+        ip_id: str,
+        ancestor_ip_id: str,
+        token: str,
+        royalty_policy: str = "LAP",
+        tx_options: dict | None = None,
+    ) -> dict:
+        """
+        Transfers to vault an amount of revenue tokens claimable via a royalty policy.
+
+        :param ip_id str: The IP ID.
+        :param ancestor_ip_id str: The ancestor IP ID.
+        :param token str: The token address.
+        :param royalty_policy str: The royalty policy to use ("LAP", "LRP" or a policy address).
+        :param tx_options dict: [Optional] Transaction options.
+        :return dict: A dictionary with the transaction hash and receipt.
+        """
+        try:
+            if not self.web3.is_address(token):
+                raise ValueError(f'Token address "{token}" is invalid.')
+            royalty_policy_client: RoyaltyPolicyLAPClient | RoyaltyPolicyLRPClient
+            if royalty_policy == "LAP":
+                royalty_policy_client = self.royalty_policy_lap_client
+            elif royalty_policy == "LRP":
+                royalty_policy_client = self.royalty_policy_lrp_client
+            else:
+                if not self.web3.is_address(royalty_policy):
+                    raise ValueError(
+                        f'Royalty policy address "{royalty_policy}" is invalid.'
+                    )
+                royalty_policy_client = copy(self.royalty_policy_lap_client)
+                royalty_policy_client.contract = get_contract_at(
+                    self.web3,
+                    "RoyaltyPolicyLAP",
+                    self.web3.to_checksum_address(royalty_policy),
+                )
+
+            response = await async_build_and_send_transaction(
+                self.web3,
+                self.account,
+                royalty_policy_client.build_transferToVault_transaction,
+                ip_id,
+                ancestor_ip_id,
+                token,
+                tx_options=tx_options,
+            )
+
+            return {"tx_hash": response["tx_hash"], "receipt": response["tx_receipt"]}
+
+        except Exception as e:
+            raise ValueError(f"Failed to transfer to vault: {str(e)}")
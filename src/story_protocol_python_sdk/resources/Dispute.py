@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from eth_abi.abi import encode
 from web3 import Web3
 
@@ -14,6 +16,7 @@ from story_protocol_python_sdk.abi.WIP.WIP_client import WIPClient
 from story_protocol_python_sdk.resources.WIP import WIP
 from story_protocol_python_sdk.utils.ipfs import convert_cid_to_hash_ipfs
 from story_protocol_python_sdk.utils.oov3 import get_assertion_bond
+from story_protocol_python_sdk.utils.receipt_decoder import decode_receipt
 from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
 
 
@@ -31,10 +34,21 @@ class Dispute:
         self.account = account
         self.chain_id = chain_id
 
-        self.dispute_module_client = DisputeModuleClient(web3)
-        self.arbitration_policy_uma_client = ArbitrationPolicyUMAClient(web3)
-        self.wip = WIP(web3, account, chain_id)
-        self.wip_client = WIPClient(web3)
+    @cached_property
+    def dispute_module_client(self) -> DisputeModuleClient:
+        return DisputeModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def arbitration_policy_uma_client(self) -> ArbitrationPolicyUMAClient:
+        return ArbitrationPolicyUMAClient(self.web3, self.chain_id)
+
+    @cached_property
+    def wip(self) -> WIP:
+        return WIP(self.web3, self.account, self.chain_id)
+
+    @cached_property
+    def wip_client(self) -> WIPClient:
+        return WIPClient(self.web3, self.chain_id)
 
     def _validate_address(self, address: str) -> str:
         """
@@ -224,15 +238,8 @@ class Dispute:
         :param tx_receipt dict: The transaction receipt.
         :return int: The dispute ID from the event.
         """
-        event_signature = self.web3.keccak(
-            text="DisputeRaised(uint256,address,address,uint256,address,bytes32,bytes32,bytes)"
-        ).hex()
-
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                data = log["data"]
-                dispute_id = int.from_bytes(data[:32], byteorder="big")
-                return dispute_id
+        for log in decode_receipt(tx_receipt).logs("DisputeRaised"):
+            return int.from_bytes(log["data"][:32], byteorder="big")
         return None
 
     def dispute_assertion(
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from ens.ens import Address, HexStr
 from web3 import Web3
 
@@ -31,6 +33,7 @@ from story_protocol_python_sdk.abi.LicensingModule.LicensingModule_client import
 from story_protocol_python_sdk.abi.ModuleRegistry.ModuleRegistry_client import (
     ModuleRegistryClient,
 )
+from story_protocol_python_sdk.abi.Multicall3.Multicall3_client import Multicall3Client
 from story_protocol_python_sdk.abi.PILicenseTemplate.PILicenseTemplate_client import (
     PILicenseTemplateClient,
 )
@@ -41,7 +44,10 @@ from story_protocol_python_sdk.types.resource.Group import (
     CollectRoyaltiesResponse,
 )
 from story_protocol_python_sdk.utils.constants import ZERO_ADDRESS, ZERO_HASH
+from story_protocol_python_sdk.utils.ip_id_derivation import get_ip_id_deriver
 from story_protocol_python_sdk.utils.licensing_config_data import LicensingConfigData
+from story_protocol_python_sdk.utils.multicall_reads import aggregate_reads
+from story_protocol_python_sdk.utils.receipt_decoder import decode_receipt
 from story_protocol_python_sdk.utils.sign import Sign
 from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
 from story_protocol_python_sdk.utils.validation import get_revenue_share
@@ -61,17 +67,71 @@ class Group:
         self.account = account
         self.chain_id = chain_id
 
-        self.grouping_module_client = GroupingModuleClient(web3)
-        self.grouping_workflows_client = GroupingWorkflowsClient(web3)
-        self.ip_asset_registry_client = IPAssetRegistryClient(web3)
-        self.dispute_module_client = DisputeModuleClient(web3)
-        self.core_metadata_module_client = CoreMetadataModuleClient(web3)
-        self.licensing_module_client = LicensingModuleClient(web3)
-        self.license_registry_client = LicenseRegistryClient(web3)
-        self.license_token_client = LicenseTokenClient(web3)
-        self.pi_license_template_client = PILicenseTemplateClient(web3)
-        self.module_registry_client = ModuleRegistryClient(web3)
-        self.sign_util = Sign(web3, self.chain_id, self.account)
+    @cached_property
+    def grouping_module_client(self) -> GroupingModuleClient:
+        return GroupingModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def grouping_workflows_client(self) -> GroupingWorkflowsClient:
+        return GroupingWorkflowsClient(self.web3, self.chain_id)
+
+    @cached_property
+    def ip_asset_registry_client(self) -> IPAssetRegistryClient:
+        return IPAssetRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def dispute_module_client(self) -> DisputeModuleClient:
+        return DisputeModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def core_metadata_module_client(self) -> CoreMetadataModuleClient:
+        return CoreMetadataModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def licensing_module_client(self) -> LicensingModuleClient:
+        return LicensingModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def license_registry_client(self) -> LicenseRegistryClient:
+        return LicenseRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def license_token_client(self) -> LicenseTokenClient:
+        return LicenseTokenClient(self.web3, self.chain_id)
+
+    @cached_property
+    def pi_license_template_client(self) -> PILicenseTemplateClient:
+        return PILicenseTemplateClient(self.web3, self.chain_id)
+
+    @cached_property
+    def module_registry_client(self) -> ModuleRegistryClient:
+        return ModuleRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def multicall3_client(self) -> Multicall3Client:
+        return Multicall3Client(self.web3, self.chain_id)
+
+    @cached_property
+    def sign_util(self) -> Sign:
+        return Sign(self.web3, self.chain_id, self.account)
+
+    def are_registered_groups(self, ip_ids: list) -> list[bool]:
+        """
+        Check if IPs are registered groups, with one Multicall3 call per 200 IPs.
+
+        :param ip_ids list: The IP IDs to check.
+        :return list[bool]: True for each registered group IP, in order.
+        """
+        for ip_id in ip_ids:
+            if not self.web3.is_address(ip_id):
+                raise ValueError(f'IP ID "{ip_id}" is invalid.')
+        return aggregate_reads(
+            self.multicall3_client,
+            [
+                (self.ip_asset_registry_client.isRegisteredGroup, (ip_id,))
+                for ip_id in ip_ids
+            ],
+        )
 
     def register_group(self, group_pool: str, tx_options: dict | None = None) -> dict:
         """
@@ -284,9 +344,13 @@ class Group:
                 raise ValueError(f"Group IP {group_id} is not registered.")
 
             # Get IP ID for the NFT
-            ip_id = self.ip_asset_registry_client.ipId(
-                self.chain_id, nft_contract, token_id
-            )
+            deriver = get_ip_id_deriver(self.web3, self.chain_id)
+            if deriver is not None:
+                ip_id = deriver.ip_id(self.chain_id, nft_contract, token_id)
+            else:
+                ip_id = self.ip_asset_registry_client.ipId(
+                    self.chain_id, nft_contract, token_id
+                )
 
             # Get IP account state
             ip_account = IPAccountImplClient(self.web3, group_id)
@@ -420,7 +484,14 @@ class Group:
                 if not self.web3.is_address(ip_id):
                     raise ValueError(f'IP ID "{ip_id}" is invalid.')
 
-                is_registered = self.ip_asset_registry_client.isRegistered(ip_id)
+            registered = aggregate_reads(
+                self.multicall3_client,
+                [
+                    (self.ip_asset_registry_client.isRegistered, (ip_id,))
+                    for ip_id in ip_ids
+                ],
+            )
+            for ip_id, is_registered in zip(ip_ids, registered):
                 if not is_registered:
                     raise ValueError(f"IP {ip_id} is not registered.")
 
@@ -428,12 +499,21 @@ class Group:
             license_data_processed = self._get_license_data([license_data])[0]
 
             # Check if license terms are attached to all IPs
-            for ip_id in ip_ids:
-                is_attached = self.license_registry_client.hasIpAttachedLicenseTerms(
-                    ip_id,
-                    license_data_processed["licenseTemplate"],
-                    license_data_processed["licenseTermsId"],
-                )
+            attached = aggregate_reads(
+                self.multicall3_client,
+                [
+                    (
+                        self.license_registry_client.hasIpAttachedLicenseTerms,
+                        (
+                            ip_id,
+                            license_data_processed["licenseTemplate"],
+                            license_data_processed["licenseTermsId"],
+                        ),
+                    )
+                    for ip_id in ip_ids
+                ],
+            )
+            for ip_id, is_attached in zip(ip_ids, attached):
                 if not is_attached:
                     raise ValueError(
                         f"License terms must be attached to IP {ip_id} before adding to group."
@@ -485,19 +565,28 @@ class Group:
                 if not self.web3.is_address(ip_id):
                     raise ValueError(f'IP ID "{ip_id}" is invalid.')
 
-            # Contract-level validation: groupId must not be disputed
-            if self.dispute_module_client.isIpTagged(group_ip_id):
+            # Contract-level validation: groupId must not be disputed, and
+            # ipIds must not contain disputed IPs or groups
+            reads = [(self.dispute_module_client.isIpTagged, (group_ip_id,))]
+            for ip_id in ip_ids:
+                reads.append((self.dispute_module_client.isIpTagged, (ip_id,)))
+                reads.append(
+                    (self.ip_asset_registry_client.isRegisteredGroup, (ip_id,))
+                )
+            is_group_tagged, *ip_states = aggregate_reads(self.multicall3_client, reads)
+            if is_group_tagged:
                 raise ValueError(
                     f'Disputed group cannot add IP: group "{group_ip_id}" is tagged by dispute module.'
                 )
 
-            # Contract-level validation: ipIds must not contain disputed IPs or groups
-            for ip_id in ip_ids:
-                if self.dispute_module_client.isIpTagged(ip_id):
+            for ip_id, is_tagged, is_group in zip(
+                ip_ids, ip_states[::2], ip_states[1::2]
+            ):
+                if is_tagged:
                     raise ValueError(
                         f'Cannot add disputed IP to group: IP "{ip_id}" is tagged by dispute module.'
                     )
-                if self.ip_asset_registry_client.isRegisteredGroup(ip_id):
+                if is_group:
                     raise ValueError(
                         f'Cannot add group to group: IP "{ip_id}" is a registered group.'
                     )
@@ -610,21 +699,24 @@ class Group:
                 if token == ZERO_ADDRESS:
                     raise ValueError("Currency token cannot be the zero address.")
 
-            # Validate group IP
-            is_group_registered = self.ip_asset_registry_client.isRegistered(
-                group_ip_id
+            for ip_id in member_ip_ids:
+                if not self.web3.is_address(ip_id):
+                    raise ValueError(f'Member IP ID "{ip_id}" is invalid.')
+
+            # Validate the group IP and member IPs
+            is_group_registered, *members_registered = aggregate_reads(
+                self.multicall3_client,
+                [
+                    (self.ip_asset_registry_client.isRegistered, (ip_id,))
+                    for ip_id in [group_ip_id, *member_ip_ids]
+                ],
             )
             if not is_group_registered:
                 raise ValueError(
                     f"The group IP with ID {group_ip_id} is not registered."
                 )
 
-            # Validate member IPs
-            for ip_id in member_ip_ids:
-                if not self.web3.is_address(ip_id):
-                    raise ValueError(f'Member IP ID "{ip_id}" is invalid.')
-
-                is_member_registered = self.ip_asset_registry_client.isRegistered(ip_id)
+            for ip_id, is_member_registered in zip(member_ip_ids, members_registered):
                 if not is_member_registered:
                     raise ValueError(f"Member IP with ID {ip_id} is not registered.")
 
@@ -697,17 +789,13 @@ class Group:
                 *claim_reward_param.values(),
                 tx_options=tx_options,
             )
-            event_signature = self.web3.keccak(
-                text="ClaimedReward(address,address,address[],uint256[])"
-            ).hex()
             claimed_rewards = None
-            for log in response["tx_receipt"]["logs"]:
-                if log["topics"][0].hex() == event_signature:
-                    event_result = self.grouping_module_client.contract.events.ClaimedReward.process_log(
-                        log
-                    )
-                    claimed_rewards = event_result["args"]
-                    break
+            for log in decode_receipt(response["tx_receipt"]).logs("ClaimedReward"):
+                event_result = self.grouping_module_client.contract.events.ClaimedReward.process_log(
+                    log
+                )
+                claimed_rewards = event_result["args"]
+                break
             if not claimed_rewards:
                 raise ValueError("Not found ClaimedReward event in transaction logs.")
             return ClaimRewardsResponse(
@@ -752,18 +840,15 @@ class Group:
                 tx_options=tx_options,
             )
 
-            event_signature = self.web3.keccak(
-                text="CollectedRoyaltiesToGroupPool(address,address,address,uint256)"
-            ).hex()
-
             collected_royalties = 0
-            for log in response["tx_receipt"]["logs"]:
-                if log["topics"][0].hex() == event_signature:
-                    event_results = self.grouping_module_client.contract.events.CollectedRoyaltiesToGroupPool.process_log(
-                        log
-                    )
-                    collected_royalties = event_results["args"]["amount"]
-                    break
+            for log in decode_receipt(response["tx_receipt"]).logs(
+                "CollectedRoyaltiesToGroupPool"
+            ):
+                event_results = self.grouping_module_client.contract.events.CollectedRoyaltiesToGroupPool.process_log(
+                    log
+                )
+                collected_royalties = event_results["args"]["amount"]
+                break
 
             return CollectRoyaltiesResponse(
                 tx_hash=response["tx_hash"],
@@ -875,14 +960,9 @@ class Group:
         :return str: The group ID.
         :raises ValueError: If the event is not found in the transaction receipt.
         """
-        event_signature = self.web3.keccak(
-            text="IPGroupRegistered(address,address)"
-        ).hex()
-
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                group_id = "0x" + log["topics"][1].hex()[24:]
-                return self.web3.to_checksum_address(group_id)
+        for log in decode_receipt(tx_receipt).logs("IPGroupRegistered"):
+            group_id = "0x" + log["topics"][1].hex()[24:]
+            return self.web3.to_checksum_address(group_id)
 
         raise ValueError("IPGroupRegistered event not found in transaction receipt")
 
@@ -894,19 +974,14 @@ class Group:
         :return dict: The IP ID and token ID.
         :raises ValueError: If the event is not found in the transaction receipt.
         """
-        event_signature = self.web3.keccak(
-            text="IPRegistered(address,uint256,address,uint256,string,string,uint256)"
-        ).hex()
-
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                ip_id = "0x" + log["data"].hex()[24:64]
-                token_id = int(log["topics"][3].hex(), 16)
-
-                return {
-                    "ip_id": self.web3.to_checksum_address(ip_id),
-                    "token_id": token_id,
-                }
+        for log in decode_receipt(tx_receipt).logs("IPRegistered"):
+            ip_id = "0x" + log["data"].hex()[24:64]
+            token_id = int(log["topics"][3].hex(), 16)
+
+            return {
+                "ip_id": self.web3.to_checksum_address(ip_id),
+                "token_id": token_id,
+            }
 
         raise ValueError("IPRegistered event not found in transaction receipt")
 
@@ -919,24 +994,20 @@ class Group:
         :param tx_receipt dict: The transaction receipt.
         :return list: List of collected royalties.
         """
-        event_signature = self.web3.keccak(
-            text="CollectedRoyaltiesToGroupPool(address,address,address,uint256)"
-        ).hex()
         collected_royalties = []
 
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                group_id = "0x" + log["topics"][1].hex()[24:]
-                amount = int(log["data"][:66].hex(), 16)
-                token = "0x" + log["topics"][2].hex()[24:]
+        for log in decode_receipt(tx_receipt).logs("CollectedRoyaltiesToGroupPool"):
+            group_id = "0x" + log["topics"][1].hex()[24:]
+            amount = int(log["data"][:66].hex(), 16)
+            token = "0x" + log["topics"][2].hex()[24:]
 
-                collected_royalties.append(
-                    {
-                        "group_id": self.web3.to_checksum_address(group_id),
-                        "amount": amount,
-                        "token": self.web3.to_checksum_address(token),
-                    }
-                )
+            collected_royalties.append(
+                {
+                    "group_id": self.web3.to_checksum_address(group_id),
+                    "amount": amount,
+                    "token": self.web3.to_checksum_address(token),
+                }
+            )
 
         return collected_royalties
 
@@ -947,27 +1018,23 @@ class Group:
         :param tx_receipt dict: The transaction receipt.
         :return list: List of royalties distributed.
         """
-        event_signature = self.web3.keccak(
-            text="RoyaltyPaid(address,address,address,address,uint256,uint256)"
-        ).hex()
         royalties_distributed = []
 
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                receiver_ip_id = "0x" + log["topics"][0].hex()[24:]
-                data = log["data"]
-                amount = int(data[128:160].hex(), 16)
-                token = "0x" + data[108:128].hex()
-                amount_after_fee = int(data[160:].hex(), 16)
+        for log in decode_receipt(tx_receipt).logs("RoyaltyPaid"):
+            receiver_ip_id = "0x" + log["topics"][0].hex()[24:]
+            data = log["data"]
+            amount = int(data[128:160].hex(), 16)
+            token = "0x" + data[108:128].hex()
+            amount_after_fee = int(data[160:].hex(), 16)
 
-                royalties_distributed.append(
-                    {
-                        "ip_id": self.web3.to_checksum_address(receiver_ip_id),
-                        "amount": amount,
-                        "token": self.web3.to_checksum_address(token),
-                        "amount_after_fee": amount_after_fee,
-                    }
-                )
+            royalties_distributed.append(
+                {
+                    "ip_id": self.web3.to_checksum_address(receiver_ip_id),
+                    "amount": amount,
+                    "token": self.web3.to_checksum_address(token),
+                    "amount_after_fee": amount_after_fee,
+                }
+            )
 
         return royalties_distributed
 
@@ -979,7 +1046,7 @@ class Group:
         :return list: List of dicts with groupId and ipIds (checksum addresses).
         """
         events = []
-        for log in tx_receipt["logs"]:
+        for log in decode_receipt(tx_receipt).logs("AddedIpToGroup"):
             try:
                 event_result = self.grouping_module_client.contract.events.AddedIpToGroup.process_log(
                     log
@@ -1006,7 +1073,7 @@ class Group:
         :return list: List of dicts with groupId and ipIds (checksum addresses).
         """
         events = []
-        for log in tx_receipt["logs"]:
+        for log in decode_receipt(tx_receipt).logs("RemovedIpFromGroup"):
             try:
                 event_result = self.grouping_module_client.contract.events.RemovedIpFromGroup.process_log(
                     log
@@ -16,6 +16,7 @@ from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import
 )
 from story_protocol_python_sdk.abi.MockERC20.MockERC20_client import MockERC20Client
 from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
+from story_protocol_python_sdk.utils.write_once_cache import cached_read
 
 
 class IPAccount:
@@ -31,11 +32,11 @@ class IPAccount:
         self.account = account
         self.chain_id = chain_id
 
-        self.ip_asset_registry_client = IPAssetRegistryClient(web3)
-        self.access_controller_client = AccessControllerClient(web3)
+        self.ip_asset_registry_client = IPAssetRegistryClient(web3, chain_id)
+        self.access_controller_client = AccessControllerClient(web3, chain_id)
         self.ip_account_client = IPAccountImplClient(web3)
-        self.core_metadata_module_client = CoreMetadataModuleClient(web3)
-        self.mock_erc20_client = MockERC20Client(web3)
+        self.core_metadata_module_client = CoreMetadataModuleClient(web3, chain_id)
+        self.mock_erc20_client = MockERC20Client(web3, chain_id)
 
     def get_token(self, ip_id: str) -> dict:
         """Retrieve token information associated with an IP account.
@@ -49,7 +50,10 @@ class IPAccount:
             ip_account_client = IPAccountImplClient(
                 self.web3, contract_address=checksum_address
             )
-            chain_id, token_contract, token_id = ip_account_client.token()
+            # The token an IP account is bound to never changes
+            chain_id, token_contract, token_id = cached_read(
+                self.web3, ("token", checksum_address), ip_account_client.token
+            )
             return {
                 "chain_id": chain_id,
                 "token_contract": token_contract,
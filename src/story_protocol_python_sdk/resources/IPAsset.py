@@ -1,6 +1,7 @@
 """Module for handling IP Account operations and transactions."""
 
 from dataclasses import asdict, is_dataclass, replace
+from functools import cached_property
 from typing import cast
 
 from ens.ens import Address, HexStr
@@ -22,12 +23,18 @@ from story_protocol_python_sdk.abi.IPAccountImpl.IPAccountImpl_client import (
 from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import (
     IPAssetRegistryClient,
 )
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_encoders import (
+    encode_register,
+)
 from story_protocol_python_sdk.abi.IpRoyaltyVaultImpl.IpRoyaltyVaultImpl_client import (
     IpRoyaltyVaultImplClient,
 )
 from story_protocol_python_sdk.abi.LicenseAttachmentWorkflows.LicenseAttachmentWorkflows_client import (
     LicenseAttachmentWorkflowsClient,
 )
+from story_protocol_python_sdk.abi.LicenseAttachmentWorkflows.LicenseAttachmentWorkflows_encoders import (
+    encode_mintAndRegisterIpAndAttachPILTerms,
+)
 from story_protocol_python_sdk.abi.LicenseRegistry.LicenseRegistry_client import (
     LicenseRegistryClient,
 )
@@ -47,6 +54,10 @@ from story_protocol_python_sdk.abi.PILicenseTemplate.PILicenseTemplate_client im
 from story_protocol_python_sdk.abi.RegistrationWorkflows.RegistrationWorkflows_client import (
     RegistrationWorkflowsClient,
 )
+from story_protocol_python_sdk.abi.RegistrationWorkflows.RegistrationWorkflows_encoders import (
+    encode_mintAndRegisterIp,
+    encode_registerIp,
+)
 from story_protocol_python_sdk.abi.RoyaltyModule.RoyaltyModule_client import (
     RoyaltyModuleClient,
 )
@@ -74,6 +85,7 @@ from story_protocol_python_sdk.types.resource.IPAsset import (
 )
 from story_protocol_python_sdk.types.resource.License import LicenseTermsInput
 from story_protocol_python_sdk.types.resource.Royalty import RoyaltyShareInput
+from story_protocol_python_sdk.utils.batch_results import BatchResults
 from story_protocol_python_sdk.utils.constants import (
     DEADLINE,
     MAX_ROYALTY_TOKEN,
@@ -85,6 +97,7 @@ from story_protocol_python_sdk.utils.derivative_data import (
     DerivativeDataInput,
 )
 from story_protocol_python_sdk.utils.function_signature import get_function_signature
+from story_protocol_python_sdk.utils.ip_id_derivation import get_ip_id_deriver
 from story_protocol_python_sdk.utils.ip_metadata import (
     IPMetadata,
     IPMetadataInput,
@@ -92,7 +105,9 @@ from story_protocol_python_sdk.utils.ip_metadata import (
     is_initial_ip_metadata,
 )
 from story_protocol_python_sdk.utils.licensing_config_data import LicensingConfigData
+from story_protocol_python_sdk.utils.multicall_reads import aggregate_reads
 from story_protocol_python_sdk.utils.pil_flavor import PILFlavor
+from story_protocol_python_sdk.utils.receipt_decoder import decode_receipt
 from story_protocol_python_sdk.utils.royalty import get_royalty_shares
 from story_protocol_python_sdk.utils.sign import Sign
 from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
@@ -119,25 +134,69 @@ class IPAsset:
         self.account = account
         self.chain_id = chain_id
 
-        self.ip_asset_registry_client = IPAssetRegistryClient(web3)
-        self.licensing_module_client = LicensingModuleClient(web3)
-        self.license_token_client = LicenseTokenClient(web3)
-        self.license_registry_client = LicenseRegistryClient(web3)
-        self.registration_workflows_client = RegistrationWorkflowsClient(web3)
-        self.license_attachment_workflows_client = LicenseAttachmentWorkflowsClient(
-            web3
-        )
-        self.derivative_workflows_client = DerivativeWorkflowsClient(web3)
-        self.core_metadata_module_client = CoreMetadataModuleClient(web3)
-        self.access_controller_client = AccessControllerClient(web3)
-        self.pi_license_template_client = PILicenseTemplateClient(web3)
-        self.royalty_token_distribution_workflows_client = (
-            RoyaltyTokenDistributionWorkflowsClient(web3)
-        )
-        self.royalty_module_client = RoyaltyModuleClient(web3)
-        self.multicall3_client = Multicall3Client(web3)
-        self.sign_util = Sign(web3, self.chain_id, self.account)
-        self.module_registry_client = ModuleRegistryClient(web3)
+    # Contract clients are built on first access, so a resource only pays
+    # for the contracts its called methods actually use.
+    @cached_property
+    def ip_asset_registry_client(self) -> IPAssetRegistryClient:
+        return IPAssetRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def licensing_module_client(self) -> LicensingModuleClient:
+        return LicensingModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def license_token_client(self) -> LicenseTokenClient:
+        return LicenseTokenClient(self.web3, self.chain_id)
+
+    @cached_property
+    def license_registry_client(self) -> LicenseRegistryClient:
+        return LicenseRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def registration_workflows_client(self) -> RegistrationWorkflowsClient:
+        return RegistrationWorkflowsClient(self.web3, self.chain_id)
+
+    @cached_property
+    def license_attachment_workflows_client(self) -> LicenseAttachmentWorkflowsClient:
+        return LicenseAttachmentWorkflowsClient(self.web3, self.chain_id)
+
+    @cached_property
+    def derivative_workflows_client(self) -> DerivativeWorkflowsClient:
+        return DerivativeWorkflowsClient(self.web3, self.chain_id)
+
+    @cached_property
+    def core_metadata_module_client(self) -> CoreMetadataModuleClient:
+        return CoreMetadataModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def access_controller_client(self) -> AccessControllerClient:
+        return AccessControllerClient(self.web3, self.chain_id)
+
+    @cached_property
+    def pi_license_template_client(self) -> PILicenseTemplateClient:
+        return PILicenseTemplateClient(self.web3, self.chain_id)
+
+    @cached_property
+    def royalty_token_distribution_workflows_client(
+        self,
+    ) -> RoyaltyTokenDistributionWorkflowsClient:
+        return RoyaltyTokenDistributionWorkflowsClient(self.web3, self.chain_id)
+
+    @cached_property
+    def royalty_module_client(self) -> RoyaltyModuleClient:
+        return RoyaltyModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def multicall3_client(self) -> Multicall3Client:
+        return Multicall3Client(self.web3, self.chain_id)
+
+    @cached_property
+    def sign_util(self) -> Sign:
+        return Sign(self.web3, self.chain_id, self.account)
+
+    @cached_property
+    def module_registry_client(self) -> ModuleRegistryClient:
+        return ModuleRegistryClient(self.web3, self.chain_id)
 
     def mint(
         self,
@@ -196,14 +255,14 @@ class IPAsset:
         :param deadline int: [Optional] Signature deadline in seconds. (default: 1000 seconds)
         :param tx_options dict: [Optional] Transaction options.
             :param encodedTxDataOnly bool: [Optional] If True, return only encoded transaction data without sending.
-        :return dict: Dictionary with the transaction hash and IP ID, or encoded transaction data if encodedTxDataOnly is True.
+        :return dict: Dictionary with the transaction hash and IP ID, or the encoded transaction data, whether it carries metadata and the IP ID if encodedTxDataOnly is True.
         """
         try:
             tx_options = tx_options or {}
             encoded_tx_data_only = tx_options.get("encodedTxDataOnly", False)
 
             ip_id = self._get_ip_id(nft_contract, token_id)
-            if self.is_registered(ip_id) and not encoded_tx_data_only:
+            if not encoded_tx_data_only and self.is_registered(ip_id):
                 return {"tx_hash": None, "ip_id": ip_id}
 
             req_object: dict = {
@@ -259,13 +318,19 @@ class IPAsset:
                 }
 
                 if encoded_tx_data_only:
-                    encoded_data = self.registration_workflows_client.contract.functions.registerIp(
-                        req_object["nftContract"],
-                        req_object["tokenId"],
-                        req_object["ipMetadata"],
-                        req_object["sigMetadata"],
-                    ).build_transaction({"from": self.account.address})["data"]
-                    return {"encoded_tx_data": encoded_data, "has_metadata": True}
+                    encoded_data = Web3.to_hex(
+                        encode_registerIp(
+                            req_object["nftContract"],
+                            req_object["tokenId"],
+                            req_object["ipMetadata"],
+                            req_object["sigMetadata"],
+                        )
+                    )
+                    return {
+                        "encoded_tx_data": encoded_data,
+                        "has_metadata": True,
+                        "ip_id": ip_id,
+                    }
 
                 response = build_and_send_transaction(
                     self.web3,
@@ -279,12 +344,14 @@ class IPAsset:
                 )
             else:
                 if encoded_tx_data_only:
-                    encoded_data = self.ip_asset_registry_client.contract.functions.register(
-                        self.chain_id,
-                        nft_contract,
-                        token_id,
-                    ).build_transaction({"from": self.account.address})["data"]
-                    return {"encoded_tx_data": encoded_data, "has_metadata": False}
+                    encoded_data = Web3.to_hex(
+                        encode_register(self.chain_id, nft_contract, token_id)
+                    )
+                    return {
+                        "encoded_tx_data": encoded_data,
+                        "has_metadata": False,
+                        "ip_id": ip_id,
+                    }
 
                 response = build_and_send_transaction(
                     self.web3,
@@ -396,31 +463,11 @@ class IPAsset:
 
             if tx_hash:
                 tx_receipt = self.web3.eth.get_transaction_receipt(tx_hash)
-                event_signature = self.web3.keccak(
-                    text="IPRegistered(address,uint256,address,uint256,string,string,uint256)"
-                ).hex()
-                for log in tx_receipt["logs"]:
-                    if log["topics"][0].hex() == event_signature:
-                        event_result = self.ip_asset_registry_client.contract.events.IPRegistered.process_log(log)
-                        results.append({
-                            "ip_id": self.web3.to_checksum_address(event_result["args"]["ipId"]),
-                            "token_id": event_result["args"]["tokenId"],
-                            "nft_contract": self.web3.to_checksum_address(event_result["args"]["tokenContract"]),
-                        })
+                results.extend(BatchResults(self.web3, tx_receipt).build())
 
             if spg_tx_hash:
                 spg_receipt = self.web3.eth.get_transaction_receipt(spg_tx_hash)
-                event_signature = self.web3.keccak(
-                    text="IPRegistered(address,uint256,address,uint256,string,string,uint256)"
-                ).hex()
-                for log in spg_receipt["logs"]:
-                    if log["topics"][0].hex() == event_signature:
-                        event_result = self.ip_asset_registry_client.contract.events.IPRegistered.process_log(log)
-                        results.append({
-                            "ip_id": self.web3.to_checksum_address(event_result["args"]["ipId"]),
-                            "token_id": event_result["args"]["tokenId"],
-                            "nft_contract": self.web3.to_checksum_address(event_result["args"]["tokenContract"]),
-                        })
+                results.extend(BatchResults(self.web3, spg_receipt).build())
 
             return {
                 "tx_hash": tx_hash,
@@ -477,6 +524,7 @@ class IPAsset:
                     max_revenue_share=max_revenue_share,
                     license_template=license_template,
                 ),
+                chain_id=self.chain_id,
             ).get_validated_data()
 
             response = build_and_send_transaction(
@@ -706,15 +754,14 @@ class IPAsset:
 
             # Check if only encoded transaction data is requested
             if tx_options and tx_options.get("encodedTxDataOnly"):
-                # Build transaction to get encoded data
-                tx_data = self.license_attachment_workflows_client.contract.functions.mintAndRegisterIpAndAttachPILTerms(
+                encoded_data = encode_mintAndRegisterIpAndAttachPILTerms(
                     spg_nft_contract,
                     self._validate_recipient(recipient),
                     metadata,
                     license_terms,
                     allow_duplicates,
-                ).build_transaction({"from": self.account.address, "gas": 0})
-                return {"encoded_tx_data": tx_data["data"]}
+                )
+                return {"encoded_tx_data": Web3.to_hex(encoded_data)}
 
             response = build_and_send_transaction(
                 self.web3,
@@ -826,30 +873,10 @@ class IPAsset:
                 tx_options=tx_options,
             )
 
-            # Parse IPRegistered events with full details
-            event_signature = self.web3.keccak(
-                text="IPRegistered(address,uint256,address,uint256,string,string,uint256)"
-            ).hex()
-            
-            results = []
-            for log in response["tx_receipt"]["logs"]:
-                if log["topics"][0].hex() == event_signature:
-                    event_result = self.ip_asset_registry_client.contract.events.IPRegistered.process_log(log)
-                    ip_id = self.web3.to_checksum_address(event_result["args"]["ipId"])
-                    token_id = event_result["args"]["tokenId"]
-                    token_contract = self.web3.to_checksum_address(event_result["args"]["tokenContract"])
-                    
-                    # Parse license terms for this IP
-                    license_terms_ids = self._parse_tx_license_terms_attached_event_for_ip(
-                        response["tx_receipt"], ip_id
-                    )
-                    
-                    results.append({
-                        "ip_id": ip_id,
-                        "token_id": token_id,
-                        "spg_nft_contract": token_contract,
-                        "license_terms_ids": license_terms_ids,
-                    })
+            # Group the license terms of the receipt by IP in one pass
+            results = BatchResults(self.web3, response["tx_receipt"]).build(
+                nft_contract_key="spg_nft_contract", license_terms_ids=True
+            )
 
             return {
                 "tx_hash": response["tx_hash"],
@@ -948,16 +975,11 @@ class IPAsset:
             encoded_data = []
             for request in requests:
                 encoded_data.append(
-                    self.registration_workflows_client.contract.encode_abi(
-                        abi_element_identifier="mintAndRegisterIp",
-                        args=[
-                            validate_address(request.spg_nft_contract),
-                            self._validate_recipient(request.recipient),
-                            IPMetadata.from_input(
-                                request.ip_metadata
-                            ).get_validated_data(),
-                            request.allow_duplicates,
-                        ],
+                    encode_mintAndRegisterIp(
+                        validate_address(request.spg_nft_contract),
+                        self._validate_recipient(request.recipient),
+                        IPMetadata.from_input(request.ip_metadata).get_validated_data(),
+                        request.allow_duplicates,
                     )
                 )
             response = build_and_send_transaction(
@@ -1150,7 +1172,7 @@ class IPAsset:
                     f"The NFT with id {token_id} is already registered as IP."
                 )
             validated_deriv_data = DerivativeData.from_input(
-                web3=self.web3, input_data=deriv_data
+                web3=self.web3, input_data=deriv_data, chain_id=self.chain_id
             ).get_validated_data()
             calculated_deadline = self.sign_util.get_deadline(deadline=deadline)
             sig_register_signature = self.sign_util.get_permission_signature(
@@ -1233,7 +1255,7 @@ class IPAsset:
 
         try:
             validated_deriv_data = DerivativeData.from_input(
-                web3=self.web3, input_data=deriv_data
+                web3=self.web3, input_data=deriv_data, chain_id=self.chain_id
             ).get_validated_data()
             response = build_and_send_transaction(
                 self.web3,
@@ -1502,7 +1524,7 @@ class IPAsset:
         try:
             validated_royalty_shares_obj = get_royalty_shares(royalty_shares)
             validated_deriv_data = DerivativeData.from_input(
-                web3=self.web3, input_data=deriv_data
+                web3=self.web3, input_data=deriv_data, chain_id=self.chain_id
             ).get_validated_data()
 
             response = build_and_send_transaction(
@@ -1569,7 +1591,7 @@ class IPAsset:
                 )
 
             validated_deriv_data = DerivativeData.from_input(
-                web3=self.web3, input_data=deriv_data
+                web3=self.web3, input_data=deriv_data, chain_id=self.chain_id
             ).get_validated_data()
             calculated_deadline = self.sign_util.get_deadline(deadline=deadline)
             royalty_shares_obj = get_royalty_shares(royalty_shares)
@@ -2403,6 +2425,9 @@ class IPAsset:
         :param token_id int: The token identifier.
         :return str: The IP ID.
         """
+        deriver = get_ip_id_deriver(self.web3, self.chain_id)
+        if deriver is not None:
+            return deriver.ip_id(self.chain_id, token_contract, token_id)
         return self.ip_asset_registry_client.ipId(
             self.chain_id, token_contract, token_id
         )
@@ -2425,6 +2450,58 @@ class IPAsset:
         ip_id = self.web3.to_checksum_address(ip_id)
         return self.ip_asset_registry_client.isRegistered(ip_id)
 
+    def are_registered(self, ip_ids: list) -> list[bool]:
+        """
+        Check if IPs are registered, with one Multicall3 call per 200 IPs.
+
+        :param ip_ids list: The IP IDs to check.
+        :return list[bool]: True for each registered IP, in order.
+        :raises ValueError: If an ip_id is empty or has invalid format.
+        """
+        checksum_ip_ids = []
+        for ip_id in ip_ids:
+            if not ip_id:
+                raise ValueError("are_registered: ip_id is required")
+            if not self.web3.is_address(ip_id):
+                raise ValueError(
+                    f"are_registered: invalid IP ID address format: {ip_id}"
+                )
+            checksum_ip_ids.append(self.web3.to_checksum_address(ip_id))
+        return aggregate_reads(
+            self.multicall3_client,
+            [
+                (self.ip_asset_registry_client.isRegistered, (ip_id,))
+                for ip_id in checksum_ip_ids
+            ],
+        )
+
+    def get_ip_ids(self, nft_contract: str, token_ids: list) -> list[str]:
+        """
+        Get the IP IDs of NFTs of one contract, with one Multicall3 call per
+        200 tokens, or offline once IP ID derivation is enabled. An IP ID is
+        known before the NFT is registered.
+
+        :param nft_contract str: The NFT contract address.
+        :param token_ids list: The token identifiers.
+        :return list[str]: The IP ID of each token, in order.
+        """
+        if not self.web3.is_address(nft_contract):
+            raise ValueError(f"Invalid NFT contract address: {nft_contract}")
+        nft_contract = self.web3.to_checksum_address(nft_contract)
+        deriver = get_ip_id_deriver(self.web3, self.chain_id)
+        if deriver is not None:
+            return deriver.ip_ids(self.chain_id, nft_contract, token_ids)
+        return aggregate_reads(
+            self.multicall3_client,
+            [
+                (
+                    self.ip_asset_registry_client.ipId,
+                    (self.chain_id, nft_contract, token_id),
+                )
+                for token_id in token_ids
+            ],
+        )
+
     def _parse_tx_ip_registered_event(self, tx_receipt: dict) -> list[RegisteredIP]:
         """
         Parse the IPRegistered event from a transaction receipt.
@@ -2432,22 +2509,16 @@ class IPAsset:
         :param tx_receipt dict: The transaction receipt.
         :return int: The IP ID and token ID from the event, or None.
         """
-        event_signature = self.web3.keccak(
-            text="IPRegistered(address,uint256,address,uint256,string,string,uint256)"
-        ).hex()
-        registered_ips: list[RegisteredIP] = []
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                event_result = self.ip_asset_registry_client.contract.events.IPRegistered.process_log(
-                    log
-                )
-                registered_ips.append(
-                    RegisteredIP(
-                        ip_id=self.web3.to_checksum_address(event_result["args"]["ipId"]),
-                        token_id=event_result["args"]["tokenId"],
-                    )
-                )
-        return registered_ips
+        return [
+            RegisteredIP(
+                ip_id=self.web3.to_checksum_address(event_result["args"]["ipId"]),
+                token_id=event_result["args"]["tokenId"],
+            )
+            for event_result in decode_receipt(tx_receipt).events(
+                "IPRegistered",
+                self.ip_asset_registry_client.contract.events.IPRegistered,
+            )
+        ]
 
     def _parse_tx_license_term_attached_event(self, tx_receipt: dict) -> int | None:
         """
@@ -2456,15 +2527,8 @@ class IPAsset:
         :param tx_receipt dict: The transaction receipt.
         :return int: The license terms ID or None if not found.
         """
-        event_signature = self.web3.keccak(
-            text="LicenseTermsAttached(address,address,address,uint256)"
-        ).hex()
-
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                data = log["data"]
-                license_terms_id = int.from_bytes(data[-32:], byteorder="big")
-                return license_terms_id
+        for log in decode_receipt(tx_receipt).logs("LicenseTermsAttached"):
+            return int.from_bytes(log["data"][-32:], byteorder="big")
         return None
 
     def _parse_tx_license_terms_attached_event(self, tx_receipt: dict) -> list[int]:
@@ -2474,43 +2538,10 @@ class IPAsset:
         :param tx_receipt dict: The transaction receipt.
         :return list: A list of license terms IDs or None if none found.
         """
-        event_signature = self.web3.keccak(
-            text="LicenseTermsAttached(address,address,address,uint256)"
-        ).hex()
-        license_terms_ids = []
-
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                data = log["data"]
-                license_terms_id = int.from_bytes(data[-32:], byteorder="big")
-                license_terms_ids.append(license_terms_id)
-
-        return license_terms_ids
-
-    def _parse_tx_license_terms_attached_event_for_ip(self, tx_receipt: dict, ip_id: str) -> list[int]:
-        """
-        Parse the LicenseTermsAttached events for a specific IP from a transaction receipt.
-
-        :param tx_receipt dict: The transaction receipt.
-        :param ip_id str: The IP ID to filter events for.
-        :return list: A list of license terms IDs for the specified IP.
-        """
-        event_signature = self.web3.keccak(
-            text="LicenseTermsAttached(address,address,address,uint256)"
-        ).hex()
-        license_terms_ids = []
-
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                # Parse the full event to get ipId
-                event_result = self.licensing_module_client.contract.events.LicenseTermsAttached.process_log(log)
-                log_ip_id = event_result["args"]["ipId"]
-                
-                if log_ip_id.lower() == ip_id.lower():
-                    license_terms_id = event_result["args"]["licenseTermsId"]
-                    license_terms_ids.append(license_terms_id)
-
-        return license_terms_ids
+        return [
+            int.from_bytes(log["data"][-32:], byteorder="big")
+            for log in decode_receipt(tx_receipt).logs("LicenseTermsAttached")
+        ]
 
     def get_royalty_vault_address_by_ip_id(
         self, tx_receipt: dict, ipId: Address
@@ -2522,16 +2553,7 @@ class IPAsset:
         :param ipId Address: The IP ID.
         :return Address: The royalty vault address.
         """
-        event_signature = Web3.keccak(
-            text="IpRoyaltyVaultDeployed(address,address)"
-        ).hex()
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                event_result = self.royalty_module_client.contract.events.IpRoyaltyVaultDeployed.process_log(
-                    log
-                )
-                if event_result["args"]["ipId"] == ipId:
-                    return event_result["args"]["ipRoyaltyVault"]
+        return BatchResults(self.web3, tx_receipt).royalty_vault(ipId)
 
     def _validate_recipient(self, recipient: Address | None) -> Address:
         """
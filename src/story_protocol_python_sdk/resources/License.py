@@ -1,4 +1,5 @@
 from dataclasses import asdict, replace
+from functools import cached_property
 
 from ens.ens import Address, HexStr
 from typing_extensions import deprecated
@@ -25,11 +26,16 @@ from story_protocol_python_sdk.abi.RoyaltyModule.RoyaltyModule_client import (
 from story_protocol_python_sdk.types.common import RevShareType
 from story_protocol_python_sdk.types.resource.License import LicenseTermsInput
 from story_protocol_python_sdk.utils.constants import ZERO_ADDRESS
+from story_protocol_python_sdk.utils.license_terms_cache import (
+    LICENSE_TERMS_REGISTERED_TOPIC,
+    get_license_terms_cache,
+)
 from story_protocol_python_sdk.utils.licensing_config_data import (
     LicensingConfig,
     LicensingConfigData,
 )
 from story_protocol_python_sdk.utils.pil_flavor import PILFlavor
+from story_protocol_python_sdk.utils.receipt_decoder import decode_receipt
 from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
 from story_protocol_python_sdk.utils.util import convert_dict_keys_to_camel_case
 from story_protocol_python_sdk.utils.validation import (
@@ -52,12 +58,29 @@ class License:
         self.account = account
         self.chain_id = chain_id
 
-        self.license_template_client = PILicenseTemplateClient(web3)
-        self.license_registry_client = LicenseRegistryClient(web3)
-        self.licensing_module_client = LicensingModuleClient(web3)
-        self.ip_asset_registry_client = IPAssetRegistryClient(web3)
-        self.module_registry_client = ModuleRegistryClient(web3)
-        self.royalty_module_client = RoyaltyModuleClient(web3)
+    @cached_property
+    def license_template_client(self) -> PILicenseTemplateClient:
+        return PILicenseTemplateClient(self.web3, self.chain_id)
+
+    @cached_property
+    def license_registry_client(self) -> LicenseRegistryClient:
+        return LicenseRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def licensing_module_client(self) -> LicensingModuleClient:
+        return LicensingModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def ip_asset_registry_client(self) -> IPAssetRegistryClient:
+        return IPAssetRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def module_registry_client(self) -> ModuleRegistryClient:
+        return ModuleRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def royalty_module_client(self) -> RoyaltyModuleClient:
+        return RoyaltyModuleClient(self.web3, self.chain_id)
 
     def _get_license_terms_id(self, license_terms: dict) -> int:
         """
@@ -66,7 +89,17 @@ class License:
         :param license_terms dict: The license terms.
         :return int: The ID of the license terms.
         """
-        return self.license_template_client.getLicenseTermsId(license_terms)
+        cache = get_license_terms_cache(self.web3)
+        if cache is None:
+            return self.license_template_client.getLicenseTermsId(license_terms)
+        license_template = self.license_template_client.contract.address
+        license_terms_id = cache.get_terms_id(license_template, license_terms)
+        if license_terms_id is None:
+            license_terms_id = self.license_template_client.getLicenseTermsId(
+                license_terms
+            )
+            cache.put(license_template, license_terms_id, license_terms)
+        return license_terms_id
 
     def register_pil_terms(
         self,
@@ -281,13 +314,8 @@ class License:
         :param tx_receipt dict: The transaction receipt.
         :return int: The ID of the license terms.
         """
-        event_signature = self.web3.keccak(
-            text="LicenseTermsRegistered(uint256,address,bytes)"
-        ).hex()
-
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                return int(log["topics"][1].hex(), 16)
+        for log in decode_receipt(tx_receipt).logs("LicenseTermsRegistered"):
+            return int(log["topics"][1].hex(), 16)
 
         return None
 
@@ -427,15 +455,10 @@ class License:
         :param tx_receipt dict: The transaction receipt.
         :return list: A list of license token IDs.
         """
-        event_signature = self.web3.keccak(
-            text="LicenseTokenMinted(address,address,uint256)"
-        ).hex()
-        token_ids = []
-
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                start_license_token_id = int(log["topics"][3].hex(), 16)
-                token_ids.append(start_license_token_id)
+        token_ids = [
+            int(log["topics"][3].hex(), 16)
+            for log in decode_receipt(tx_receipt).logs("LicenseTokenMinted")
+        ]
 
         return token_ids if token_ids else None
 
@@ -447,12 +470,48 @@ class License:
         :return dict: An object containing all of the selected license terms.
         """
         try:
-            return self.license_template_client.getLicenseTerms(
-                selected_license_terms_id
-            )
+            cache = get_license_terms_cache(self.web3)
+            if cache is None:
+                return self.license_template_client.getLicenseTerms(
+                    selected_license_terms_id
+                )
+            license_template = self.license_template_client.contract.address
+            license_terms = cache.get_terms(license_template, selected_license_terms_id)
+            if license_terms is None:
+                license_terms = self.license_template_client.getLicenseTerms(
+                    selected_license_terms_id
+                )
+                cache.put(license_template, selected_license_terms_id, license_terms)
+            return license_terms
         except Exception as e:
             raise ValueError(f"Failed to get license terms: {str(e)}")
 
+    def warm_license_terms_cache(
+        self, from_block: int = 0, to_block: int | str = "latest"
+    ) -> int:
+        """
+        Fill the license terms cache from the LicenseTermsRegistered logs of
+        the license template. Nodes limit the block range of one log query,
+        so long histories are best warmed in several ranges.
+
+        :param from_block int: [Optional] The first block to scan. Default is 0.
+        :param to_block int | str: [Optional] The last block to scan. Default is "latest".
+        :return int: The number of license terms recorded.
+        :raises ValueError: If the license terms cache is not enabled.
+        """
+        cache = get_license_terms_cache(self.web3)
+        if cache is None:
+            raise ValueError("The license terms cache is not enabled.")
+        logs = self.web3.eth.get_logs(
+            {
+                "address": self.license_template_client.contract.address,
+                "topics": ["0x" + LICENSE_TERMS_REGISTERED_TOPIC.hex()],
+                "fromBlock": from_block,
+                "toBlock": to_block,
+            }
+        )
+        return cache.warm_from_logs(logs)
+
     def predict_minting_license_fee(
         self,
         licensor_ip_id: str,
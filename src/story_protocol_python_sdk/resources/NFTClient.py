@@ -8,7 +8,12 @@ from story_protocol_python_sdk.abi.RegistrationWorkflows.RegistrationWorkflows_c
 )
 from story_protocol_python_sdk.abi.SPGNFTImpl.SPGNFTImpl_client import SPGNFTImplClient
 from story_protocol_python_sdk.utils.constants import ZERO_ADDRESS
+from story_protocol_python_sdk.utils.receipt_decoder import decode_receipt
 from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
+from story_protocol_python_sdk.utils.write_once_cache import (
+    MINT_FEE_TOKEN_TTL,
+    cached_read,
+)
 
 
 class NFTClient:
@@ -25,7 +30,7 @@ class NFTClient:
         self.account = account
         self.chain_id = chain_id
 
-        self.registration_workflows_client = RegistrationWorkflowsClient(web3)
+        self.registration_workflows_client = RegistrationWorkflowsClient(web3, chain_id)
 
     def create_nft_collection(
         self,
@@ -109,13 +114,8 @@ class NFTClient:
         :param tx_receipt dict: The transaction receipt.
         :return int: The ID of the license terms.
         """
-        event_signature = self.web3.keccak(text="CollectionCreated(address)").hex()
-
-        for log in tx_receipt["logs"]:
-            if log["topics"][0].hex() == event_signature:
-                return self.web3.to_checksum_address(
-                    "0x" + log["topics"][1].hex()[-40:]
-                )
+        for log in decode_receipt(tx_receipt).logs("CollectionCreated"):
+            return self.web3.to_checksum_address("0x" + log["topics"][1].hex()[-40:])
 
         return None
 
@@ -130,7 +130,13 @@ class NFTClient:
             nft_contract = self.web3.to_checksum_address(nft_contract)
             spg_nft_client = SPGNFTImplClient(self.web3, contract_address=nft_contract)
 
-            return spg_nft_client.mintFeeToken()
+            # The collection owner can change it, so it is only kept a while
+            return cached_read(
+                self.web3,
+                ("mintFeeToken", nft_contract),
+                spg_nft_client.mintFeeToken,
+                positive_ttl=MINT_FEE_TOKEN_TTL,
+            )
         except Exception as e:
             raise ValueError(f"Failed to get mint fee token: {str(e)}")
 
@@ -33,9 +33,9 @@ class Permission:
         self.account = account
         self.chain_id = chain_id
 
-        self.ip_asset_registry_client = IPAssetRegistryClient(web3)
+        self.ip_asset_registry_client = IPAssetRegistryClient(web3, chain_id)
         self.ip_account = IPAccount(web3, account, chain_id)
-        self.access_controller_client = AccessControllerClient(web3)
+        self.access_controller_client = AccessControllerClient(web3, chain_id)
         self.sign_util = Sign(web3, self.chain_id, self.account)
 
     def set_permission(
@@ -1,5 +1,8 @@
 # src/story_protcol_python_sdk/resources/Royalty.py
 
+from copy import copy
+from functools import cached_property
+
 from web3 import Web3
 
 from story_protocol_python_sdk.abi.IPAccountImpl.IPAccountImpl_client import (
@@ -25,13 +28,19 @@ from story_protocol_python_sdk.abi.RoyaltyPolicyLRP.RoyaltyPolicyLRP_client impo
 from story_protocol_python_sdk.abi.RoyaltyWorkflows.RoyaltyWorkflows_client import (
     RoyaltyWorkflowsClient,
 )
+from story_protocol_python_sdk.abi.RoyaltyWorkflows.RoyaltyWorkflows_encoders import (
+    encode_claimAllRevenue,
+)
 from story_protocol_python_sdk.abi.WrappedIP.WrappedIP_client import WrappedIPClient
-from story_protocol_python_sdk.utils.constants import WIP_TOKEN_ADDRESS
+from story_protocol_python_sdk.utils.constants import WIP_TOKEN_ADDRESS, ZERO_ADDRESS
+from story_protocol_python_sdk.utils.contract_registry import get_contract_at
+from story_protocol_python_sdk.utils.receipt_decoder import decode_receipt
 from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
 from story_protocol_python_sdk.utils.validation import (
     validate_address,
     validate_addresses,
 )
+from story_protocol_python_sdk.utils.write_once_cache import cached_read
 
 
 class Royalty:
@@ -48,16 +57,45 @@ class Royalty:
         self.account = account
         self.chain_id = chain_id
 
-        self.ip_asset_registry_client = IPAssetRegistryClient(web3)
-        self.royalty_policy_lap_client = RoyaltyPolicyLAPClient(web3)
-        self.royalty_module_client = RoyaltyModuleClient(web3)
-        self.ip_royalty_vault_client = IpRoyaltyVaultImplClient(web3)
-        self.royalty_workflows_client = RoyaltyWorkflowsClient(web3)
-        self.ip_account_impl_client = IPAccountImplClient(web3)
-        self.mock_erc20_client = MockERC20Client(web3)
-        self.royalty_policy_lrp_client = RoyaltyPolicyLRPClient(web3)
-        self.wrapped_ip_client = WrappedIPClient(web3)
-        self.multicall3_client = Multicall3Client(web3)
+    @cached_property
+    def ip_asset_registry_client(self) -> IPAssetRegistryClient:
+        return IPAssetRegistryClient(self.web3, self.chain_id)
+
+    @cached_property
+    def royalty_policy_lap_client(self) -> RoyaltyPolicyLAPClient:
+        return RoyaltyPolicyLAPClient(self.web3, self.chain_id)
+
+    @cached_property
+    def royalty_module_client(self) -> RoyaltyModuleClient:
+        return RoyaltyModuleClient(self.web3, self.chain_id)
+
+    @cached_property
+    def ip_royalty_vault_client(self) -> IpRoyaltyVaultImplClient:
+        return IpRoyaltyVaultImplClient(self.web3)
+
+    @cached_property
+    def royalty_workflows_client(self) -> RoyaltyWorkflowsClient:
+        return RoyaltyWorkflowsClient(self.web3, self.chain_id)
+
+    @cached_property
+    def ip_account_impl_client(self) -> IPAccountImplClient:
+        return IPAccountImplClient(self.web3)
+
+    @cached_property
+    def mock_erc20_client(self) -> MockERC20Client:
+        return MockERC20Client(self.web3, self.chain_id)
+
+    @cached_property
+    def royalty_policy_lrp_client(self) -> RoyaltyPolicyLRPClient:
+        return RoyaltyPolicyLRPClient(self.web3, self.chain_id)
+
+    @cached_property
+    def wrapped_ip_client(self) -> WrappedIPClient:
+        return WrappedIPClient(self.web3, self.chain_id)
+
+    @cached_property
+    def multicall3_client(self) -> Multicall3Client:
+        return Multicall3Client(self.web3, self.chain_id)
 
     def get_royalty_vault_address(self, ip_id: str) -> str:
         """
@@ -66,11 +104,20 @@ class Royalty:
         :param ip_id str: The IP ID.
         :return str: The respective royalty vault address.
         """
-        is_registered = self.ip_asset_registry_client.isRegistered(ip_id)
-        if not is_registered:
-            raise ValueError(f"The IP with id {ip_id} is not registered.")
 
-        return self.royalty_module_client.ipRoyaltyVaults(ip_id)
+        def read_vault_address() -> str:
+            is_registered = self.ip_asset_registry_client.isRegistered(ip_id)
+            if not is_registered:
+                raise ValueError(f"The IP with id {ip_id} is not registered.")
+            return self.royalty_module_client.ipRoyaltyVaults(ip_id)
+
+        # A deployed vault never moves, so only a missing one is read again
+        return cached_read(
+            self.web3,
+            ("ipRoyaltyVaults", ip_id.lower()),
+            read_vault_address,
+            is_set=lambda vault_address: vault_address != ZERO_ADDRESS,
+        )
 
     def claimable_revenue(
         self, royalty_vault_ip_id: str, claimer: str, token: str
@@ -285,13 +332,13 @@ class Royalty:
                 # Batch claimAllRevenue calls into a single multicall
                 encoded_txs = []
                 for ancestor_ip in ancestor_ips:
-                    encoded_data = self.royalty_workflows_client.contract.functions.claimAllRevenue(
+                    encoded_data = encode_claimAllRevenue(
                         validate_address(ancestor_ip["ip_id"]),
                         validate_address(ancestor_ip["claimer"]),
                         validate_addresses(ancestor_ip["child_ip_ids"]),
                         validate_addresses(ancestor_ip["royalty_policies"]),
                         validate_addresses(ancestor_ip["currency_tokens"]),
-                    )._encode_transaction_data()
+                    )
                     encoded_txs.append(encoded_data)
 
                 response = build_and_send_transaction(
@@ -418,11 +465,13 @@ class Royalty:
                     raise ValueError(
                         f'Royalty policy address "{royalty_policy}" is invalid.'
                     )
-                royalty_policy_client = (
-                    self.royalty_policy_lap_client
-                )  # Same ABI for all royalty policies
-                royalty_policy_client.contract.address = self.web3.to_checksum_address(
-                    royalty_policy
+                # Same ABI for all royalty policies. Contract instances are
+                # shared, so bind a new one instead of re-pointing the LAP one.
+                royalty_policy_client = copy(self.royalty_policy_lap_client)
+                royalty_policy_client.contract = get_contract_at(
+                    self.web3,
+                    "RoyaltyPolicyLAP",
+                    self.web3.to_checksum_address(royalty_policy),
                 )
 
             response = build_and_send_transaction(
@@ -509,20 +558,13 @@ class Royalty:
         :param tx_receipt dict: The transaction receipt.
         :return list: List of claimed tokens with claimer address, token address and amount.
         """
-        event_signature = Web3.keccak(
-            text="RevenueTokenClaimed(address,address,uint256)"
-        ).hex()
-        claimed_tokens = []
-        for log in tx_receipt.get("logs", []):
-            if log["topics"][0].hex() == event_signature:
-                event_result = self.ip_royalty_vault_client.contract.events.RevenueTokenClaimed.process_log(
-                    log
-                )[
-                    "args"
-                ]
-                claimed_tokens.append(event_result)
-
-        return claimed_tokens
+        return [
+            event_result["args"]
+            for event_result in decode_receipt(tx_receipt).events(
+                "RevenueTokenClaimed",
+                self.ip_royalty_vault_client.contract.events.RevenueTokenClaimed,
+            )
+        ]
 
     def _unwrap_claimed_tokens_from_ip_to_wallet(self, claimed_tokens: list) -> list:
         """
@@ -20,7 +20,7 @@ class WIP:
         self.account = account
         self.chain_id = chain_id
 
-        self.wip_client = WIPClient(web3)
+        self.wip_client = WIPClient(web3, chain_id)
 
     def deposit(self, amount: int, tx_options: dict | None = None) -> dict:
         """
@@ -40,7 +40,6 @@ class WIP:
             transaction_options.update(
                 {
                     "from": self.account.address,
-                    "nonce": self.web3.eth.get_transaction_count(self.account.address),
                     "value": amount,
                 }
             )
@@ -1,6 +1,13 @@
 import json
 import os
+import pickle
 
+from eth_utils.abi import (
+    abi_to_signature,
+    collapse_if_tuple,
+    event_abi_to_log_topic,
+    function_abi_to_4byte_selector,
+)
 from jinja2 import Template
 
 # Define the folder containing the ABI JSON files
@@ -9,28 +16,14 @@ JSONS_FOLDER = os.path.join(os.path.dirname(__file__), "..", "abi", "jsons")
 # Template for regular clients that read address from config
 regular_class_template = Template(
     """
-import json
-import os
 from web3 import Web3
 
+from story_protocol_python_sdk.utils.contract_registry import get_contract
+
 class {{ class_name }}:
-    def __init__(self, web3: Web3):
+    def __init__(self, web3: Web3, chain_id: int | None = None):
         self.web3 = web3
-        # Assuming config.json is located at the root of the project
-        config_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'scripts', 'config.json'))
-        with open(config_path, 'r') as config_file:
-            config = json.load(config_file)
-        contract_address = None
-        for contract in config['contracts']:
-            if contract['contract_name'] == '{{ contract_name }}':
-                contract_address = contract['contract_address']
-                break
-        if not contract_address:
-            raise ValueError(f"Contract address for {{ contract_name }} not found in config.json")
-        abi_path = os.path.join(os.path.dirname(__file__), '..', '..', 'abi', 'jsons', '{{ contract_name }}.json')
-        with open(abi_path, 'r') as abi_file:
-            abi = json.load(abi_file)
-        self.contract = self.web3.eth.contract(address=contract_address, abi=abi)
+        self.contract = get_contract(web3, '{{ contract_name }}', chain_id)
     {% for function in functions %}
     def {{ function.python_name }}(self{% if function.inputs %}, {{ function.inputs | join(', ') }}{% endif %}):
         {% if function.stateMutability == 'view' or function.stateMutability == 'pure' %}
@@ -48,17 +41,14 @@ class {{ class_name }}:
 # Template for Impl clients that require address in constructor
 impl_class_template = Template(
     """
-import json
-import os
 from web3 import Web3
 
+from story_protocol_python_sdk.utils.contract_registry import get_contract_at
+
 class {{ class_name }}:
     def __init__(self, web3: Web3, contract_address=None):
         self.web3 = web3
-        abi_path = os.path.join(os.path.dirname(__file__), '..', '..', 'abi', 'jsons', '{{ contract_name }}.json')
-        with open(abi_path, 'r') as abi_file:
-            abi = json.load(abi_file)
-        self.contract = self.web3.eth.contract(address=contract_address, abi=abi)
+        self.contract = get_contract_at(web3, '{{ contract_name }}', contract_address)
     {% for function in functions %}
     def {{ function.python_name }}(self{% if function.inputs %}, {{ function.inputs | join(', ') }}{% endif %}):
         {% if function.stateMutability == 'view' or function.stateMutability == 'pure' %}
@@ -73,6 +63,24 @@ class {{ class_name }}:
 """
 )
 
+# Template for the calldata encoders of a contract's client functions
+encoders_template = Template(
+    '''
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+{% for function in functions %}
+
+def encode_{{ function.python_name }}({{ function.inputs | join(', ') }}) -> bytes:
+    """Encode the calldata of ``{{ function.signature }}``."""
+    return encode_call(
+        {{ function.selector }},
+        {{ function.types }},
+        {{ function.specs }},
+        ({{ function.inputs | join(', ') }}{% if function.inputs | length == 1 %},{% endif %}),
+    )
+{% endfor %}
+'''
+)
+
 
 def load_abi_from_file(contract_name):
     """Load ABI JSON from the jsons folder."""
@@ -112,6 +120,16 @@ def generate_python_class_from_abi(abi, contract_name, functions, output_dir):
                 "name": item["name"],
                 "inputs": inputs,
                 "stateMutability": item.get("stateMutability", "nonpayable"),
+                "signature": abi_to_signature(item),
+                "selector": 'b"'
+                + "".join(
+                    f"\\x{byte:02x}" for byte in function_abi_to_4byte_selector(item)
+                )
+                + '"',
+                "types": repr(
+                    tuple(collapse_if_tuple(param) for param in item["inputs"])
+                ),
+                "specs": repr(build_normalization_specs(item["inputs"])),
             }
             selected_functions.append(function)
 
@@ -148,9 +166,102 @@ def generate_python_class_from_abi(abi, contract_name, functions, output_dir):
     with open(output_file_path, "w") as output_file:
         output_file.write(rendered_class)
 
+    if selected_functions:
+        encoders_file_path = os.path.join(
+            contract_output_dir, f"{contract_name}_encoders.py"
+        )
+        with open(encoders_file_path, "w") as output_file:
+            output_file.write(encoders_template.render(functions=selected_functions))
+
     print(f"Generated {class_name} class from ABI")
 
 
+def build_normalization_spec(param):
+    """
+    Build the normalisation spec of an ABI parameter, as documented in
+    ``utils/abi_encoding.py``, or ``None`` if its value needs no normalising.
+    """
+    param_type = param["type"]
+    if param_type.endswith("]"):
+        item_spec = build_normalization_spec(
+            {**param, "type": param_type[: param_type.rindex("[")]}
+        )
+        return None if item_spec is None else ("array", item_spec)
+    if param_type == "tuple":
+        return (
+            "tuple",
+            tuple(
+                (component["name"], build_normalization_spec(component))
+                for component in param["components"]
+            ),
+        )
+    if param_type.startswith("bytes"):
+        return "bytes"
+    return None
+
+
+def build_normalization_specs(params):
+    """Build the normalisation specs of a function's inputs."""
+    specs = tuple(build_normalization_spec(param) for param in params)
+    return None if all(spec is None for spec in specs) else specs
+
+
+def prune_abi(abi):
+    """
+    Keep the ABI entries a contract instance can use (functions, events and
+    errors) and drop fields web3 does not read, such as ``internalType``.
+    """
+
+    def prune_params(params):
+        pruned = []
+        for param in params:
+            param = {k: v for k, v in param.items() if k != "internalType"}
+            if "components" in param:
+                param["components"] = prune_params(param["components"])
+            pruned.append(param)
+        return pruned
+
+    pruned_abi = []
+    for item in abi:
+        if item["type"] not in ("function", "event", "error"):
+            continue
+        item = dict(item)
+        for key in ("inputs", "outputs"):
+            if key in item:
+                item[key] = prune_params(item[key])
+        pruned_abi.append(item)
+    return tuple(pruned_abi)
+
+
+def generate_abi_bundle(jsons_folder, output_path):
+    """
+    Generate a pickled bundle holding every pruned ABI, with function selectors
+    and event topics precomputed, so clients don't parse JSON at runtime.
+    """
+    bundle = {"abis": {}, "function_selectors": {}, "event_topics": {}}
+    for file_name in sorted(os.listdir(jsons_folder)):
+        if not file_name.endswith(".json"):
+            continue
+        contract_name = file_name[: -len(".json")]
+        abi = prune_abi(load_abi_from_file(contract_name))
+        bundle["abis"][contract_name] = abi
+        bundle["function_selectors"][contract_name] = {
+            abi_to_signature(item): "0x" + function_abi_to_4byte_selector(item).hex()
+            for item in abi
+            if item["type"] == "function"
+        }
+        bundle["event_topics"][contract_name] = {
+            abi_to_signature(item): "0x" + event_abi_to_log_topic(item).hex()
+            for item in abi
+            if item["type"] == "event"
+        }
+
+    with open(output_path, "wb") as output_file:
+        pickle.dump(bundle, output_file, protocol=4)
+
+    print(f"Generated ABI bundle for {len(bundle['abis'])} contracts")
+
+
 def fix_client_formatting(client_dir):
     """Fix formatting issues in generated client files."""
     for root, dirs, files in os.walk(client_dir):
@@ -215,6 +326,8 @@ def main(config_path, output_dir):
     # Fix formatting in all generated client files
     fix_client_formatting(output_dir)
 
+    generate_abi_bundle(JSONS_FOLDER, os.path.join(output_dir, "abi_bundle.pickle"))
+
 
 if __name__ == "__main__":
     config_path = os.path.join(os.path.dirname(__file__), "config.json")
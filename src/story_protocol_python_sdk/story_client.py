@@ -1,17 +1,33 @@
 # src/story_protocol_python_sdk/story_client.py
 
+from __future__ import annotations
+
 import os
 import sys
-
-from story_protocol_python_sdk.resources.Dispute import Dispute
-from story_protocol_python_sdk.resources.Group import Group
-from story_protocol_python_sdk.resources.IPAccount import IPAccount
-from story_protocol_python_sdk.resources.IPAsset import IPAsset
-from story_protocol_python_sdk.resources.License import License
-from story_protocol_python_sdk.resources.NFTClient import NFTClient
-from story_protocol_python_sdk.resources.Permission import Permission
-from story_protocol_python_sdk.resources.Royalty import Royalty
-from story_protocol_python_sdk.resources.WIP import WIP
+from typing import TYPE_CHECKING
+
+from story_protocol_python_sdk.utils.constants import SUPPORTED_CHAIN_IDS
+
+if TYPE_CHECKING:
+    from story_protocol_python_sdk.resources.Dispute import Dispute
+    from story_protocol_python_sdk.resources.Group import Group
+    from story_protocol_python_sdk.resources.IPAccount import IPAccount
+    from story_protocol_python_sdk.resources.IPAsset import IPAsset
+    from story_protocol_python_sdk.resources.License import License
+    from story_protocol_python_sdk.resources.NFTClient import NFTClient
+    from story_protocol_python_sdk.resources.Permission import Permission
+    from story_protocol_python_sdk.resources.Royalty import Royalty
+    from story_protocol_python_sdk.resources.WIP import WIP
+    from story_protocol_python_sdk.utils.batch_reads import ReadBatch
+    from story_protocol_python_sdk.utils.gas_estimator import GasEstimateCache
+    from story_protocol_python_sdk.utils.ip_id_derivation import IpIdDeriver
+    from story_protocol_python_sdk.utils.license_terms_cache import LicenseTermsCache
+    from story_protocol_python_sdk.utils.receipt_watcher import ReceiptWatcher
+    from story_protocol_python_sdk.utils.retry_policy import RetryPolicy
+    from story_protocol_python_sdk.utils.sender_pool import SenderPool
+    from story_protocol_python_sdk.utils.transaction_batcher import TransactionBatcher
+    from story_protocol_python_sdk.utils.transaction_pipeline import TransactionPipeline
+    from story_protocol_python_sdk.utils.write_once_cache import WriteOnceCache
 
 # Ensure the src directory is in the Python path
 current_dir = os.path.dirname(__file__)
@@ -41,7 +57,7 @@ class StoryClient:
         if not web3 or not account:
             raise ValueError("web3 and account must be provided")
 
-        if chain_id not in [1315, 1514]:
+        if chain_id not in SUPPORTED_CHAIN_IDS:
             raise ValueError("only support story devnet")
 
         self.web3 = web3
@@ -66,6 +82,8 @@ class StoryClient:
         :return IPAsset: An instance of IPAsset.
         """
         if self._ip_asset is None:
+            from story_protocol_python_sdk.resources.IPAsset import IPAsset
+
             self._ip_asset = IPAsset(self.web3, self.account, self.chain_id)
         return self._ip_asset
 
@@ -77,6 +95,8 @@ class StoryClient:
         :return License: An instance of License.
         """
         if self._license is None:
+            from story_protocol_python_sdk.resources.License import License
+
             self._license = License(self.web3, self.account, self.chain_id)
         return self._license
 
@@ -88,6 +108,8 @@ class StoryClient:
         :return Royalty: An instance of Royalty.
         """
         if self._royalty is None:
+            from story_protocol_python_sdk.resources.Royalty import Royalty
+
             self._royalty = Royalty(self.web3, self.account, self.chain_id)
         return self._royalty
 
@@ -99,6 +121,8 @@ class StoryClient:
         :return IPAccount: An instance of IPAccount.
         """
         if self._ip_account is None:
+            from story_protocol_python_sdk.resources.IPAccount import IPAccount
+
             self._ip_account = IPAccount(self.web3, self.account, self.chain_id)
         return self._ip_account
 
@@ -110,6 +134,8 @@ class StoryClient:
         :return Permission: An instance of Permission.
         """
         if self._permission is None:
+            from story_protocol_python_sdk.resources.Permission import Permission
+
             self._permission = Permission(self.web3, self.account, self.chain_id)
         return self._permission
 
@@ -121,6 +147,8 @@ class StoryClient:
         :return NFTClient: An instance of NFTClient.
         """
         if self._nft_client is None:
+            from story_protocol_python_sdk.resources.NFTClient import NFTClient
+
             self._nft_client = NFTClient(self.web3, self.account, self.chain_id)
         return self._nft_client
 
@@ -132,6 +160,8 @@ class StoryClient:
         :return Dispute: An instance of Dispute.
         """
         if self._dispute is None:
+            from story_protocol_python_sdk.resources.Dispute import Dispute
+
             self._dispute = Dispute(self.web3, self.account, self.chain_id)
         return self._dispute
 
@@ -143,6 +173,8 @@ class StoryClient:
         :return WIP: An instance of WIP.
         """
         if self._wip is None:
+            from story_protocol_python_sdk.resources.WIP import WIP
+
             self._wip = WIP(self.web3, self.account, self.chain_id)
         return self._wip
 
@@ -152,9 +184,181 @@ class StoryClient:
         Access the Group resource.
         """
         if self._group is None:
+            from story_protocol_python_sdk.resources.Group import Group
+
             self._group = Group(self.web3, self.account, self.chain_id)
         return self._group
 
+    def pipeline(
+        self, poll_interval: float | None = None, max_workers: int | None = None
+    ) -> TransactionPipeline:
+        """
+        Create a pipeline to submit many writes back-to-back and collect their
+        parsed results together.
+
+        :param poll_interval float: [Optional] Seconds between two checks for a new block.
+        :param max_workers int: [Optional] The most calls that run at once. Default is 16.
+        :return TransactionPipeline: A new pipeline.
+        """
+        from story_protocol_python_sdk.utils.receipt_watcher import (
+            DEFAULT_POLL_INTERVAL,
+        )
+        from story_protocol_python_sdk.utils.transaction_pipeline import (
+            DEFAULT_MAX_WORKERS,
+            TransactionPipeline,
+        )
+
+        return TransactionPipeline(
+            self.web3,
+            DEFAULT_POLL_INTERVAL if poll_interval is None else poll_interval,
+            max_workers=DEFAULT_MAX_WORKERS if max_workers is None else max_workers,
+        )
+
+    def batcher(self, **kwargs) -> TransactionBatcher:
+        """
+        Create a batcher that coalesces independent writes, from any thread,
+        into multicall transactions.
+
+        :param kwargs: [Optional] ``max_calls``, ``max_gas``, ``max_delay`` and
+            ``tx_options``, as for :class:`TransactionBatcher`.
+        :return TransactionBatcher: A new batcher.
+        """
+        from story_protocol_python_sdk.utils.transaction_batcher import (
+            TransactionBatcher,
+        )
+
+        return TransactionBatcher(self.web3, self.account, self.chain_id, **kwargs)
+
+    def sender_pool(self, accounts: list, **kwargs) -> SenderPool:
+        """
+        Create a pool that runs SDK calls on the least-loaded of this
+        client's account and the given ones, each with its own nonce lane.
+        This client's account is the pool owner.
+
+        :param accounts list: The other funded accounts to send from.
+        :param kwargs: [Optional] ``max_in_flight_per_key``, as for :class:`SenderPool`.
+        :return SenderPool: A new sender pool.
+        """
+        from story_protocol_python_sdk.utils.sender_pool import SenderPool
+
+        return SenderPool(self.web3, [self.account, *accounts], self.chain_id, **kwargs)
+
+    def batch_reads(self, **kwargs) -> ReadBatch:
+        """
+        Create a batch that sends the contract reads added to it as one
+        JSON-RPC batch request when its ``with`` block ends.
+
+        :param kwargs: [Optional] ``max_batch_size`` and ``block_identifier``,
+            as for :class:`ReadBatch`.
+        :return ReadBatch: A new read batch.
+        """
+        from story_protocol_python_sdk.utils.batch_reads import ReadBatch
+
+        return ReadBatch(self.web3, **kwargs)
+
+    def enable_gas_estimate_cache(
+        self, margin: float | None = None
+    ) -> GasEstimateCache:
+        """
+        Skip gas estimation for calls whose shape was mined before, using the
+        largest recorded gas usage plus a safety margin as the gas limit.
+
+        :param margin float: [Optional] The safety margin over the recorded usage. Default is 0.2.
+        :return GasEstimateCache: The cache, shared by every client on this web3 instance.
+        """
+        from story_protocol_python_sdk.utils.gas_estimator import (
+            DEFAULT_GAS_MARGIN,
+            enable_gas_estimate_cache,
+        )
+
+        return enable_gas_estimate_cache(
+            self.web3, DEFAULT_GAS_MARGIN if margin is None else margin
+        )
+
+    def enable_receipt_watcher(
+        self, poll_interval: float | None = None
+    ) -> ReceiptWatcher:
+        """
+        Wait for every receipt through one watcher that follows new blocks,
+        instead of a polling loop per transaction. Worth it when many
+        writes are in flight at once, e.g. from several threads.
+
+        :param poll_interval float: [Optional] Seconds between two checks for a new block.
+        :return ReceiptWatcher: The watcher, shared by every client on this web3 instance.
+        """
+        from story_protocol_python_sdk.utils.receipt_watcher import (
+            DEFAULT_POLL_INTERVAL,
+            enable_receipt_watcher,
+        )
+
+        return enable_receipt_watcher(
+            self.web3,
+            DEFAULT_POLL_INTERVAL if poll_interval is None else poll_interval,
+        )
+
+    def enable_ip_id_derivation(self) -> IpIdDeriver:
+        """
+        Derive IP IDs offline instead of asking the IP asset registry for
+        each NFT. The registry parameters are read, and checked against one
+        on-chain IP ID, once.
+
+        :return IpIdDeriver: The deriver, shared by every client of this chain on this web3 instance.
+        """
+        from story_protocol_python_sdk.utils.ip_id_derivation import (
+            enable_ip_id_derivation,
+        )
+
+        return enable_ip_id_derivation(self.web3, self.chain_id)
+
+    def enable_license_terms_cache(
+        self, max_size: int = 4096, path: str | None = None
+    ) -> LicenseTermsCache:
+        """
+        Cache registered license terms, which never change, so repeated
+        license terms lookups skip RPC. Give a path to keep them in a SQLite
+        file shared by every process that opens it.
+
+        :param max_size int: [Optional] The most entries kept in memory per direction. Default is 4096.
+        :param path str: [Optional] The SQLite file. Default is memory only.
+        :return LicenseTermsCache: The cache, shared by every client on this web3 instance.
+        """
+        from story_protocol_python_sdk.utils.license_terms_cache import (
+            enable_license_terms_cache,
+        )
+
+        return enable_license_terms_cache(self.web3, max_size, path)
+
+    def enable_write_once_cache(
+        self, negative_ttl: float = 30.0, max_size: int = 65536
+    ) -> WriteOnceCache:
+        """
+        Memoize reads whose answer never changes once set: royalty vault
+        addresses and IP account tokens. Unset answers, such as a vault that
+        is not deployed yet, are read again after ``negative_ttl`` seconds.
+        Mint fee tokens are kept for a minute, since the collection owner can
+        change them.
+
+        :param negative_ttl float: [Optional] Seconds an unset answer is kept. Default is 30.
+        :param max_size int: [Optional] The most answers kept. Default is 65536.
+        :return WriteOnceCache: The cache, shared by every client on this web3 instance.
+        """
+        from story_protocol_python_sdk.utils.write_once_cache import (
+            enable_write_once_cache,
+        )
+
+        return enable_write_once_cache(self.web3, negative_ttl, max_size)
+
+    def set_retry_policy(self, policy: RetryPolicy | None) -> None:
+        """
+        Set how every write reacts to send errors and to transactions that
+        stay pending, unless a write gives its own ``retryPolicy`` option.
+
+        :param policy RetryPolicy: The policy, or None for the default one.
+        """
+        from story_protocol_python_sdk.utils.retry_policy import set_retry_policy
+
+        set_retry_policy(self.web3, policy)
+
     def get_balance(self, address: str) -> int:
         """
         Get the native token (IP) balance of the specified address.
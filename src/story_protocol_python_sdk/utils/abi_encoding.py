@@ -0,0 +1,59 @@
+"""Runtime support for the calldata encoders generated per contract function.
+
+``scripts/generate_clients.py`` emits an ``abi/<Contract>/<Contract>_encoders.py``
+module with one ``encode_<function>`` per client function. Each of them bakes
+in the 4-byte selector, the ``eth_abi`` type strings and a normalisation spec,
+and calls :func:`encode_call`, which skips web3's function lookup, ABI
+matching and argument normalisation.
+
+A normalisation spec describes how to turn SDK-style arguments into the
+values ``eth_abi`` expects:
+
+- ``None``: the value is passed through unchanged.
+- ``"bytes"``: a ``0x`` hex string is converted to bytes (``bytes``/``bytesN``).
+- ``("tuple", (("name", spec), ...))``: a struct given as a dict is converted
+  to a tuple in component order.
+- ``("array", spec)``: every item of a list is normalised with ``spec``.
+"""
+
+from functools import cache
+
+from eth_abi.encoding import TupleEncoder
+from eth_abi.registry import registry
+from eth_utils import to_bytes
+
+
+@cache
+def _get_encoder(types: tuple[str, ...]) -> TupleEncoder:
+    return TupleEncoder(encoders=tuple(registry.get_encoder(t) for t in types))
+
+
+def _normalize(spec, value):
+    if spec is None:
+        return value
+    if spec == "bytes":
+        return to_bytes(hexstr=value) if isinstance(value, str) else value
+    kind, inner = spec
+    if kind == "array":
+        return [_normalize(inner, item) for item in value]
+    if isinstance(value, dict):
+        return tuple(_normalize(spec, value[name]) for name, spec in inner)
+    return tuple(_normalize(spec, item) for (_, spec), item in zip(inner, value))
+
+
+def encode_call(
+    selector: bytes, types: tuple[str, ...], specs: tuple, args: tuple
+) -> bytes:
+    """
+    Encode the calldata of a contract function call.
+
+    :param selector bytes: The 4-byte function selector.
+    :param types tuple[str, ...]: The ``eth_abi`` type strings of the inputs.
+    :param specs tuple: The normalisation spec of each input, or ``None`` if
+        no input needs normalising.
+    :param args tuple: The call arguments.
+    :return bytes: The selector followed by the ABI-encoded arguments.
+    """
+    if specs is not None:
+        args = tuple(_normalize(spec, arg) for spec, arg in zip(specs, args))
+    return selector + _get_encoder(types)(args)
@@ -0,0 +1,216 @@
+"""Shared receipt collection for writes sent through an ``AsyncWeb3``.
+
+``AsyncWeb3.eth.wait_for_transaction_receipt`` polls its own transaction every
+100 ms, so a few hundred concurrent writes make a few thousand requests per
+second while they wait. Every async send waits on the
+:class:`AsyncReceiptCollector` of its web3 instance instead: a single task
+checks for a new block and only then resolves every pending transaction,
+the same way a :class:`ReceiptWatcher` does: with ``eth_getBlockReceipts``
+when there are more pending transactions than new blocks, otherwise with
+concurrent ``eth_getTransactionReceipt`` calls. Failed polls are retried
+after a backoff, as by a :class:`ReceiptWatcher`.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from story_protocol_python_sdk.utils.receipt_watcher import (
+    DEFAULT_POLL_INTERVAL,
+    MAX_POLL_FAILURES,
+    MAX_SCANNED_BLOCKS,
+    _is_unsupported_method_error,
+    poll_delay,
+)
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+# AsyncWeb3 instance -> AsyncReceiptCollector
+_collectors: "weakref.WeakKeyDictionary[AsyncWeb3, AsyncReceiptCollector]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class AsyncReceiptCollector:
+    """
+    Waits for the receipts of many transactions with one polling task.
+
+    The task runs while at least one transaction is awaited and stops once
+    every receipt has been handed out.
+
+    :param web3 AsyncWeb3: The web3 instance to poll.
+    :param poll_interval float: [Optional] Seconds between two checks for a new block.
+    :param max_failures int: [Optional] Consecutive failed polls after which
+        the pending transactions fail with the last error. Default is 5.
+    """
+
+    def __init__(
+        self,
+        web3: AsyncWeb3,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_failures: int = MAX_POLL_FAILURES,
+    ):
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1.")
+        self.web3 = web3
+        self.poll_interval = poll_interval
+        self.max_failures = max_failures
+        self.failures = 0
+        self.block_receipts_supported: bool | None = None
+        self._waiters: dict = {}
+        # Hashes watched since the last scan, which may be in the last block
+        self._unscanned: set = set()
+        self._last_block: int | None = None
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def pending(self) -> int:
+        """The number of transactions whose receipt is awaited."""
+        return len(self._waiters)
+
+    async def wait_for_receipt(self, tx_hash, timeout: float) -> dict:
+        """
+        Wait for the receipt of a transaction.
+
+        :param tx_hash HexBytes: The transaction hash.
+        :param timeout float: Seconds to wait for the receipt.
+        :return dict: The transaction receipt.
+        :raises TimeExhausted: If the receipt is not available in time.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The previous event loop is gone along with its task and waiters
+            self._loop = loop
+            self._task = None
+            self._waiters = {}
+            self._unscanned = set()
+            self._last_block = None
+        tx_hash = HexBytes(tx_hash)
+        waiter = self._waiters.get(tx_hash)
+        if waiter is None:
+            waiter = self._waiters[tx_hash] = loop.create_future()
+            self._unscanned.add(tx_hash)
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._collect_receipts())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except asyncio.TimeoutError:
+            self._waiters.pop(tx_hash, None)
+            raise TimeExhausted(
+                f"Transaction {tx_hash.hex()} is not in the chain after {timeout} seconds"
+            )
+
+    async def _fetch_receipt(self, tx_hash):
+        try:
+            return await self.web3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+
+    async def _fetch_receipts(self, pending: list, block_number: int) -> dict:
+        start = block_number if self._last_block is None else self._last_block + 1
+        if self._last_block is not None and self._unscanned:
+            start = self._last_block
+        blocks = range(start, block_number + 1)
+        if (
+            self.block_receipts_supported is not False
+            and len(blocks) < len(pending)
+            and len(blocks) <= MAX_SCANNED_BLOCKS
+        ):
+            try:
+                block_receipts = await asyncio.gather(
+                    *(self.web3.eth.get_block_receipts(block) for block in blocks)
+                )
+                self.block_receipts_supported = True
+                return {
+                    HexBytes(receipt["transactionHash"]): receipt
+                    for receipts in block_receipts
+                    for receipt in receipts
+                }
+            except Exception as e:
+                if self.block_receipts_supported or not _is_unsupported_method_error(e):
+                    raise
+                self.block_receipts_supported = False
+
+        receipts = await asyncio.gather(
+            *(self._fetch_receipt(tx_hash) for tx_hash, _ in pending)
+        )
+        return {
+            tx_hash: receipt
+            for (tx_hash, _), receipt in zip(pending, receipts)
+            if receipt is not None
+        }
+
+    async def _collect_receipts(self) -> None:
+        self._last_block = None
+        self.failures = 0
+        while self._waiters:
+            pending = list(self._waiters.items())
+            try:
+                block_number = await self.web3.eth.block_number
+                if block_number != self._last_block:
+                    unscanned = set(self._unscanned)
+                    receipts = await self._fetch_receipts(pending, block_number)
+                    self._last_block = block_number
+                    self._unscanned -= unscanned
+                    for tx_hash, waiter in pending:
+                        receipt = receipts.get(tx_hash)
+                        if receipt is None:
+                            continue
+                        self._waiters.pop(tx_hash, None)
+                        if not waiter.done():
+                            waiter.set_result(receipt)
+                self.failures = 0
+            except Exception as e:
+                self.failures += 1
+                if self.failures < self.max_failures:
+                    logger.warning(
+                        "Receipt poll failed (%d/%d), retrying: %s",
+                        self.failures,
+                        self.max_failures,
+                        e,
+                    )
+                else:
+                    self.failures = 0
+                    for tx_hash, waiter in pending:
+                        self._waiters.pop(tx_hash, None)
+                        self._unscanned.discard(tx_hash)
+                        if not waiter.done():
+                            waiter.set_exception(e)
+            if self._waiters:
+                await asyncio.sleep(poll_delay(self.poll_interval, self.failures))
+
+
+def get_receipt_collector(web3: AsyncWeb3) -> AsyncReceiptCollector:
+    """
+    Get the receipt collector shared by every async send on a web3 instance.
+
+    :param web3 AsyncWeb3: The web3 instance.
+    :return AsyncReceiptCollector: The collector, created on first use.
+    """
+    with _lock:
+        collector = _collectors.get(web3)
+        if collector is None:
+            collector = _collectors[web3] = AsyncReceiptCollector(web3)
+    return collector
+
+
+async def wait_for_transaction_receipt(
+    web3: AsyncWeb3, tx_hash, timeout: float
+) -> dict:
+    """
+    Wait for a transaction receipt through the web3 instance's collector.
+
+    :param web3 AsyncWeb3: The web3 instance.
+    :param tx_hash HexBytes: The transaction hash.
+    :param timeout float: Seconds to wait for the receipt.
+    :return dict: The transaction receipt.
+    """
+    return await get_receipt_collector(web3).wait_for_receipt(tx_hash, timeout)
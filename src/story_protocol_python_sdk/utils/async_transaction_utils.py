@@ -0,0 +1,276 @@
+"""Build, sign and send transactions through an ``AsyncWeb3``.
+
+Mirrors :func:`~story_protocol_python_sdk.utils.transaction_utils.build_and_send_transaction`
+for the async resources: the same options, nonce handling and retries, with
+every network call awaited so a single event loop can drive many sends. The
+decisions of a send are the shared ``_send_steps``; this module only awaits
+the I/O they ask for.
+"""
+
+import asyncio
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3.exceptions import TransactionNotFound
+
+from story_protocol_python_sdk.utils.async_transaction_pipeline import (
+    wait_for_transaction_receipt,
+)
+from story_protocol_python_sdk.utils.fee_oracle import (
+    DEFAULT_FEE_STRATEGY,
+    get_async_fee_oracle,
+    resolve_fee_strategy,
+)
+from story_protocol_python_sdk.utils.nonce_manager import get_async_nonce_manager
+from story_protocol_python_sdk.utils.retry_policy import (
+    ALREADY_KNOWN,
+    RetryPolicy,
+    classify_send_error,
+    get_retry_policy,
+)
+from story_protocol_python_sdk.utils.transaction_utils import (
+    _get_cached_gas_limit,
+    _get_transaction_options,
+    _has_caller_fees,
+    _learn_gas_usage,
+    _send_steps,
+    _validate_nonce,
+)
+
+
+async def _get_async_fee_options(
+    web3: AsyncWeb3, tx_options: dict, bump_ratio: float | None = None
+) -> dict | None:
+    """
+    Awaited fee fields, raised by ``bump_ratio`` for a replacement, or None
+    if the caller priced the transaction.
+    """
+    if bump_ratio is None and _has_caller_fees(tx_options):
+        return None
+    strategy = resolve_fee_strategy(tx_options.get("feeStrategy", DEFAULT_FEE_STRATEGY))
+    try:
+        fees = await get_async_fee_oracle(web3).get_fees(strategy)
+    except Exception:
+        if bump_ratio is None:
+            # e.g. a chain without EIP-1559 fee history: leave the fees to web3
+            return {}
+    else:
+        if bump_ratio is not None:
+            fees = fees.bumped(bump_ratio)
+        return fees.to_tx_options()
+    try:
+        return {"gasPrice": int(await web3.eth.gas_price * bump_ratio)}
+    except Exception:
+        return {"gasPrice": web3.to_wei(2, "gwei")}
+
+
+async def _next_replacement_fees(
+    web3: AsyncWeb3,
+    tx_options: dict,
+    policy: RetryPolicy,
+    replacements: int,
+    previous: dict,
+) -> dict:
+    """Awaited counterpart of ``transaction_utils._next_replacement_fees``."""
+    previous = {
+        name: previous[name]
+        for name in ("gasPrice", "maxFeePerGas", "maxPriorityFeePerGas")
+        if name in previous
+    }
+    fees = await _get_async_fee_options(
+        web3, tx_options, policy.bump_ratio(replacements)
+    )
+    if previous and set(previous) != set(fees):
+        fees = {}
+    for name, value in previous.items():
+        fees[name] = max(fees.get(name, 0), int(value * policy.fee_bump_ratio))
+    return policy.cap_fees(fees)
+
+
+async def _get_async_transaction_options(
+    web3: AsyncWeb3,
+    account,
+    tx_options: dict,
+    nonce: int,
+    fee_options: dict | None = None,
+) -> dict:
+    """Build the transaction options dict, awaiting the fee lookup."""
+    if fee_options is None:
+        fee_options = await _get_async_fee_options(web3, tx_options)
+    return _get_transaction_options(
+        web3,
+        account,
+        tx_options,
+        nonce_override=nonce,
+        fee_options=fee_options,
+    )
+
+
+async def _sign_one(
+    account, client_function, client_args: tuple, transaction_options: dict
+):
+    """Build and sign one transaction."""
+    return account.sign_transaction(
+        await client_function(*client_args, transaction_options)
+    )
+
+
+async def _send_signed(web3: AsyncWeb3, signed_txn):
+    """Send one signed transaction. No retry."""
+    try:
+        return await web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+    except Exception as e:
+        # A resend of a transaction the node already has, e.g. after a timeout
+        if classify_send_error(e) == ALREADY_KNOWN:
+            return HexBytes(signed_txn.hash)
+        raise
+
+
+async def _find_receipt(web3: AsyncWeb3, tx_hashes: list) -> tuple:
+    """The first of the hashes that was mined, with its receipt, if any."""
+    for tx_hash in tx_hashes:
+        try:
+            return tx_hash, await web3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            continue
+    return None, None
+
+
+async def _run_async_steps(steps, io):
+    """Run the steps of a send with awaited I/O. Returns what they return."""
+    result = error = None
+    while True:
+        try:
+            step = steps.send(result) if error is None else steps.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        name, *args = step
+        try:
+            result, error = await getattr(io, name)(*args), None
+        except Exception as e:
+            result, error = None, e
+
+
+class _AsyncSendIO:
+    """The awaited I/O of the steps of one send."""
+
+    def __init__(
+        self,
+        web3: AsyncWeb3,
+        account,
+        client_function,
+        client_args: tuple,
+        send_options: dict,
+        policy: RetryPolicy,
+        nonce_manager,
+    ):
+        self.web3 = web3
+        self.account = account
+        self.client_function = client_function
+        self.client_args = client_args
+        self.send_options = send_options
+        self.policy = policy
+        self.nonce_manager = nonce_manager
+
+    async def allocate(self) -> int:
+        return await self.nonce_manager.allocate()
+
+    async def options(self, nonce: int, fee_options: dict | None) -> dict:
+        return await _get_async_transaction_options(
+            self.web3, self.account, self.send_options, nonce, fee_options
+        )
+
+    async def sign(self, opts: dict):
+        return await _sign_one(
+            self.account, self.client_function, self.client_args, opts
+        )
+
+    async def send(self, signed_txn):
+        return await _send_signed(self.web3, signed_txn)
+
+    async def find_receipt(self, tx_hashes: list) -> tuple:
+        return await _find_receipt(self.web3, tx_hashes)
+
+    async def replacement_fees(self, replacements: int, previous: dict) -> dict:
+        return await _next_replacement_fees(
+            self.web3, self.send_options, self.policy, replacements, previous
+        )
+
+    async def sleep(self, delay: float) -> bool:
+        # Cancelling the task interrupts the wait
+        await asyncio.sleep(delay)
+        return True
+
+    async def wait_receipt(self, tx_hash, timeout: float):
+        return await wait_for_transaction_receipt(self.web3, tx_hash, timeout)
+
+
+async def async_build_and_send_transaction(
+    web3: AsyncWeb3,
+    account,
+    client_function,
+    *client_args,
+    tx_options: dict | None = None,
+) -> dict:
+    """
+    Builds and sends a transaction using the provided client function and arguments.
+
+    The client function is the ``build_*_transaction`` method of a generated
+    client bound to an ``AsyncWeb3``, which returns a coroutine. Nonces come
+    from the account's :class:`AsyncNonceManager` and the receipt from the
+    web3 instance's :class:`AsyncReceiptCollector`. Retries follow the
+    :class:`RetryPolicy` of the send, and the gas estimate cache works as
+    for ``build_and_send_transaction``; backoffs are awaited, so they never
+    block the event loop.
+
+    :param web3 AsyncWeb3: An instance of AsyncWeb3.
+    :param account: The account to use for signing the transaction.
+    :param client_function: The client function to build the transaction.
+    :param client_args: Arguments to pass to the client function.
+    :param tx_options dict: Optional transaction options, as for ``build_and_send_transaction``.
+    :return dict: A dictionary with the transaction hash and optionally receipt (if wait_for_receipt is True),
+                  or encoded data if encodedTxDataOnly is True.
+    :raises Exception: If there is an error during the transaction process.
+    """
+    tx_options = tx_options or {}
+    client_args = tuple(client_args)
+    nonce_manager = (
+        None
+        if "nonce" in tx_options
+        else get_async_nonce_manager(web3, account.address)
+    )
+
+    if tx_options.get("encodedTxDataOnly"):
+        nonce = (
+            _validate_nonce(tx_options["nonce"])
+            if nonce_manager is None
+            else await nonce_manager.peek()
+        )
+        opts = await _get_async_transaction_options(web3, account, tx_options, nonce)
+        return {"encodedTxData": await client_function(*client_args, opts)}
+
+    gas_cache, gas_key, gas_limit = _get_cached_gas_limit(
+        web3, client_function, client_args, tx_options
+    )
+    send_options = tx_options if gas_limit is None else {**tx_options, "gas": gas_limit}
+
+    policy = get_retry_policy(web3, tx_options)
+    tx_hash, tx_receipt = await _run_async_steps(
+        _send_steps(policy, nonce_manager, tx_options),
+        _AsyncSendIO(
+            web3,
+            account,
+            client_function,
+            client_args,
+            send_options,
+            policy,
+            nonce_manager,
+        ),
+    )
+    if tx_receipt is None:
+        return {"tx_hash": tx_hash.hex()}
+    if _learn_gas_usage(gas_cache, gas_key, gas_limit, tx_receipt):
+        return await async_build_and_send_transaction(
+            web3, account, client_function, *client_args, tx_options=tx_options
+        )
+    return {"tx_hash": tx_hash.hex(), "tx_receipt": tx_receipt}
@@ -0,0 +1,304 @@
+"""Batching of read-only contract calls into JSON-RPC batch requests.
+
+Every generated client read, e.g. ``IPAssetRegistryClient.isRegistered``, is
+one ``eth_call`` and one HTTP round trip. A :class:`ReadBatch` collects reads
+and sends them as one JSON-RPC batch array over the provider of the web3
+instance, so N validation reads cost one round trip.
+
+The batch goes straight to the provider's ``make_batch_request``, not through
+``web3.batch_requests()``: that one switches the whole provider into batching
+mode, which would also capture the calls of other threads, e.g. a receipt
+watcher. Providers without batch support, and nodes that answer a batch with
+a "method not found" or "batch not supported" error, get the reads one by
+one.
+
+No SDK method reads through :class:`ReadBatch`. Their validation reads go
+through ``Multicall3.aggregate3`` (see :mod:`multicall_reads`), which costs
+one ``eth_call`` and needs no batch support from the node. A
+:class:`ReadBatch` is for callers, e.g. on a chain or fork without Multicall3.
+"""
+
+import importlib
+
+from eth_utils import to_bytes, to_checksum_address
+from eth_utils.abi import get_abi_output_types
+from typing_extensions import Self
+from web3 import Web3
+
+DEFAULT_MAX_BATCH_SIZE = 100
+# JSON-RPC error codes of nodes that take no batch arrays: invalid request,
+# method not found
+_UNSUPPORTED_BATCH_CODES = frozenset({-32600, -32601})
+_UNSUPPORTED_BATCH_MESSAGES = (
+    "method not found",
+    "batch not supported",
+    "batch requests are not supported",
+    "batch requests not supported",
+    "batch requests disabled",
+    "batching is not supported",
+)
+# Messages of batches that were too big, not unsupported
+_BATCH_SIZE_MESSAGES = ("too large", "too many", "exceed", "limit")
+
+
+class BatchedRead:
+    """The pending result of a read added to a :class:`ReadBatch`."""
+
+    def __init__(self, client_function, client_args: tuple):
+        self.client_function = client_function
+        self.client_args = client_args
+        self._done = False
+        self._value = None
+        self._error: Exception | None = None
+
+    def done(self) -> bool:
+        """Whether the batch of the read was sent."""
+        return self._done
+
+    def _set(self, value=None, error: Exception | None = None) -> None:
+        self._value, self._error, self._done = value, error, True
+
+    @property
+    def result(self):
+        """
+        The return value of the read, as the client method would return it.
+
+        :raises ValueError: If the batch was not sent yet.
+        :raises Exception: The error of the read, if it failed.
+        """
+        if not self._done:
+            raise ValueError("The read batch was not executed yet.")
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
+def _function_name(client_function) -> str:
+    name = getattr(client_function, "__name__", "")
+    client = getattr(client_function, "__self__", None)
+    if client is None or not hasattr(client, "contract") or name.startswith("build_"):
+        raise ValueError(
+            f"{name or client_function} is not a read method of a generated client."
+        )
+    return name
+
+
+def encode_client_read(client_function, client_args: tuple) -> bytes:
+    """
+    Encode the calldata of a generated client read.
+
+    :param client_function: The read method of a generated client, e.g.
+        ``ip_asset_registry_client.isRegistered``.
+    :param client_args tuple: The arguments of the read.
+    :return bytes: The calldata.
+    :raises ValueError: If the function is not a generated client read.
+    """
+    name = _function_name(client_function)
+    client = client_function.__self__
+    encoders_module = type(client).__module__.removesuffix("_client") + "_encoders"
+    try:
+        encoder = getattr(importlib.import_module(encoders_module), f"encode_{name}")
+    except (ImportError, AttributeError):
+        return to_bytes(hexstr=client.contract.encode_abi(name, args=list(client_args)))
+    return encoder(*client_args)
+
+
+def decode_client_read(web3: Web3, client_function, client_args: tuple, data: bytes):
+    """
+    Decode the return data of a generated client read the way ``call()`` does.
+
+    :param web3 Web3: The web3 instance.
+    :param client_function: The read method of a generated client.
+    :param client_args tuple: The arguments of the read.
+    :param data bytes: The return data of the ``eth_call``.
+    :return: The single output, or a tuple of the outputs.
+    """
+    name = _function_name(client_function)
+    contract = client_function.__self__.contract
+    fn_abi = contract.functions[name](*client_args).abi
+    decoded = web3.codec.decode(get_abi_output_types(fn_abi), data)
+    normalized = [
+        _checksum_addresses(output["type"], output.get("components"), value)
+        for output, value in zip(fn_abi["outputs"], decoded)
+    ]
+    return normalized[0] if len(normalized) == 1 else normalized
+
+
+def _checksum_addresses(abi_type: str, components, value):
+    # call() returns addresses checksummed and arrays as lists
+    if abi_type.endswith("]"):
+        item_type = abi_type[: abi_type.rindex("[")]
+        return [_checksum_addresses(item_type, components, item) for item in value]
+    if abi_type == "tuple":
+        return tuple(
+            _checksum_addresses(component["type"], component.get("components"), item)
+            for component, item in zip(components, value)
+        )
+    if abi_type == "address":
+        return to_checksum_address(value)
+    return value
+
+
+def _is_unsupported_batch_error(error) -> bool:
+    """Whether the error object of a batch response says batches are not taken."""
+    if not isinstance(error, dict):
+        return False
+    message = str(error.get("message", "")).lower()
+    if any(size_message in message for size_message in _BATCH_SIZE_MESSAGES):
+        return False
+    return error.get("code") in _UNSUPPORTED_BATCH_CODES or any(
+        unsupported in message for unsupported in _UNSUPPORTED_BATCH_MESSAGES
+    )
+
+
+class ReadBatch:
+    """
+    Collects generated client reads and sends them as JSON-RPC batch requests.
+
+    Example::
+
+        with client.batch_reads() as batch:
+            registered = batch.add(ip_asset_registry_client.isRegistered, ip_id)
+            attached = batch.add(
+                license_registry_client.hasIpAttachedLicenseTerms,
+                ip_id,
+                pil_template,
+                license_terms_id,
+            )
+        if registered.result and attached.result:
+            ...
+
+    :param web3 Web3: The web3 instance whose provider sends the batches.
+    :param max_batch_size int: [Optional] The most calls in one JSON-RPC
+        batch. Nodes cap batch sizes, so bigger batches are split. Default is 100.
+    :param block_identifier: [Optional] The block to read at. Default is "latest".
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        block_identifier="latest",
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        self.web3 = web3
+        self.max_batch_size = max_batch_size
+        self.block_identifier = block_identifier
+        self._reads: list[BatchedRead] = []
+        self.batch_supported: bool | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.execute()
+        else:
+            self._reads = []
+
+    def add(self, client_function, *client_args) -> BatchedRead:
+        """
+        Add a read to the batch.
+
+        :param client_function: The read method of a generated client.
+        :param client_args: The arguments of the read.
+        :return BatchedRead: Holds the result once the batch is executed.
+        """
+        _function_name(client_function)
+        read = BatchedRead(client_function, client_args)
+        self._reads.append(read)
+        return read
+
+    def execute(self) -> list:
+        """
+        Send every read added since the last execution.
+
+        :return list: The results of the reads, in the order they were added.
+        :raises Exception: The error of the first failed read.
+        """
+        reads, self._reads = self._reads, []
+        for start in range(0, len(reads), self.max_batch_size):
+            chunk = reads[start : start + self.max_batch_size]
+            if self.batch_supported is not False and len(chunk) > 1:
+                if self._send_batch(chunk):
+                    continue
+                self.batch_supported = False
+            self._send_one_by_one(chunk)
+        return [read.result for read in reads]
+
+    def _send_batch(self, reads: list[BatchedRead]) -> bool:
+        """Send reads as one batch. False if the provider or node takes no batches."""
+        make_batch_request = getattr(self.web3.provider, "make_batch_request", None)
+        if make_batch_request is None:
+            return False
+        calls = [
+            (
+                "eth_call",
+                [
+                    {
+                        "to": read.client_function.__self__.contract.address,
+                        "data": "0x"
+                        + encode_client_read(
+                            read.client_function, read.client_args
+                        ).hex(),
+                    },
+                    self.block_identifier,
+                ],
+            )
+            for read in reads
+        ]
+        try:
+            responses = make_batch_request(calls)
+        except NotImplementedError:
+            return False
+        if not isinstance(responses, list):
+            error = responses.get("error", responses)
+            if _is_unsupported_batch_error(error):
+                return False
+            raise ValueError(f"The batch request failed: {error}")
+        if len(responses) != len(reads):
+            raise ValueError(
+                f"Expected {len(reads)} batch responses, got {len(responses)}."
+            )
+        self.batch_supported = True
+        for read, response in zip(reads, responses):
+            if response.get("error") is not None:
+                error = response["error"]
+                message = error.get("message") if isinstance(error, dict) else error
+                read._set(error=ValueError(f"eth_call failed: {message}"))
+                continue
+            try:
+                read._set(
+                    decode_client_read(
+                        self.web3,
+                        read.client_function,
+                        read.client_args,
+                        to_bytes(hexstr=response["result"]),
+                    )
+                )
+            except Exception as e:
+                read._set(error=e)
+        return True
+
+    def _send_one_by_one(self, reads: list[BatchedRead]) -> None:
+        for read in reads:
+            try:
+                read._set(read.client_function(*read.client_args))
+            except Exception as e:
+                read._set(error=e)
+
+
+def read_all(web3: Web3, reads, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE) -> list:
+    """
+    Run many generated client reads as JSON-RPC batch requests.
+
+    :param web3 Web3: The web3 instance.
+    :param reads: Pairs of a client read method and a tuple of its arguments.
+    :param max_batch_size int: [Optional] The most calls in one batch request.
+    :return list: The results of the reads, in order.
+    """
+    batch = ReadBatch(web3, max_batch_size)
+    for client_function, client_args in reads:
+        batch.add(client_function, *client_args)
+    return batch.execute()
@@ -0,0 +1,124 @@
+"""Per-IP results of a batch transaction.
+
+A multicall that registers n IPs emits their IPRegistered events in receipt
+order, together with the events of what each registration did: the license
+terms it attached and the royalty vault it deployed. Matching those to each
+IP by scanning the receipt once per IP costs O(IPs x logs). A
+:class:`BatchResults` decodes every event kind once and groups it by IP ID,
+so each per-IP lookup is a dict read::
+
+    batch = BatchResults(web3, tx_receipt)
+    results = batch.build(license_terms_ids=True)
+"""
+
+from functools import cached_property
+
+from web3 import Web3
+
+from story_protocol_python_sdk.utils.receipt_decoder import (
+    decode_receipt,
+    get_event_decoder,
+)
+
+
+class BatchResults:
+    """
+    The events of a batch transaction receipt, grouped by IP.
+
+    :param web3 Web3: The web3 instance, used to checksum addresses.
+    :param tx_receipt dict: The transaction receipt.
+    """
+
+    def __init__(self, web3: Web3, tx_receipt: dict):
+        self.web3 = web3
+        self._decoded = decode_receipt(tx_receipt)
+
+    @cached_property
+    def registered(self) -> list:
+        """
+        The IPRegistered records, in receipt order. Addresses are lowercase.
+        """
+        return self._decoded.records(
+            get_event_decoder("IPAssetRegistry", "IPRegistered")
+        )
+
+    @cached_property
+    def _license_terms_ids(self) -> dict[str, list[int]]:
+        # lowercase IP ID -> license terms IDs, in receipt order
+        grouped: dict[str, list[int]] = {}
+        for attached in self._decoded.records(
+            get_event_decoder("LicensingModule", "LicenseTermsAttached")
+        ):
+            grouped.setdefault(attached.ipId, []).append(attached.licenseTermsId)
+        return grouped
+
+    @cached_property
+    def _royalty_vaults(self) -> dict[str, str]:
+        # lowercase IP ID -> lowercase royalty vault address
+        return {
+            deployed.ipId: deployed.ipRoyaltyVault
+            for deployed in self._decoded.records(
+                get_event_decoder("RoyaltyModule", "IpRoyaltyVaultDeployed")
+            )
+        }
+
+    def license_terms_ids(self, ip_id: str) -> list[int]:
+        """
+        Get the license terms attached to an IP in the batch.
+
+        :param ip_id str: The IP ID.
+        :return list[int]: The license terms IDs, in receipt order.
+        """
+        return self._license_terms_ids.get(ip_id.lower(), [])
+
+    def royalty_vault(self, ip_id: str) -> str | None:
+        """
+        Get the royalty vault deployed for an IP in the batch.
+
+        :param ip_id str: The IP ID.
+        :return str | None: The royalty vault address, or None if none was deployed.
+        """
+        royalty_vault = self._royalty_vaults.get(ip_id.lower())
+        return (
+            None
+            if royalty_vault is None
+            else self.web3.to_checksum_address(royalty_vault)
+        )
+
+    def build(
+        self,
+        nft_contract_key: str = "nft_contract",
+        license_terms_ids: bool = False,
+        royalty_vault: bool = False,
+    ) -> list[dict]:
+        """
+        Build one result per registered IP, in receipt order.
+
+        :param nft_contract_key str: [Optional] The result key of the NFT
+            contract address. Default is ``"nft_contract"``.
+        :param license_terms_ids bool: [Optional] Whether to add the
+            ``license_terms_ids`` attached to each IP. Default is False.
+        :param royalty_vault bool: [Optional] Whether to add the
+            ``royalty_vault`` deployed for each IP. Default is False.
+        :return list[dict]: The results, each containing:
+            :return ip_id str: The IP ID.
+            :return token_id int: The token ID.
+            :return nft_contract str: The NFT contract address, under ``nft_contract_key``.
+            :return license_terms_ids list[int]: [Optional] The attached license terms IDs.
+            :return royalty_vault str: [Optional] The royalty vault address.
+        """
+        results = []
+        for ip_registered in self.registered:
+            result = {
+                "ip_id": self.web3.to_checksum_address(ip_registered.ipId),
+                "token_id": ip_registered.tokenId,
+                nft_contract_key: self.web3.to_checksum_address(
+                    ip_registered.tokenContract
+                ),
+            }
+            if license_terms_ids:
+                result["license_terms_ids"] = self.license_terms_ids(ip_registered.ipId)
+            if royalty_vault:
+                result["royalty_vault"] = self.royalty_vault(ip_registered.ipId)
+            results.append(result)
+        return results
@@ -6,5 +6,8 @@ MAX_ROYALTY_TOKEN = 100_000_000
 ROYALTY_POLICY_LAP_ADDRESS = "0xBe54FB168b3c982b7AaE60dB6CF75Bd8447b390E"
 ROYALTY_POLICY_LRP_ADDRESS = "0x9156e603C949481883B1d3355c6f1132D191fC41"
 WIP_TOKEN_ADDRESS = "0x1514000000000000000000000000000000000000"
+AENEID_CHAIN_ID = 1315
+MAINNET_CHAIN_ID = 1514
+SUPPORTED_CHAIN_IDS = (AENEID_CHAIN_ID, MAINNET_CHAIN_ID)
 # Default deadline for signature in seconds
 DEADLINE = 1000
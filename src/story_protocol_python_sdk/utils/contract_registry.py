@@ -0,0 +1,301 @@
+"""Process-wide registry of contract ABIs, addresses and contract instances.
+
+Every generated client used to open and parse ``scripts/config.json`` and its
+ABI JSON on instantiation. The registry does that work once per process and
+hands out shared objects, so building a ``StoryClient`` only pays for the
+files it has not seen before. ABIs are read from the precompiled
+``abi/abi_bundle.pickle`` written by ``scripts/generate_clients.py``.
+Address-bound implementation contracts are kept in a bounded LRU pool.
+"""
+
+import json
+import os
+import pickle
+import threading
+import weakref
+from collections import OrderedDict
+from functools import cache
+from types import MappingProxyType
+
+from eth_utils.abi import (
+    abi_to_signature,
+    event_abi_to_log_topic,
+    function_abi_to_4byte_selector,
+)
+from web3 import Web3
+
+from story_protocol_python_sdk.utils.constants import AENEID_CHAIN_ID
+
+_PACKAGE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+CONFIG_PATH = os.path.join(_PACKAGE_DIR, "scripts", "config.json")
+ABI_DIR = os.path.join(_PACKAGE_DIR, "abi", "jsons")
+ABI_BUNDLE_PATH = os.path.join(_PACKAGE_DIR, "abi", "abi_bundle.pickle")
+
+_lock = threading.Lock()
+# web3 instance -> {(chain_id, contract_name): contract}
+_contracts: "weakref.WeakKeyDictionary[Web3, dict]" = weakref.WeakKeyDictionary()
+# web3 instance -> pool of address-bound contract instances
+_pools: "weakref.WeakKeyDictionary[Web3, ContractPool]" = weakref.WeakKeyDictionary()
+
+# Default number of address-bound contract instances pooled per web3 instance.
+CONTRACT_POOL_SIZE = 1024
+
+
+@cache
+def load_abi_bundle() -> dict:
+    """
+    Load the precompiled ABI bundle emitted by ``scripts/generate_clients.py``.
+
+    :return dict: The bundle with ``abis``, ``function_selectors`` and
+        ``event_topics`` keyed by contract name, or empty mappings if the
+        bundle has not been generated.
+    """
+    try:
+        with open(ABI_BUNDLE_PATH, "rb") as bundle_file:
+            return pickle.load(bundle_file)
+    except FileNotFoundError:
+        return {"abis": {}, "function_selectors": {}, "event_topics": {}}
+
+
+@cache
+def load_abi(contract_name: str) -> tuple:
+    """
+    Load the ABI of a contract once per process.
+
+    ABIs come from the precompiled bundle; the JSON file is only parsed for
+    ABIs missing from it.
+
+    :param contract_name str: The ABI file name without the ``.json`` suffix.
+    :return tuple: The ABI entries, shared between all callers. Do not mutate.
+    """
+    abi = load_abi_bundle()["abis"].get(contract_name)
+    if abi is not None:
+        return abi
+    with open(os.path.join(ABI_DIR, f"{contract_name}.json"), "r") as abi_file:
+        return tuple(json.load(abi_file))
+
+
+def get_event_topics(contract_name: str) -> dict[str, str]:
+    """
+    Get the precomputed event topics of a contract.
+
+    :param contract_name str: The contract name.
+    :return dict: A mapping of event signature to ``0x``-prefixed topic hash.
+    """
+    topics = load_abi_bundle()["event_topics"].get(contract_name)
+    if topics is None:
+        topics = {
+            abi_to_signature(item): "0x" + event_abi_to_log_topic(item).hex()
+            for item in load_abi(contract_name)
+            if item["type"] == "event"
+        }
+    return topics
+
+
+def get_function_selectors(contract_name: str) -> dict[str, str]:
+    """
+    Get the precomputed function selectors of a contract.
+
+    :param contract_name str: The contract name.
+    :return dict: A mapping of function signature to ``0x``-prefixed selector.
+    """
+    selectors = load_abi_bundle()["function_selectors"].get(contract_name)
+    if selectors is None:
+        selectors = {
+            abi_to_signature(item): "0x" + function_abi_to_4byte_selector(item).hex()
+            for item in load_abi(contract_name)
+            if item["type"] == "function"
+        }
+    return selectors
+
+
+@cache
+def load_config() -> dict:
+    """
+    Load ``scripts/config.json`` once per process.
+
+    :return dict: The parsed config.
+    """
+    with open(CONFIG_PATH, "r") as config_file:
+        return json.load(config_file)
+
+
+@cache
+def get_address_book(chain_id: int | None = None) -> MappingProxyType:
+    """
+    Get the contract address book of a chain, built once per chain ID.
+
+    A contract's ``contract_address`` in config.json applies to every chain
+    unless its optional ``chain_addresses`` mapping (chain ID as a string to
+    address) overrides it. Addresses are stored checksummed.
+
+    :param chain_id int: (Optional) The chain ID. Defaults to aeneid.
+    :return MappingProxyType: A read-only mapping of contract name to address.
+    """
+    chain_key = str(AENEID_CHAIN_ID if chain_id is None else chain_id)
+    address_book = {}
+    for contract in load_config()["contracts"]:
+        address = contract.get("chain_addresses", {}).get(
+            chain_key, contract["contract_address"]
+        )
+        address_book[contract["contract_name"]] = Web3.to_checksum_address(address)
+    return MappingProxyType(address_book)
+
+
+def get_contract_address(contract_name: str, chain_id: int | None = None) -> str:
+    """
+    Get the deployed address of a contract from the address book.
+
+    :param contract_name str: The contract name.
+    :param chain_id int: (Optional) The chain ID. Defaults to aeneid.
+    :return str: The checksummed contract address.
+    """
+    contract_address = get_address_book(chain_id).get(contract_name)
+    if not contract_address:
+        raise ValueError(
+            f"Contract address for {contract_name} not found in config.json"
+        )
+    return contract_address
+
+
+def get_contract(web3: Web3, contract_name: str, chain_id: int | None = None):
+    """
+    Get the deployed contract instance bound to a web3 instance.
+
+    Instances are cached per web3 instance, chain ID and contract name, so
+    clients of the same contract on the same provider share one instance.
+    Contract instances must therefore be treated as read-only by callers.
+
+    :param web3 Web3: The web3 instance.
+    :param contract_name str: The contract name, also used as the ABI name.
+    :param chain_id int: (Optional) The chain ID. Defaults to aeneid.
+    :return Contract: The contract instance.
+    """
+    key = (AENEID_CHAIN_ID if chain_id is None else chain_id, contract_name)
+    with _lock:
+        contracts = _contracts.setdefault(web3, {})
+        contract = contracts.get(key)
+        if contract is None:
+            contract = web3.eth.contract(
+                address=get_contract_address(contract_name, key[0]),
+                abi=load_abi(contract_name),
+            )
+            contracts[key] = contract
+    return contract
+
+
+class ContractPool:
+    """
+    A bounded, least-recently-used pool of address-bound contract instances.
+
+    Implementation clients (IP accounts, royalty vaults, SPG NFTs) are bound
+    to a different address on almost every call. The pool keeps the most
+    recently used instances per web3 instance so sweeps over many addresses
+    reuse them instead of building a new contract each time.
+
+    :param web3 Web3: The web3 instance the contracts are bound to.
+    :param max_size int: The maximum number of pooled contract instances.
+    """
+
+    def __init__(self, web3: Web3, max_size: int = CONTRACT_POOL_SIZE):
+        if max_size < 1:
+            raise ValueError("The contract pool size must be at least 1.")
+        self.web3 = web3
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._contracts: OrderedDict[tuple[str, str], object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._contracts)
+
+    def get(self, contract_name: str, address: str):
+        """
+        Get the pooled contract instance of a contract at an address.
+
+        :param contract_name str: The ABI name.
+        :param address str: The contract address.
+        :return Contract: The contract instance.
+        """
+        key = (contract_name, address.lower())
+        with self._lock:
+            contract = self._contracts.get(key)
+            if contract is not None:
+                self._contracts.move_to_end(key)
+                self.hits += 1
+                return contract
+            self.misses += 1
+            contract = self.web3.eth.contract(
+                address=address, abi=load_abi(contract_name)
+            )
+            self._contracts[key] = contract
+            if len(self._contracts) > self.max_size:
+                self._contracts.popitem(last=False)
+        return contract
+
+    def stats(self) -> dict:
+        """
+        Get the pool counters.
+
+        :return dict: A dictionary with ``hits``, ``misses``, ``size`` and
+            ``max_size``.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._contracts),
+                "max_size": self.max_size,
+            }
+
+    def clear(self) -> None:
+        """Drop every pooled contract instance and reset the counters."""
+        with self._lock:
+            self._contracts.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def get_contract_pool(web3: Web3) -> ContractPool:
+    """
+    Get the pool of address-bound contract instances of a web3 instance.
+
+    :param web3 Web3: The web3 instance.
+    :return ContractPool: The pool, created on first use.
+    """
+    with _lock:
+        pool = _pools.get(web3)
+        if pool is None:
+            pool = _pools[web3] = ContractPool(web3)
+    return pool
+
+
+def get_contract_at(web3: Web3, contract_name: str, address: str | None = None):
+    """
+    Get a contract instance for an arbitrary address using the shared ABI.
+
+    Used by implementation clients (IP accounts, royalty vaults, SPG NFTs)
+    whose address varies per call. Instances bound to an address come from
+    the web3 instance's :class:`ContractPool`; an unbound instance is built
+    fresh and not pooled.
+
+    :param web3 Web3: The web3 instance.
+    :param contract_name str: The ABI name.
+    :param address str: (Optional) The contract address.
+    :return Contract: The contract instance.
+    """
+    if address is None:
+        return web3.eth.contract(address=address, abi=load_abi(contract_name))
+    return get_contract_pool(web3).get(contract_name, address)
+
+
+def clear_cache() -> None:
+    """Drop every cached ABI, address, contract instance and contract pool."""
+    with _lock:
+        _contracts.clear()
+        _pools.clear()
+    load_abi_bundle.cache_clear()
+    load_abi.cache_clear()
+    load_config.cache_clear()
+    get_address_book.cache_clear()
@@ -1,3 +1,5 @@
+import threading
+import weakref
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -10,16 +12,53 @@ from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import
 from story_protocol_python_sdk.abi.LicenseRegistry.LicenseRegistry_client import (
     LicenseRegistryClient,
 )
+from story_protocol_python_sdk.abi.Multicall3.Multicall3_client import Multicall3Client
 from story_protocol_python_sdk.abi.PILicenseTemplate.PILicenseTemplate_client import (
     PILicenseTemplateClient,
 )
 from story_protocol_python_sdk.types.common import RevShareType
 from story_protocol_python_sdk.utils.constants import MAX_ROYALTY_TOKEN, ZERO_ADDRESS
+from story_protocol_python_sdk.utils.multicall_reads import try_aggregate_reads
 from story_protocol_python_sdk.utils.validation import (
     get_revenue_share,
     validate_address,
 )
 
+_lock = threading.Lock()
+# web3 instance -> chain ID -> the contract clients DerivativeData validates with
+_clients: "weakref.WeakKeyDictionary[Web3, dict[int | None, tuple]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_clients(
+    web3: Web3,
+    chain_id: int | None = None,
+) -> tuple[
+    PILicenseTemplateClient,
+    IPAssetRegistryClient,
+    LicenseRegistryClient,
+    Multicall3Client,
+]:
+    with _lock:
+        chain_clients = _clients.setdefault(web3, {})
+        clients = chain_clients.get(chain_id)
+        if clients is None:
+            clients = (
+                PILicenseTemplateClient(web3, chain_id),
+                IPAssetRegistryClient(web3, chain_id),
+                LicenseRegistryClient(web3, chain_id),
+                Multicall3Client(web3, chain_id),
+            )
+            chain_clients[chain_id] = clients
+        return clients
+
+
+def clear_derivative_data_clients() -> None:
+    """Forget the contract clients shared by every DerivativeData."""
+    with _lock:
+        _clients.clear()
+
 
 @dataclass
 class DerivativeDataInput:
@@ -56,14 +95,19 @@ class DerivativeData:
     max_rts: int | float
     max_revenue_share: int
     license_template: Optional[str]
+    chain_id: Optional[int] = None
 
     pi_license_template_client: PILicenseTemplateClient = field(init=False)
     ip_asset_registry_client: IPAssetRegistryClient = field(init=False)
     license_registry_client: LicenseRegistryClient = field(init=False)
+    multicall3_client: Multicall3Client = field(init=False)
 
     @classmethod
     def from_input(
-        cls, web3: Web3, input_data: DerivativeDataInput
+        cls,
+        web3: Web3,
+        input_data: DerivativeDataInput,
+        chain_id: Optional[int] = None,
     ) -> "DerivativeData":
         """
         Create a DerivativeData instance from DerivativeDataInput.
@@ -71,6 +115,7 @@ class DerivativeData:
         Args:
             web3: Web3 instance for blockchain interaction
             input_data: User-provided derivative data
+            chain_id: [Optional] The chain ID whose contracts to validate against. Defaults to aeneid.
 
         Returns:
             DerivativeData instance with validated data
@@ -83,14 +128,18 @@ class DerivativeData:
             max_rts=input_data.max_rts,
             max_revenue_share=input_data.max_revenue_share,
             license_template=input_data.license_template,
+            chain_id=chain_id,
         )
 
     def __post_init__(self):
         """Initialize clients and validate data after object creation."""
 
-        self.pi_license_template_client = PILicenseTemplateClient(self.web3)
-        self.ip_asset_registry_client = IPAssetRegistryClient(self.web3)
-        self.license_registry_client = LicenseRegistryClient(self.web3)
+        (
+            self.pi_license_template_client,
+            self.ip_asset_registry_client,
+            self.license_registry_client,
+            self.multicall3_client,
+        ) = _get_clients(self.web3, self.chain_id)
 
         if self.license_template is None:
             self.license_template = self.pi_license_template_client.contract.address
@@ -113,23 +162,39 @@ class DerivativeData:
             raise ValueError(
                 "The number of parent IP IDs must match the number of license terms IDs."
             )
-        total_royalty_percent = 0
+        for parent_ip_id in self.parent_ip_ids:
+            validate_address(parent_ip_id)
+
+        # Every read of every parent goes out in one aggregate3 call
+        reads = []
         for parent_ip_id, license_terms_id in zip(
             self.parent_ip_ids, self.license_terms_ids
         ):
-            validate_address(parent_ip_id)
+            terms = (parent_ip_id, self.license_template, license_terms_id)
+            reads += [
+                (self.ip_asset_registry_client.isRegistered, (parent_ip_id,)),
+                (self.license_registry_client.hasIpAttachedLicenseTerms, terms),
+                (self.license_registry_client.getRoyaltyPercent, terms),
+            ]
+        results = try_aggregate_reads(self.multicall3_client, reads)
 
-            if not self.ip_asset_registry_client.isRegistered(parent_ip_id):
+        total_royalty_percent = 0
+        for i, (parent_ip_id, license_terms_id) in enumerate(
+            zip(self.parent_ip_ids, self.license_terms_ids)
+        ):
+            (_, is_registered), (_, is_attached), (has_royalty, royalty_percent) = (
+                results[3 * i : 3 * i + 3]
+            )
+            if not is_registered:
                 raise ValueError(f"The parent IP ID {parent_ip_id} must be registered.")
-            if not self.license_registry_client.hasIpAttachedLicenseTerms(
-                parent_ip_id, self.license_template, license_terms_id
-            ):
+            if not is_attached:
                 raise ValueError(
                     f"License terms id {license_terms_id} must be attached to the parent ipId {parent_ip_id} before registering derivative."
                 )
-            royalty_percent = self.license_registry_client.getRoyaltyPercent(
-                parent_ip_id, self.license_template, license_terms_id
-            )
+            if not has_royalty:
+                raise ValueError(
+                    f"Failed to get the royalty percent of license terms id {license_terms_id} of the parent ipId {parent_ip_id}."
+                )
             total_royalty_percent += royalty_percent
             if (
                 self.max_revenue_share != 0
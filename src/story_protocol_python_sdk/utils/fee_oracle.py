@@ -0,0 +1,319 @@
+"""Per-block EIP-1559 fee estimates shared by every send on a web3 instance.
+
+Without fee options, web3 fills ``maxFeePerGas`` and ``maxPriorityFeePerGas``
+with extra RPC calls for every transaction it builds. A :class:`FeeOracle`
+looks the fees up once per block with ``eth_feeHistory`` and hands the same
+estimate to every transaction built in that block. :class:`AsyncFeeOracle`
+does the same for senders on an ``AsyncWeb3``.
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+
+from web3 import AsyncWeb3, Web3
+
+DEFAULT_FEE_STRATEGY = "standard"
+FEE_HISTORY_BLOCKS = 10
+# How long the latest block number is trusted before it is fetched again
+BLOCK_NUMBER_MAX_AGE = 1.0
+
+_lock = threading.Lock()
+# web3 instance -> FeeOracle
+_oracles: "weakref.WeakKeyDictionary[Web3, FeeOracle]" = weakref.WeakKeyDictionary()
+# AsyncWeb3 instance -> AsyncFeeOracle
+_async_oracles: "weakref.WeakKeyDictionary[AsyncWeb3, AsyncFeeOracle]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@dataclass(frozen=True)
+class FeeEstimate:
+    """
+    The EIP-1559 fees for transactions built in one block.
+
+    :param block_number int: The block the estimate was made for.
+    :param base_fee_per_gas int: The base fee of the next block in wei.
+    :param max_priority_fee_per_gas int: The priority fee (tip) in wei.
+    :param max_fee_per_gas int: The max fee in wei.
+    """
+
+    block_number: int
+    base_fee_per_gas: int
+    max_priority_fee_per_gas: int
+    max_fee_per_gas: int
+
+    def bumped(self, ratio: float) -> "FeeEstimate":
+        """
+        Get the estimate with both fees raised, e.g. to replace a transaction.
+
+        :param ratio float: The factor to raise the fees by.
+        :return FeeEstimate: The raised estimate.
+        """
+        return FeeEstimate(
+            block_number=self.block_number,
+            base_fee_per_gas=self.base_fee_per_gas,
+            max_priority_fee_per_gas=int(self.max_priority_fee_per_gas * ratio),
+            max_fee_per_gas=int(self.max_fee_per_gas * ratio),
+        )
+
+    def to_tx_options(self) -> dict:
+        """
+        Get the fee fields of a transaction.
+
+        :return dict: The ``maxFeePerGas`` and ``maxPriorityFeePerGas`` fields.
+        """
+        return {
+            "maxFeePerGas": self.max_fee_per_gas,
+            "maxPriorityFeePerGas": self.max_priority_fee_per_gas,
+        }
+
+
+@dataclass(frozen=True)
+class FeeStrategy:
+    """
+    Turns an ``eth_feeHistory`` result into a fee estimate.
+
+    The priority fee is the median, over the non-empty blocks of the history,
+    of the ``reward_percentile`` tip paid in each block. The max fee leaves
+    room for the base fee to grow by ``base_fee_multiplier`` before the
+    transaction is priced out. Subclass and override :meth:`priority_fee` or
+    :meth:`estimate` for other policies.
+
+    :param name str: The name of the strategy.
+    :param reward_percentile float: The tip percentile (0-100) to pay.
+    :param base_fee_multiplier float: The headroom over the next base fee.
+    :param block_count int: [Optional] The number of blocks of fee history to use.
+    """
+
+    name: str
+    reward_percentile: float
+    base_fee_multiplier: float
+    block_count: int = FEE_HISTORY_BLOCKS
+
+    @classmethod
+    def percentile(cls, reward_percentile: float) -> "FeeStrategy":
+        """
+        Create a strategy paying the given tip percentile of recent blocks.
+
+        :param reward_percentile float: The tip percentile (0-100) to pay.
+        :return FeeStrategy: The strategy.
+        """
+        if not 0 <= reward_percentile <= 100:
+            raise ValueError(
+                f"Reward percentile must be between 0 and 100, got {reward_percentile}."
+            )
+        return cls(f"p{reward_percentile:g}", reward_percentile, 2.0)
+
+    def priority_fee(self, fee_history) -> int | None:
+        """
+        Get the priority fee from a fee history.
+
+        :param fee_history dict: The ``eth_feeHistory`` result.
+        :return int | None: The priority fee in wei, or None if no recent
+            block paid a tip.
+        """
+        tips = sorted(
+            reward[0]
+            for reward, gas_used_ratio in zip(
+                fee_history["reward"], fee_history["gasUsedRatio"]
+            )
+            if gas_used_ratio > 0 and reward
+        )
+        if not tips or tips[len(tips) // 2] == 0:
+            return None
+        return tips[len(tips) // 2]
+
+    def estimate(
+        self, block_number: int, base_fee_per_gas: int, priority_fee: int
+    ) -> FeeEstimate:
+        """
+        Build the estimate for a block.
+
+        :param block_number int: The block the estimate is made for.
+        :param base_fee_per_gas int: The base fee of the next block in wei.
+        :param priority_fee int: The priority fee in wei.
+        :return FeeEstimate: The estimate.
+        """
+        return FeeEstimate(
+            block_number=block_number,
+            base_fee_per_gas=base_fee_per_gas,
+            max_priority_fee_per_gas=priority_fee,
+            max_fee_per_gas=int(base_fee_per_gas * self.base_fee_multiplier)
+            + priority_fee,
+        )
+
+
+FEE_STRATEGIES = {
+    "fast": FeeStrategy("fast", 90, 2.0),
+    "standard": FeeStrategy("standard", 50, 2.0),
+    "economy": FeeStrategy("economy", 10, 1.25),
+}
+
+
+def resolve_fee_strategy(strategy: str | FeeStrategy) -> FeeStrategy:
+    """
+    Get a fee strategy by name, or pass a strategy through.
+
+    :param strategy str | FeeStrategy: "fast", "standard", "economy" or a strategy.
+    :return FeeStrategy: The strategy.
+    :raises ValueError: If the name is unknown.
+    """
+    if isinstance(strategy, FeeStrategy):
+        return strategy
+    if strategy not in FEE_STRATEGIES:
+        raise ValueError(
+            f"Unknown fee strategy: {strategy}. "
+            f"Expected one of {', '.join(FEE_STRATEGIES)} or a FeeStrategy."
+        )
+    return FEE_STRATEGIES[strategy]
+
+
+class FeeOracle:
+    """
+    Caches the fee estimates of a web3 instance per block.
+
+    The latest block number is trusted for ``block_number_max_age`` seconds,
+    so a burst of sends costs at most one ``eth_blockNumber`` call, and each
+    strategy costs one ``eth_feeHistory`` call per block.
+
+    :param web3 Web3: The web3 instance.
+    :param block_number_max_age float: [Optional] Seconds to trust the latest block number.
+    """
+
+    def __init__(self, web3: Web3, block_number_max_age: float = BLOCK_NUMBER_MAX_AGE):
+        self.web3 = web3
+        self.block_number_max_age = block_number_max_age
+        self._block_number: int | None = None
+        self._checked_at = 0.0
+        self._estimates: dict[FeeStrategy, FeeEstimate] = {}
+        self._lock = threading.Lock()
+
+    def _is_block_number_stale(self) -> bool:
+        return (
+            self._block_number is None
+            or time.monotonic() - self._checked_at >= self.block_number_max_age
+        )
+
+    def _set_block_number(self, block_number: int) -> None:
+        self._checked_at = time.monotonic()
+        if block_number != self._block_number:
+            self._block_number = block_number
+            self._estimates = {}
+
+    def get_fees(
+        self, strategy: str | FeeStrategy = DEFAULT_FEE_STRATEGY
+    ) -> FeeEstimate:
+        """
+        Get the fee estimate for the current block.
+
+        :param strategy str | FeeStrategy: [Optional] The fee strategy. Default is "standard".
+        :return FeeEstimate: The estimate, shared by all callers in the block.
+        """
+        strategy = resolve_fee_strategy(strategy)
+        with self._lock:
+            if self._is_block_number_stale():
+                self._set_block_number(self.web3.eth.block_number)
+            estimate = self._estimates.get(strategy)
+            if estimate is None:
+                fee_history = self.web3.eth.fee_history(
+                    strategy.block_count,
+                    self._block_number,
+                    [strategy.reward_percentile],
+                )
+                priority_fee = strategy.priority_fee(fee_history)
+                if priority_fee is None:
+                    priority_fee = self.web3.eth.max_priority_fee
+                estimate = self._estimates[strategy] = strategy.estimate(
+                    self._block_number, fee_history["baseFeePerGas"][-1], priority_fee
+                )
+            return estimate
+
+    def invalidate(self) -> None:
+        """Look the block number and fees up again on the next call."""
+        with self._lock:
+            self._block_number = None
+            self._estimates = {}
+
+
+class AsyncFeeOracle(FeeOracle):
+    """
+    Caches the fee estimates of an ``AsyncWeb3`` instance per block.
+
+    ``get_fees`` is a coroutine. Concurrent tasks wait for a single lookup
+    instead of each fetching the fees.
+
+    :param web3 AsyncWeb3: The web3 instance.
+    :param block_number_max_age float: [Optional] Seconds to trust the latest block number.
+    """
+
+    def __init__(
+        self, web3: AsyncWeb3, block_number_max_age: float = BLOCK_NUMBER_MAX_AGE
+    ):
+        super().__init__(web3, block_number_max_age)
+        self._async_lock = asyncio.Lock()
+
+    async def get_fees(
+        self, strategy: str | FeeStrategy = DEFAULT_FEE_STRATEGY
+    ) -> FeeEstimate:
+        """
+        Get the fee estimate for the current block.
+
+        :param strategy str | FeeStrategy: [Optional] The fee strategy. Default is "standard".
+        :return FeeEstimate: The estimate, shared by all callers in the block.
+        """
+        strategy = resolve_fee_strategy(strategy)
+        async with self._async_lock:
+            if self._is_block_number_stale():
+                self._set_block_number(await self.web3.eth.block_number)
+            estimate = self._estimates.get(strategy)
+            if estimate is None:
+                fee_history = await self.web3.eth.fee_history(
+                    strategy.block_count,
+                    self._block_number,
+                    [strategy.reward_percentile],
+                )
+                priority_fee = strategy.priority_fee(fee_history)
+                if priority_fee is None:
+                    priority_fee = await self.web3.eth.max_priority_fee
+                estimate = self._estimates[strategy] = strategy.estimate(
+                    self._block_number, fee_history["baseFeePerGas"][-1], priority_fee
+                )
+            return estimate
+
+
+def get_fee_oracle(web3: Web3) -> FeeOracle:
+    """
+    Get the fee oracle shared by every sender on a web3 instance.
+
+    :param web3 Web3: The web3 instance.
+    :return FeeOracle: The fee oracle.
+    """
+    with _lock:
+        oracle = _oracles.get(web3)
+        if oracle is None:
+            oracle = _oracles[web3] = FeeOracle(web3)
+    return oracle
+
+
+def get_async_fee_oracle(web3: AsyncWeb3) -> AsyncFeeOracle:
+    """
+    Get the fee oracle shared by every sender on an ``AsyncWeb3`` instance.
+
+    :param web3 AsyncWeb3: The web3 instance.
+    :return AsyncFeeOracle: The fee oracle.
+    """
+    with _lock:
+        oracle = _async_oracles.get(web3)
+        if oracle is None:
+            oracle = _async_oracles[web3] = AsyncFeeOracle(web3)
+    return oracle
+
+
+def clear_fee_oracles() -> None:
+    """Forget every fee oracle and its cached estimates."""
+    with _lock:
+        _oracles.clear()
+        _async_oracles.clear()
@@ -0,0 +1,191 @@
+"""Opt-in gas limits learned from past receipts.
+
+Without a ``gas`` option, building a transaction costs an ``eth_estimateGas``
+call, one of the slowest RPC methods for workflow contracts. Once a
+:class:`GasEstimateCache` is enabled for a web3 instance, every mined
+transaction records its ``gasUsed`` under its contract, function and argument
+shape. Later calls with the same key are sent with the largest recorded
+usage plus a safety margin and skip the estimation.
+
+A cached limit also skips the revert check that estimation performs before
+sending. If a transaction sent with a cached limit reverts, its entry is
+dropped and the call is sent once more with a real estimate, which surfaces
+the revert reason or finds the higher limit the call needed.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+
+from web3 import Web3
+
+DEFAULT_GAS_MARGIN = 0.2
+GAS_ESTIMATE_CACHE_SIZE = 1024
+
+_lock = threading.Lock()
+# web3 instance -> GasEstimateCache
+_caches: "weakref.WeakKeyDictionary[Web3, GasEstimateCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _arg_shape(value):
+    """The part of an argument that drives gas usage: lengths, not values."""
+    if isinstance(value, (list, tuple)):
+        return (len(value), tuple(_arg_shape(item) for item in value))
+    if isinstance(value, dict):
+        return tuple((key, _arg_shape(item)) for key, item in value.items())
+    if isinstance(value, (str, bytes)):
+        # Calldata and storage are paid per 32-byte word
+        return (len(value) + 31) // 32
+    return None
+
+
+class GasEstimateCache:
+    """
+    A bounded, least-recently-used cache of gas usage per call shape.
+
+    The key of a call is the contract address, the generated client function
+    and the shape of the arguments: the lengths of arrays, and of strings and
+    bytes in 32-byte words. Scalar values are not part of the key, so the
+    margin must cover the difference they make (e.g. writing a zero or a
+    non-zero storage slot).
+
+    :param margin float: [Optional] The safety margin over the recorded usage. Default is 0.2.
+    :param max_size int: [Optional] The maximum number of cached call shapes.
+    """
+
+    def __init__(
+        self,
+        margin: float = DEFAULT_GAS_MARGIN,
+        max_size: int = GAS_ESTIMATE_CACHE_SIZE,
+    ):
+        if margin < 0:
+            raise ValueError("The gas margin must not be negative.")
+        if max_size < 1:
+            raise ValueError("The gas estimate cache size must be at least 1.")
+        self.margin = margin
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._gas_used: OrderedDict[tuple, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._gas_used)
+
+    @staticmethod
+    def key_for(client_function, client_args: tuple) -> tuple | None:
+        """
+        Get the cache key of a call.
+
+        :param client_function: The ``build_*_transaction`` method of a generated client.
+        :param client_args tuple: The arguments of the call.
+        :return tuple | None: The key, or None if the function is not bound
+            to a contract.
+        """
+        contract = getattr(getattr(client_function, "__self__", None), "contract", None)
+        address = getattr(contract, "address", None)
+        if not isinstance(address, str):
+            return None
+        return (address.lower(), client_function.__name__, _arg_shape(client_args))
+
+    def gas_limit(self, key: tuple) -> int | None:
+        """
+        Get the gas limit to send a call with.
+
+        :param key tuple: The cache key of the call.
+        :return int | None: The recorded usage plus the margin, or None on a miss.
+        """
+        with self._lock:
+            gas_used = self._gas_used.get(key)
+            if gas_used is None:
+                self.misses += 1
+                return None
+            self._gas_used.move_to_end(key)
+            self.hits += 1
+        return int(gas_used * (1 + self.margin))
+
+    def record(self, key: tuple, gas_used: int) -> None:
+        """
+        Record the gas used by a mined call. The largest usage is kept.
+
+        :param key tuple: The cache key of the call.
+        :param gas_used int: The ``gasUsed`` of the receipt.
+        """
+        with self._lock:
+            self._gas_used[key] = max(gas_used, self._gas_used.get(key, 0))
+            self._gas_used.move_to_end(key)
+            if len(self._gas_used) > self.max_size:
+                self._gas_used.popitem(last=False)
+
+    def forget(self, key: tuple) -> None:
+        """
+        Drop a call shape so its next call is estimated again.
+
+        :param key tuple: The cache key of the call.
+        """
+        with self._lock:
+            self._gas_used.pop(key, None)
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters.
+
+        :return dict: A dictionary with ``hits``, ``misses``, ``size`` and
+            ``max_size``.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._gas_used),
+                "max_size": self.max_size,
+            }
+
+
+def enable_gas_estimate_cache(
+    web3: Web3,
+    margin: float = DEFAULT_GAS_MARGIN,
+    max_size: int = GAS_ESTIMATE_CACHE_SIZE,
+) -> GasEstimateCache:
+    """
+    Learn gas limits from the receipts of every send on a web3 instance.
+
+    Enabling the cache again keeps the learned usage and updates the margin.
+
+    :param web3 Web3: The web3 instance.
+    :param margin float: [Optional] The safety margin over the recorded usage. Default is 0.2.
+    :param max_size int: [Optional] The maximum number of cached call shapes.
+    :return GasEstimateCache: The cache of the web3 instance.
+    """
+    with _lock:
+        cache = _caches.get(web3)
+        if cache is None:
+            cache = _caches[web3] = GasEstimateCache(margin, max_size)
+        else:
+            if margin < 0:
+                raise ValueError("The gas margin must not be negative.")
+            cache.margin = margin
+    return cache
+
+
+def disable_gas_estimate_cache(web3: Web3) -> None:
+    """
+    Estimate the gas of every send on a web3 instance again.
+
+    :param web3 Web3: The web3 instance.
+    """
+    with _lock:
+        _caches.pop(web3, None)
+
+
+def get_gas_estimate_cache(web3: Web3) -> GasEstimateCache | None:
+    """
+    Get the gas estimate cache of a web3 instance.
+
+    :param web3 Web3: The web3 instance.
+    :return GasEstimateCache | None: The cache, or None unless it was enabled.
+    """
+    with _lock:
+        return _caches.get(web3)
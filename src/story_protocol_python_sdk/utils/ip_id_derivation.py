@@ -0,0 +1,250 @@
+"""Offline derivation of IP IDs.
+
+The IP ID of an NFT is the address of its IP account, an ERC-6551 account
+that the ERC-6551 registry deploys with CREATE2. ``IPAssetRegistry.ipId``
+computes it from three registry parameters, ``ERC6551_PUBLIC_REGISTRY``,
+``IP_ACCOUNT_IMPL`` and ``IP_ACCOUNT_SALT``, and from the chain ID, token
+contract and token ID of the NFT::
+
+    bytecode = 0x3d60ad80600a3d3981f3363d3d373d3d3d363d73 ++ implementation
+               ++ 0x5af43d82803e903d91602b57fd5bf3
+               ++ abi.encode(salt, chainId, tokenContract, tokenId)
+    ipId = keccak256(0xff ++ registry ++ salt ++ keccak256(bytecode))[12:]
+
+An :class:`IpIdDeriver` reads the parameters once, checks one derived IP ID
+against ``ipId`` on chain, and from then on derives IP IDs without RPC.
+Derivers are enabled per web3 instance and chain ID, since every chain has
+its own registry.
+"""
+
+import threading
+import weakref
+
+from eth_abi import encode
+from eth_utils import keccak, to_bytes, to_checksum_address
+from web3 import AsyncWeb3, Web3
+
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import (
+    IPAssetRegistryClient,
+)
+
+# ERC-1167 minimal proxy around the account implementation (ERC-6551 v0.3)
+_PROXY_HEAD = bytes.fromhex("3d60ad80600a3d3981f3363d3d373d3d3d363d73")
+_PROXY_TAIL = bytes.fromhex("5af43d82803e903d91602b57fd5bf3")
+# Token ID used for the on-chain self-check
+_SELF_CHECK_TOKEN_ID = 1
+
+_lock = threading.Lock()
+# web3 instance -> chain ID -> IpIdDeriver used by IPAsset to get IP IDs
+_derivers: "weakref.WeakKeyDictionary[Web3, dict[int, IpIdDeriver]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class IpIdDeriver:
+    """
+    Derives IP IDs from the parameters of the IP asset registry.
+
+    :param erc6551_registry str: The address of the ERC-6551 registry.
+    :param ip_account_impl str: The address of the IP account implementation.
+    :param ip_account_salt bytes: The 32-byte salt of IP accounts.
+    """
+
+    def __init__(self, erc6551_registry: str, ip_account_impl: str, ip_account_salt):
+        self.erc6551_registry = to_checksum_address(erc6551_registry)
+        self.ip_account_impl = to_checksum_address(ip_account_impl)
+        self.ip_account_salt = (
+            to_bytes(hexstr=ip_account_salt)
+            if isinstance(ip_account_salt, str)
+            else bytes(ip_account_salt)
+        )
+        if len(self.ip_account_salt) != 32:
+            raise ValueError("The IP account salt must be 32 bytes.")
+        self._bytecode_head = (
+            _PROXY_HEAD
+            + to_bytes(hexstr=self.ip_account_impl)
+            + _PROXY_TAIL
+            + self.ip_account_salt
+        )
+        self._create2_head = (
+            b"\xff" + to_bytes(hexstr=self.erc6551_registry) + self.ip_account_salt
+        )
+
+    @classmethod
+    def from_registry(
+        cls, ip_asset_registry_client: IPAssetRegistryClient, chain_id: int
+    ) -> "IpIdDeriver":
+        """
+        Read the parameters of an IP asset registry and check one derived IP
+        ID against the registry's ``ipId``.
+
+        :param ip_asset_registry_client IPAssetRegistryClient: The registry client.
+        :param chain_id int: The chain ID to run the self-check with.
+        :return IpIdDeriver: The deriver.
+        :raises ValueError: If the derived IP ID does not match the registry's.
+        """
+        functions = ip_asset_registry_client.contract.functions
+        deriver = cls(
+            functions.ERC6551_PUBLIC_REGISTRY().call(),
+            functions.IP_ACCOUNT_IMPL().call(),
+            functions.IP_ACCOUNT_SALT().call(),
+        )
+        token_contract = ip_asset_registry_client.contract.address
+        deriver._self_check(
+            chain_id,
+            token_contract,
+            ip_asset_registry_client.ipId(
+                chain_id, token_contract, _SELF_CHECK_TOKEN_ID
+            ),
+        )
+        return deriver
+
+    @classmethod
+    async def from_async_registry(
+        cls, ip_asset_registry_client: IPAssetRegistryClient, chain_id: int
+    ) -> "IpIdDeriver":
+        """
+        Read the parameters of an IP asset registry over an AsyncWeb3 and check
+        one derived IP ID against the registry's ``ipId``.
+
+        :param ip_asset_registry_client IPAssetRegistryClient: The registry
+            client, built on an AsyncWeb3.
+        :param chain_id int: The chain ID to run the self-check with.
+        :return IpIdDeriver: The deriver.
+        :raises ValueError: If the derived IP ID does not match the registry's.
+        """
+        functions = ip_asset_registry_client.contract.functions
+        deriver = cls(
+            await functions.ERC6551_PUBLIC_REGISTRY().call(),
+            await functions.IP_ACCOUNT_IMPL().call(),
+            await functions.IP_ACCOUNT_SALT().call(),
+        )
+        token_contract = ip_asset_registry_client.contract.address
+        deriver._self_check(
+            chain_id,
+            token_contract,
+            await ip_asset_registry_client.ipId(
+                chain_id, token_contract, _SELF_CHECK_TOKEN_ID
+            ),
+        )
+        return deriver
+
+    def _self_check(self, chain_id: int, token_contract: str, expected: str) -> None:
+        derived = self.ip_id(chain_id, token_contract, _SELF_CHECK_TOKEN_ID)
+        if derived.lower() != expected.lower():
+            raise ValueError(
+                f"Derived IP ID {derived} does not match the registry's {expected}."
+            )
+
+    def ip_id(self, chain_id: int, token_contract: str, token_id: int) -> str:
+        """
+        Derive the IP ID of an NFT.
+
+        :param chain_id int: The chain ID of the NFT.
+        :param token_contract str: The NFT contract address.
+        :param token_id int: The token identifier.
+        :return str: The checksummed IP ID.
+        """
+        return self.ip_ids(chain_id, token_contract, [token_id])[0]
+
+    def ip_ids(self, chain_id: int, token_contract: str, token_ids) -> list[str]:
+        """
+        Derive the IP IDs of NFTs of one contract. The bytes shared by every
+        token are encoded once, so each token costs two hashes.
+
+        :param chain_id int: The chain ID of the NFTs.
+        :param token_contract str: The NFT contract address.
+        :param token_ids: The token identifiers.
+        :return list[str]: The checksummed IP ID of each token, in order.
+        """
+        head = self._bytecode_head + encode(
+            ["uint256", "address"], [chain_id, token_contract]
+        )
+        return [
+            to_checksum_address(
+                keccak(
+                    self._create2_head + keccak(head + token_id.to_bytes(32, "big"))
+                )[12:]
+            )
+            for token_id in token_ids
+        ]
+
+
+def enable_ip_id_derivation(web3: Web3, chain_id: int | None = None) -> IpIdDeriver:
+    """
+    Derive IP IDs offline for every IPAsset of a chain on a web3 instance.
+    The first call for the chain reads the registry parameters and checks
+    them on chain.
+
+    :param web3 Web3: The web3 instance.
+    :param chain_id int: [Optional] The ID of the blockchain network. Default
+        is the chain of the web3 instance.
+    :return IpIdDeriver: The deriver.
+    :raises ValueError: If the self-check fails.
+    """
+    if chain_id is None:
+        chain_id = web3.eth.chain_id
+    deriver = get_ip_id_deriver(web3, chain_id)
+    if deriver is None:
+        deriver = IpIdDeriver.from_registry(
+            IPAssetRegistryClient(web3, chain_id), chain_id
+        )
+        deriver = _set_deriver(web3, chain_id, deriver)
+    return deriver
+
+
+async def async_enable_ip_id_derivation(
+    web3: AsyncWeb3, chain_id: int | None = None
+) -> IpIdDeriver:
+    """
+    Derive IP IDs offline for every AsyncIPAsset of a chain on an AsyncWeb3.
+    The first call for the chain reads the registry parameters and checks
+    them on chain.
+
+    :param web3 AsyncWeb3: The async web3 instance.
+    :param chain_id int: [Optional] The ID of the blockchain network. Default
+        is the chain of the web3 instance.
+    :return IpIdDeriver: The deriver.
+    :raises ValueError: If the self-check fails.
+    """
+    if chain_id is None:
+        chain_id = await web3.eth.chain_id
+    deriver = get_ip_id_deriver(web3, chain_id)
+    if deriver is None:
+        deriver = await IpIdDeriver.from_async_registry(
+            IPAssetRegistryClient(web3, chain_id), chain_id
+        )
+        deriver = _set_deriver(web3, chain_id, deriver)
+    return deriver
+
+
+def _set_deriver(web3, chain_id: int, deriver: IpIdDeriver) -> IpIdDeriver:
+    with _lock:
+        return _derivers.setdefault(web3, {}).setdefault(chain_id, deriver)
+
+
+def disable_ip_id_derivation(web3: Web3, chain_id: int | None = None) -> None:
+    """
+    Get IP IDs from the registry over RPC again.
+
+    :param web3 Web3: The web3 instance.
+    :param chain_id int: [Optional] The ID of the blockchain network. Default
+        is every chain.
+    """
+    with _lock:
+        if chain_id is None:
+            _derivers.pop(web3, None)
+        else:
+            _derivers.get(web3, {}).pop(chain_id, None)
+
+
+def get_ip_id_deriver(web3: Web3, chain_id: int) -> IpIdDeriver | None:
+    """
+    Get the deriver enabled for a chain on a web3 instance.
+
+    :param web3 Web3: The web3 instance.
+    :param chain_id int: The ID of the blockchain network.
+    :return IpIdDeriver | None: The deriver, or None if derivation is not enabled.
+    """
+    with _lock:
+        return _derivers.get(web3, {}).get(chain_id)
@@ -0,0 +1,337 @@
+"""Cache of registered license terms.
+
+Registered license terms never change, so the mapping between a terms ID and
+its terms can be kept forever. A :class:`LicenseTermsCache` keeps it in an
+in-memory LRU and, given a path, in a SQLite file that several processes can
+share. It is filled by ``License`` reads and can be warmed up front from
+``LicenseTermsRegistered`` logs.
+
+Terms are kept in their canonical form, the tuple ``getLicenseTerms``
+returns: fields in ``PILTerms`` order, checksummed addresses and bytes.
+"""
+
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+
+from eth_abi import decode, encode
+from eth_utils import keccak, to_bytes, to_checksum_address
+from web3 import Web3
+
+from story_protocol_python_sdk.utils.constants import ZERO_ADDRESS
+
+PIL_TERMS_FIELDS = (
+    ("transferable", "bool"),
+    ("royaltyPolicy", "address"),
+    ("defaultMintingFee", "uint256"),
+    ("expiration", "uint256"),
+    ("commercialUse", "bool"),
+    ("commercialAttribution", "bool"),
+    ("commercializerChecker", "address"),
+    ("commercializerCheckerData", "bytes"),
+    ("commercialRevShare", "uint32"),
+    ("commercialRevCeiling", "uint256"),
+    ("derivativesAllowed", "bool"),
+    ("derivativesAttribution", "bool"),
+    ("derivativesApproval", "bool"),
+    ("derivativesReciprocal", "bool"),
+    ("derivativeRevCeiling", "uint256"),
+    ("currency", "address"),
+    ("uri", "string"),
+)
+PIL_TERMS_TYPE = "(" + ",".join(abi_type for _, abi_type in PIL_TERMS_FIELDS) + ")"
+LICENSE_TERMS_REGISTERED_TOPIC = keccak(
+    text="LicenseTermsRegistered(uint256,address,bytes)"
+)
+DEFAULT_MAX_SIZE = 4096
+
+_lock = threading.Lock()
+# web3 instance -> LicenseTermsCache used by License
+_caches: "weakref.WeakKeyDictionary[Web3, LicenseTermsCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def canonical_terms(terms) -> tuple:
+    """
+    Convert license terms to their canonical form.
+
+    :param terms: The terms as a dict keyed by ``PILTerms`` field names, or
+        as a tuple in field order.
+    :return tuple: The canonical terms.
+    """
+    if isinstance(terms, dict):
+        terms = tuple(terms[name] for name, _ in PIL_TERMS_FIELDS)
+    if len(terms) != len(PIL_TERMS_FIELDS):
+        raise ValueError(
+            f"Expected {len(PIL_TERMS_FIELDS)} license terms fields, got {len(terms)}."
+        )
+    values = []
+    for (_, abi_type), value in zip(PIL_TERMS_FIELDS, terms):
+        if abi_type == "address":
+            value = to_checksum_address(value)
+        elif abi_type == "bytes":
+            value = to_bytes(hexstr=value) if isinstance(value, str) else bytes(value)
+        elif abi_type == "bool":
+            value = bool(value)
+        elif abi_type != "string":
+            value = int(value)
+        values.append(value)
+    return tuple(values)
+
+
+def _canonical_terms_or_none(terms) -> tuple | None:
+    """
+    Convert license terms to their canonical form, if they have every PIL
+    field.
+
+    :param terms: The terms, as for :func:`canonical_terms`.
+    :return tuple | None: The canonical terms, or None if a field is missing.
+    """
+    try:
+        return canonical_terms(terms)
+    except KeyError:
+        return None
+
+
+def _encode_terms(terms: tuple) -> bytes:
+    return encode([PIL_TERMS_TYPE], [terms])
+
+
+def _decode_terms(data: bytes) -> tuple:
+    return canonical_terms(decode([PIL_TERMS_TYPE], data)[0])
+
+
+# What getLicenseTerms answers for an unknown ID
+_EMPTY_TERMS = canonical_terms(
+    (False, ZERO_ADDRESS, 0, 0, False, False, ZERO_ADDRESS, b"")
+    + (0, 0, False, False, False, False, 0, ZERO_ADDRESS, "")
+)
+
+
+class LicenseTermsCache:
+    """
+    Maps license terms IDs to their terms and back, per license template.
+
+    :param max_size int: [Optional] The most entries kept in memory per
+        direction. Default is 4096.
+    :param path str: [Optional] A SQLite file that keeps every entry on disk,
+        shared by every process that opens it. Default is memory only.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, path: str | None = None):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self.max_size = max_size
+        self.path = path
+        self._lock = threading.Lock()
+        # (template, terms_id) -> terms
+        self._terms: OrderedDict[tuple[str, int], tuple] = OrderedDict()
+        # (template, terms) -> terms_id
+        self._ids: OrderedDict[tuple[str, tuple], int] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS license_terms ("
+                "template TEXT NOT NULL, terms_id INTEGER NOT NULL, terms BLOB NOT NULL, "
+                "PRIMARY KEY (template, terms_id))"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS license_terms_by_terms "
+                "ON license_terms (template, terms)"
+            )
+            self._db.commit()
+
+    def _remember(self, template: str, terms_id: int, terms: tuple) -> None:
+        for entries, key, value in (
+            (self._terms, (template, terms_id), terms),
+            (self._ids, (template, terms), terms_id),
+        ):
+            entries[key] = value
+            entries.move_to_end(key)
+            if len(entries) > self.max_size:
+                entries.popitem(last=False)
+
+    def get_terms(self, license_template: str, terms_id: int) -> tuple | None:
+        """
+        Get the terms of a license terms ID.
+
+        :param license_template str: The address of the license template.
+        :param terms_id int: The license terms ID.
+        :return tuple | None: The canonical terms, or None if not cached.
+        """
+        template = to_checksum_address(license_template)
+        with self._lock:
+            terms = self._terms.get((template, terms_id))
+            if terms is not None:
+                self._terms.move_to_end((template, terms_id))
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT terms FROM license_terms WHERE template = ? AND terms_id = ?",
+                    (template, terms_id),
+                ).fetchone()
+                if row is not None:
+                    terms = _decode_terms(row[0])
+                    self._remember(template, terms_id, terms)
+            if terms is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return terms
+
+    def get_terms_id(self, license_template: str, terms) -> int | None:
+        """
+        Get the ID of license terms.
+
+        :param license_template str: The address of the license template.
+        :param terms: The terms, as for :func:`canonical_terms`.
+        :return int | None: The license terms ID, or None if not cached.
+        """
+        template = to_checksum_address(license_template)
+        terms = _canonical_terms_or_none(terms)
+        with self._lock:
+            if terms is None:
+                # Terms missing PIL fields are never cached.
+                self.misses += 1
+                return None
+            terms_id = self._ids.get((template, terms))
+            if terms_id is not None:
+                self._ids.move_to_end((template, terms))
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT terms_id FROM license_terms WHERE template = ? AND terms = ?",
+                    (template, _encode_terms(terms)),
+                ).fetchone()
+                if row is not None:
+                    terms_id = row[0]
+                    self._remember(template, terms_id, terms)
+            if terms_id is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return terms_id
+
+    def put(self, license_template: str, terms_id: int, terms) -> None:
+        """
+        Record registered license terms. Unregistered terms, i.e. ID 0 or
+        all-zero terms, and terms missing PIL fields are ignored.
+
+        :param license_template str: The address of the license template.
+        :param terms_id int: The license terms ID.
+        :param terms: The terms, as for :func:`canonical_terms`.
+        """
+        self.put_many(license_template, [(terms_id, terms)])
+
+    def put_many(self, license_template: str, entries) -> None:
+        """
+        Record many registered license terms.
+
+        :param license_template str: The address of the license template.
+        :param entries: Pairs of a license terms ID and its terms.
+        """
+        template = to_checksum_address(license_template)
+        entries = [
+            (terms_id, terms)
+            for terms_id, terms in (
+                (int(terms_id), _canonical_terms_or_none(terms))
+                for terms_id, terms in entries
+            )
+            if terms_id != 0 and terms is not None and terms != _EMPTY_TERMS
+        ]
+        with self._lock:
+            for terms_id, terms in entries:
+                self._remember(template, terms_id, terms)
+            if self._db is not None and entries:
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO license_terms (template, terms_id, terms) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (template, terms_id, _encode_terms(terms))
+                        for terms_id, terms in entries
+                    ],
+                )
+                self._db.commit()
+
+    def warm_from_logs(self, logs) -> int:
+        """
+        Record the terms of ``LicenseTermsRegistered`` logs.
+
+        :param logs: Raw logs, e.g. from ``web3.eth.get_logs``. Other logs are skipped.
+        :return int: The number of terms recorded.
+        """
+        by_template: dict[str, list] = {}
+        for log in logs:
+            topics = log["topics"]
+            if len(topics) < 3 or bytes(topics[0]) != LICENSE_TERMS_REGISTERED_TOPIC:
+                continue
+            data = log["data"]
+            data = to_bytes(hexstr=data) if isinstance(data, str) else bytes(data)
+            (terms_data,) = decode(["bytes"], data)
+            by_template.setdefault(log["address"], []).append(
+                (
+                    int.from_bytes(bytes(topics[1]), "big"),
+                    decode([PIL_TERMS_TYPE], terms_data)[0],
+                )
+            )
+        for template, entries in by_template.items():
+            self.put_many(template, entries)
+        return sum(len(entries) for entries in by_template.values())
+
+    def clear(self) -> None:
+        """Forget the in-memory entries. The SQLite file is kept."""
+        with self._lock:
+            self._terms.clear()
+            self._ids.clear()
+
+    def close(self) -> None:
+        """Close the SQLite file."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def enable_license_terms_cache(
+    web3: Web3, max_size: int = DEFAULT_MAX_SIZE, path: str | None = None
+) -> LicenseTermsCache:
+    """
+    Cache license terms reads of every License resource on a web3 instance.
+
+    :param web3 Web3: The web3 instance.
+    :param max_size int: [Optional] The most entries kept in memory per direction.
+    :param path str: [Optional] A SQLite file that keeps every entry on disk.
+    :return LicenseTermsCache: The cache. Enabling it again returns the same one.
+    """
+    with _lock:
+        cache = _caches.get(web3)
+        if cache is None:
+            cache = _caches[web3] = LicenseTermsCache(max_size, path)
+        return cache
+
+
+def disable_license_terms_cache(web3: Web3) -> None:
+    """
+    Stop caching license terms reads on a web3 instance.
+
+    :param web3 Web3: The web3 instance.
+    """
+    with _lock:
+        cache = _caches.pop(web3, None)
+    if cache is not None:
+        cache.close()
+
+
+def get_license_terms_cache(web3: Web3) -> LicenseTermsCache | None:
+    """
+    Get the license terms cache of a web3 instance.
+
+    :param web3 Web3: The web3 instance.
+    :return LicenseTermsCache | None: The cache, or None if not enabled.
+    """
+    with _lock:
+        return _caches.get(web3)
@@ -0,0 +1,89 @@
+"""Bulk contract reads through ``Multicall3.aggregate3``.
+
+Validating N IPs one ``isRegistered`` at a time costs N round trips. The
+functions here encode generated client reads as ``aggregate3`` calls with
+``allowFailure`` set, so one revert does not fail its neighbours, and run
+them as one ``eth_call`` per chunk of reads. Return data is decoded the way
+the client method would decode it.
+"""
+
+from story_protocol_python_sdk.abi.Multicall3.Multicall3_client import Multicall3Client
+from story_protocol_python_sdk.utils.batch_reads import (
+    decode_client_read,
+    encode_client_read,
+)
+
+# Reads per aggregate3 call, sized to stay well under node eth_call gas caps
+DEFAULT_CHUNK_SIZE = 200
+
+
+def try_aggregate_reads(
+    multicall3_client: Multicall3Client,
+    reads: list,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list:
+    """
+    Run generated client reads through ``Multicall3.aggregate3``, allowing
+    each of them to fail.
+
+    :param multicall3_client Multicall3Client: The Multicall3 client.
+    :param reads list: Pairs of a client read method, e.g.
+        ``ip_asset_registry_client.isRegistered``, and a tuple of its arguments.
+    :param chunk_size int: [Optional] The most reads in one aggregate3 call. Default is 200.
+    :return list: A ``(success, value)`` pair per read, in order. ``value``
+        is None for a read that reverted.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    results = []
+    for start in range(0, len(reads), chunk_size):
+        chunk = reads[start : start + chunk_size]
+        calls = [
+            {
+                "target": client_function.__self__.contract.address,
+                "allowFailure": True,
+                "callData": encode_client_read(client_function, client_args),
+            }
+            for client_function, client_args in chunk
+        ]
+        responses = multicall3_client.contract.functions.aggregate3(calls).call()
+        for (client_function, client_args), (success, return_data) in zip(
+            chunk, responses
+        ):
+            if not success:
+                results.append((False, None))
+                continue
+            results.append(
+                (
+                    True,
+                    decode_client_read(
+                        multicall3_client.web3,
+                        client_function,
+                        client_args,
+                        return_data,
+                    ),
+                )
+            )
+    return results
+
+
+def aggregate_reads(
+    multicall3_client: Multicall3Client,
+    reads: list,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list:
+    """
+    Run generated client reads through ``Multicall3.aggregate3``.
+
+    :param multicall3_client Multicall3Client: The Multicall3 client.
+    :param reads list: Pairs of a client read method and a tuple of its arguments.
+    :param chunk_size int: [Optional] The most reads in one aggregate3 call. Default is 200.
+    :return list: The value of each read, in order.
+    :raises ValueError: If a read reverted.
+    """
+    results = try_aggregate_reads(multicall3_client, reads, chunk_size)
+    for (client_function, client_args), (success, _) in zip(reads, results):
+        if not success:
+            args = ", ".join(str(arg) for arg in client_args)
+            raise ValueError(f"{client_function.__name__}({args}) reverted.")
+    return [value for _, value in results]
@@ -0,0 +1,236 @@
+"""Local, thread-safe nonce allocation per sending account.
+
+``build_and_send_transaction`` used to call ``eth_getTransactionCount`` before
+every send, and concurrent senders on one key raced for the same nonce. A
+:class:`NonceManager` reads the ``pending`` count once, then hands out nonces
+locally. A nonce that was allocated but never broadcast is handed out again
+before any new one, so it leaves no gap. After a nonce error it resyncs from
+the chain, without reissuing the nonces other senders still hold: the
+``pending`` count cannot see those until they are broadcast.
+:class:`AsyncNonceManager` does the same for senders on an ``AsyncWeb3``.
+"""
+
+import asyncio
+import heapq
+import threading
+import weakref
+
+from web3 import AsyncWeb3, Web3
+
+_lock = threading.Lock()
+# web3 instance -> {address: NonceManager}
+_managers: "weakref.WeakKeyDictionary[Web3, dict]" = weakref.WeakKeyDictionary()
+# AsyncWeb3 instance -> {address: AsyncNonceManager}
+_async_managers: "weakref.WeakKeyDictionary[AsyncWeb3, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class NonceManager:
+    """
+    Allocates the nonces of one account on one chain.
+
+    :param web3 Web3: The web3 instance used to sync with the chain.
+    :param address str: The address of the sending account.
+    """
+
+    def __init__(self, web3: Web3, address: str):
+        self.web3 = web3
+        self.address = address
+        self._next_nonce: int | None = None
+        self._in_flight: set[int] = set()
+        # Released nonces below _next_nonce, smallest first
+        self._released: list[int] = []
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """The number of allocated nonces not yet confirmed or released."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def _apply_count(self, count: int) -> None:
+        # Continue after the chain's pending count and every nonce still held,
+        # and hand out the unheld nonces in between first
+        self._next_nonce = max([count, *(nonce + 1 for nonce in self._in_flight)])
+        self._released = [
+            nonce
+            for nonce in range(count, self._next_nonce)
+            if nonce not in self._in_flight
+        ]
+
+    def _sync(self) -> None:
+        self._apply_count(self.web3.eth.get_transaction_count(self.address, "pending"))
+
+    def _take(self) -> int:
+        nonce = heapq.heappop(self._released) if self._released else self._next_nonce
+        if nonce == self._next_nonce:
+            self._next_nonce = nonce + 1
+        self._in_flight.add(nonce)
+        return nonce
+
+    def _next(self) -> int:
+        return self._released[0] if self._released else self._next_nonce
+
+    def peek(self) -> int:
+        """
+        Get the nonce the next allocation will return, without allocating it.
+
+        :return int: The next nonce.
+        """
+        with self._lock:
+            if self._next_nonce is None:
+                self._sync()
+            return self._next()
+
+    def allocate(self) -> int:
+        """
+        Allocate the next nonce.
+
+        Released nonces are handed out first, smallest first. The
+        ``pending`` transaction count is only fetched from the chain on the
+        first allocation and after a resync was requested.
+
+        :return int: The allocated nonce.
+        """
+        with self._lock:
+            if self._next_nonce is None:
+                self._sync()
+            return self._take()
+
+    def confirm(self, nonce: int) -> None:
+        """
+        Mark a nonce as mined.
+
+        :param nonce int: The nonce of the mined transaction.
+        """
+        with self._lock:
+            self._in_flight.discard(nonce)
+
+    def release(self, nonce: int) -> None:
+        """
+        Return a nonce whose transaction was never broadcast.
+
+        It is handed out again before any new nonce, so the gap it would
+        leave is filled.
+
+        :param nonce int: The released nonce.
+        """
+        with self._lock:
+            if nonce not in self._in_flight:
+                return
+            self._in_flight.discard(nonce)
+            if self._next_nonce is not None:
+                heapq.heappush(self._released, nonce)
+
+    def resync(self, nonce: int | None = None) -> None:
+        """
+        Refetch the ``pending`` transaction count on the next allocation.
+
+        The next nonce is then the larger of that count and the nonce after
+        the highest one still in flight, as other senders hold those without
+        the chain seeing them yet.
+
+        :param nonce int: [Optional] The nonce of the failed send that
+            requested the resync, which is no longer held.
+        """
+        with self._lock:
+            if nonce is not None:
+                self._in_flight.discard(nonce)
+            self._next_nonce = None
+            self._released = []
+
+
+class AsyncNonceManager(NonceManager):
+    """
+    Allocates the nonces of one account on one chain, for senders on an
+    ``AsyncWeb3``.
+
+    ``peek`` and ``allocate`` are coroutines because a sync with the chain
+    awaits ``eth_getTransactionCount``. Concurrent tasks wait for a single
+    sync instead of each fetching the count. ``confirm``, ``release`` and
+    ``resync`` never touch the chain and stay synchronous.
+
+    :param web3 AsyncWeb3: The web3 instance used to sync with the chain.
+    :param address str: The address of the sending account.
+    """
+
+    def __init__(self, web3: AsyncWeb3, address: str):
+        super().__init__(web3, address)
+        self._sync_lock = asyncio.Lock()
+
+    async def _ensure_synced(self) -> None:
+        async with self._sync_lock:
+            if self._next_nonce is not None:
+                return
+            count = await self.web3.eth.get_transaction_count(self.address, "pending")
+            with self._lock:
+                if self._next_nonce is None:
+                    self._apply_count(count)
+
+    async def peek(self) -> int:
+        """
+        Get the nonce the next allocation will return, without allocating it.
+
+        :return int: The next nonce.
+        """
+        while True:
+            await self._ensure_synced()
+            with self._lock:
+                if self._next_nonce is not None:
+                    return self._next()
+
+    async def allocate(self) -> int:
+        """
+        Allocate the next nonce.
+
+        :return int: The allocated nonce.
+        """
+        while True:
+            await self._ensure_synced()
+            with self._lock:
+                # A resync may have been requested while this task waited
+                if self._next_nonce is None:
+                    continue
+                return self._take()
+
+
+def get_nonce_manager(web3: Web3, address: str) -> NonceManager:
+    """
+    Get the nonce manager of an account, shared by every sender on a web3
+    instance.
+
+    :param web3 Web3: The web3 instance.
+    :param address str: The address of the sending account.
+    :return NonceManager: The nonce manager.
+    """
+    with _lock:
+        managers = _managers.setdefault(web3, {})
+        manager = managers.get(address.lower())
+        if manager is None:
+            manager = managers[address.lower()] = NonceManager(web3, address)
+    return manager
+
+
+def get_async_nonce_manager(web3: AsyncWeb3, address: str) -> AsyncNonceManager:
+    """
+    Get the nonce manager of an account, shared by every sender on an
+    ``AsyncWeb3`` instance.
+
+    :param web3 AsyncWeb3: The web3 instance.
+    :param address str: The address of the sending account.
+    :return AsyncNonceManager: The nonce manager.
+    """
+    with _lock:
+        managers = _async_managers.setdefault(web3, {})
+        manager = managers.get(address.lower())
+        if manager is None:
+            manager = managers[address.lower()] = AsyncNonceManager(web3, address)
+    return manager
+
+
+def clear_nonce_managers() -> None:
+    """Drop every nonce manager, so the next send syncs from the chain."""
+    with _lock:
+        _managers.clear()
+        _async_managers.clear()
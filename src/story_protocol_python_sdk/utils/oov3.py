@@ -1,19 +1,9 @@
-# Define the ABI for the getAssertion function
-# Load the ABI from the JSON file
-import json
-import os
-
 from web3 import Web3
 
 from story_protocol_python_sdk.abi.ArbitrationPolicyUMA.ArbitrationPolicyUMA_client import (
     ArbitrationPolicyUMAClient,
 )
-
-abi_path = os.path.join(
-    os.path.dirname(__file__), "..", "abi", "jsons", "ASSERTION_ABI.json"
-)
-with open(abi_path, "r") as abi_file:
-    ASSERTION_ABI = json.load(abi_file)
+from story_protocol_python_sdk.utils.contract_registry import get_contract_at
 
 
 def get_oov3_contract(arbitration_policy_uma_client: ArbitrationPolicyUMAClient) -> str:
@@ -44,9 +34,7 @@ def get_assertion_bond(
             get_oov3_contract(arbitration_policy_uma_client)
         )
 
-        oov3_contract = web3.eth.contract(
-            address=oov3_contract_address, abi=ASSERTION_ABI
-        )
+        oov3_contract = get_contract_at(web3, "ASSERTION_ABI", oov3_contract_address)
 
         assertion_data = oov3_contract.functions.getAssertion(assertion_id).call()
 
@@ -0,0 +1,284 @@
+"""Single-pass bucketing of transaction receipt logs by event.
+
+The resources read events out of receipts in many places, and a register
+flow reads the same receipt three or four times. A :class:`ReceiptDecoder`
+hashes the event signatures the SDK reads once per process, sorts the logs
+of a receipt into per-event buckets in one pass, and remembers the buckets
+of the last receipts it saw, so every later read of the same receipt is a
+dict lookup::
+
+    decoded = decode_receipt(tx_receipt)
+    for event in decoded.events("IPRegistered", contract.events.IPRegistered):
+        ...
+
+Events are decoded with the ``process_log`` of the contract event the
+caller passes, or, on hot paths such as batch results, with an
+:class:`EventDecoder` compiled from the contract ABI. The latter splits the
+indexed topics itself and runs one ``eth_abi.decode`` over the data, and
+returns plain named tuples instead of web3's AttributeDicts.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+from functools import cache
+
+from eth_abi import decode
+from eth_abi.grammar import parse
+from eth_utils import keccak
+from eth_utils.abi import abi_to_signature
+
+from story_protocol_python_sdk.utils.contract_registry import load_abi
+
+# Events read by the resources, by name
+EVENT_SIGNATURES = {
+    "AddedIpToGroup": "AddedIpToGroup(address,address[])",
+    "ClaimedReward": "ClaimedReward(address,address,address[],uint256[])",
+    "CollectedRoyaltiesToGroupPool": (
+        "CollectedRoyaltiesToGroupPool(address,address,address,uint256)"
+    ),
+    "CollectionCreated": "CollectionCreated(address)",
+    "DisputeRaised": (
+        "DisputeRaised(uint256,address,address,uint256,address,bytes32,bytes32,bytes)"
+    ),
+    "IPGroupRegistered": "IPGroupRegistered(address,address)",
+    "IPRegistered": (
+        "IPRegistered(address,uint256,address,uint256,string,string,uint256)"
+    ),
+    "IpRoyaltyVaultDeployed": "IpRoyaltyVaultDeployed(address,address)",
+    "LicenseTermsAttached": "LicenseTermsAttached(address,address,address,uint256)",
+    "LicenseTermsRegistered": "LicenseTermsRegistered(uint256,address,bytes)",
+    "LicenseTokenMinted": "LicenseTokenMinted(address,address,uint256)",
+    "RemovedIpFromGroup": "RemovedIpFromGroup(address,address[])",
+    "RevenueTokenClaimed": "RevenueTokenClaimed(address,address,uint256)",
+    "RoyaltyPaid": "RoyaltyPaid(address,address,address,address,uint256,uint256)",
+}
+# Receipts whose buckets are remembered, most recently decoded last
+DEFAULT_RECENT_RECEIPTS = 32
+
+
+def _topic_key(topic):
+    """Topics come as HexBytes from a node and as hex strings from some tools."""
+    if isinstance(topic, str):
+        return bytes.fromhex(topic[2:] if topic.startswith("0x") else topic)
+    return topic
+
+
+def _topic_decoder(abi_type: str):
+    """Decode one indexed topic. Dynamic values are only stored as their hash."""
+    if abi_type == "address":
+        return lambda topic: "0x" + bytes(topic[-20:]).hex()
+    if abi_type == "bool":
+        return lambda topic: topic[-1] != 0
+    if abi_type.startswith("uint"):
+        return lambda topic: int.from_bytes(topic, "big")
+    if parse(abi_type).is_dynamic or abi_type.startswith("bytes"):
+        return bytes
+    return lambda topic: decode([abi_type], bytes(topic))[0]
+
+
+class EventDecoder:
+    """
+    Decodes the raw logs of one event without web3's ``process_log``.
+
+    Records are named tuples with a field per event input, in ABI order.
+    Addresses are lowercase hex strings, as ``eth_abi`` returns them, and
+    indexed dynamic values are their 32-byte hash.
+
+    :param event_abi dict: The ABI entry of the event.
+    """
+
+    def __init__(self, event_abi: dict):
+        self.name = event_abi["name"]
+        self.signature = abi_to_signature(event_abi)
+        self.topic = keccak(text=self.signature)
+        inputs = event_abi["inputs"]
+        self.record = namedtuple(
+            self.name, [item["name"] for item in inputs], rename=True
+        )
+        self._topic_decoders = [
+            _topic_decoder(item["type"]) for item in inputs if item["indexed"]
+        ]
+        self._data_types = [item["type"] for item in inputs if not item["indexed"]]
+        # Input position -> (True, topic index) or (False, data index)
+        self._layout = []
+        topic_index = data_index = 0
+        for item in inputs:
+            if item["indexed"]:
+                topic_index += 1
+                self._layout.append((True, topic_index))
+            else:
+                self._layout.append((False, data_index))
+                data_index += 1
+
+    def decode(self, log) -> tuple:
+        """
+        Decode a raw log.
+
+        :param log: The raw log, with ``topics`` and ``data``.
+        :return tuple: The event record.
+        :raises ValueError: If the log is not an instance of this event.
+        """
+        topics = [_topic_key(topic) for topic in log["topics"]]
+        if (
+            len(topics) != len(self._topic_decoders) + 1
+            or bytes(topics[0]) != self.topic
+        ):
+            raise ValueError(f"The log is not a {self.name} event.")
+        data = log["data"]
+        data = _topic_key(data) if isinstance(data, str) else bytes(data)
+        values = decode(self._data_types, data) if self._data_types else ()
+        indexed = [
+            topic_decoder(topic)
+            for topic_decoder, topic in zip(self._topic_decoders, topics[1:])
+        ]
+        return self.record(
+            *(
+                indexed[index - 1] if is_indexed else values[index]
+                for is_indexed, index in self._layout
+            )
+        )
+
+
+@cache
+def get_event_decoder(contract_name: str, event_name: str) -> EventDecoder:
+    """
+    Get the decoder of a contract event, compiled once per process.
+
+    :param contract_name str: The contract name, e.g. ``"IPAssetRegistry"``.
+    :param event_name str: The event name, e.g. ``"IPRegistered"``.
+    :return EventDecoder: The decoder.
+    """
+    for item in load_abi(contract_name):
+        if item["type"] == "event" and item["name"] == event_name:
+            return EventDecoder(item)
+    raise ValueError(f"{contract_name} has no {event_name} event.")
+
+
+class DecodedReceipt:
+    """
+    The logs of one receipt, bucketed by event name.
+
+    :param logs dict: Event name to its logs, in receipt order.
+    """
+
+    def __init__(self, logs: dict[str, list]):
+        self._logs = logs
+        self._lock = threading.Lock()
+        # event name -> process_log results
+        self._events: dict[str, list] = {}
+        # event name -> EventDecoder records
+        self._records: dict[str, list] = {}
+
+    def logs(self, event_name: str) -> list:
+        """
+        Get the raw logs of an event.
+
+        :param event_name str: The event name, e.g. ``"IPRegistered"``.
+        :return list: The logs, in receipt order.
+        """
+        return self._logs.get(event_name, [])
+
+    def events(self, event_name: str, contract_event) -> list:
+        """
+        Get the decoded logs of an event. They are decoded once per receipt.
+
+        :param event_name str: The event name, e.g. ``"IPRegistered"``.
+        :param contract_event: The contract event that decodes them, e.g.
+            ``ip_asset_registry_client.contract.events.IPRegistered``.
+        :return list: The decoded events, in receipt order.
+        """
+        with self._lock:
+            events = self._events.get(event_name)
+        if events is None:
+            events = [contract_event.process_log(log) for log in self.logs(event_name)]
+            with self._lock:
+                self._events[event_name] = events
+        return events
+
+    def records(self, event_decoder: EventDecoder) -> list:
+        """
+        Get the logs of an event decoded by an :class:`EventDecoder`. They
+        are decoded once per receipt.
+
+        :param event_decoder EventDecoder: The decoder of the event.
+        :return list: The event records, in receipt order.
+        """
+        with self._lock:
+            records = self._records.get(event_decoder.name)
+        if records is None:
+            records = [
+                event_decoder.decode(log) for log in self.logs(event_decoder.name)
+            ]
+            with self._lock:
+                self._records[event_decoder.name] = records
+        return records
+
+
+class ReceiptDecoder:
+    """
+    Buckets receipt logs by event.
+
+    :param event_signatures dict: [Optional] Event name to its signature.
+        Default is every event the resources read.
+    :param recent_receipts int: [Optional] How many receipts to remember the
+        buckets of. Default is 32.
+    """
+
+    def __init__(
+        self,
+        event_signatures: dict[str, str] = EVENT_SIGNATURES,
+        recent_receipts: int = DEFAULT_RECENT_RECEIPTS,
+    ):
+        self.topics = {
+            name: keccak(text=signature) for name, signature in event_signatures.items()
+        }
+        self._names = {topic: name for name, topic in self.topics.items()}
+        self.recent_receipts = recent_receipts
+        self._lock = threading.Lock()
+        # id(receipt) -> (receipt, log count, DecodedReceipt). The receipt is
+        # held so its id is not reused while the entry lives.
+        self._recent: OrderedDict[int, tuple] = OrderedDict()
+
+    def decode(self, tx_receipt: dict) -> DecodedReceipt:
+        """
+        Bucket the logs of a receipt by event.
+
+        :param tx_receipt dict: The transaction receipt.
+        :return DecodedReceipt: The bucketed logs.
+        """
+        logs = tx_receipt.get("logs", [])
+        key = id(tx_receipt)
+        with self._lock:
+            entry = self._recent.get(key)
+            if entry is not None and entry[0] is tx_receipt and entry[1] == len(logs):
+                self._recent.move_to_end(key)
+                return entry[2]
+
+        buckets: dict[str, list] = {}
+        names = self._names
+        for log in logs:
+            topics = log["topics"]
+            name = names.get(_topic_key(topics[0])) if topics else None
+            if name is not None:
+                buckets.setdefault(name, []).append(log)
+        decoded = DecodedReceipt(buckets)
+
+        with self._lock:
+            self._recent[key] = (tx_receipt, len(logs), decoded)
+            self._recent.move_to_end(key)
+            if len(self._recent) > self.recent_receipts:
+                self._recent.popitem(last=False)
+        return decoded
+
+
+RECEIPT_DECODER = ReceiptDecoder()
+
+
+def decode_receipt(tx_receipt: dict) -> DecodedReceipt:
+    """
+    Bucket the logs of a receipt by event with the shared decoder.
+
+    :param tx_receipt dict: The transaction receipt.
+    :return DecodedReceipt: The bucketed logs.
+    """
+    return RECEIPT_DECODER.decode(tx_receipt)
@@ -0,0 +1,360 @@
+"""Block-driven receipt collection shared by all pending transactions.
+
+``web3.eth.wait_for_transaction_receipt`` polls ``eth_getTransactionReceipt``
+in a loop for each hash, so N transactions in flight cost N polling loops.
+A :class:`ReceiptWatcher` polls ``eth_blockNumber`` instead, and on each new
+block resolves every pending hash at once: with ``eth_getBlockReceipts``
+when there are more pending hashes than new blocks, otherwise with one
+``eth_getTransactionReceipt`` per pending hash. Nodes without
+``eth_getBlockReceipts`` fall back to the per-hash lookups.
+
+A hash may be mined in the latest block just before it is watched, so the
+first scan of a newly watched hash includes the block that was latest when
+it was registered. The receipts of the last scanned block are kept, so this
+usually costs no extra request.
+
+A failed poll, e.g. a rate-limited or dropped request, keeps every hash
+watched and is retried after a growing backoff. Only ``max_failures``
+consecutive failed polls fail the waiting callers.
+"""
+
+import logging
+import threading
+import weakref
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import MethodUnavailable, TimeExhausted, TransactionNotFound
+
+DEFAULT_POLL_INTERVAL = 0.5
+# Beyond this many new blocks, pending hashes are looked up one by one
+MAX_SCANNED_BLOCKS = 8
+# Consecutive failed polls after which the pending waiters fail
+MAX_POLL_FAILURES = 5
+# The longest wait before polling again after a failed poll, in seconds
+MAX_POLL_BACKOFF = 8.0
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+# web3 instance -> ReceiptWatcher serving every receipt wait
+_watchers: "weakref.WeakKeyDictionary[Web3, ReceiptWatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _is_unsupported_method_error(exc: Exception) -> bool:
+    """True if the node does not implement the requested RPC method."""
+    if isinstance(exc, MethodUnavailable):
+        return True
+    msg = str(exc).lower()
+    return (
+        "method not found" in msg
+        or "not supported" in msg
+        or "does not exist" in msg
+        or "-32601" in msg
+    )
+
+
+def poll_delay(poll_interval: float, failures: int) -> float:
+    """
+    Get the wait before the next poll, doubled for each consecutive failure.
+
+    :param poll_interval float: Seconds between two polls.
+    :param failures int: The number of consecutive failed polls.
+    :return float: Seconds to wait.
+    """
+    if not failures:
+        return poll_interval
+    return min(MAX_POLL_BACKOFF, poll_interval * 2**failures)
+
+
+class ReceiptWaiter:
+    """
+    A pending receipt of a :class:`ReceiptWatcher`.
+
+    :ivar tx_hash HexBytes: The transaction hash.
+    """
+
+    def __init__(self, watcher: "ReceiptWatcher", tx_hash: HexBytes, scan_from):
+        self.tx_hash = tx_hash
+        self._watcher = watcher
+        self._scan_from: int | None = scan_from
+        self._event = threading.Event()
+        self._receipt = None
+        self._error: Exception | None = None
+
+    def _resolve(self, receipt=None, error: Exception | None = None) -> None:
+        self._receipt = receipt
+        self._error = error
+        self._event.set()
+
+    def done(self) -> bool:
+        """
+        Whether the receipt or an error is available.
+
+        :return bool: True once resolved.
+        """
+        return self._event.is_set()
+
+    def result(self, timeout: float | None = None) -> dict:
+        """
+        Wait for the receipt.
+
+        :param timeout float: [Optional] Seconds to wait. Waits forever by default.
+        :return dict: The transaction receipt.
+        :raises TimeExhausted: If the transaction is not mined in time.
+        """
+        if not self._event.wait(timeout):
+            self._watcher._forget(self)
+            raise TimeExhausted(
+                f"Transaction {self.tx_hash.hex()} is not in the chain after {timeout} seconds"
+            )
+        if self._error is not None:
+            raise self._error
+        return self._receipt
+
+
+class ReceiptWatcher:
+    """
+    Follows new blocks and resolves the receipts of every watched hash.
+
+    A background thread polls while hashes are pending and stops when none
+    are left. With ``background=False`` the caller drives :meth:`poll`.
+
+    :param web3 Web3: The web3 instance to poll.
+    :param poll_interval float: [Optional] Seconds between two checks for a new block.
+    :param background bool: [Optional] Poll in a background thread. Default is True.
+    :param max_failures int: [Optional] Consecutive failed polls after which
+        the pending waiters fail with the last error. Default is 5.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        background: bool = True,
+        max_failures: int = MAX_POLL_FAILURES,
+    ):
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1.")
+        self.web3 = web3
+        self.poll_interval = poll_interval
+        self.background = background
+        self.max_failures = max_failures
+        self.failures = 0
+        self.block_receipts_supported: bool | None = None
+        self._waiters: dict[HexBytes, ReceiptWaiter] = {}
+        self._last_block: int | None = None
+        self._last_block_receipts: dict[HexBytes, dict] | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._stats = {
+            "blocks": 0,
+            "block_receipt_requests": 0,
+            "receipt_requests": 0,
+        }
+
+    @property
+    def pending(self) -> int:
+        """The number of watched hashes without a receipt yet."""
+        with self._lock:
+            return len(self._waiters)
+
+    def stats(self) -> dict:
+        """
+        Get the watcher counters.
+
+        :return dict: A dictionary with ``blocks`` (new blocks seen),
+            ``block_receipt_requests``, ``receipt_requests`` and ``pending``.
+        """
+        with self._lock:
+            return {**self._stats, "pending": len(self._waiters)}
+
+    def watch(self, tx_hash) -> ReceiptWaiter:
+        """
+        Start watching a transaction hash.
+
+        :param tx_hash HexBytes: The transaction hash.
+        :return ReceiptWaiter: The pending receipt.
+        """
+        tx_hash = HexBytes(tx_hash)
+        with self._lock:
+            waiter = self._waiters.get(tx_hash)
+            if waiter is not None:
+                return waiter
+            waiter = ReceiptWaiter(self, tx_hash, self._last_block)
+            receipt = (self._last_block_receipts or {}).get(tx_hash)
+            if receipt is not None:
+                waiter._resolve(receipt)
+                return waiter
+            self._waiters[tx_hash] = waiter
+            if self.background and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="story-receipt-watcher", daemon=True
+                )
+                self._thread.start()
+        return waiter
+
+    def wait(self, tx_hash, timeout: float | None = None) -> dict:
+        """
+        Wait for the receipt of a transaction.
+
+        :param tx_hash HexBytes: The transaction hash.
+        :param timeout float: [Optional] Seconds to wait. Waits forever by default.
+        :return dict: The transaction receipt.
+        :raises TimeExhausted: If the transaction is not mined in time.
+        """
+        return self.watch(tx_hash).result(timeout)
+
+    def poll(self) -> None:
+        """Check for a new block once and resolve the hashes mined since."""
+        with self._poll_lock:
+            with self._lock:
+                pending = list(self._waiters.values())
+            if not pending:
+                return
+            try:
+                block_number = self.web3.eth.block_number
+                if block_number == self._last_block:
+                    return
+                receipts = self._fetch_receipts(pending, block_number)
+            except Exception as e:
+                self.failures += 1
+                if self.failures < self.max_failures:
+                    # Keep every waiter: the transactions are still being
+                    # mined, and the next poll retries after a backoff
+                    logger.warning(
+                        "Receipt poll failed (%d/%d), retrying: %s",
+                        self.failures,
+                        self.max_failures,
+                        e,
+                    )
+                    return
+                self.failures = 0
+                with self._lock:
+                    for waiter in pending:
+                        self._waiters.pop(waiter.tx_hash, None)
+                for waiter in pending:
+                    waiter._resolve(error=e)
+                return
+
+            self.failures = 0
+            with self._lock:
+                self._stats["blocks"] += 1
+                self._last_block = block_number
+                for waiter in pending:
+                    waiter._scan_from = None
+                    receipt = receipts.get(waiter.tx_hash)
+                    if receipt is not None:
+                        self._waiters.pop(waiter.tx_hash, None)
+                        waiter._resolve(receipt)
+
+    def _fetch_receipts(
+        self, pending: list[ReceiptWaiter], block_number: int
+    ) -> dict[HexBytes, dict]:
+        start = block_number if self._last_block is None else self._last_block + 1
+        rescan = [w._scan_from for w in pending if w._scan_from is not None]
+        if rescan:
+            start = min(start, min(rescan))
+        blocks = range(start, block_number + 1)
+        cached = self._last_block_receipts if self._last_block in blocks else None
+        to_fetch = [
+            block for block in blocks if cached is None or block != self._last_block
+        ]
+
+        if (
+            self.block_receipts_supported is not False
+            and len(to_fetch) < len(pending)
+            and len(blocks) <= MAX_SCANNED_BLOCKS
+        ):
+            try:
+                receipts = dict(cached or {})
+                for block in to_fetch:
+                    with self._lock:
+                        self._stats["block_receipt_requests"] += 1
+                    block_receipts = {
+                        HexBytes(receipt["transactionHash"]): receipt
+                        for receipt in self.web3.eth.get_block_receipts(block)
+                    }
+                    receipts.update(block_receipts)
+                self.block_receipts_supported = True
+                self._last_block_receipts = block_receipts if to_fetch else cached
+                return receipts
+            except Exception as e:
+                if self.block_receipts_supported or not _is_unsupported_method_error(e):
+                    raise
+                self.block_receipts_supported = False
+
+        self._last_block_receipts = None
+        receipts = {}
+        for waiter in pending:
+            with self._lock:
+                self._stats["receipt_requests"] += 1
+            try:
+                receipts[waiter.tx_hash] = self.web3.eth.get_transaction_receipt(
+                    waiter.tx_hash
+                )
+            except TransactionNotFound:
+                continue
+        return receipts
+
+    def _forget(self, waiter: ReceiptWaiter) -> None:
+        with self._lock:
+            if self._waiters.get(waiter.tx_hash) is waiter:
+                del self._waiters[waiter.tx_hash]
+
+    def _run(self) -> None:
+        idle = threading.Event()
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._thread = None
+                    self.failures = 0
+                    self._last_block = None
+                    self._last_block_receipts = None
+                    return
+            self.poll()
+            idle.wait(poll_delay(self.poll_interval, self.failures))
+
+
+def enable_receipt_watcher(
+    web3: Web3, poll_interval: float = DEFAULT_POLL_INTERVAL
+) -> ReceiptWatcher:
+    """
+    Wait for every receipt on a web3 instance through one shared
+    :class:`ReceiptWatcher` instead of a polling loop per transaction.
+
+    :param web3 Web3: The web3 instance.
+    :param poll_interval float: [Optional] Seconds between two checks for a new block.
+    :return ReceiptWatcher: The watcher of the web3 instance.
+    """
+    with _lock:
+        watcher = _watchers.get(web3)
+        if watcher is None:
+            watcher = _watchers[web3] = ReceiptWatcher(web3, poll_interval)
+        else:
+            watcher.poll_interval = poll_interval
+    return watcher
+
+
+def disable_receipt_watcher(web3: Web3) -> None:
+    """
+    Wait for receipts on a web3 instance with web3's own polling again.
+
+    :param web3 Web3: The web3 instance.
+    """
+    with _lock:
+        _watchers.pop(web3, None)
+
+
+def get_receipt_watcher(web3: Web3) -> ReceiptWatcher | None:
+    """
+    Get the shared receipt watcher of a web3 instance.
+
+    :param web3 Web3: The web3 instance.
+    :return ReceiptWatcher | None: The watcher, or None unless it was enabled.
+    """
+    with _lock:
+        return _watchers.get(web3)
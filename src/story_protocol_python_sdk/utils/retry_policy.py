@@ -0,0 +1,294 @@
+"""Retry and replacement policy of transaction sends.
+
+``build_and_send_transaction`` classifies every send error into a kind and
+asks the :class:`RetryPolicy` of the send what to do with it:
+
+- ``underpriced``: send again at once with the same nonce and fees raised by
+  ``fee_bump_ratio`` per attempt, up to ``max_fee_per_gas``. A "replacement
+  transaction underpriced" for a managed nonce this send never broadcast means
+  another transaction holds the nonce: it is not replaced, the nonce manager
+  is resynced instead.
+- ``nonce_too_low`` / ``nonce_gap``: resync the nonce manager and send again
+  at once with a fresh nonce. A caller-given nonce is never replaced, so the
+  error is raised.
+- ``timeout``, ``rate_limited`` and ``connection``: send the same signed
+  transaction again after an exponential backoff with jitter. That is safe: a
+  node that already has it answers "already known". A ``nonce_too_low`` after
+  a timeout or a dropped connection may mean the first send was mined, so the
+  sender looks up the receipts of its earlier attempts instead of signing the
+  call again under a new nonce.
+- anything else is raised.
+
+With ``stuck_timeout`` set, a sent transaction that has no receipt after that
+many seconds is replaced by the same transaction with raised fees, until the
+receipt ``timeout`` of the send runs out.
+
+A blocking backoff waits on the event set with :func:`retries_interrupted_by`
+if there is one, so a :class:`TransactionPipeline` or :class:`SenderPool`
+that is closed stops its calls from waiting to retry.
+"""
+
+import asyncio
+import random
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+import requests
+from web3 import Web3
+
+UNDERPRICED = "underpriced"
+NONCE_TOO_LOW = "nonce_too_low"
+NONCE_GAP = "nonce_gap"
+ALREADY_KNOWN = "already_known"
+TIMEOUT = "timeout"
+RATE_LIMITED = "rate_limited"
+CONNECTION = "connection"
+FATAL = "fatal"
+
+TRANSIENT_ERRORS = frozenset({TIMEOUT, RATE_LIMITED, CONNECTION})
+
+# What the sender does with a classified error
+RESYNC_NONCE = "resync_nonce"
+REPLACE = "replace"
+BACKOFF = "backoff"
+
+_lock = threading.Lock()
+# web3 instance -> RetryPolicy used when tx_options has none
+_policies: "weakref.WeakKeyDictionary[Web3, RetryPolicy]" = weakref.WeakKeyDictionary()
+# Set by the pipeline or sender pool that runs the current call
+_interrupt: ContextVar[threading.Event | None] = ContextVar(
+    "story_retry_interrupt", default=None
+)
+
+
+def classify_send_error(exc: Exception) -> str:
+    """
+    Classify an error raised while sending a transaction.
+
+    :param exc Exception: The error.
+    :return str: One of "underpriced", "nonce_too_low", "nonce_gap",
+        "already_known", "timeout", "rate_limited", "connection" or "fatal".
+    """
+    msg = str(exc).lower()
+    if "already known" in msg or "known transaction" in msg:
+        return ALREADY_KNOWN
+    if (
+        "underpriced" in msg
+        or "fee too low" in msg
+        or "max fee per gas less than block base fee" in msg
+    ):
+        return UNDERPRICED
+    if "nonce too low" in msg:
+        return NONCE_TOO_LOW
+    if "nonce too high" in msg or "nonce gap" in msg:
+        return NONCE_GAP
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None) or getattr(exc, "status", None)
+    if status == 429 or "too many requests" in msg or "rate limit" in msg:
+        return RATE_LIMITED
+    if isinstance(
+        exc, (TimeoutError, asyncio.TimeoutError, requests.exceptions.Timeout)
+    ):
+        return TIMEOUT
+    if isinstance(exc, (ConnectionError, requests.exceptions.ConnectionError)):
+        return CONNECTION
+    return FATAL
+
+
+def is_replacement_error(exc: Exception) -> bool:
+    """
+    Whether an underpriced send was rejected because the pool already holds
+    a transaction with the same nonce.
+
+    :param exc Exception: The error.
+    :return bool: True for a replacement that offered too little.
+    """
+    return "replacement" in str(exc).lower()
+
+
+def _fee_per_gas(fees: dict) -> int | None:
+    return fees.get("maxFeePerGas", fees.get("gasPrice"))
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How a send reacts to errors and to a transaction that stays pending.
+
+    :param max_attempts int: [Optional] The most sends of one transaction,
+        replacements included. Default is 3.
+    :param backoff float: [Optional] Seconds before the first resend after a
+        transient error, doubled on each further one. Default is 0.1.
+    :param max_backoff float: [Optional] The longest wait before a resend. Default is 2.
+    :param jitter float: [Optional] The fraction (0-1) of each wait that is
+        randomized, so concurrent senders do not retry in lockstep. Default is 0.5.
+    :param fee_bump_ratio float: [Optional] The factor fees are raised by for
+        each replacement. Nodes require at least 1.1. Default is 1.2.
+    :param max_fee_per_gas int: [Optional] The highest fee per gas in wei a
+        replacement may offer. Default is no cap.
+    :param stuck_timeout float: [Optional] Seconds without a receipt after which
+        a transaction is replaced by fee. Default is never.
+    :param retry_on frozenset: [Optional] The error kinds to retry.
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.1
+    max_backoff: float = 2.0
+    jitter: float = 0.5
+    fee_bump_ratio: float = 1.2
+    max_fee_per_gas: int | None = None
+    stuck_timeout: float | None = None
+    retry_on: frozenset = frozenset(
+        {UNDERPRICED, NONCE_TOO_LOW, NONCE_GAP, TIMEOUT, RATE_LIMITED, CONNECTION}
+    )
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        if self.backoff < 0 or self.max_backoff < 0:
+            raise ValueError("The backoff must not be negative.")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError(f"Jitter must be between 0 and 1, got {self.jitter}.")
+        if self.fee_bump_ratio <= 1:
+            raise ValueError("The fee bump ratio must be greater than 1.")
+        if self.stuck_timeout is not None and self.stuck_timeout <= 0:
+            raise ValueError("stuck_timeout must be positive.")
+
+    def action(
+        self,
+        kind: str,
+        attempt: int,
+        managed_nonce: bool,
+        foreign_nonce: bool = False,
+    ) -> str | None:
+        """
+        Decide how to retry a failed send.
+
+        :param kind str: The kind of the error, from :func:`classify_send_error`.
+        :param attempt int: The number of sends made so far.
+        :param managed_nonce bool: Whether the nonce comes from a nonce manager.
+        :param foreign_nonce bool: [Optional] Whether the pool holds a
+            transaction at the nonce that this send did not broadcast. Default is False.
+        :return str | None: "resync_nonce", "replace", "backoff", or None to
+            raise the error.
+        """
+        if attempt >= self.max_attempts or kind not in self.retry_on:
+            return None
+        if kind in (NONCE_TOO_LOW, NONCE_GAP):
+            # A caller-given nonce that is already used cannot be replaced
+            return RESYNC_NONCE if managed_nonce else None
+        if kind == UNDERPRICED:
+            # Never replace another sender's transaction at a managed nonce
+            return RESYNC_NONCE if managed_nonce and foreign_nonce else REPLACE
+        if kind in TRANSIENT_ERRORS:
+            return BACKOFF
+        return None
+
+    def delay(self, attempt: int) -> float:
+        """
+        Get the wait before resending after a transient error.
+
+        :param attempt int: The number of sends made so far.
+        :return float: Seconds to wait.
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def bump_ratio(self, replacements: int) -> float:
+        """
+        Get the factor to raise fees by for a replacement.
+
+        :param replacements int: The number of the replacement, from 1.
+        :return float: The factor over the current fees.
+        """
+        return self.fee_bump_ratio**replacements
+
+    def cap_fees(self, fees: dict) -> dict:
+        """
+        Limit fee fields to ``max_fee_per_gas``.
+
+        :param fees dict: The ``gasPrice`` or EIP-1559 fee fields.
+        :return dict: The capped fields.
+        """
+        if self.max_fee_per_gas is None:
+            return fees
+        capped = dict(fees)
+        for name in ("gasPrice", "maxFeePerGas", "maxPriorityFeePerGas"):
+            if name in capped:
+                capped[name] = min(capped[name], self.max_fee_per_gas)
+        return capped
+
+    def outbids(self, fees: dict, previous: dict) -> bool:
+        """
+        Whether replacement fees offer more than the fees they replace. False
+        once the cap stops them from growing.
+
+        :param fees dict: The replacement fee fields.
+        :param previous dict: The fee fields of the replaced send.
+        :return bool: True if the replacement is worth sending.
+        """
+        fee, previous_fee = _fee_per_gas(fees), _fee_per_gas(previous)
+        return fee is None or previous_fee is None or fee > previous_fee
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def set_retry_policy(web3: Web3, policy: RetryPolicy | None) -> None:
+    """
+    Set the retry policy of every send on a web3 instance that has no
+    ``retryPolicy`` option.
+
+    :param web3 Web3: The web3 instance.
+    :param policy RetryPolicy: The policy, or None for the default one.
+    """
+    with _lock:
+        if policy is None:
+            _policies.pop(web3, None)
+        else:
+            _policies[web3] = policy
+
+
+def get_retry_policy(web3: Web3, tx_options: dict | None = None) -> RetryPolicy:
+    """
+    Get the retry policy of a send.
+
+    :param web3 Web3: The web3 instance.
+    :param tx_options dict: [Optional] The transaction options of the send.
+    :return RetryPolicy: The ``retryPolicy`` option, else the policy set for
+        the web3 instance, else the default one.
+    """
+    policy = (tx_options or {}).get("retryPolicy")
+    if policy is not None:
+        if not isinstance(policy, RetryPolicy):
+            raise ValueError(f"Invalid retry policy: {policy!r}.")
+        return policy
+    with _lock:
+        return _policies.get(web3, DEFAULT_RETRY_POLICY)
+
+
+@contextmanager
+def retries_interrupted_by(event: threading.Event):
+    """
+    Let an event cut short the backoffs of the sends made in this context.
+    Once it is set, a send that would wait to retry raises its error instead.
+
+    :param event threading.Event: The event, e.g. set when a pool closes.
+    """
+    token = _interrupt.set(event)
+    try:
+        yield
+    finally:
+        _interrupt.reset(token)
+
+
+def get_retry_interrupt() -> threading.Event | None:
+    """
+    Get the event that cuts short the backoffs of the current sends.
+
+    :return threading.Event | None: The event, or None if nothing can interrupt them.
+    """
+    return _interrupt.get()
@@ -0,0 +1,223 @@
+"""Horizontal write throughput over several funded accounts.
+
+A :class:`StoryClient` sends every write from one account, so all of them
+share one nonce sequence. A :class:`SenderPool` holds one client per account
+and runs each submitted SDK call on the least-loaded one. Every account has
+its own nonce manager, so the accounts send in parallel lanes.
+
+A whole SDK call runs on one account: its approvals, fee payments and
+signatures all come from that account, and NFTs it mints go to that account
+unless the call names a recipient. Calls that must come from a specific
+account, e.g. because they act on an IP asset that account owns and sign for
+it with :meth:`Sign.get_permission_signature`, take that account as
+``owner``. Calls on the ``IPAccount``, ``Permission`` and ``WIP`` resources
+act for an owner by nature and run on the pool owner unless told otherwise.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from typing_extensions import Self
+from web3 import Web3
+
+from story_protocol_python_sdk.utils.retry_policy import retries_interrupted_by
+
+DEFAULT_MAX_IN_FLIGHT_PER_KEY = 16
+# Resources whose writes act for the owner of an IP account or a balance
+OWNER_PINNED_RESOURCES = frozenset({"IPAccount", "Permission", "WIP"})
+
+
+class _Lane:
+    def __init__(self, client, max_in_flight: int):
+        self.client = client
+        self.address: str = client.account.address
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_in_flight,
+            thread_name_prefix=f"story-sender-{self.address[:10]}",
+        )
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.started_at: float | None = None
+
+    @property
+    def load(self) -> int:
+        return self.queued + self.running
+
+
+class SenderPool:
+    """
+    Runs SDK calls on the least-loaded of several accounts.
+
+    Example::
+
+        with client.sender_pool([account_2, account_3]) as pool:
+            futures = [
+                pool.submit("IPAsset.mint_and_register_ip", spg_nft_contract)
+                for _ in range(300)
+            ]
+            ip_ids = [future.result()["ip_id"] for future in futures]
+            print(pool.stats())
+
+    :param web3 Web3: The web3 instance shared by every account.
+    :param accounts list: The funded accounts to send from.
+    :param chain_id int: The ID of the blockchain network.
+    :param owner str: [Optional] The address of the account that runs
+        owner-pinned calls. Default is the first account.
+    :param max_in_flight_per_key int: [Optional] The most calls that run at
+        once on one account. Default is 16.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        accounts: list,
+        chain_id: int,
+        owner: str | None = None,
+        max_in_flight_per_key: int = DEFAULT_MAX_IN_FLIGHT_PER_KEY,
+    ):
+        from story_protocol_python_sdk.story_client import StoryClient
+
+        if not accounts:
+            raise ValueError("A sender pool needs at least one account.")
+        if max_in_flight_per_key < 1:
+            raise ValueError("max_in_flight_per_key must be at least 1.")
+        self._lanes: dict[str, _Lane] = {}
+        for account in accounts:
+            key = account.address.lower()
+            if key in self._lanes:
+                raise ValueError(f"Account {account.address} is in the pool twice.")
+            self._lanes[key] = _Lane(
+                StoryClient(web3, account, chain_id), max_in_flight_per_key
+            )
+        self.web3 = web3
+        self.chain_id = chain_id
+        self.owner = self._lane_of(owner or accounts[0].address).address
+        self._lock = threading.Lock()
+        self._closing = threading.Event()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            # Let the submitted calls finish, retries included
+            self._shutdown()
+        self.close()
+
+    @property
+    def clients(self) -> dict:
+        """The StoryClient of each account, by address."""
+        return {lane.address: lane.client for lane in self._lanes.values()}
+
+    def _lane_of(self, address: str) -> _Lane:
+        lane = self._lanes.get(address.lower())
+        if lane is None:
+            raise ValueError(f"{address} is not an account of the sender pool.")
+        return lane
+
+    def submit(self, call, *args, owner: str | None = None, **kwargs) -> Future:
+        """
+        Run an SDK call on one account of the pool.
+
+        :param call: The SDK method as "Resource.method", e.g.
+            "IPAsset.register", or a callable that takes the StoryClient of
+            the chosen account followed by ``args`` and ``kwargs``.
+        :param args: Positional arguments for the call.
+        :param owner str: [Optional] The address of the account the call must
+            run on. Default is the least-loaded account, or the pool owner for
+            the owner-pinned resources.
+        :param kwargs: Keyword arguments for the call.
+        :return Future: Resolved with the return value of the call.
+        """
+        if isinstance(call, str):
+            resource_name, _, method_name = call.partition(".")
+            if not method_name:
+                raise ValueError(f"Expected 'Resource.method', got {call!r}.")
+            if owner is None and resource_name in OWNER_PINNED_RESOURCES:
+                owner = self.owner
+        with self._lock:
+            if owner is not None:
+                lane = self._lane_of(owner)
+            else:
+                lane = min(self._lanes.values(), key=lambda lane: lane.load)
+            lane.queued += 1
+        return lane.executor.submit(self._run, lane, call, args, kwargs)
+
+    def call(self, call, *args, owner: str | None = None, **kwargs):
+        """
+        Run an SDK call on one account of the pool and wait for its result.
+
+        :param call: The SDK method, as for :meth:`submit`.
+        :param args: Positional arguments for the call.
+        :param owner str: [Optional] The address of the account the call must run on.
+        :param kwargs: Keyword arguments for the call.
+        :return: The return value of the call.
+        """
+        return self.submit(call, *args, owner=owner, **kwargs).result()
+
+    def _run(self, lane: _Lane, call, args: tuple, kwargs: dict):
+        with self._lock:
+            lane.queued -= 1
+            lane.running += 1
+            if lane.started_at is None:
+                lane.started_at = time.monotonic()
+        try:
+            with retries_interrupted_by(self._closing):
+                if isinstance(call, str):
+                    resource_name, _, method_name = call.partition(".")
+                    method = getattr(getattr(lane.client, resource_name), method_name)
+                    result = method(*args, **kwargs)
+                else:
+                    result = call(lane.client, *args, **kwargs)
+        except BaseException:
+            with self._lock:
+                lane.failed += 1
+            raise
+        else:
+            with self._lock:
+                lane.completed += 1
+            return result
+        finally:
+            with self._lock:
+                lane.running -= 1
+
+    def stats(self) -> dict:
+        """
+        Get the counters of each account.
+
+        :return dict: By address, a dictionary with ``completed`` and ``failed``
+            calls, ``in_flight`` (running) and ``backlog`` (queued) calls, and
+            ``throughput``, the completed calls per second since the account
+            started its first call.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                lane.address: {
+                    "completed": lane.completed,
+                    "failed": lane.failed,
+                    "in_flight": lane.running,
+                    "backlog": lane.queued,
+                    "throughput": (
+                        lane.completed / (now - lane.started_at)
+                        if lane.started_at is not None and now > lane.started_at
+                        else 0.0
+                    ),
+                }
+                for lane in self._lanes.values()
+            }
+
+    def close(self) -> None:
+        """
+        Wait for every submitted call and stop the worker threads. Calls that
+        are waiting to retry a send give up and raise its error.
+        """
+        self._closing.set()
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        for lane in self._lanes.values():
+            lane.executor.shutdown(wait=True)
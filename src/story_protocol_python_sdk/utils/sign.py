@@ -20,7 +20,7 @@ class Sign:
         self.account = account
 
         self.ip_account_client = IPAccountImplClient(web3)
-        self.access_controller_client = AccessControllerClient(web3)
+        self.access_controller_client = AccessControllerClient(web3, chain_id)
 
     def get_signature(
         self,
@@ -0,0 +1,438 @@
+"""Coalescing of independent SDK writes into multicall transactions.
+
+``batch_register``, ``batch_mint_and_register_ip`` and
+``batch_claim_all_revenue`` each batch one kind of call. A
+:class:`TransactionBatcher` accepts any generated client write from any
+thread, queues it per route and sends each queue as one transaction when it
+reaches a size or gas threshold, or when its oldest call has waited long
+enough. Every caller gets a future resolved with its own result.
+
+Resource methods are queued through the calldata they return with
+``encodedTxDataOnly``: :meth:`TransactionBatcher.submit_register` does so for
+``IPAsset.register`` and resolves with its usual result, and
+:meth:`TransactionBatcher.submit_call_data` takes the encoded output of any
+other resource method together with the client of its contract.
+
+There are two routes:
+
+- Calls to a workflow contract with its own ``multicall`` (e.g.
+  ``RegistrationWorkflows``, ``RoyaltyWorkflows``) are batched into that
+  contract's ``multicall``, which delegate-calls each of them, so
+  ``msg.sender`` stays the sending account.
+- Any other call is batched into ``Multicall3.aggregate3``, where
+  ``msg.sender`` is the Multicall3 contract. Only calls that do not depend on
+  the caller, like ``IPAssetRegistry.register``, can take this route.
+
+Every call of a batch reverts together with it.
+"""
+
+import importlib
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from eth_utils import to_bytes
+from typing_extensions import Self
+from web3 import Web3
+
+from story_protocol_python_sdk.abi.Multicall3.Multicall3_client import Multicall3Client
+from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
+
+DEFAULT_MAX_CALLS = 50
+DEFAULT_MAX_DELAY = 0.5
+MAX_CONCURRENT_BATCHES = 4
+
+AGGREGATE3 = "aggregate3"
+MULTICALL = "multicall"
+
+
+def encode_client_call(client_function, client_args: tuple) -> bytes:
+    """
+    Encode the calldata of a generated client write.
+
+    :param client_function: The ``build_*_transaction`` method of a generated client.
+    :param client_args tuple: The arguments of the call.
+    :return bytes: The calldata.
+    :raises ValueError: If the function is not a generated client write.
+    """
+    name = getattr(client_function, "__name__", "")
+    client = getattr(client_function, "__self__", None)
+    if (
+        client is None
+        or not name.startswith("build_")
+        or not name.endswith("_transaction")
+    ):
+        raise ValueError(
+            f"{name or client_function} is not a build_*_transaction method of a generated client."
+        )
+    function_name = name[len("build_") : -len("_transaction")]
+    encoders_module = type(client).__module__.removesuffix("_client") + "_encoders"
+    try:
+        encoder = getattr(
+            importlib.import_module(encoders_module), f"encode_{function_name}"
+        )
+    except (ImportError, AttributeError):
+        return to_bytes(
+            hexstr=client.contract.encode_abi(function_name, args=list(client_args))
+        )
+    return encoder(*client_args)
+
+
+def match_event(parse_events, **fields):
+    """
+    Build a ``parse`` callback that picks the result of one call out of the
+    receipt of its batch.
+
+    :param parse_events: Parses a receipt into a list of event dicts, e.g.
+        ``IPAsset._parse_tx_ip_registered_event``.
+    :param fields: The values that identify the event of the call.
+    :return: A ``parse(tx_receipt, index)`` callback returning the first
+        matching event.
+    """
+
+    def parse(tx_receipt, index):
+        for event in parse_events(tx_receipt):
+            if all(event.get(name) == value for name, value in fields.items()):
+                return event
+        raise ValueError(f"No event matching {fields} in the batch receipt.")
+
+    return parse
+
+
+class _Batch:
+    def __init__(self, route: tuple, client):
+        self.route = route
+        self.client = client
+        self.calls: list[bytes] = []
+        self.targets: list[str] = []
+        self.parsers: list = []
+        self.futures: list[Future] = []
+        self.gas = 0
+        self.opened_at = time.monotonic()
+
+
+class TransactionBatcher:
+    """
+    Queues writes from any thread and sends them as multicall transactions.
+
+    Example::
+
+        with client.batcher(max_calls=20) as batcher:
+            futures = [
+                batcher.submit_register(client.IPAsset, nft_contract, token_id)
+                for token_id in token_ids
+            ]
+        ip_ids = [future.result()["ip_id"] for future in futures]
+
+    Generated client writes are queued with :meth:`submit`, with a ``parse``
+    callback such as one built by :func:`match_event`.
+
+    :param web3 Web3: The web3 instance the batches are sent through.
+    :param account: The account that signs the batches.
+    :param chain_id int: The ID of the blockchain network.
+    :param max_calls int: [Optional] Send a batch once it holds this many calls. Default is 50.
+    :param max_gas int: [Optional] Send a batch before the gas hints of its calls exceed this.
+    :param max_delay float: [Optional] Send a batch once its oldest call waited this many seconds. Default is 0.5.
+    :param tx_options dict: [Optional] Transaction options of every batch.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        account,
+        chain_id: int,
+        max_calls: int = DEFAULT_MAX_CALLS,
+        max_gas: int | None = None,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        tx_options: dict | None = None,
+    ):
+        if max_calls < 1:
+            raise ValueError("max_calls must be at least 1.")
+        if max_delay < 0:
+            raise ValueError("max_delay must not be negative.")
+        tx_options = tx_options or {}
+        if tx_options.get("encodedTxDataOnly") or not tx_options.get(
+            "wait_for_receipt", True
+        ):
+            raise ValueError(
+                "Batches must wait for their receipts to resolve the results."
+            )
+        self.web3 = web3
+        self.account = account
+        self.chain_id = chain_id
+        self.max_calls = max_calls
+        self.max_gas = max_gas
+        self.max_delay = max_delay
+        self.tx_options = tx_options
+        self._open: dict[tuple, _Batch] = {}
+        self._ready: list[_Batch] = []
+        self._closed = False
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_BATCHES, thread_name_prefix="story-batcher"
+        )
+        self._multicall3_client: Multicall3Client | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """The number of queued calls not yet sent."""
+        with self._condition:
+            return sum(len(batch.calls) for batch in self._open.values()) + sum(
+                len(batch.calls) for batch in self._ready
+            )
+
+    def submit(
+        self,
+        client_function,
+        *client_args,
+        parse=None,
+        gas: int = 0,
+        route: str | None = None,
+    ) -> Future:
+        """
+        Queue a write.
+
+        :param client_function: The ``build_*_transaction`` method of a
+            generated client, as passed to ``build_and_send_transaction``.
+        :param client_args: Arguments to pass to the client function.
+        :param parse: [Optional] Called as ``parse(tx_receipt, index)`` with
+            the receipt of the batch and the position of the call in it, to
+            decode the result of the call. The receipt holds the logs of every
+            call of the batch.
+        :param gas int: [Optional] A gas hint for the ``max_gas`` threshold.
+        :param route str: [Optional] "multicall" or "aggregate3". Default is the
+            contract's own multicall if it has one, else aggregate3.
+        :return Future: Resolved with the parsed result, or with a dict with
+            ``tx_hash``, ``tx_receipt`` and ``index`` if ``parse`` is not given.
+        """
+        return self.submit_call_data(
+            client_function.__self__,
+            encode_client_call(client_function, client_args),
+            parse=parse,
+            gas=gas,
+            route=route,
+        )
+
+    def submit_call_data(
+        self,
+        client,
+        call_data: bytes | str,
+        parse=None,
+        gas: int = 0,
+        route: str | None = None,
+    ) -> Future:
+        """
+        Queue a write that is already encoded, like the ``encoded_tx_data``
+        a resource method returns with ``encodedTxDataOnly``.
+
+        :param client: The generated client of the contract the call is to.
+        :param call_data bytes | str: The calldata, as bytes or hex.
+        :param parse: [Optional] As for :meth:`submit`.
+        :param gas int: [Optional] A gas hint for the ``max_gas`` threshold.
+        :param route str: [Optional] As for :meth:`submit`.
+        :return Future: As for :meth:`submit`.
+        """
+        if isinstance(call_data, str):
+            call_data = to_bytes(hexstr=call_data)
+        if route is None:
+            route = (
+                MULTICALL
+                if hasattr(client, "build_multicall_transaction")
+                else AGGREGATE3
+            )
+        if route == MULTICALL:
+            if not hasattr(client, "build_multicall_transaction"):
+                raise ValueError(
+                    f"{type(client).__name__} has no multicall, use the aggregate3 route."
+                )
+            key = (MULTICALL, client.contract.address)
+        elif route == AGGREGATE3:
+            key = (AGGREGATE3,)
+        else:
+            raise ValueError(f"Unknown batch route: {route}.")
+
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise ValueError("The batcher is closed.")
+            batch = self._open.get(key)
+            if (
+                batch is not None
+                and self.max_gas is not None
+                and batch.gas + gas > self.max_gas
+            ):
+                self._ready.append(self._open.pop(key))
+                batch = None
+            if batch is None:
+                batch = self._open[key] = _Batch(key, client)
+            batch.calls.append(call_data)
+            batch.targets.append(client.contract.address)
+            batch.parsers.append(parse)
+            batch.futures.append(future)
+            batch.gas += gas
+            if len(batch.calls) >= self.max_calls:
+                self._ready.append(self._open.pop(key))
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="story-batcher-queue", daemon=True
+                )
+                self._worker.start()
+            self._condition.notify()
+        return future
+
+    def submit_register(
+        self,
+        ip_asset,
+        nft_contract: str,
+        token_id: int,
+        ip_metadata: dict | None = None,
+        deadline: int | None = None,
+    ) -> Future:
+        """
+        Queue :meth:`IPAsset.register`. A registration with metadata is sent
+        through ``RegistrationWorkflows.multicall``, which keeps the account
+        as the signer of its permission, and one without through aggregate3.
+
+        :param ip_asset IPAsset: The IPAsset resource to encode the call with.
+        :param nft_contract str: The address of the NFT.
+        :param token_id int: The token identifier of the NFT.
+        :param ip_metadata dict: [Optional] Metadata for the IP, as for :meth:`IPAsset.register`.
+        :param deadline int: [Optional] Signature deadline in seconds.
+        :return Future: Resolved like :meth:`IPAsset.register`, with the
+            transaction hash and IP ID. It is already resolved, with no
+            transaction hash, if the IP is registered.
+        """
+        encoded = ip_asset.register(
+            nft_contract,
+            token_id,
+            ip_metadata=ip_metadata,
+            deadline=deadline,
+            tx_options={"encodedTxDataOnly": True},
+        )
+        ip_id = encoded["ip_id"]
+        if ip_asset.is_registered(ip_id):
+            future = Future()
+            future.set_result({"tx_hash": None, "ip_id": ip_id})
+            return future
+
+        registered = match_event(ip_asset._parse_tx_ip_registered_event, ip_id=ip_id)
+
+        def parse(tx_receipt, index):
+            return {
+                "tx_hash": tx_receipt["transactionHash"].hex(),
+                "ip_id": registered(tx_receipt, index)["ip_id"],
+            }
+
+        return self.submit_call_data(
+            (
+                ip_asset.registration_workflows_client
+                if encoded["has_metadata"]
+                else ip_asset.ip_asset_registry_client
+            ),
+            encoded["encoded_tx_data"],
+            parse=parse,
+        )
+
+    def flush(self) -> None:
+        """Send every queued call now, without waiting for the thresholds."""
+        with self._condition:
+            self._ready.extend(self._open.values())
+            self._open.clear()
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Send every queued call and wait until all batches are resolved."""
+        with self._condition:
+            self._closed = True
+            self._ready.extend(self._open.values())
+            self._open.clear()
+            self._condition.notify()
+            worker = self._worker
+        if worker is not None:
+            worker.join()
+        self._executor.shutdown(wait=True)
+
+    def _take_due_batches(self) -> list[_Batch] | None:
+        """Wait for batches to send. None once closed and drained."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                for key, batch in list(self._open.items()):
+                    if now - batch.opened_at >= self.max_delay:
+                        self._ready.append(self._open.pop(key))
+                if self._ready:
+                    ready, self._ready = self._ready, []
+                    return ready
+                if self._closed:
+                    self._worker = None
+                    return None
+                timeout = None
+                if self._open:
+                    timeout = max(
+                        0.0,
+                        min(batch.opened_at for batch in self._open.values())
+                        + self.max_delay
+                        - now,
+                    )
+                self._condition.wait(timeout)
+
+    def _run(self) -> None:
+        while True:
+            batches = self._take_due_batches()
+            if batches is None:
+                return
+            for batch in batches:
+                self._executor.submit(self._send, batch)
+
+    def _send(self, batch: _Batch) -> None:
+        try:
+            if batch.route[0] == MULTICALL:
+                response = build_and_send_transaction(
+                    self.web3,
+                    self.account,
+                    batch.client.build_multicall_transaction,
+                    batch.calls,
+                    tx_options=self.tx_options,
+                )
+            else:
+                if self._multicall3_client is None:
+                    self._multicall3_client = Multicall3Client(self.web3, self.chain_id)
+                response = build_and_send_transaction(
+                    self.web3,
+                    self.account,
+                    self._multicall3_client.build_aggregate3_transaction,
+                    [
+                        {"target": target, "allowFailure": False, "callData": call}
+                        for target, call in zip(batch.targets, batch.calls)
+                    ],
+                    tx_options=self.tx_options,
+                )
+            tx_receipt = response["tx_receipt"]
+            if tx_receipt.get("status") == 0:
+                raise ValueError(f"Batch transaction {response['tx_hash']} reverted.")
+        except Exception as e:
+            for future in batch.futures:
+                future.set_exception(e)
+            return
+
+        for index, (future, parse) in enumerate(zip(batch.futures, batch.parsers)):
+            try:
+                if parse is None:
+                    future.set_result(
+                        {
+                            "tx_hash": response["tx_hash"],
+                            "tx_receipt": tx_receipt,
+                            "index": index,
+                        }
+                    )
+                else:
+                    future.set_result(parse(tx_receipt, index))
+            except Exception as e:
+                future.set_exception(e)
@@ -0,0 +1,223 @@
+"""Pipelined submission of SDK writes.
+
+A blocking SDK write sends its transaction, waits for the receipt and parses
+it. Sending many of them one by one costs one confirmation latency each.
+:class:`TransactionPipeline` runs the submitted calls on a bounded pool of
+worker threads. ``submit`` returns as soon as the call has broadcast its first
+transaction, so the next call is signed with the next nonce straight away.
+While the workers wait, one :class:`ReceiptWatcher` resolves the receipts of
+all of them once per new block and hands each one to its worker. The worker
+then parses the receipt exactly like the blocking call would.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+
+from typing_extensions import Self
+from web3 import Web3
+
+from story_protocol_python_sdk.utils.receipt_watcher import (
+    DEFAULT_POLL_INTERVAL,
+    ReceiptWatcher,
+    get_receipt_watcher,
+)
+from story_protocol_python_sdk.utils.retry_policy import retries_interrupted_by
+
+# Default number of calls a pipeline runs at once
+DEFAULT_MAX_WORKERS = 16
+
+_active: ContextVar[tuple["TransactionPipeline", "PendingTransaction"] | None] = (
+    ContextVar("story_transaction_pipeline", default=None)
+)
+
+
+class PendingTransaction:
+    """
+    A handle to an SDK call submitted through a :class:`TransactionPipeline`.
+
+    :ivar tx_hashes list[str]: The hashes of the transactions sent by the call,
+        in order.
+    """
+
+    def __init__(self):
+        self.tx_hashes: list[str] = []
+        self._future: Future = Future()
+        self._submitted = threading.Event()
+
+    @property
+    def tx_hash(self) -> str | None:
+        """The hash of the first transaction sent by the call, if any."""
+        return self.tx_hashes[0] if self.tx_hashes else None
+
+    def done(self) -> bool:
+        """
+        Whether the call has finished.
+
+        :return bool: True once the result or the error is available.
+        """
+        return self._future.done()
+
+    def result(self, timeout: float | None = None):
+        """
+        Wait for the call and return its result.
+
+        :param timeout float: [Optional] Seconds to wait. Waits forever by default.
+        :return: The return value of the call, e.g. the same dict the blocking
+            call returns with ``tx_hash``, ``ip_id`` and so on.
+        :raises Exception: The error raised by the call.
+        """
+        return self._future.result(timeout)
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        """
+        Wait for the call and return its error.
+
+        :param timeout float: [Optional] Seconds to wait. Waits forever by default.
+        :return Exception: The error raised by the call, or None.
+        """
+        return self._future.exception(timeout)
+
+
+class TransactionPipeline:
+    """
+    Submits SDK writes back-to-back and collects their receipts together.
+
+    Example::
+
+        with client.pipeline() as pipeline:
+            handles = [
+                pipeline.submit(client.IPAsset.register, nft_contract, token_id)
+                for token_id in token_ids
+            ]
+            results = pipeline.collect()
+
+    Nonces come from the account's nonce manager, so consecutive submissions
+    use consecutive nonces. At most ``max_workers`` calls run at once; once
+    they all do, ``submit`` waits for one of them to finish.
+
+    :param web3 Web3: The web3 instance the calls send through.
+    :param poll_interval float: [Optional] Seconds between two checks for a new block.
+    :param watcher ReceiptWatcher: [Optional] The watcher that resolves the
+        receipts. Default is the one enabled for the web3 instance, else a
+        watcher of the pipeline's own.
+    :param max_workers int: [Optional] The most calls that run at once. Default is 16.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        watcher: ReceiptWatcher | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self.web3 = web3
+        self.poll_interval = poll_interval
+        self.handles: list[PendingTransaction] = []
+        self.watcher = (
+            watcher or get_receipt_watcher(web3) or ReceiptWatcher(web3, poll_interval)
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="story-pipeline-call"
+        )
+        self._closing = threading.Event()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.collect(return_exceptions=True)
+        self.close()
+
+    def submit(self, method, *args, **kwargs) -> PendingTransaction:
+        """
+        Run an SDK call in the pipeline.
+
+        Returns once the call has sent its first transaction, or has
+        finished without sending one. Waits for a free worker first if
+        ``max_workers`` calls are running.
+
+        :param method: The SDK method, e.g. ``client.IPAsset.register``.
+        :param args: Positional arguments for the method.
+        :param kwargs: Keyword arguments for the method.
+        :return PendingTransaction: The handle of the call.
+        """
+        handle = PendingTransaction()
+
+        def run():
+            token = _active.set((self, handle))
+            try:
+                with retries_interrupted_by(self._closing):
+                    handle._future.set_result(method(*args, **kwargs))
+            except BaseException as e:
+                handle._future.set_exception(e)
+            finally:
+                _active.reset(token)
+                handle._submitted.set()
+
+        self._executor.submit(run)
+        handle._submitted.wait()
+        self.handles.append(handle)
+        return handle
+
+    def collect(
+        self, timeout: float | None = None, return_exceptions: bool = False
+    ) -> list:
+        """
+        Wait for every submitted call and return their results.
+
+        :param timeout float: [Optional] Seconds to wait for each call.
+        :param return_exceptions bool: [Optional] Return the errors of failed
+            calls in place of their results instead of raising the first one.
+        :return list: The results, in submission order.
+        """
+        results = []
+        for handle in self.handles:
+            error = handle.exception(timeout)
+            if error is None:
+                results.append(handle.result())
+            elif return_exceptions:
+                results.append(error)
+            else:
+                raise error
+        return results
+
+    def close(self) -> None:
+        """
+        Wait for every running call and stop the worker threads. Calls that
+        are waiting to retry a send give up and raise its error.
+        """
+        self._closing.set()
+        self._executor.shutdown(wait=True)
+
+    def _wait_for_receipt(
+        self, handle: PendingTransaction, tx_hash, timeout: float
+    ) -> dict:
+        waiter = self.watcher.watch(tx_hash)
+        handle.tx_hashes.append(tx_hash.hex())
+        handle._submitted.set()
+        return waiter.result(timeout)
+
+
+def wait_for_transaction_receipt(web3: Web3, tx_hash, timeout: float) -> dict:
+    """
+    Wait for a transaction receipt, through the active pipeline if the
+    caller runs in one, else through the receipt watcher enabled for the
+    web3 instance, if any.
+
+    :param web3 Web3: The web3 instance.
+    :param tx_hash HexBytes: The transaction hash.
+    :param timeout float: Seconds to wait for the receipt.
+    :return dict: The transaction receipt.
+    """
+    active = _active.get()
+    if active is None:
+        watcher = get_receipt_watcher(web3)
+        if watcher is None:
+            return web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+        return watcher.wait(tx_hash, timeout)
+    pipeline, handle = active
+    return pipeline._wait_for_receipt(handle, tx_hash, timeout)
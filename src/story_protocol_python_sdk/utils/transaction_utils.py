@@ -1,9 +1,40 @@
 import time
 
+from hexbytes import HexBytes
 from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from story_protocol_python_sdk.utils.fee_oracle import (
+    DEFAULT_FEE_STRATEGY,
+    get_fee_oracle,
+    resolve_fee_strategy,
+)
+from story_protocol_python_sdk.utils.gas_estimator import (
+    GasEstimateCache,
+    get_gas_estimate_cache,
+)
+from story_protocol_python_sdk.utils.nonce_manager import get_nonce_manager
+from story_protocol_python_sdk.utils.retry_policy import (
+    ALREADY_KNOWN,
+    BACKOFF,
+    CONNECTION,
+    NONCE_GAP,
+    NONCE_TOO_LOW,
+    REPLACE,
+    RESYNC_NONCE,
+    TIMEOUT,
+    UNDERPRICED,
+    RetryPolicy,
+    classify_send_error,
+    get_retry_interrupt,
+    get_retry_policy,
+    is_replacement_error,
+)
+from story_protocol_python_sdk.utils.transaction_pipeline import (
+    wait_for_transaction_receipt,
+)
 
 TRANSACTION_TIMEOUT = 300
-REPLACEMENT_UNDERPRICED_RETRY_DELAY = 5
 REPLACEMENT_GAS_BUMP_RATIO = 1.2
 
 
@@ -23,37 +54,40 @@ def _get_transaction_options(
     *,
     nonce_override: int | None = None,
     bump_gas: bool = False,
+    fee_options: dict | None = None,
 ) -> dict:
     """
     Build the transaction options dict (from, nonce, value, gas).
-    Used for both encodedTxDataOnly and send path.
+    Used for both encodedTxDataOnly and send path. ``fee_options`` replaces
+    the fee lookup, for callers that fetched the fees themselves.
     """
     opts = {"from": account.address}
 
-    # Nonce: use override (retry), explicit from tx_options, or fetch from chain
+    # Nonce: use override (allocated or retry), explicit from tx_options, or
+    # the next nonce of the account's nonce manager
     if nonce_override is not None:
         opts["nonce"] = nonce_override
     elif "nonce" in tx_options:
         opts["nonce"] = _validate_nonce(tx_options["nonce"])
     else:
-        opts["nonce"] = web3.eth.get_transaction_count(account.address)
+        opts["nonce"] = get_nonce_manager(web3, account.address).peek()
 
     if "value" in tx_options:
         opts["value"] = tx_options["value"]
 
-    # Gas: bump for replacement, or use tx_options
-    if bump_gas:
-        try:
-            opts["gasPrice"] = int(
-                web3.eth.gas_price * REPLACEMENT_GAS_BUMP_RATIO
-            )
-        except Exception:
-            opts["gasPrice"] = web3.to_wei(2, "gwei")
-    else:
+    # Gas: bump for replacement, use tx_options, or use the per-block fee
+    # estimate shared by every send on this web3 instance
+    if fee_options is not None:
+        opts.update(fee_options)
+    elif bump_gas:
+        opts.update(_get_replacement_fees(web3, tx_options))
+    elif _has_caller_fees(tx_options):
         if "gasPrice" in tx_options:
             opts["gasPrice"] = web3.to_wei(tx_options["gasPrice"], "gwei")
         if "maxFeePerGas" in tx_options:
             opts["maxFeePerGas"] = tx_options["maxFeePerGas"]
+    else:
+        opts.update(_get_oracle_fees(web3, tx_options))
 
     # Gas limit: use explicit gas if provided to avoid estimation
     if "gas" in tx_options:
@@ -62,34 +96,354 @@ def _get_transaction_options(
     return opts
 
 
-def _is_retryable_send_error(exc: Exception) -> bool:
-    """True if we should retry send (same nonce, higher gas)."""
-    msg = str(exc).lower()
-    return (
-        "replacement transaction underpriced" in msg
-        or "nonce too low" in msg
+def _has_caller_fees(tx_options: dict) -> bool:
+    """True if the caller priced the transaction in tx_options."""
+    return "gasPrice" in tx_options or "maxFeePerGas" in tx_options
+
+
+def _get_oracle_fees(web3: Web3, tx_options: dict) -> dict:
+    """Fee fields from the web3 instance's fee oracle, or none if it fails."""
+    strategy = resolve_fee_strategy(
+        tx_options.get("feeStrategy", DEFAULT_FEE_STRATEGY)
     )
+    try:
+        return get_fee_oracle(web3).get_fees(strategy).to_tx_options()
+    except Exception:
+        # e.g. a chain without EIP-1559 fee history: leave the fees to web3
+        return {}
+
 
+def _get_replacement_fees(
+    web3: Web3, tx_options: dict, ratio: float = REPLACEMENT_GAS_BUMP_RATIO
+) -> dict:
+    """Fee fields raised enough to replace a pending transaction."""
+    strategy = resolve_fee_strategy(
+        tx_options.get("feeStrategy", DEFAULT_FEE_STRATEGY)
+    )
+    try:
+        return (
+            get_fee_oracle(web3)
+            .get_fees(strategy)
+            .bumped(ratio)
+            .to_tx_options()
+        )
+    except Exception:
+        pass
+    try:
+        return {"gasPrice": int(web3.eth.gas_price * ratio)}
+    except Exception:
+        return {"gasPrice": web3.to_wei(2, "gwei")}
 
-def _send_one(
+
+def _get_cached_gas_limit(
+    web3: Web3, client_function, client_args: tuple, tx_options: dict
+) -> tuple[GasEstimateCache | None, tuple | None, int | None]:
+    """The enabled gas estimate cache, the key of the call and its gas limit."""
+    gas_cache = None if "gas" in tx_options else get_gas_estimate_cache(web3)
+    if gas_cache is None:
+        return None, None, None
+    key = gas_cache.key_for(client_function, client_args)
+    if key is None:
+        return None, None, None
+    return gas_cache, key, gas_cache.gas_limit(key)
+
+
+def _learn_gas_usage(
+    gas_cache: GasEstimateCache | None,
+    key: tuple | None,
+    gas_limit: int | None,
+    tx_receipt,
+) -> bool:
+    """
+    Record the gas used by a mined call.
+    True if it was sent with a cached limit and reverted, so it should be
+    sent again with a real estimate.
+    """
+    if gas_cache is None:
+        return False
+    if tx_receipt.get("status") == 0:
+        gas_cache.forget(key)
+        return gas_limit is not None
+    if tx_receipt.get("gasUsed") is not None:
+        gas_cache.record(key, tx_receipt["gasUsed"])
+    return False
+
+
+def _next_replacement_fees(
     web3: Web3,
-    account,
-    client_function,
-    client_args: tuple,
     tx_options: dict,
-    transaction_options: dict,
+    policy: RetryPolicy,
+    replacements: int,
+    previous: dict,
 ) -> dict:
-    """Build, sign, send one transaction. No retry."""
-    transaction = client_function(*client_args, transaction_options)
-    signed_txn = account.sign_transaction(transaction)
-    tx_hash = web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+    """
+    Fee fields for the ``replacements``-th replacement of a send: current
+    fees raised by the policy, and at least one bump over the fees sent
+    before, so nodes accept the replacement. Capped by the policy.
+    """
+    previous = {
+        name: previous[name]
+        for name in ("gasPrice", "maxFeePerGas", "maxPriorityFeePerGas")
+        if name in previous
+    }
+    fees = _get_replacement_fees(web3, tx_options, policy.bump_ratio(replacements))
+    if previous and set(previous) != set(fees):
+        fees = {}
+    for name, value in previous.items():
+        fees[name] = max(fees.get(name, 0), int(value * policy.fee_bump_ratio))
+    return policy.cap_fees(fees)
 
-    if not tx_options.get("wait_for_receipt", True):
-        return {"tx_hash": tx_hash.hex()}
 
+def _sign_one(account, client_function, client_args: tuple, transaction_options: dict):
+    """Build and sign one transaction."""
+    return account.sign_transaction(client_function(*client_args, transaction_options))
+
+
+def _send_signed(web3: Web3, signed_txn):
+    """Send one signed transaction. No retry."""
+    try:
+        return web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+    except Exception as e:
+        # A resend of a transaction the node already has, e.g. after a timeout
+        if classify_send_error(e) == ALREADY_KNOWN:
+            return HexBytes(signed_txn.hash)
+        raise
+
+
+def _find_receipt(web3: Web3, tx_hashes: list) -> tuple:
+    """The first of the hashes that was mined, with its receipt, if any."""
+    for tx_hash in tx_hashes:
+        try:
+            return tx_hash, web3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            continue
+    return None, None
+
+
+def _wait_or_replace_steps(policy: RetryPolicy, opts: dict, tx_hash, tx_options: dict):
+    """
+    The steps of waiting for the receipt of a send, as for :func:`_send_steps`.
+    With a ``stuck_timeout``, the transaction is replaced by fee each time it
+    stays pending that long. Returns the hash that was mined and its receipt.
+    """
     timeout = tx_options.get("timeout", TRANSACTION_TIMEOUT)
-    tx_receipt = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
-    return {"tx_hash": tx_hash.hex(), "tx_receipt": tx_receipt}
+    if policy.stuck_timeout is None:
+        return tx_hash, (yield ("wait_receipt", tx_hash, timeout))
+
+    deadline = time.monotonic() + timeout
+    tx_hashes = [tx_hash]
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            return tx_hashes[-1], (
+                yield (
+                    "wait_receipt",
+                    tx_hashes[-1],
+                    min(remaining, policy.stuck_timeout),
+                )
+            )
+        except TimeExhausted:
+            mined_hash, tx_receipt = yield ("find_receipt", tx_hashes[:-1])
+            if tx_receipt is not None:
+                return mined_hash, tx_receipt
+            if deadline - time.monotonic() <= 0:
+                raise
+        if len(tx_hashes) >= policy.max_attempts:
+            continue
+        fees = yield ("replacement_fees", len(tx_hashes), opts)
+        if not policy.outbids(fees, opts):
+            # The fee cap is reached: keep waiting for the sent transactions
+            continue
+        replacement_opts = {**opts, **fees}
+        try:
+            signed_txn = yield ("sign", replacement_opts)
+            replacement_hash = yield ("send", signed_txn)
+        except Exception as e:
+            if classify_send_error(e) in (NONCE_TOO_LOW, UNDERPRICED):
+                # One of the sent transactions was mined meanwhile, or the
+                # pool wants a larger bump: keep waiting
+                continue
+            raise
+        opts = replacement_opts
+        tx_hashes.append(replacement_hash)
+
+
+def _send_steps(policy: RetryPolicy, nonce_manager, tx_options: dict):
+    """
+    The decisions of one send, from allocating its nonce to confirming it,
+    shared by :func:`build_and_send_transaction` and
+    ``async_build_and_send_transaction``.
+
+    A generator that yields each I/O step it needs as ``(name, *args)``, for
+    a driver to run with the method of that name of its :class:`_SendIO`
+    and send back the result, or throw in the error. Returns the hash of the
+    sent transaction and its receipt, None if nothing waits for it.
+    """
+    if nonce_manager is None:
+        used_nonce = _validate_nonce(tx_options["nonce"])
+    else:
+        used_nonce = yield ("allocate",)
+
+    # Retry as the policy decides, with a resynced nonce, the same nonce and
+    # higher fees, or the same signed transaction after a backoff. A send
+    # that timed out or lost its connection may still have been broadcast,
+    # so once one did, "nonce too low" means one of the signed attempts may
+    # be mined: it is looked up, never signed again under a new nonce.
+    fee_options = None
+    signed_txn = None
+    signed_hashes = []
+    maybe_broadcast = False
+    tx_receipt = None
+    replacements = 0
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            if signed_txn is None:
+                opts = yield ("options", used_nonce, fee_options)
+                signed_txn = yield ("sign", opts)
+                signed_hashes.append(signed_txn.hash)
+            tx_hash = yield ("send", signed_txn)
+            break
+        except Exception as e:
+            kind = classify_send_error(e)
+            if kind == NONCE_TOO_LOW and attempt > 1:
+                tx_hash, tx_receipt = yield (
+                    "find_receipt",
+                    [HexBytes(signed_hash) for signed_hash in signed_hashes],
+                )
+                if tx_receipt is not None:
+                    break
+            action = policy.action(
+                kind,
+                attempt,
+                nonce_manager is not None,
+                # Only a send that may have been broadcast can own the
+                # transaction the pool holds at its nonce
+                foreign_nonce=not maybe_broadcast and is_replacement_error(e),
+            )
+            if maybe_broadcast and kind == NONCE_TOO_LOW:
+                action = None
+            if action == RESYNC_NONCE:
+                # The nonce was used by another sender or left a gap behind
+                # it: resync from the chain and retry with a fresh nonce.
+                nonce_manager.resync(used_nonce)
+                used_nonce = yield ("allocate",)
+                signed_txn = None
+                continue
+            if action == REPLACE:
+                replacements += 1
+                fee_options = yield ("replacement_fees", replacements, opts)
+                if policy.outbids(fee_options, opts):
+                    signed_txn = None
+                    continue
+            elif action == BACKOFF:
+                maybe_broadcast = maybe_broadcast or kind in (TIMEOUT, CONNECTION)
+                if (yield ("sleep", policy.delay(attempt))):
+                    continue
+                # The wait was interrupted: give up
+            if nonce_manager is not None:
+                if kind in (NONCE_TOO_LOW, NONCE_GAP) or maybe_broadcast:
+                    # The chain knows best whether the nonce was used
+                    nonce_manager.resync(used_nonce)
+                else:
+                    nonce_manager.release(used_nonce)
+            raise
+
+    if not tx_options.get("wait_for_receipt", True):
+        if nonce_manager is not None:
+            # Nothing waits for this receipt, so nothing would confirm the nonce
+            nonce_manager.confirm(used_nonce)
+        return tx_hash, None
+
+    if tx_receipt is None:
+        try:
+            tx_hash, tx_receipt = yield from _wait_or_replace_steps(
+                policy, opts, tx_hash, tx_options
+            )
+        except TimeExhausted:
+            # The transaction may have been dropped, leaving a nonce gap that
+            # every later send would queue behind: resync from the chain
+            if nonce_manager is not None:
+                nonce_manager.resync(used_nonce)
+            raise
+    if nonce_manager is not None:
+        nonce_manager.confirm(used_nonce)
+    return tx_hash, tx_receipt
+
+
+def _run_steps(steps, io):
+    """Run the steps of a send with blocking I/O. Returns what they return."""
+    result = error = None
+    while True:
+        try:
+            step = steps.send(result) if error is None else steps.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        name, *args = step
+        try:
+            result, error = getattr(io, name)(*args), None
+        except Exception as e:
+            result, error = None, e
+
+
+class _SendIO:
+    """The blocking I/O of the steps of one send."""
+
+    def __init__(
+        self,
+        web3: Web3,
+        account,
+        client_function,
+        client_args: tuple,
+        send_options: dict,
+        policy: RetryPolicy,
+        nonce_manager,
+    ):
+        self.web3 = web3
+        self.account = account
+        self.client_function = client_function
+        self.client_args = client_args
+        self.send_options = send_options
+        self.policy = policy
+        self.nonce_manager = nonce_manager
+
+    def allocate(self) -> int:
+        return self.nonce_manager.allocate()
+
+    def options(self, nonce: int, fee_options: dict | None) -> dict:
+        return _get_transaction_options(
+            self.web3,
+            self.account,
+            self.send_options,
+            nonce_override=nonce,
+            fee_options=fee_options,
+        )
+
+    def sign(self, opts: dict):
+        return _sign_one(self.account, self.client_function, self.client_args, opts)
+
+    def send(self, signed_txn):
+        return _send_signed(self.web3, signed_txn)
+
+    def find_receipt(self, tx_hashes: list) -> tuple:
+        return _find_receipt(self.web3, tx_hashes)
+
+    def replacement_fees(self, replacements: int, previous: dict) -> dict:
+        return _next_replacement_fees(
+            self.web3, self.send_options, self.policy, replacements, previous
+        )
+
+    def sleep(self, delay: float) -> bool:
+        """Wait before a resend. False if the wait was interrupted."""
+        interrupt = get_retry_interrupt()
+        if interrupt is None:
+            time.sleep(delay)
+            return True
+        return not interrupt.wait(delay)
+
+    def wait_receipt(self, tx_hash, timeout: float):
+        return wait_for_transaction_receipt(self.web3, tx_hash, timeout)
 
 
 def build_and_send_transaction(
@@ -102,21 +456,39 @@ def build_and_send_transaction(
     """
     Builds and sends a transaction using the provided client function and arguments.
 
-    On "replacement transaction underpriced" or "nonce too low", retries once
-    after a short delay with the same nonce and higher gas.
+    Unless a nonce is given, it is allocated locally by the account's
+    :class:`NonceManager`, so consecutive and concurrent sends from one key
+    need no nonce round trip. Send errors are retried as the
+    :class:`RetryPolicy` of the send decides: nonce errors resync the nonce
+    manager and resend at once, underpriced sends are resent at once with
+    raised fees (unless another transaction holds the allocated nonce, which
+    resyncs it instead), and transient RPC errors (timeouts, rate limits,
+    dropped connections) resend the same signed transaction after a short
+    backoff with jitter. After a timeout or dropped connection, a "nonce too low"
+    returns the receipt of the earlier attempt that was mined, or is raised.
+    A receipt timeout resyncs the nonce manager, in case the transaction was
+    dropped and left a nonce gap. Inside a
+    :class:`TransactionPipeline`, the receipt is collected by the pipeline
+    instead of being polled by this call. With a gas estimate cache enabled
+    for ``web3``, a call whose shape was mined before skips gas estimation,
+    and is sent once more with a real estimate if it reverts.
 
     :param web3 Web3: An instance of Web3.
     :param account: The account to use for signing the transaction.
     :param client_function: The client function to build the transaction.
     :param client_args: Arguments to pass to the client function.
     :param tx_options dict: Optional transaction options. Can include:
-                            - 'nonce': Custom nonce value (int). If not provided, nonce will be fetched from web3.eth.get_transaction_count().
+                            - 'nonce': Custom nonce value (int). If not provided, nonce will be allocated by the account's nonce manager.
                             - 'wait_for_receipt': Whether to wait for transaction receipt (bool, default True).
                             - 'timeout': Custom timeout in seconds for waiting for receipt (int/float, default TRANSACTION_TIMEOUT).
                             - 'encodedTxDataOnly': If True, returns encoded transaction data without sending.
                             - 'value': Transaction value in wei.
                             - 'gasPrice': Gas price in gwei.
                             - 'maxFeePerGas': Max fee per gas in wei.
+                            - 'feeStrategy': Fee strategy used when no gas price is given: "fast", "standard"
+                              (default), "economy" or a FeeStrategy. Fees are looked up once per block.
+                            - 'retryPolicy': The RetryPolicy of the send. Default is the one set with
+                              set_retry_policy for ``web3``, else DEFAULT_RETRY_POLICY.
     :return dict: A dictionary with the transaction hash and optionally receipt (if wait_for_receipt is True),
                   or encoded data if encodedTxDataOnly is True.
     :raises Exception: If there is an error during the transaction process.
@@ -130,35 +502,31 @@ def build_and_send_transaction(
         encoded = client_function(*client_args, opts)
         return {"encodedTxData": encoded}
 
-    # Send path: optionally retry once with same nonce + higher gas
-    used_nonce = None
-    last_error = None
+    policy = get_retry_policy(web3, tx_options)
+    nonce_manager = (
+        None if "nonce" in tx_options else get_nonce_manager(web3, account.address)
+    )
+    gas_cache, gas_key, gas_limit = _get_cached_gas_limit(
+        web3, client_function, client_args, tx_options
+    )
+    send_options = tx_options if gas_limit is None else {**tx_options, "gas": gas_limit}
 
-    for attempt in range(2):
-        opts = _get_transaction_options(
+    tx_hash, tx_receipt = _run_steps(
+        _send_steps(policy, nonce_manager, tx_options),
+        _SendIO(
             web3,
             account,
-            tx_options,
-            nonce_override=used_nonce,
-            bump_gas=(attempt == 1),
+            client_function,
+            client_args,
+            send_options,
+            policy,
+            nonce_manager,
+        ),
+    )
+    if tx_receipt is None:
+        return {"tx_hash": tx_hash.hex()}
+    if _learn_gas_usage(gas_cache, gas_key, gas_limit, tx_receipt):
+        return build_and_send_transaction(
+            web3, account, client_function, *client_args, tx_options=tx_options
         )
-        if used_nonce is None:
-            used_nonce = opts["nonce"]
-
-        try:
-            return _send_one(
-                web3,
-                account,
-                client_function,
-                client_args,
-                tx_options,
-                opts,
-            )
-        except Exception as e:
-            last_error = e
-            if not _is_retryable_send_error(e):
-                raise
-            if attempt == 0:
-                time.sleep(REPLACEMENT_UNDERPRICED_RETRY_DELAY)
-
-    raise last_error
+    return {"tx_hash": tx_hash.hex(), "tx_receipt": tx_receipt}
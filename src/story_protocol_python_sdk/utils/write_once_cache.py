@@ -0,0 +1,258 @@
+"""Memoization of write-once on-chain facts.
+
+Some reads answer with a value that, once set, never changes: the royalty
+vault of an IP, the token an IP account is bound to. A :class:`WriteOnceCache`
+keeps such a value forever once it is set. An unset value, such as a vault
+that is not deployed yet, is kept only for ``negative_ttl`` seconds so it
+gets read again later.
+
+Values that the contract owner may still change, such as the mint fee token
+of an SPG NFT collection, are kept for a ``positive_ttl`` instead.
+
+Resources read through :func:`cached_read` and :func:`async_cached_read`,
+which go straight to the chain unless a cache is enabled for the web3
+instance.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from web3 import AsyncWeb3, Web3
+
+DEFAULT_NEGATIVE_TTL = 30.0
+DEFAULT_MAX_SIZE = 65536
+# Seconds a mint fee token is kept; the collection owner can change it
+MINT_FEE_TOKEN_TTL = 60.0
+
+_lock = threading.Lock()
+# web3 instance -> WriteOnceCache used by the resources
+_caches: "weakref.WeakKeyDictionary[Web3, WriteOnceCache]" = weakref.WeakKeyDictionary()
+
+
+class WriteOnceCache:
+    """
+    Keeps set values forever and unset values for a while.
+
+    :param negative_ttl float: [Optional] Seconds an unset value is kept. Default is 30.
+    :param max_size int: [Optional] The most values kept, least recently used
+        first out. Default is 65536.
+    :param clock: [Optional] The time source, in seconds. Default is ``time.monotonic``.
+    """
+
+    def __init__(
+        self,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if negative_ttl < 0:
+            raise ValueError("negative_ttl must not be negative.")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, expiry time or None to keep it forever)
+        self._entries: OrderedDict[tuple, tuple] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: tuple) -> tuple[bool, object]:
+        """
+        Look a value up.
+
+        :param key tuple: The key, e.g. ``("ipRoyaltyVaults", ip_id)``.
+        :return tuple[bool, object]: Whether the value was cached, and the value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[1] is None or entry[1] > self._clock()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def store(
+        self,
+        key: tuple,
+        value,
+        is_set: bool = True,
+        positive_ttl: float | None = None,
+    ) -> None:
+        """
+        Keep a value.
+
+        :param key tuple: The key.
+        :param value: The value.
+        :param is_set bool: [Optional] Whether the value is set for good. An
+            unset value expires after ``negative_ttl``. Default is True.
+        :param positive_ttl float: [Optional] Seconds a set value is kept.
+            Default is forever.
+        """
+        ttl = positive_ttl if is_set else self.negative_ttl
+        with self._lock:
+            self._entries[key] = (value, None if ttl is None else self._clock() + ttl)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get(
+        self,
+        key: tuple,
+        load: Callable[[], object],
+        is_set: Callable[[object], bool] = lambda value: True,
+        positive_ttl: float | None = None,
+    ):
+        """
+        Get a value, loading and keeping it on a miss.
+
+        :param key tuple: The key.
+        :param load Callable: Reads the value on a miss.
+        :param is_set Callable: [Optional] Tells whether a loaded value is set
+            for good. Default is always.
+        :param positive_ttl float: [Optional] Seconds a set value is kept.
+            Default is forever.
+        :return: The value.
+        """
+        cached, value = self.lookup(key)
+        if cached:
+            return value
+        value = load()
+        self.store(key, value, is_set(value), positive_ttl)
+        return value
+
+    async def get_async(
+        self,
+        key: tuple,
+        load: Callable[[], Awaitable],
+        is_set: Callable[[object], bool] = lambda value: True,
+        positive_ttl: float | None = None,
+    ):
+        """
+        Get a value, awaiting the load and keeping its value on a miss.
+
+        :param key tuple: The key.
+        :param load Callable: Returns an awaitable of the value on a miss.
+        :param is_set Callable: [Optional] Tells whether a loaded value is set
+            for good. Default is always.
+        :param positive_ttl float: [Optional] Seconds a set value is kept.
+            Default is forever.
+        :return: The value.
+        """
+        cached, value = self.lookup(key)
+        if cached:
+            return value
+        value = await load()
+        self.store(key, value, is_set(value), positive_ttl)
+        return value
+
+    def invalidate(self, key: tuple | None = None) -> None:
+        """
+        Forget one value, or every value.
+
+        :param key tuple: [Optional] The key. Default is every key.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+def enable_write_once_cache(
+    web3: Web3,
+    negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+    max_size: int = DEFAULT_MAX_SIZE,
+) -> WriteOnceCache:
+    """
+    Memoize write-once reads of every resource on a web3 instance.
+
+    :param web3 Web3: The web3 instance.
+    :param negative_ttl float: [Optional] Seconds an unset value is kept. Default is 30.
+    :param max_size int: [Optional] The most values kept. Default is 65536.
+    :return WriteOnceCache: The cache. Enabling it again returns the same one.
+    """
+    with _lock:
+        cache = _caches.get(web3)
+        if cache is None:
+            cache = _caches[web3] = WriteOnceCache(negative_ttl, max_size)
+        return cache
+
+
+def disable_write_once_cache(web3: Web3) -> None:
+    """
+    Stop memoizing write-once reads on a web3 instance.
+
+    :param web3 Web3: The web3 instance.
+    """
+    with _lock:
+        _caches.pop(web3, None)
+
+
+def get_write_once_cache(web3: Web3) -> WriteOnceCache | None:
+    """
+    Get the write-once cache of a web3 instance.
+
+    :param web3 Web3: The web3 instance.
+    :return WriteOnceCache | None: The cache, or None if not enabled.
+    """
+    with _lock:
+        return _caches.get(web3)
+
+
+def cached_read(
+    web3: Web3,
+    key: tuple,
+    load: Callable[[], object],
+    is_set: Callable[[object], bool] = lambda value: True,
+    positive_ttl: float | None = None,
+):
+    """
+    Read a value through the write-once cache of a web3 instance, if enabled.
+
+    :param web3 Web3: The web3 instance.
+    :param key tuple: The key, e.g. ``("ipRoyaltyVaults", ip_id)``.
+    :param load Callable: Reads the value from the chain.
+    :param is_set Callable: [Optional] Tells whether a loaded value is set
+        for good. Default is always.
+    :param positive_ttl float: [Optional] Seconds a set value is kept.
+        Default is forever.
+    :return: The value.
+    """
+    cache = get_write_once_cache(web3)
+    if cache is None:
+        return load()
+    return cache.get(key, load, is_set, positive_ttl)
+
+
+async def async_cached_read(
+    web3: AsyncWeb3,
+    key: tuple,
+    load: Callable[[], Awaitable],
+    is_set: Callable[[object], bool] = lambda value: True,
+    positive_ttl: float | None = None,
+):
+    """
+    Read a value through the write-once cache of an async web3 instance, if
+    enabled.
+
+    :param web3 AsyncWeb3: The async web3 instance.
+    :param key tuple: The key.
+    :param load Callable: Returns an awaitable of the value read from the chain.
+    :param is_set Callable: [Optional] Tells whether a loaded value is set
+        for good. Default is always.
+    :param positive_ttl float: [Optional] Seconds a set value is kept.
+        Default is forever.
+    :return: The value.
+    """
+    cache = get_write_once_cache(web3)
+    if cache is None:
+        return await load()
+    return await cache.get_async(key, load, is_set, positive_ttl)
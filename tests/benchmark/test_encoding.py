@@ -0,0 +1,90 @@
+"""Calldata encoding benchmark.
+
+Encodes 10k ``claimAllRevenue`` and ``mintAndRegisterIp`` calls through web3's
+``Contract.encode_abi`` and through the generated ``encode_<function>`` encoders,
+and checks both produce the same calldata.
+
+Run with ``pytest tests/benchmark -s`` to see the timings.
+"""
+
+import time
+
+import pytest
+from web3 import HTTPProvider, Web3
+
+from story_protocol_python_sdk.abi.RegistrationWorkflows.RegistrationWorkflows_client import (
+    RegistrationWorkflowsClient,
+)
+from story_protocol_python_sdk.abi.RegistrationWorkflows.RegistrationWorkflows_encoders import (
+    encode_mintAndRegisterIp,
+)
+from story_protocol_python_sdk.abi.RoyaltyWorkflows.RoyaltyWorkflows_client import (
+    RoyaltyWorkflowsClient,
+)
+from story_protocol_python_sdk.abi.RoyaltyWorkflows.RoyaltyWorkflows_encoders import (
+    encode_claimAllRevenue,
+)
+
+CALLS = 10_000
+ADDRESS = "0x1234567890123456789012345678901234567890"
+CLAIM_ALL_REVENUE_ARGS = (ADDRESS, ADDRESS, [ADDRESS, ADDRESS], [ADDRESS], [ADDRESS])
+MINT_AND_REGISTER_IP_ARGS = (
+    ADDRESS,
+    ADDRESS,
+    {
+        "ipMetadataURI": "https://example.com/ip.json",
+        "ipMetadataHash": "0x" + "ab" * 32,
+        "nftMetadataURI": "https://example.com/nft.json",
+        "nftMetadataHash": "0x" + "cd" * 32,
+    },
+    True,
+)
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def web3():
+    return Web3(HTTPProvider("http://127.0.0.1:8545"))
+
+
+def measure(encode, args) -> tuple[float, bytes]:
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        data = encode(*args)
+    return time.perf_counter() - start, data
+
+
+@pytest.mark.parametrize(
+    "client_class, function_name, encoder, args",
+    [
+        (
+            RoyaltyWorkflowsClient,
+            "claimAllRevenue",
+            encode_claimAllRevenue,
+            CLAIM_ALL_REVENUE_ARGS,
+        ),
+        (
+            RegistrationWorkflowsClient,
+            "mintAndRegisterIp",
+            encode_mintAndRegisterIp,
+            MINT_AND_REGISTER_IP_ARGS,
+        ),
+    ],
+)
+def test_encoding(web3, client_class, function_name, encoder, args):
+    contract = client_class(web3).contract
+
+    def web3_encode(*args):
+        return contract.encode_abi(function_name, args=args)
+
+    web3_time, web3_data = measure(web3_encode, args)
+    generated_time, generated_data = measure(encoder, args)
+
+    print(
+        f"\n{function_name} x{CALLS}: web3 {web3_time * 1000:.0f} ms, "
+        f"generated {generated_time * 1000:.0f} ms "
+        f"({web3_time / generated_time:.1f}x)"
+    )
+    assert Web3.to_hex(generated_data) == web3_data
+    assert generated_time < web3_time
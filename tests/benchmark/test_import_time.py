@@ -0,0 +1,55 @@
+"""Import-time regression test.
+
+Runs ``python -X importtime`` in a fresh interpreter and fails if importing the
+package costs more than the budget, or if it starts importing web3 eagerly.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+# Import time budget for the statement, in microseconds.
+IMPORT_TIME_BUDGET_US = 50_000
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """
+    Return the self import time in microseconds of every module the statement
+    imports, leaving out the modules imported during interpreter startup.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_time, _, module = line[len("import time:") :].split("|")
+        if module.strip() == "site":
+            # Everything up to and including site is interpreter startup.
+            times = {}
+            continue
+        times[module.strip()] = int(self_time)
+    return times
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import story_protocol_python_sdk",
+        "from story_protocol_python_sdk import StoryClient",
+    ],
+)
+def test_cold_import_time(statement):
+    times = import_times(statement)
+    total = sum(times.values())
+
+    print(f"\n{statement}: {total / 1000:.1f} ms, {len(times)} modules")
+    assert "web3" not in times
+    assert total < IMPORT_TIME_BUDGET_US
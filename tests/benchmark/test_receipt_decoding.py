@@ -0,0 +1,138 @@
+"""Receipt decoding benchmarks.
+
+``test_receipt_decoding`` reads the IPRegistered, LicenseTermsAttached and
+IpRoyaltyVaultDeployed events of a 500-log multicall receipt the way a batch
+register flow does: once per registered IP for its license terms, plus once
+per event kind. The per-helper scan hashes the event signature and converts every topic with
+``.hex()`` on each read; the shared decoder buckets the receipt once.
+
+``test_event_decoding`` decodes the IPRegistered logs of a 1,000-IP batch
+receipt with web3's ``process_log`` and with the compiled ``EventDecoder``.
+
+Run with ``pytest tests/benchmark -s`` to see the timings.
+"""
+
+import time
+
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from story_protocol_python_sdk.utils.contract_registry import load_abi
+from story_protocol_python_sdk.utils.receipt_decoder import (
+    EVENT_SIGNATURES,
+    ReceiptDecoder,
+    get_event_decoder,
+)
+
+LOGS = 500
+ROUNDS = 20
+BATCH_IPS = 1000
+ADDRESS = "0x1234567890123456789012345678901234567890"
+EVENT_NAMES = ("IPRegistered", "LicenseTermsAttached", "IpRoyaltyVaultDeployed")
+# Events of a multicall that registers IPs, attaches terms and deploys vaults,
+# mixed with the token transfers around them
+OTHER_SIGNATURE = "Transfer(address,address,uint256)"
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def receipt():
+    signatures = [EVENT_SIGNATURES[name] for name in EVENT_NAMES] + [OTHER_SIGNATURE]
+    return {
+        "logs": [
+            {
+                "topics": [Web3.keccak(text=signatures[index % len(signatures)])],
+                "data": index.to_bytes(32, "big"),
+            }
+            for index in range(LOGS)
+        ]
+    }
+
+
+def scan(receipt, event_name):
+    """What every _parse_tx_* helper did before the shared decoder."""
+    event_signature = Web3.keccak(text=EVENT_SIGNATURES[event_name]).hex()
+    return [log for log in receipt["logs"] if log["topics"][0].hex() == event_signature]
+
+
+def read_events(read, receipt):
+    registered = read(receipt, "IPRegistered")
+    for _ in registered:
+        read(receipt, "LicenseTermsAttached")
+    read(receipt, "IpRoyaltyVaultDeployed")
+    return [len(read(receipt, name)) for name in EVENT_NAMES]
+
+
+def measure(read, receipt) -> tuple[float, list]:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        counts = read_events(read, receipt)
+    return time.perf_counter() - start, counts
+
+
+def test_receipt_decoding(receipt):
+    def decode(receipt, event_name):
+        return decoder.decode(receipt).logs(event_name)
+
+    decoder = ReceiptDecoder()
+    scan_time, scan_counts = measure(scan, receipt)
+    decoder_time, decoder_counts = measure(decode, receipt)
+
+    print(
+        f"\n{LOGS}-log receipt x{ROUNDS}: per-helper scans {scan_time * 1000:.0f} ms, "
+        f"shared decoder {decoder_time * 1000:.1f} ms "
+        f"({scan_time / decoder_time:.0f}x)"
+    )
+    assert decoder_counts == scan_counts
+    assert decoder_time < scan_time
+
+
+@pytest.fixture(scope="module")
+def batch_logs():
+    topic = Web3.keccak(text=EVENT_SIGNATURES["IPRegistered"])
+    return [
+        {
+            "address": ADDRESS,
+            "topics": [
+                topic,
+                HexBytes((1315).to_bytes(32, "big")),
+                HexBytes(bytes(12) + bytes.fromhex(ADDRESS[2:])),
+                HexBytes(token_id.to_bytes(32, "big")),
+            ],
+            "data": HexBytes(
+                encode(
+                    ["address", "string", "string", "uint256"],
+                    [ADDRESS, f"IP {token_id}", "https://example.com/ip.json", 0],
+                )
+            ),
+            "logIndex": token_id,
+            "transactionIndex": 0,
+            "transactionHash": HexBytes(bytes(32)),
+            "blockHash": HexBytes(bytes(32)),
+            "blockNumber": 1,
+        }
+        for token_id in range(BATCH_IPS)
+    ]
+
+
+def test_event_decoding(batch_logs):
+    event = Web3().eth.contract(abi=load_abi("IPAssetRegistry")).events.IPRegistered()
+    decoder = get_event_decoder("IPAssetRegistry", "IPRegistered")
+
+    start = time.perf_counter()
+    web3_token_ids = [event.process_log(log)["args"]["tokenId"] for log in batch_logs]
+    web3_time = time.perf_counter() - start
+    start = time.perf_counter()
+    token_ids = [decoder.decode(log).tokenId for log in batch_logs]
+    decoder_time = time.perf_counter() - start
+
+    print(
+        f"\n{BATCH_IPS} IPRegistered logs: process_log {web3_time * 1000:.0f} ms, "
+        f"EventDecoder {decoder_time * 1000:.1f} ms "
+        f"({web3_time / decoder_time:.0f}x)"
+    )
+    assert token_ids == web3_token_ids
+    assert decoder_time < web3_time
@@ -0,0 +1,91 @@
+"""Startup benchmark for ``StoryClient``.
+
+Measures ``StoryClient(...)`` plus first access of every resource property and
+one of its contract clients, and checks how many JSON files are read along the
+way. No RPC connection is needed: building contract objects makes no calls.
+
+Run with ``pytest tests/benchmark -s`` to see the timings; they are reported,
+not asserted, since they vary from run to run.
+"""
+
+import builtins
+import time
+from unittest.mock import patch
+
+import pytest
+from eth_account import Account
+from web3 import HTTPProvider, Web3
+
+from story_protocol_python_sdk.story_client import StoryClient
+from story_protocol_python_sdk.utils import contract_registry
+
+# Resource property -> a client it builds, so every resource builds a contract.
+RESOURCES = {
+    "IPAsset": "ip_asset_registry_client",
+    "License": "license_template_client",
+    "Royalty": "royalty_module_client",
+    "IPAccount": "ip_account_client",
+    "Permission": "access_controller_client",
+    "NFTClient": "registration_workflows_client",
+    "Dispute": "dispute_module_client",
+    "WIP": "wip_client",
+    "Group": "grouping_module_client",
+}
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture
+def account():
+    return Account.from_key("0x" + "11" * 32)
+
+
+def new_web3() -> Web3:
+    return Web3(HTTPProvider("http://127.0.0.1:8545"))
+
+
+def build_story_client(web3: Web3, account) -> StoryClient:
+    story_client = StoryClient(web3, account, 1315)
+    for resource, client in RESOURCES.items():
+        getattr(getattr(story_client, resource), client)
+    return story_client
+
+
+def measure(web3: Web3, account) -> tuple[float, int]:
+    """Return the elapsed seconds and the number of JSON files opened."""
+    json_reads = 0
+    original_open = builtins.open
+
+    def counting_open(file, *args, **kwargs):
+        nonlocal json_reads
+        if str(file).endswith(".json"):
+            json_reads += 1
+        return original_open(file, *args, **kwargs)
+
+    with patch("builtins.open", counting_open):
+        start = time.perf_counter()
+        build_story_client(web3, account)
+        elapsed = time.perf_counter() - start
+    return elapsed, json_reads
+
+
+def test_story_client_startup(account):
+    contract_registry.clear_cache()
+    cold_time, cold_reads = measure(new_web3(), account)
+
+    web3 = new_web3()
+    build_story_client(web3, account)
+    warm_time, warm_reads = measure(web3, account)
+
+    new_provider_time, new_provider_reads = measure(new_web3(), account)
+
+    print(
+        f"\ncold: {cold_time * 1000:.1f} ms ({cold_reads} JSON reads)"
+        f"\nwarm, same provider: {warm_time * 1000:.1f} ms ({warm_reads} JSON reads)"
+        f"\nwarm, new provider: {new_provider_time * 1000:.1f} ms "
+        f"({new_provider_reads} JSON reads)"
+    )
+    # ABIs come from the precompiled bundle; only the address book is read.
+    assert cold_reads == 1
+    assert warm_reads == 0
+    assert new_provider_reads == 0
@@ -4,6 +4,9 @@ import pytest
 from eth_account import Account
 from web3 import Web3
 
+from story_protocol_python_sdk.utils.derivative_data import (
+    clear_derivative_data_clients,
+)
 from tests.unit.fixtures.data import ACCOUNT_ADDRESS, ADDRESS, TX_HASH
 
 
@@ -142,3 +145,27 @@ def mock_web3_is_address(mock_web3):
         return patch.object(mock_web3, "is_address", return_value=is_address)
 
     return _mock
+
+
+@pytest.fixture(autouse=True)
+def fresh_derivative_data_clients():
+    """Build fresh DerivativeData clients for every test, so tests can mock them."""
+    clear_derivative_data_clients()
+    yield
+    clear_derivative_data_clients()
+
+
+@pytest.fixture
+def sequential_derivative_data_reads():
+    """
+    Run the aggregate3 reads of DerivativeData validation one by one on their
+    client methods, so tests can mock the clients.
+    """
+    with patch(
+        "story_protocol_python_sdk.utils.derivative_data.try_aggregate_reads",
+        side_effect=lambda multicall3_client, reads: [
+            (True, client_function(*client_args))
+            for client_function, client_args in reads
+        ],
+    ) as try_aggregate_reads:
+        yield try_aggregate_reads
@@ -1,4 +1,7 @@
 from ens.ens import HexStr
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
 
 from story_protocol_python_sdk import (
     IPMetadataInput,
@@ -84,3 +87,46 @@ IP_METADATA = IPMetadataInput(
     nft_metadata_uri="https://example.com/nft-metadata.json",
     nft_metadata_hash=HexStr("0x" + "b" * 64),
 )
+
+
+def ip_registered_log(ip_id: str, token_contract: str, token_id: int) -> dict:
+    """A raw IPRegistered log, as a node returns it."""
+    return {
+        "address": ADDRESS,
+        "topics": [
+            Web3.keccak(
+                text="IPRegistered(address,uint256,address,uint256,string,string,uint256)"
+            ),
+            HexBytes(CHAIN_ID.to_bytes(32, "big")),
+            HexBytes(bytes(12) + bytes.fromhex(token_contract[2:])),
+            HexBytes(token_id.to_bytes(32, "big")),
+        ],
+        "data": HexBytes(
+            encode(
+                ["address", "string", "string", "uint256"],
+                [ip_id, "IP asset", "https://example.com/ip.json", 0],
+            )
+        ),
+    }
+
+
+def license_terms_attached_log(ip_id: str, license_terms_id: int) -> dict:
+    """A raw LicenseTermsAttached log, as a node returns it."""
+    return {
+        "address": ADDRESS,
+        "topics": [
+            Web3.keccak(text="LicenseTermsAttached(address,address,address,uint256)"),
+            HexBytes(bytes(12) + bytes.fromhex(ADDRESS[2:])),
+            HexBytes(bytes(12) + bytes.fromhex(ip_id[2:])),
+        ],
+        "data": HexBytes(encode(["address", "uint256"], [ADDRESS, license_terms_id])),
+    }
+
+
+def ip_royalty_vault_deployed_log(ip_id: str, royalty_vault: str) -> dict:
+    """A raw IpRoyaltyVaultDeployed log, as a node returns it."""
+    return {
+        "address": ADDRESS,
+        "topics": [Web3.keccak(text="IpRoyaltyVaultDeployed(address,address)")],
+        "data": HexBytes(encode(["address", "address"], [ip_id, royalty_vault])),
+    }
@@ -0,0 +1,827 @@
+import asyncio
+import inspect
+from dataclasses import asdict
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from story_protocol_python_sdk import AccessPermission, AsyncStoryClient, PILFlavor
+from story_protocol_python_sdk.resources.AsyncDispute import AsyncDispute
+from story_protocol_python_sdk.resources.AsyncGroup import AsyncGroup
+from story_protocol_python_sdk.resources.AsyncIPAccount import AsyncIPAccount
+from story_protocol_python_sdk.resources.AsyncIPAsset import AsyncIPAsset
+from story_protocol_python_sdk.resources.AsyncLicense import AsyncLicense
+from story_protocol_python_sdk.resources.AsyncNFTClient import AsyncNFTClient
+from story_protocol_python_sdk.resources.AsyncPermission import AsyncPermission
+from story_protocol_python_sdk.resources.AsyncRoyalty import AsyncRoyalty
+from story_protocol_python_sdk.resources.AsyncWIP import AsyncWIP
+from story_protocol_python_sdk.utils.constants import ZERO_ADDRESS
+from tests.unit.fixtures.data import (
+    ACCOUNT_ADDRESS,
+    ADDRESS,
+    CHAIN_ID,
+    IP_ID,
+    LICENSE_TERMS,
+    LICENSING_CONFIG,
+    TX_HASH,
+)
+
+CID = "QmYwAPJzv5CZsnA625s3Xf2nemtYgPpHdWEz79ojWnPbdG"
+
+
+def patch_send(module: str, **kwargs):
+    return patch(
+        f"story_protocol_python_sdk.resources.{module}.async_build_and_send_transaction",
+        AsyncMock(**kwargs),
+    )
+
+
+@pytest.fixture
+def async_web3():
+    return AsyncWeb3(AsyncHTTPProvider("http://localhost:8545"))
+
+
+@pytest.fixture
+def account():
+    account = Mock()
+    account.address = ACCOUNT_ADDRESS
+    return account
+
+
+class TestAsyncClientConstruction:
+    def test_view_methods_return_coroutines(self, async_web3, account):
+        wip = AsyncWIP(async_web3, account, CHAIN_ID)
+        result = wip.wip_client.balanceOf(ADDRESS)
+        assert inspect.iscoroutine(result)
+        result.close()
+
+    def test_story_client_rejects_unsupported_chain(self, async_web3, account):
+        with pytest.raises(ValueError, match="only support story devnet"):
+            AsyncStoryClient(async_web3, account, 1)
+
+    def test_story_client_resources_are_lazy_and_cached(self, async_web3, account):
+        client = AsyncStoryClient(async_web3, account, CHAIN_ID)
+        assert client._ip_asset is None
+        assert isinstance(client.IPAsset, AsyncIPAsset)
+        assert client.IPAsset is client.IPAsset
+        assert isinstance(client.Group, AsyncGroup)
+
+    def test_story_client_get_balances(self, async_web3, account):
+        client = AsyncStoryClient(async_web3, account, CHAIN_ID)
+        with patch.object(
+            async_web3.eth, "get_balance", AsyncMock(side_effect=[1, 2])
+        ) as get_balance:
+            balances = asyncio.run(client.get_balances([ADDRESS, ACCOUNT_ADDRESS]))
+        assert balances == [1, 2]
+        assert get_balance.await_count == 2
+
+    def test_story_client_get_balance_invalid_address(self, async_web3, account):
+        client = AsyncStoryClient(async_web3, account, CHAIN_ID)
+        with pytest.raises(ValueError, match="Invalid address format: 0xabc"):
+            asyncio.run(client.get_balance("0xabc"))
+
+
+class TestAsyncWIP:
+    def test_deposit_sends_value(self, async_web3, account):
+        wip = AsyncWIP(async_web3, account, CHAIN_ID)
+        with patch(
+            "story_protocol_python_sdk.resources.AsyncWIP.async_build_and_send_transaction",
+            AsyncMock(return_value={"tx_hash": TX_HASH.hex()}),
+        ) as send:
+            response = asyncio.run(wip.deposit(amount=10))
+        assert response == {"tx_hash": TX_HASH.hex()}
+        assert send.call_args.kwargs["tx_options"] == {"value": 10}
+
+    def test_deposit_rejects_non_positive_amount(self, async_web3, account):
+        wip = AsyncWIP(async_web3, account, CHAIN_ID)
+        with pytest.raises(
+            ValueError,
+            match="Failed to deposit IP for WIP: WIP deposit amount must be greater than 0.",
+        ):
+            asyncio.run(wip.deposit(amount=0))
+
+    def test_balance_of_invalid_address(self, async_web3, account):
+        wip = AsyncWIP(async_web3, account, CHAIN_ID)
+        with pytest.raises(ValueError, match="The address 0xabc is not valid."):
+            asyncio.run(wip.balance_of("0xabc"))
+
+
+class TestAsyncIPAsset:
+    @pytest.fixture
+    def ip_asset(self, async_web3, account):
+        ip_asset = AsyncIPAsset(async_web3, account, CHAIN_ID)
+        ip_asset.ip_asset_registry_client = Mock(
+            ipId=AsyncMock(return_value=IP_ID),
+            isRegistered=AsyncMock(return_value=False),
+        )
+        return ip_asset
+
+    def test_register_already_registered(self, ip_asset):
+        ip_asset.ip_asset_registry_client.isRegistered.return_value = True
+        with patch(
+            "story_protocol_python_sdk.resources.AsyncIPAsset.async_build_and_send_transaction",
+            AsyncMock(),
+        ) as send:
+            response = asyncio.run(ip_asset.register(ADDRESS, 3))
+        assert response == {"tx_hash": None, "ip_id": IP_ID}
+        send.assert_not_awaited()
+
+    def test_register_parses_receipt(self, ip_asset):
+        with (
+            patch(
+                "story_protocol_python_sdk.resources.AsyncIPAsset.async_build_and_send_transaction",
+                AsyncMock(return_value={"tx_hash": TX_HASH.hex(), "tx_receipt": {}}),
+            ) as send,
+            patch.object(
+                ip_asset,
+                "_parse_tx_ip_registered_event",
+                return_value=[{"ip_id": IP_ID, "token_id": 3}],
+            ),
+        ):
+            response = asyncio.run(ip_asset.register(ADDRESS, 3))
+        assert response == {"tx_hash": TX_HASH.hex(), "ip_id": IP_ID}
+        assert (
+            send.call_args.args[2]
+            == ip_asset.ip_asset_registry_client.build_register_transaction
+        )
+
+    def test_encoded_tx_data_only_skips_registration_check(self, ip_asset):
+        response = asyncio.run(
+            ip_asset.register(ADDRESS, 3, tx_options={"encodedTxDataOnly": True})
+        )
+        assert response["has_metadata"] is False
+        assert response["ip_id"] == IP_ID
+        assert response["encoded_tx_data"].startswith("0x")
+        ip_asset.ip_asset_registry_client.isRegistered.assert_not_awaited()
+
+    def test_register_wraps_failures(self, ip_asset):
+        with (
+            patch(
+                "story_protocol_python_sdk.resources.AsyncIPAsset.async_build_and_send_transaction",
+                AsyncMock(side_effect=Exception("Transaction failed")),
+            ),
+            pytest.raises(
+                ValueError, match="Failed to register IP: Transaction failed"
+            ),
+        ):
+            asyncio.run(ip_asset.register(ADDRESS, 3))
+
+
+class TestAsyncGroup:
+    def test_add_ips_to_group_rejects_tagged_ip(self, async_web3, account):
+        group = AsyncGroup(async_web3, account, CHAIN_ID)
+        group.dispute_module_client = Mock(
+            isIpTagged=AsyncMock(side_effect=lambda ip_id: ip_id == ADDRESS)
+        )
+        group.ip_asset_registry_client = Mock(
+            isRegisteredGroup=AsyncMock(return_value=False)
+        )
+        with pytest.raises(
+            ValueError,
+            match=f'Cannot add disputed IP to group: IP "{ADDRESS}" is tagged by dispute module.',
+        ):
+            asyncio.run(group.add_ips_to_group(IP_ID, [ADDRESS]))
+        assert group.dispute_module_client.isIpTagged.await_count == 2
+
+
+class TestAsyncLicense:
+    @pytest.fixture
+    def license(self, async_web3, account):
+        license = AsyncLicense(async_web3, account, CHAIN_ID)
+        license.license_template_client = Mock(
+            contract=Mock(address=ADDRESS),
+            getLicenseTermsId=AsyncMock(return_value=0),
+            getLicenseTerms=AsyncMock(return_value=LICENSE_TERMS),
+            exists=AsyncMock(return_value=True),
+        )
+        license.license_registry_client = Mock(
+            exists=AsyncMock(return_value=True),
+            hasIpAttachedLicenseTerms=AsyncMock(return_value=False),
+            getLicensingConfig=AsyncMock(return_value=tuple(LICENSING_CONFIG.values())),
+        )
+        license.ip_asset_registry_client = Mock(
+            isRegistered=AsyncMock(return_value=True)
+        )
+        license.royalty_module_client = Mock(
+            isWhitelistedRoyaltyPolicy=AsyncMock(return_value=True),
+            isWhitelistedRoyaltyToken=AsyncMock(return_value=True),
+        )
+        license.licensing_module_client = Mock(
+            predictMintingLicenseFee=AsyncMock(return_value=(ADDRESS, 10))
+        )
+        return license
+
+    def test_register_pil_terms_already_registered(self, license):
+        license.license_template_client.getLicenseTermsId.return_value = 1
+        with patch_send("AsyncLicense") as send:
+            response = asyncio.run(
+                license.register_pil_terms(
+                    **asdict(PILFlavor.non_commercial_social_remixing())
+                )
+            )
+        assert response == {"license_terms_id": 1}
+        send.assert_not_awaited()
+
+    def test_register_pil_terms_success(self, license):
+        with (
+            patch_send(
+                "AsyncLicense",
+                return_value={"tx_hash": TX_HASH.hex(), "tx_receipt": {}},
+            ),
+            patch.object(
+                license, "_parse_tx_license_terms_registered_event", return_value=5
+            ),
+        ):
+            response = asyncio.run(
+                license.register_pil_terms(
+                    **asdict(
+                        PILFlavor.commercial_use(
+                            default_minting_fee=10,
+                            currency=ADDRESS,
+                            royalty_policy=ADDRESS,
+                        )
+                    )
+                )
+            )
+        assert response == {"tx_hash": TX_HASH.hex(), "license_terms_id": 5}
+
+    def test_register_pil_terms_royalty_policy_not_whitelisted(self, license):
+        license.royalty_module_client.isWhitelistedRoyaltyPolicy.return_value = False
+        with pytest.raises(ValueError, match="The royalty_policy is not whitelisted."):
+            asyncio.run(
+                license.register_pil_terms(
+                    **asdict(
+                        PILFlavor.commercial_use(
+                            default_minting_fee=10,
+                            currency=ADDRESS,
+                            royalty_policy=ADDRESS,
+                        )
+                    )
+                )
+            )
+
+    def test_register_pil_terms_currency_not_whitelisted(self, license):
+        license.royalty_module_client.isWhitelistedRoyaltyToken.return_value = False
+        with pytest.raises(ValueError, match="The currency is not whitelisted."):
+            asyncio.run(
+                license.register_pil_terms(
+                    **asdict(
+                        PILFlavor.commercial_use(
+                            default_minting_fee=10,
+                            currency=ADDRESS,
+                            royalty_policy=ADDRESS,
+                        )
+                    )
+                )
+            )
+
+    def test_attach_license_terms_success(self, license):
+        with patch_send("AsyncLicense", return_value={"tx_hash": TX_HASH.hex()}):
+            response = asyncio.run(license.attach_license_terms(IP_ID, ADDRESS, 1))
+        assert response == {"tx_hash": TX_HASH.hex()}
+
+    def test_attach_license_terms_invalid_template(self, license):
+        with pytest.raises(ValueError, match='Address "0xabc" is invalid.'):
+            asyncio.run(license.attach_license_terms(IP_ID, "0xabc", 1))
+
+    def test_attach_license_terms_unregistered_ip(self, license):
+        license.ip_asset_registry_client.isRegistered.return_value = False
+        with pytest.raises(
+            ValueError, match=f"The IP with id {IP_ID} is not registered."
+        ):
+            asyncio.run(license.attach_license_terms(IP_ID, ADDRESS, 1))
+
+    def test_attach_license_terms_already_attached(self, license):
+        license.license_registry_client.hasIpAttachedLicenseTerms.return_value = True
+        with pytest.raises(
+            ValueError,
+            match=f"License terms id 1 is already attached to the IP with id {IP_ID}.",
+        ):
+            asyncio.run(license.attach_license_terms(IP_ID, ADDRESS, 1))
+
+    def test_mint_license_tokens_success(self, license):
+        license.license_registry_client.hasIpAttachedLicenseTerms.return_value = True
+        with (
+            patch_send(
+                "AsyncLicense",
+                return_value={"tx_hash": TX_HASH.hex(), "tx_receipt": {}},
+            ) as send,
+            patch.object(
+                license, "_parse_tx_license_tokens_minted_event", return_value=[1, 2]
+            ),
+        ):
+            response = asyncio.run(
+                license.mint_license_tokens(IP_ID, ADDRESS, 1, 2, ACCOUNT_ADDRESS)
+            )
+        assert response == {"tx_hash": TX_HASH.hex(), "license_token_ids": [1, 2]}
+        assert send.call_args.args[3:8] == (IP_ID, ADDRESS, 1, 2, ACCOUNT_ADDRESS)
+
+    def test_mint_license_tokens_invalid_receiver(self, license):
+        with pytest.raises(ValueError, match="Invalid address: 0xabc."):
+            asyncio.run(license.mint_license_tokens(IP_ID, ADDRESS, 1, 2, "0xabc"))
+
+    def test_mint_license_tokens_not_attached(self, license):
+        with pytest.raises(
+            ValueError,
+            match=f"License terms id 1 is not attached to the IP with id {IP_ID}.",
+        ):
+            asyncio.run(
+                license.mint_license_tokens(IP_ID, ADDRESS, 1, 2, ACCOUNT_ADDRESS)
+            )
+
+    def test_get_license_terms(self, license):
+        assert asyncio.run(license.get_license_terms(1)) == LICENSE_TERMS
+
+    def test_get_license_terms_wraps_failures(self, license):
+        license.license_template_client.getLicenseTerms.side_effect = Exception(
+            "Not found"
+        )
+        with pytest.raises(ValueError, match="Failed to get license terms: Not found"):
+            asyncio.run(license.get_license_terms(1))
+
+    def test_predict_minting_license_fee(self, license):
+        response = asyncio.run(license.predict_minting_license_fee(IP_ID, 1, 2))
+        assert response == {"currency": ADDRESS, "amount": 10}
+        args = license.licensing_module_client.predictMintingLicenseFee.call_args.args
+        assert args[1] == ADDRESS
+        assert args[4] == ACCOUNT_ADDRESS
+
+    def test_predict_minting_license_fee_missing_terms(self, license):
+        license.license_template_client.exists.return_value = False
+        with pytest.raises(
+            ValueError,
+            match="Failed to predict minting license fee: License terms id 1 does not exist.",
+        ):
+            asyncio.run(license.predict_minting_license_fee(IP_ID, 1, 2))
+
+    def test_get_licensing_config(self, license):
+        response = asyncio.run(license.get_licensing_config(IP_ID, 1))
+        assert response == LICENSING_CONFIG
+
+    def test_get_licensing_config_invalid_ip_id(self, license):
+        with pytest.raises(
+            ValueError,
+            match="Failed to get licensing config: Invalid address: 0xabc.",
+        ):
+            asyncio.run(license.get_licensing_config("0xabc", 1))
+
+
+class TestAsyncRoyalty:
+    @pytest.fixture
+    def royalty(self, async_web3, account):
+        royalty = AsyncRoyalty(async_web3, account, CHAIN_ID)
+        royalty.ip_asset_registry_client = Mock(
+            isRegistered=AsyncMock(return_value=True)
+        )
+        royalty.royalty_module_client = Mock(
+            ipRoyaltyVaults=AsyncMock(return_value=ADDRESS)
+        )
+        return royalty
+
+    def test_get_royalty_vault_address(self, royalty):
+        assert asyncio.run(royalty.get_royalty_vault_address(IP_ID)) == ADDRESS
+
+    def test_get_royalty_vault_address_unregistered_ip(self, royalty):
+        royalty.ip_asset_registry_client.isRegistered.return_value = False
+        with pytest.raises(
+            ValueError, match=f"The IP with id {IP_ID} is not registered."
+        ):
+            asyncio.run(royalty.get_royalty_vault_address(IP_ID))
+
+    def test_claimable_revenue(self, royalty):
+        vault_client = Mock(claimableRevenue=AsyncMock(return_value=7))
+        with patch(
+            "story_protocol_python_sdk.resources.AsyncRoyalty.IpRoyaltyVaultImplClient",
+            return_value=vault_client,
+        ) as vault_client_class:
+            response = asyncio.run(
+                royalty.claimable_revenue(IP_ID, ACCOUNT_ADDRESS, ADDRESS)
+            )
+        assert response == 7
+        assert vault_client_class.call_args.kwargs["contract_address"] == ADDRESS
+        vault_client.claimableRevenue.assert_awaited_once_with(
+            claimer=ACCOUNT_ADDRESS, token=ADDRESS
+        )
+
+    def test_pay_royalty_on_behalf_success(self, royalty):
+        with patch_send("AsyncRoyalty", return_value={"tx_hash": TX_HASH.hex()}):
+            response = asyncio.run(
+                royalty.pay_royalty_on_behalf(IP_ID, ADDRESS, ADDRESS, 10)
+            )
+        assert response == {"tx_hash": TX_HASH.hex()}
+
+    def test_pay_royalty_on_behalf_unregistered_payer(self, royalty):
+        royalty.ip_asset_registry_client.isRegistered.side_effect = [True, False]
+        with pytest.raises(
+            ValueError, match=f"The payer IP with id {ADDRESS} is not registered."
+        ):
+            asyncio.run(royalty.pay_royalty_on_behalf(IP_ID, ADDRESS, ADDRESS, 10))
+
+    def test_transfer_to_vault_success(self, royalty):
+        royalty.royalty_policy_lrp_client = Mock()
+        with patch_send(
+            "AsyncRoyalty", return_value={"tx_hash": TX_HASH.hex(), "tx_receipt": {}}
+        ) as send:
+            response = asyncio.run(
+                royalty.transfer_to_vault(IP_ID, ADDRESS, ADDRESS, "LRP")
+            )
+        assert response == {"tx_hash": TX_HASH.hex(), "receipt": {}}
+        assert (
+            send.call_args.args[2]
+            == royalty.royalty_policy_lrp_client.build_transferToVault_transaction
+        )
+
+    def test_transfer_to_vault_invalid_token(self, royalty):
+        with pytest.raises(
+            ValueError,
+            match='Failed to transfer to vault: Token address "0xabc" is invalid.',
+        ):
+            asyncio.run(royalty.transfer_to_vault(IP_ID, ADDRESS, "0xabc"))
+
+    def test_transfer_to_vault_invalid_royalty_policy(self, royalty):
+        with pytest.raises(
+            ValueError,
+            match='Failed to transfer to vault: Royalty policy address "0xabc" is invalid.',
+        ):
+            asyncio.run(royalty.transfer_to_vault(IP_ID, ADDRESS, ADDRESS, "0xabc"))
+
+
+class TestAsyncDispute:
+    @pytest.fixture
+    def dispute(self, async_web3, account):
+        dispute = AsyncDispute(async_web3, account, CHAIN_ID)
+        dispute.dispute_module_client = Mock(
+            isWhitelistedDisputeTag=AsyncMock(return_value=True)
+        )
+        dispute.arbitration_policy_uma_client = Mock(
+            minLiveness=AsyncMock(return_value=100),
+            maxLiveness=AsyncMock(return_value=1000),
+            maxBonds=AsyncMock(return_value=50),
+            disputeIdToAssertionId=AsyncMock(return_value="0x1234"),
+            oov3=AsyncMock(return_value=ADDRESS),
+        )
+        dispute.wip = Mock(deposit=AsyncMock())
+        return dispute
+
+    def test_raise_dispute_success(self, dispute):
+        with (
+            patch_send(
+                "AsyncDispute",
+                return_value={"tx_hash": TX_HASH.hex(), "tx_receipt": {}},
+            ),
+            patch.object(dispute, "_parse_tx_dispute_raised_event", return_value=3),
+        ):
+            response = asyncio.run(
+                dispute.raise_dispute(IP_ID, "IMPROPER_REGISTRATION", CID, 200, 10)
+            )
+        assert response == {"tx_hash": TX_HASH.hex(), "dispute_id": 3}
+        dispute.wip.deposit.assert_awaited_once_with(amount=10)
+
+    def test_raise_dispute_invalid_target(self, dispute):
+        with pytest.raises(
+            ValueError, match="Failed to raise dispute: Invalid address: 0xabc."
+        ):
+            asyncio.run(dispute.raise_dispute("0xabc", "TAG", CID, 200, 10))
+
+    def test_raise_dispute_tag_not_whitelisted(self, dispute):
+        dispute.dispute_module_client.isWhitelistedDisputeTag.return_value = False
+        with pytest.raises(
+            ValueError,
+            match="Failed to raise dispute: The target tag TAG is not whitelisted.",
+        ):
+            asyncio.run(dispute.raise_dispute(IP_ID, "TAG", CID, 200, 10))
+
+    def test_raise_dispute_liveness_out_of_range(self, dispute):
+        with pytest.raises(
+            ValueError,
+            match="Failed to raise dispute: Liveness must be between 100 and 1000.",
+        ):
+            asyncio.run(dispute.raise_dispute(IP_ID, "TAG", CID, 10, 10))
+
+    def test_raise_dispute_bond_too_high(self, dispute):
+        with pytest.raises(
+            ValueError, match="Failed to raise dispute: Bond must be less than 50."
+        ):
+            asyncio.run(dispute.raise_dispute(IP_ID, "TAG", CID, 200, 100))
+        dispute.wip.deposit.assert_not_awaited()
+
+    def test_cancel_dispute_success(self, dispute):
+        with patch_send(
+            "AsyncDispute", return_value={"tx_hash": TX_HASH.hex()}
+        ) as send:
+            response = asyncio.run(dispute.cancel_dispute(3))
+        assert response == {"tx_hash": TX_HASH.hex()}
+        assert send.call_args.args[3:] == (3, "0x")
+
+    def test_cancel_dispute_wraps_failures(self, dispute):
+        with (
+            patch_send("AsyncDispute", side_effect=Exception("Not allowed")),
+            pytest.raises(ValueError, match="Failed to cancel dispute: Not allowed"),
+        ):
+            asyncio.run(dispute.cancel_dispute(3))
+
+    def test_resolve_dispute_success(self, dispute):
+        with patch_send("AsyncDispute", return_value={"tx_hash": TX_HASH.hex()}):
+            response = asyncio.run(dispute.resolve_dispute(3, "0x"))
+        assert response == {"tx_hash": TX_HASH.hex()}
+
+    def test_resolve_dispute_wraps_failures(self, dispute):
+        with (
+            patch_send("AsyncDispute", side_effect=Exception("Not judged")),
+            pytest.raises(ValueError, match="Failed to resolve dispute: Not judged"),
+        ):
+            asyncio.run(dispute.resolve_dispute(3, "0x"))
+
+    def test_dispute_id_to_assertion_id(self, dispute):
+        assert asyncio.run(dispute.dispute_id_to_assertion_id(3)) == "0x1234"
+
+    def test_dispute_id_to_assertion_id_wraps_failures(self, dispute):
+        dispute.arbitration_policy_uma_client.disputeIdToAssertionId.side_effect = (
+            Exception("Unknown dispute")
+        )
+        with pytest.raises(
+            ValueError,
+            match="Failed to convert dispute ID to assertion ID: Unknown dispute",
+        ):
+            asyncio.run(dispute.dispute_id_to_assertion_id(3))
+
+    def test_get_assertion_bond(self, dispute):
+        oov3_contract = Mock()
+        oov3_contract.functions.getAssertion.return_value.call = AsyncMock(
+            return_value=[0] * 9 + [25]
+        )
+        with patch(
+            "story_protocol_python_sdk.resources.AsyncDispute.get_contract_at",
+            return_value=oov3_contract,
+        ):
+            assert asyncio.run(dispute.get_assertion_bond("0x1234")) == 25
+        oov3_contract.functions.getAssertion.assert_called_once_with("0x1234")
+
+    def test_get_assertion_bond_wraps_failures(self, dispute):
+        dispute.arbitration_policy_uma_client.oov3.side_effect = Exception("No oov3")
+        with pytest.raises(
+            ValueError, match="Failed to get assertion details: No oov3"
+        ):
+            asyncio.run(dispute.get_assertion_bond("0x1234"))
+
+
+class TestAsyncPermission:
+    @pytest.fixture
+    def permission(self, async_web3, account):
+        permission = AsyncPermission(async_web3, account, CHAIN_ID)
+        permission.ip_asset_registry_client = Mock(
+            isRegistered=AsyncMock(return_value=True)
+        )
+        permission.ip_account = Mock(
+            execute=AsyncMock(return_value={"tx_hash": TX_HASH.hex()})
+        )
+        return permission
+
+    def test_set_permission_success(self, permission):
+        response = asyncio.run(
+            permission.set_permission(IP_ID, ADDRESS, ADDRESS, AccessPermission.ALLOW)
+        )
+        assert response == {"tx_hash": TX_HASH.hex()}
+        kwargs = permission.ip_account.execute.call_args.kwargs
+        assert kwargs["to"] == permission.access_controller_client.contract.address
+        assert kwargs["ip_id"] == IP_ID
+        assert kwargs["data"].startswith("0x")
+
+    def test_set_permission_invalid_signer(self, permission):
+        with pytest.raises(
+            Exception,
+            match=f"Failed to set permission for IP {IP_ID}: Invalid address: 0xabc.",
+        ):
+            asyncio.run(
+                permission.set_permission(
+                    IP_ID, "0xabc", ADDRESS, AccessPermission.ALLOW
+                )
+            )
+
+    def test_set_permission_unregistered_ip(self, permission):
+        permission.ip_asset_registry_client.isRegistered.return_value = False
+        with pytest.raises(
+            Exception,
+            match=f"Failed to set permission for IP {IP_ID}: IP id with {IP_ID} is not registered.",
+        ):
+            asyncio.run(
+                permission.set_permission(
+                    IP_ID, ADDRESS, ADDRESS, AccessPermission.ALLOW
+                )
+            )
+        permission.ip_account.execute.assert_not_awaited()
+
+    def test_set_all_permissions_success(self, permission):
+        response = asyncio.run(
+            permission.set_all_permissions(IP_ID, ADDRESS, AccessPermission.DENY)
+        )
+        assert response == {"tx_hash": TX_HASH.hex()}
+        permission.ip_account.execute.assert_awaited_once()
+
+    def test_set_all_permissions_invalid_signer(self, permission):
+        with pytest.raises(
+            Exception,
+            match=f"Failed to set all permissions for IP {IP_ID} and signer 0xabc: Invalid address: 0xabc.",
+        ):
+            asyncio.run(
+                permission.set_all_permissions(IP_ID, "0xabc", AccessPermission.ALLOW)
+            )
+
+
+class TestAsyncIPAccount:
+    @pytest.fixture
+    def ip_account(self, async_web3, account):
+        ip_account = AsyncIPAccount(async_web3, account, CHAIN_ID)
+        ip_account.ip_asset_registry_client = Mock(
+            isRegistered=AsyncMock(return_value=True)
+        )
+        return ip_account
+
+    @pytest.fixture
+    def ip_account_client(self):
+        ip_account_client = Mock(
+            contract=Mock(address=IP_ID),
+            token=AsyncMock(return_value=(CHAIN_ID, ADDRESS, 3)),
+            state=AsyncMock(return_value=b"state"),
+            owner=AsyncMock(return_value=ACCOUNT_ADDRESS),
+        )
+        with patch(
+            "story_protocol_python_sdk.resources.AsyncIPAccount.IPAccountImplClient",
+            return_value=ip_account_client,
+        ):
+            yield ip_account_client
+
+    def test_get_token(self, ip_account, ip_account_client):
+        assert asyncio.run(ip_account.get_token(IP_ID)) == {
+            "chain_id": CHAIN_ID,
+            "token_contract": ADDRESS,
+            "token_id": 3,
+        }
+
+    def test_get_token_invalid_ip_id(self, ip_account):
+        with pytest.raises(ValueError, match="Invalid IP id address: 0xabc"):
+            asyncio.run(ip_account.get_token("0xabc"))
+
+    def test_execute_success(self, ip_account, ip_account_client):
+        with patch_send(
+            "AsyncIPAccount", return_value={"tx_hash": TX_HASH.hex()}
+        ) as send:
+            response = asyncio.run(ip_account.execute(ADDRESS, 0, IP_ID, "0x"))
+        assert response == {"tx_hash": TX_HASH.hex()}
+        assert send.call_args.args[2] == ip_account_client.build_execute_transaction
+        assert send.call_args.args[3:] == (ADDRESS, 0, "0x", 0)
+
+    def test_execute_invalid_recipient(self, ip_account):
+        with pytest.raises(
+            ValueError,
+            match="The recipient of the transaction 0xabc is not a valid address.",
+        ):
+            asyncio.run(ip_account.execute("0xabc", 0, IP_ID, "0x"))
+
+    def test_execute_unregistered_ip(self, ip_account):
+        ip_account.ip_asset_registry_client.isRegistered.return_value = False
+        with pytest.raises(ValueError, match=f"The IP id {IP_ID} is not registered."):
+            asyncio.run(ip_account.execute(ADDRESS, 0, IP_ID, "0x"))
+
+    def test_execute_with_sig_success(self, ip_account, ip_account_client):
+        with patch_send(
+            "AsyncIPAccount", return_value={"tx_hash": TX_HASH.hex()}
+        ) as send:
+            response = asyncio.run(
+                ip_account.execute_with_sig(
+                    IP_ID, ADDRESS, "0x", ACCOUNT_ADDRESS, 100, b"signature"
+                )
+            )
+        assert response == {"tx_hash": TX_HASH.hex()}
+        assert (
+            send.call_args.args[2] == ip_account_client.build_executeWithSig_transaction
+        )
+
+    def test_execute_with_sig_unregistered_ip(self, ip_account):
+        ip_account.ip_asset_registry_client.isRegistered.return_value = False
+        with pytest.raises(ValueError, match=f"The IP id {IP_ID} is not registered."):
+            asyncio.run(
+                ip_account.execute_with_sig(
+                    IP_ID, ADDRESS, "0x", ACCOUNT_ADDRESS, 100, b"signature"
+                )
+            )
+
+    def test_get_ip_account_nonce(self, ip_account, ip_account_client):
+        assert asyncio.run(ip_account.get_ip_account_nonce(IP_ID)) == b"state"
+
+    def test_owner(self, ip_account, ip_account_client):
+        assert asyncio.run(ip_account.owner(IP_ID)) == ACCOUNT_ADDRESS
+
+    def test_owner_invalid_ip_id(self, ip_account):
+        with pytest.raises(ValueError, match="Invalid IP id address: 0xabc"):
+            asyncio.run(ip_account.owner("0xabc"))
+
+    def test_set_ip_metadata_success(self, ip_account):
+        with patch.object(
+            ip_account,
+            "execute",
+            AsyncMock(return_value={"tx_hash": TX_HASH.hex()}),
+        ) as execute:
+            response = asyncio.run(
+                ip_account.set_ip_metadata(IP_ID, "uri", "0x" + "00" * 32)
+            )
+        assert response == {"tx_hash": TX_HASH.hex()}
+        assert (
+            execute.call_args.kwargs["to"]
+            == ip_account.core_metadata_module_client.contract.address
+        )
+
+    def test_set_ip_metadata_unregistered_ip(self, ip_account):
+        ip_account.ip_asset_registry_client.isRegistered.return_value = False
+        with pytest.raises(ValueError, match=f"IP id {IP_ID} is not registered"):
+            asyncio.run(ip_account.set_ip_metadata(IP_ID, "uri", "0x" + "00" * 32))
+
+    def test_transfer_erc20_success(self, ip_account, ip_account_client):
+        with patch_send(
+            "AsyncIPAccount", return_value={"tx_hash": TX_HASH.hex()}
+        ) as send:
+            response = asyncio.run(
+                ip_account.transfer_erc20(
+                    IP_ID,
+                    [{"address": ADDRESS, "target": ACCOUNT_ADDRESS, "amount": 5}],
+                )
+            )
+        assert response == {"tx_hash": TX_HASH.hex()}
+        calls = send.call_args.args[3]
+        assert len(calls) == 1
+        assert calls[0]["target"] == ADDRESS
+        assert calls[0]["value"] == 0
+
+    def test_transfer_erc20_missing_fields(self, ip_account):
+        with pytest.raises(
+            ValueError,
+            match="Failed to transfer ERC20: Each token transfer must include 'address', 'target', and 'amount'",
+        ):
+            asyncio.run(ip_account.transfer_erc20(IP_ID, [{"address": ADDRESS}]))
+
+
+class TestAsyncNFTClient:
+    @pytest.fixture
+    def nft_client(self, async_web3, account):
+        return AsyncNFTClient(async_web3, account, CHAIN_ID)
+
+    @pytest.fixture
+    def spg_nft_client(self):
+        spg_nft_client = Mock(
+            contract=Mock(address=ADDRESS),
+            mintFeeToken=AsyncMock(return_value=ZERO_ADDRESS),
+            mintFee=AsyncMock(return_value=10),
+        )
+        with patch(
+            "story_protocol_python_sdk.resources.AsyncNFTClient.SPGNFTImplClient",
+            return_value=spg_nft_client,
+        ):
+            yield spg_nft_client
+
+    def test_create_nft_collection_success(self, nft_client):
+        with (
+            patch_send(
+                "AsyncNFTClient",
+                return_value={"tx_hash": TX_HASH.hex(), "tx_receipt": {}},
+            ) as send,
+            patch.object(
+                nft_client, "_parse_tx_collection_created_event", return_value=ADDRESS
+            ),
+        ):
+            response = asyncio.run(
+                nft_client.create_nft_collection(
+                    "Test", "TST", True, True, ADDRESS, "uri"
+                )
+            )
+        assert response == {"tx_hash": TX_HASH.hex(), "nft_contract": ADDRESS}
+        init_params = send.call_args.args[3]
+        assert init_params["owner"] == ACCOUNT_ADDRESS
+        assert init_params["maxSupply"] == 2**32 - 1
+        assert init_params["mintFeeToken"] == ZERO_ADDRESS
+
+    def test_create_nft_collection_invalid_mint_fee_token(self, nft_client):
+        with pytest.raises(
+            ValueError,
+            match="Invalid mint fee token address, mint fee is greater than 0.",
+        ):
+            asyncio.run(
+                nft_client.create_nft_collection(
+                    "Test", "TST", True, True, ADDRESS, "uri", mint_fee=1
+                )
+            )
+
+    def test_get_mint_fee_token(self, nft_client, spg_nft_client):
+        assert asyncio.run(nft_client.get_mint_fee_token(ADDRESS)) == ZERO_ADDRESS
+
+    def test_get_mint_fee_token_invalid_contract(self, nft_client):
+        with pytest.raises(ValueError, match="Failed to get mint fee token: "):
+            asyncio.run(nft_client.get_mint_fee_token("0xabc"))
+
+    def test_get_mint_fee(self, nft_client, spg_nft_client):
+        assert asyncio.run(nft_client.get_mint_fee(ADDRESS)) == 10
+
+    def test_get_mint_fee_wraps_failures(self, nft_client, spg_nft_client):
+        spg_nft_client.mintFee.side_effect = Exception("Not an SPG NFT")
+        with pytest.raises(ValueError, match="Failed to get mint fee: Not an SPG NFT"):
+            asyncio.run(nft_client.get_mint_fee(ADDRESS))
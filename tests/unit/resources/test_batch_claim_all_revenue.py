@@ -49,17 +49,9 @@ class TestBatchClaimAllRevenue:
         self, royalty_client
     ):
         """Test batch claim with multiple ancestors using multicall"""
-        with patch.object(
-            royalty_client.royalty_workflows_client.contract.functions,
-            "claimAllRevenue",
-            return_value=type(
-                "MockFunction",
-                (),
-                {
-                    "build_transaction": lambda self, opts: {"data": "0x1234"},
-                    "_encode_transaction_data": lambda self: "0x1234",
-                },
-            )(),
+        with patch(
+            "story_protocol_python_sdk.resources.Royalty.encode_claimAllRevenue",
+            return_value=bytes.fromhex("1234"),
         ):
             with patch.object(
                 royalty_client,
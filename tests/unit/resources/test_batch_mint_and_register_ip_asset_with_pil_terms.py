@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from story_protocol_python_sdk.resources.IPAsset import IPAsset
+from tests.unit.fixtures.data import ip_registered_log, license_terms_attached_log
 
 # Test constants
 SPG_NFT_CONTRACT = "0x1234567890123456789012345678901234567890"
@@ -60,27 +61,12 @@ class TestBatchMintAndRegisterIpAssetWithPilTerms:
             },
         }
 
-        # Create mock logs for IPRegistered events
-        mock_topic = Mock()
-        mock_topic.hex.return_value = "0xip_registered_sig"
-        
-        mock_log_1 = {"topics": [mock_topic]}
-        mock_log_2 = {"topics": [mock_topic]}
-        
-        # Mock keccak for event signature
-        mock_keccak_result = Mock()
-        mock_keccak_result.hex.return_value = "0xip_registered_sig"
-        ip_asset_client.web3.keccak = Mock(return_value=mock_keccak_result)
+        # Create logs for IPRegistered events
+        mock_log_1 = ip_registered_log(IP_ID_1, SPG_NFT_CONTRACT, 1)
+        mock_log_2 = ip_registered_log(IP_ID_2, SPG_NFT_CONTRACT, 2)
         
         # Mock to_checksum_address
         ip_asset_client.web3.to_checksum_address = Mock(side_effect=lambda x: x)
-        
-        # Mock event processing
-        mock_event_1 = {"args": {"ipId": IP_ID_1, "tokenId": 1, "tokenContract": SPG_NFT_CONTRACT}}
-        mock_event_2 = {"args": {"ipId": IP_ID_2, "tokenId": 2, "tokenContract": SPG_NFT_CONTRACT}}
-        ip_asset_client.ip_asset_registry_client.contract.events.IPRegistered.process_log = Mock(
-            side_effect=[mock_event_1, mock_event_2]
-        )
 
         # Mock mint_and_register_ip_asset_with_pil_terms to return encoded data
         with patch.object(
@@ -96,27 +82,29 @@ class TestBatchMintAndRegisterIpAssetWithPilTerms:
                 "story_protocol_python_sdk.resources.IPAsset.build_and_send_transaction",
                 return_value={
                     "tx_hash": TX_HASH,
-                    "tx_receipt": {"logs": [mock_log_1, mock_log_2]},
+                    "tx_receipt": {
+                        "logs": [
+                            mock_log_1,
+                            license_terms_attached_log(IP_ID_1, 1),
+                            license_terms_attached_log(IP_ID_1, 2),
+                            mock_log_2,
+                            license_terms_attached_log(IP_ID_2, 3),
+                        ]
+                    },
                 },
             ):
-                # Mock license terms parsing
-                with patch.object(
-                    ip_asset_client,
-                    "_parse_tx_license_terms_attached_event_for_ip",
-                    side_effect=[[1, 2], [3]],
-                ):
-                    result = ip_asset_client.batch_mint_and_register_ip_asset_with_pil_terms(
-                        args=[
-                            {
-                                "spg_nft_contract": SPG_NFT_CONTRACT,
-                                "terms": [license_terms_template],
-                            },
-                            {
-                                "spg_nft_contract": SPG_NFT_CONTRACT,
-                                "terms": [license_terms_template],
-                            },
-                        ]
-                    )
+                result = ip_asset_client.batch_mint_and_register_ip_asset_with_pil_terms(
+                    args=[
+                        {
+                            "spg_nft_contract": SPG_NFT_CONTRACT,
+                            "terms": [license_terms_template],
+                        },
+                        {
+                            "spg_nft_contract": SPG_NFT_CONTRACT,
+                            "terms": [license_terms_template],
+                        },
+                    ]
+                )
 
         assert result["tx_hash"] == TX_HASH
         assert len(result["results"]) == 2
@@ -162,24 +150,11 @@ class TestBatchMintAndRegisterIpAssetWithPilTerms:
             },
         }
 
-        # Create mock log for IPRegistered event
-        mock_topic = Mock()
-        mock_topic.hex.return_value = "0xip_registered_sig"
-        mock_log = {"topics": [mock_topic]}
-        
-        # Mock keccak for event signature
-        mock_keccak_result = Mock()
-        mock_keccak_result.hex.return_value = "0xip_registered_sig"
-        ip_asset_client.web3.keccak = Mock(return_value=mock_keccak_result)
+        # Create log for IPRegistered event
+        mock_log = ip_registered_log(IP_ID_1, SPG_NFT_CONTRACT, 1)
         
         # Mock to_checksum_address
         ip_asset_client.web3.to_checksum_address = Mock(side_effect=lambda x: x)
-        
-        # Mock event processing
-        mock_event = {"args": {"ipId": IP_ID_1, "tokenId": 1, "tokenContract": SPG_NFT_CONTRACT}}
-        ip_asset_client.ip_asset_registry_client.contract.events.IPRegistered.process_log = Mock(
-            return_value=mock_event
-        )
 
         with patch.object(
             ip_asset_client,
@@ -190,26 +165,23 @@ class TestBatchMintAndRegisterIpAssetWithPilTerms:
                 "story_protocol_python_sdk.resources.IPAsset.build_and_send_transaction",
                 return_value={
                     "tx_hash": TX_HASH,
-                    "tx_receipt": {"logs": [mock_log]},
+                    "tx_receipt": {
+                        "logs": [mock_log, license_terms_attached_log(IP_ID_1, 1)]
+                    },
                 },
             ):
-                with patch.object(
-                    ip_asset_client,
-                    "_parse_tx_license_terms_attached_event_for_ip",
-                    return_value=[1],
-                ):
-                    result = ip_asset_client.batch_mint_and_register_ip_asset_with_pil_terms(
-                        args=[
-                            {
-                                "spg_nft_contract": SPG_NFT_CONTRACT,
-                                "terms": [license_terms_template],
-                                "ip_metadata": {
-                                    "ip_metadata_uri": "https://example.com/metadata",
-                                    "ip_metadata_hash": ZERO_HASH,
-                                },
-                            }
-                        ]
-                    )
+                result = ip_asset_client.batch_mint_and_register_ip_asset_with_pil_terms(
+                    args=[
+                        {
+                            "spg_nft_contract": SPG_NFT_CONTRACT,
+                            "terms": [license_terms_template],
+                            "ip_metadata": {
+                                "ip_metadata_uri": "https://example.com/metadata",
+                                "ip_metadata_hash": ZERO_HASH,
+                            },
+                        }
+                    ]
+                )
 
         assert result["tx_hash"] == TX_HASH
         assert len(result["results"]) == 1
@@ -249,24 +221,11 @@ class TestBatchMintAndRegisterIpAssetWithPilTerms:
             },
         }
 
-        # Create mock log for IPRegistered event
-        mock_topic = Mock()
-        mock_topic.hex.return_value = "0xip_registered_sig"
-        mock_log = {"topics": [mock_topic]}
-        
-        # Mock keccak for event signature
-        mock_keccak_result = Mock()
-        mock_keccak_result.hex.return_value = "0xip_registered_sig"
-        ip_asset_client.web3.keccak = Mock(return_value=mock_keccak_result)
+        # Create log for IPRegistered event
+        mock_log = ip_registered_log(IP_ID_1, SPG_NFT_CONTRACT, 1)
         
         # Mock to_checksum_address
         ip_asset_client.web3.to_checksum_address = Mock(side_effect=lambda x: x)
-        
-        # Mock event processing
-        mock_event = {"args": {"ipId": IP_ID_1, "tokenId": 1, "tokenContract": SPG_NFT_CONTRACT}}
-        ip_asset_client.ip_asset_registry_client.contract.events.IPRegistered.process_log = Mock(
-            return_value=mock_event
-        )
 
         with patch.object(
             ip_asset_client,
@@ -277,23 +236,20 @@ class TestBatchMintAndRegisterIpAssetWithPilTerms:
                 "story_protocol_python_sdk.resources.IPAsset.build_and_send_transaction",
                 return_value={
                     "tx_hash": TX_HASH,
-                    "tx_receipt": {"logs": [mock_log]},
+                    "tx_receipt": {
+                        "logs": [mock_log, license_terms_attached_log(IP_ID_1, 1)]
+                    },
                 },
             ):
-                with patch.object(
-                    ip_asset_client,
-                    "_parse_tx_license_terms_attached_event_for_ip",
-                    return_value=[1],
-                ):
-                    result = ip_asset_client.batch_mint_and_register_ip_asset_with_pil_terms(
-                        args=[
-                            {
-                                "spg_nft_contract": SPG_NFT_CONTRACT,
-                                "terms": [license_terms_template],
-                                "recipient": recipient,
-                            }
-                        ]
-                    )
+                result = ip_asset_client.batch_mint_and_register_ip_asset_with_pil_terms(
+                    args=[
+                        {
+                            "spg_nft_contract": SPG_NFT_CONTRACT,
+                            "terms": [license_terms_template],
+                            "recipient": recipient,
+                        }
+                    ]
+                )
 
         assert result["tx_hash"] == TX_HASH
         assert len(result["results"]) == 1
@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from web3 import Web3
+
+from story_protocol_python_sdk.resources.Dispute import Dispute
+from story_protocol_python_sdk.resources.Group import Group
+from story_protocol_python_sdk.resources.IPAsset import IPAsset
+from story_protocol_python_sdk.resources.License import License
+from story_protocol_python_sdk.resources.Royalty import Royalty
+from tests.unit.fixtures.data import ADDRESS, CHAIN_ID, IP_ID
+
+
+@pytest.fixture
+def web3():
+    """A fresh web3 mock, so no contract is cached by the registry yet."""
+    web3 = Mock(spec=Web3)
+    web3.eth = Mock()
+    web3.eth.contract = MagicMock(side_effect=lambda **kwargs: MagicMock(**kwargs))
+    web3.is_address = MagicMock(return_value=True)
+    web3.to_checksum_address = MagicMock(return_value=IP_ID)
+    return web3
+
+
+class TestLazyClientConstruction:
+    @pytest.mark.parametrize("resource", [IPAsset, Royalty, Group, License, Dispute])
+    def test_constructor_builds_no_clients(self, web3, mock_account, resource):
+        resource(web3, mock_account, CHAIN_ID)
+
+        assert web3.eth.contract.call_count == 0
+
+    def test_ip_asset_is_registered_builds_one_client(self, web3, mock_account):
+        ip_asset = IPAsset(web3, mock_account, CHAIN_ID)
+
+        ip_asset.is_registered(IP_ID)
+
+        assert web3.eth.contract.call_count == 1
+
+    def test_license_get_license_terms_builds_one_client(self, web3, mock_account):
+        license = License(web3, mock_account, CHAIN_ID)
+
+        license.get_license_terms(1)
+
+        assert web3.eth.contract.call_count == 1
+
+    def test_royalty_get_royalty_vault_address_builds_two_clients(
+        self, web3, mock_account
+    ):
+        royalty = Royalty(web3, mock_account, CHAIN_ID)
+
+        royalty.get_royalty_vault_address(IP_ID)
+
+        assert web3.eth.contract.call_count == 2
+
+    def test_client_is_built_once(self, web3, mock_account):
+        ip_asset = IPAsset(web3, mock_account, CHAIN_ID)
+
+        first = ip_asset.ip_asset_registry_client
+        second = ip_asset.ip_asset_registry_client
+
+        assert first is second
+        assert web3.eth.contract.call_count == 1
+
+    def test_client_can_be_replaced(self, web3, mock_account):
+        ip_asset = IPAsset(web3, mock_account, CHAIN_ID)
+        client = MagicMock(contract=MagicMock(address=ADDRESS))
+
+        ip_asset.ip_asset_registry_client = client
+
+        assert ip_asset.ip_asset_registry_client is client
+        assert web3.eth.contract.call_count == 0
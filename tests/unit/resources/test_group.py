@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 import pytest
+from web3 import Web3
 
 from story_protocol_python_sdk.resources.Group import Group
 from story_protocol_python_sdk.types.resource.Group import (
@@ -16,6 +17,18 @@ def group(mock_web3, mock_account):
     return Group(mock_web3, mock_account, CHAIN_ID)
 
 
+@pytest.fixture
+def sequential_reads():
+    """Runs the reads of an aggregate3 call one by one on their client methods."""
+    with patch(
+        "story_protocol_python_sdk.resources.Group.aggregate_reads",
+        side_effect=lambda multicall3_client, reads: [
+            client_function(*client_args) for client_function, client_args in reads
+        ],
+    ) as aggregate_reads:
+        yield aggregate_reads
+
+
 class TestGroupCollectRoyalties:
     """Test class for Group.collect_royalties method"""
 
@@ -66,7 +79,7 @@ class TestGroupCollectRoyalties:
                         "logs": [
                             {
                                 "topics": [
-                                    group.web3.keccak(
+                                    Web3.keccak(
                                         text="CollectedRoyaltiesToGroupPool(address,address,address,uint256)"
                                     )
                                 ]
@@ -105,9 +118,7 @@ class TestGroupCollectRoyalties:
                 return_value={
                     "tx_hash": TX_HASH,
                     "tx_receipt": {
-                        "logs": [
-                            {"topics": [group.web3.keccak(text="DifferentEvent()")]}
-                        ]
+                        "logs": [{"topics": [Web3.keccak(text="DifferentEvent()")]}]
                     },
                 },
             ), patch.object(
@@ -227,7 +238,7 @@ class TestGroupClaimRewards:
                         "logs": [
                             {
                                 "topics": [
-                                    group.web3.keccak(
+                                    Web3.keccak(
                                         text="ClaimedReward(address,address,address[],uint256[])"
                                     )
                                 ]
@@ -278,7 +289,7 @@ class TestGroupClaimRewards:
                         "logs": [
                             {
                                 "topics": [
-                                    group.web3.keccak(
+                                    Web3.keccak(
                                         text="ClaimedReward(address,address,address[],uint256[])"
                                     )
                                 ]
@@ -332,9 +343,7 @@ class TestGroupClaimRewards:
                 return_value={
                     "tx_hash": TX_HASH,
                     "tx_receipt": {
-                        "logs": [
-                            {"topics": [group.web3.keccak(text="DifferentEvent()")]}
-                        ]
+                        "logs": [{"topics": [Web3.keccak(text="DifferentEvent()")]}]
                     },
                 },
             ), patch.object(
@@ -367,7 +376,7 @@ class TestGroupClaimRewards:
                         "logs": [
                             {
                                 "topics": [
-                                    group.web3.keccak(
+                                    Web3.keccak(
                                         text="ClaimedReward(address,address,address[],uint256[])"
                                     )
                                 ]
@@ -424,6 +433,7 @@ class TestGroupClaimRewards:
                     )
 
 
+@pytest.mark.usefixtures("sequential_reads")
 class TestGroupAddIpsToGroup:
     """Test class for Group.add_ips_to_group method"""
 
@@ -499,7 +509,7 @@ class TestGroupAddIpsToGroup:
             with patch.object(
                 group.dispute_module_client,
                 "isIpTagged",
-                side_effect=[False, True],  # group ok, first ip disputed
+                side_effect=[False, True, False],  # group ok, first ip disputed
             ):
                 with pytest.raises(
                     ValueError,
@@ -556,6 +566,26 @@ class TestGroupAddIpsToGroup:
                 assert "tx_hash" in result
                 assert result["tx_hash"] == TX_HASH
 
+    def test_add_ips_to_group_validates_with_one_aggregate_call(
+        self, group: Group, mock_web3_is_address, sequential_reads
+    ):
+        """Test add_ips_to_group sends every validation read in one aggregate3 call."""
+        with mock_web3_is_address():
+            with patch.object(
+                group.dispute_module_client, "isIpTagged", return_value=False
+            ), patch.object(
+                group.ip_asset_registry_client,
+                "isRegisteredGroup",
+                return_value=False,
+            ), patch(
+                "story_protocol_python_sdk.resources.Group.build_and_send_transaction",
+                return_value={"tx_hash": TX_HASH, "tx_receipt": {}},
+            ):
+                group.add_ips_to_group(group_ip_id=IP_ID, ip_ids=[IP_ID, ADDRESS])
+
+        sequential_reads.assert_called_once()
+        assert len(sequential_reads.call_args.args[1]) == 5
+
     def test_add_ips_to_group_default_max_allowed_reward_share_percentage(
         self,
         group: Group,
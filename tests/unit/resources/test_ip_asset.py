@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 import pytest
 from ens.ens import HexStr
+from eth_abi import encode
 from web3 import Web3
 
 from story_protocol_python_sdk import (
@@ -36,6 +37,8 @@ from tests.unit.fixtures.data import (
     TX_HASH,
     ZERO_ADDRESS,
     ZERO_HASH,
+    ip_registered_log,
+    ip_royalty_vault_deployed_log,
 )
 
 
@@ -223,6 +226,7 @@ def mock_is_whitelisted_royalty_token(ip_asset):
     return _mock
 
 
+@pytest.mark.usefixtures("sequential_derivative_data_reads")
 class TestRegisterDerivativeIp:
     def test_ip_is_already_registered(
         self, ip_asset, mock_get_ip_id, mock_is_registered
@@ -452,6 +456,7 @@ class TestRegisterIpAndAttachPilTerms:
             }
 
 
+@pytest.mark.usefixtures("sequential_derivative_data_reads")
 class TestRegisterDerivative:
     def test_child_ip_is_not_registered(
         self, ip_asset: IPAsset, mock_get_ip_id, mock_is_registered
@@ -536,6 +541,7 @@ class TestRegisterDerivative:
                 assert call_args[3] == ADDRESS  # license_template
 
 
+@pytest.mark.usefixtures("sequential_derivative_data_reads")
 class TestMintAndRegisterIpAndMakeDerivative:
     def test_throw_error_when_spg_nft_contract_is_invalid(
         self, ip_asset, mock_license_registry_client
@@ -1090,6 +1096,7 @@ class TestRegisterPilTermsAndAttach:
                     )
 
 
+@pytest.mark.usefixtures("sequential_derivative_data_reads")
 class TestMintAndRegisterIpAndMakeDerivativeAndDistributeRoyaltyTokens:
     def test_throw_error_when_royalty_shares_empty(self, ip_asset: IPAsset):
         with pytest.raises(ValueError, match="Royalty shares must be provided."):
@@ -1178,23 +1185,10 @@ class TestMintAndRegisterIpAndMakeDerivativeAndDistributeRoyaltyTokens:
                     return_value={
                         "tx_hash": TX_HASH,
                         "tx_receipt": {
-                            "logs": [
-                                {
-                                    "topics": [
-                                        Web3.keccak(
-                                            text="IpRoyaltyVaultDeployed(address,address)"
-                                        )
-                                    ]
-                                }
-                            ]
+                            "logs": [ip_royalty_vault_deployed_log(IP_ID, ADDRESS)]
                         },
                     },
                 ),
-                patch.object(
-                    ip_asset.royalty_module_client.contract.events.IpRoyaltyVaultDeployed,
-                    "process_log",
-                    return_value={"args": {"ipId": IP_ID, "ipRoyaltyVault": ADDRESS}},
-                ),
             ):
                 result = ip_asset.mint_and_register_ip_and_make_derivative_and_distribute_royalty_tokens(
                     spg_nft_contract=ADDRESS,
@@ -1637,6 +1631,7 @@ class TestRegisterIpAndAttachPilTermsAndDistributeRoyaltyTokens:
                     )
 
 
+@pytest.mark.usefixtures("sequential_derivative_data_reads")
 class TestRegisterDerivativeIpAndAttachPilTermsAndDistributeRoyaltyTokens:
     def test_token_id_is_already_registered(
         self, ip_asset: IPAsset, mock_get_ip_id, mock_is_registered
@@ -1922,29 +1917,24 @@ class TestBatchMintAndRegisterIP:
     def test_batch_mint_with_default_values(
         self, ip_asset: IPAsset, mock_parse_ip_registered_event
     ):
-        """Test batch mint with default values - verify encode_abi is called with correct default parameters."""
+        """Test batch mint with default values - verify the calldata is encoded with correct default parameters."""
         requests = [
             BatchMintAndRegisterIPInput(spg_nft_contract=ADDRESS),
             BatchMintAndRegisterIPInput(spg_nft_contract=ADDRESS),
         ]
 
         with mock_parse_ip_registered_event():
-            with patch.object(
-                ip_asset.registration_workflows_client.contract,
-                "encode_abi",
+            with patch(
+                "story_protocol_python_sdk.resources.IPAsset.encode_mintAndRegisterIp",
                 return_value=b"encoded_data",
-            ) as mock_encode_abi:
+            ) as mock_encode:
                 result = ip_asset.batch_mint_and_register_ip(requests=requests)
 
-                # Verify encode_abi was called twice (once per request)
-                assert mock_encode_abi.call_count == 2
+                # Verify the calldata was encoded twice (once per request)
+                assert mock_encode.call_count == 2
 
                 # Verify first call with default values
-                first_call_args = mock_encode_abi.call_args_list[0]
-                assert (
-                    first_call_args[1]["abi_element_identifier"] == "mintAndRegisterIp"
-                )
-                args = first_call_args[1]["args"]
+                args = mock_encode.call_args_list[0][0]
                 assert args[0] == ADDRESS  # spg_nft_contract
                 assert args[1] == ACCOUNT_ADDRESS  # recipient (default)
                 assert (
@@ -1963,7 +1953,7 @@ class TestBatchMintAndRegisterIP:
     def test_batch_mint_with_custom_values(
         self, ip_asset: IPAsset, mock_parse_ip_registered_event
     ):
-        """Test batch mint with custom values - verify encode_abi is called with custom parameters."""
+        """Test batch mint with custom values - verify the calldata is encoded with custom parameters."""
         custom_recipient = "0x9876543210987654321098765432109876543210"
 
         requests = [
@@ -1982,20 +1972,15 @@ class TestBatchMintAndRegisterIP:
         ]
 
         with mock_parse_ip_registered_event():
-            with patch.object(
-                ip_asset.registration_workflows_client.contract,
-                "encode_abi",
+            with patch(
+                "story_protocol_python_sdk.resources.IPAsset.encode_mintAndRegisterIp",
                 return_value=b"encoded_data",
-            ) as mock_encode_abi:
+            ) as mock_encode:
                 result = ip_asset.batch_mint_and_register_ip(requests=requests)
 
-                # Verify encode_abi was called twice
-                assert mock_encode_abi.call_count == 2
-                second_call_args = mock_encode_abi.call_args_list[1]
-                assert (
-                    second_call_args[1]["abi_element_identifier"] == "mintAndRegisterIp"
-                )
-                args = second_call_args[1]["args"]
+                # Verify the calldata was encoded twice
+                assert mock_encode.call_count == 2
+                args = mock_encode.call_args_list[1][0]
                 assert args[0] == ADDRESS  # spg_nft_contract
                 assert args[1] == ADDRESS  # recipient
                 assert (
@@ -2034,10 +2019,9 @@ class TestBatchMintAndRegisterIP:
 
     def test_batch_mint_empty_requests(self, ip_asset: IPAsset):
         """Test batch mint with empty requests list."""
-        with patch.object(
-            ip_asset.registration_workflows_client.contract,
-            "encode_abi",
-        ) as mock_encode_abi:
+        with patch(
+            "story_protocol_python_sdk.resources.IPAsset.encode_mintAndRegisterIp",
+        ) as mock_encode:
             with patch(
                 "story_protocol_python_sdk.resources.IPAsset.build_and_send_transaction",
                 return_value={
@@ -2047,8 +2031,8 @@ class TestBatchMintAndRegisterIP:
             ):
                 result = ip_asset.batch_mint_and_register_ip(requests=[])
 
-                # encode_abi should not be called for empty requests
-                mock_encode_abi.assert_not_called()
+                # Nothing should be encoded for empty requests
+                mock_encode.assert_not_called()
                 assert result["tx_hash"] == TX_HASH.hex()
                 assert result["registered_ips"] == []
 
@@ -2058,9 +2042,8 @@ class TestBatchMintAndRegisterIP:
             BatchMintAndRegisterIPInput(spg_nft_contract=ADDRESS),
         ]
 
-        with patch.object(
-            ip_asset.registration_workflows_client.contract,
-            "encode_abi",
+        with patch(
+            "story_protocol_python_sdk.resources.IPAsset.encode_mintAndRegisterIp",
             return_value=b"encoded_data",
         ):
             with patch(
@@ -2083,9 +2066,8 @@ class TestBatchMintAndRegisterIP:
         ]
 
         with mock_parse_ip_registered_event():
-            with patch.object(
-                ip_asset.registration_workflows_client.contract,
-                "encode_abi",
+            with patch(
+                "story_protocol_python_sdk.resources.IPAsset.encode_mintAndRegisterIp",
                 return_value=b"encoded_data",
             ):
                 with patch.object(
@@ -2858,6 +2840,7 @@ class TestRegisterIpAsset:
             )  # allow_duplicates
 
 
+@pytest.mark.usefixtures("sequential_derivative_data_reads")
 class TestRegisterDerivativeIpAsset:
     def test_throw_error_when_deriv_data_is_not_provided_and_royalty_shares_are_provided_for_minted_nft(
         self, ip_asset: IPAsset
@@ -3361,6 +3344,7 @@ class TestRegisterDerivativeIpAsset:
             assert result["token_id"] == 3
 
 
+@pytest.mark.usefixtures("sequential_derivative_data_reads")
 class TestLinkDerivative:
     def test_throw_error_when_parent_ip_ids_and_license_token_ids_are_not_provided(
         self, ip_asset: IPAsset
@@ -3546,6 +3530,92 @@ class TestLinkDerivative:
                 ip_asset.link_derivative(license_token_ids=[1], child_ip_id=IP_ID)
 
 
+class TestLinkDerivativeAggregateReads:
+    """link_derivative validates its parents through DerivativeData's aggregate3 call."""
+
+    @pytest.fixture
+    def ip_asset(self, mock_account):
+        return IPAsset(Web3(), mock_account, CHAIN_ID)
+
+    @pytest.fixture
+    def aggregate3(self, ip_asset: IPAsset):
+        # DerivativeData's Multicall3 client shares the contract of the chain
+        with patch.object(
+            ip_asset.multicall3_client.contract.functions, "aggregate3"
+        ) as aggregate3:
+            yield aggregate3
+
+    @pytest.fixture
+    def link_derivative(self, ip_asset: IPAsset):
+        def _link_derivative():
+            return ip_asset.link_derivative(
+                child_ip_id=IP_ID,
+                parent_ip_ids=[IP_ID, ADDRESS],
+                license_terms_ids=[1, 2],
+            )
+
+        with patch.object(
+            ip_asset.ip_asset_registry_client, "isRegistered", return_value=True
+        ):
+            yield _link_derivative
+
+    def test_validates_every_parent_in_one_aggregate3_call(
+        self, ip_asset: IPAsset, aggregate3, link_derivative
+    ):
+        aggregate3.return_value.call.return_value = [
+            (True, encode(["bool"], [True])),
+            (True, encode(["bool"], [True])),
+            (True, encode(["uint32"], [10])),
+        ] * 2
+
+        with patch(
+            "story_protocol_python_sdk.resources.IPAsset.build_and_send_transaction",
+            return_value={"tx_hash": TX_HASH, "tx_receipt": {}},
+        ) as mock_build_and_send:
+            result = link_derivative()
+
+        assert result == {"tx_hash": TX_HASH}
+        calls = aggregate3.call_args.args[0]
+        assert aggregate3.call_count == 1
+        assert [call["target"] for call in calls] == [
+            ip_asset.ip_asset_registry_client.contract.address,
+            ip_asset.license_registry_client.contract.address,
+            ip_asset.license_registry_client.contract.address,
+        ] * 2
+        assert (
+            mock_build_and_send.call_args.args[6]
+            == ip_asset.pi_license_template_client.contract.address
+        )  # license_template
+
+    def test_unregistered_parent(self, aggregate3, link_derivative):
+        aggregate3.return_value.call.return_value = [
+            (True, encode(["bool"], [True])),
+            (True, encode(["bool"], [True])),
+            (True, encode(["uint32"], [10])),
+            (True, encode(["bool"], [False])),
+            (True, encode(["bool"], [False])),
+            (False, b""),
+        ]
+
+        with pytest.raises(
+            ValueError, match=f"The parent IP ID {ADDRESS} must be registered."
+        ):
+            link_derivative()
+
+    def test_reverted_royalty_percent_read(self, aggregate3, link_derivative):
+        aggregate3.return_value.call.return_value = [
+            (True, encode(["bool"], [True])),
+            (True, encode(["bool"], [True])),
+            (False, b""),
+        ] * 2
+
+        with pytest.raises(
+            ValueError,
+            match=f"Failed to get the royalty percent of license terms id 1 of the parent ipId {IP_ID}.",
+        ):
+            link_derivative()
+
+
 class TestIPAssetBatchRegister:
     def test_batch_register_missing_required_fields(self, ip_asset):
         with pytest.raises(ValueError, match="Each arg must contain 'nft_contract' and 'token_id'"):
@@ -3560,54 +3630,37 @@ class TestIPAssetBatchRegister:
         mock_is_registered,
     ):
         with mock_get_ip_id(), mock_is_registered():
-            with patch.object(
-                ip_asset.ip_asset_registry_client.contract.functions,
-                "register",
-                return_value=type("MockFunction", (), {
-                    "build_transaction": lambda self, opts: {"data": "0x1234"}
-                })(),
+            with patch(
+                "story_protocol_python_sdk.resources.IPAsset.encode_register",
+                return_value=bytes.fromhex("1234"),
             ):
                 with patch.object(
                     ip_asset.web3.eth,
                     "get_transaction_receipt",
                     return_value={
                         "logs": [
-                            {
-                                "topics": [ip_asset.web3.keccak(text="IPRegistered(address,uint256,address,uint256,string,string,uint256)")],
-                                "address": ip_asset.ip_asset_registry_client.contract.address,
-                            },
-                            {
-                                "topics": [ip_asset.web3.keccak(text="IPRegistered(address,uint256,address,uint256,string,string,uint256)")],
-                                "address": ip_asset.ip_asset_registry_client.contract.address,
-                            }
+                            ip_registered_log(IP_ID, ADDRESS, 3),
+                            ip_registered_log(ADDRESS, ADDRESS, 4),
                         ]
                     },
                 ):
-                    with patch.object(
-                        ip_asset.ip_asset_registry_client.contract.events.IPRegistered,
-                        "process_log",
-                        side_effect=[
-                            {"args": {"ipId": IP_ID, "tokenId": 3, "tokenContract": ADDRESS}},
-                            {"args": {"ipId": ADDRESS, "tokenId": 4, "tokenContract": ADDRESS}},
+                    result = ip_asset.batch_register(
+                        args=[
+                            {"nft_contract": ADDRESS, "token_id": 3},
+                            {"nft_contract": ADDRESS, "token_id": 4},
                         ],
-                    ):
-                        result = ip_asset.batch_register(
-                            args=[
-                                {"nft_contract": ADDRESS, "token_id": 3},
-                                {"nft_contract": ADDRESS, "token_id": 4},
-                            ],
-                        )
-                        assert result["tx_hash"] == TX_HASH.hex()
-                        assert result["spg_tx_hash"] is None
-                        assert len(result["results"]) == 2
-                        # Check that we got 2 results with correct token IDs
-                        assert result["results"][0]["token_id"] == 3
-                        assert result["results"][1]["token_id"] == 4
-                        # Check that IP IDs are present (exact values depend on mock)
-                        assert "ip_id" in result["results"][0]
-                        assert "ip_id" in result["results"][1]
-                        assert "nft_contract" in result["results"][0]
-                        assert "nft_contract" in result["results"][1]
+                    )
+                    assert result["tx_hash"] == TX_HASH.hex()
+                    assert result["spg_tx_hash"] is None
+                    assert len(result["results"]) == 2
+                    # Check that we got 2 results with correct token IDs
+                    assert result["results"][0]["token_id"] == 3
+                    assert result["results"][1]["token_id"] == 4
+                    # Check that IP IDs are present (exact values depend on mock)
+                    assert "ip_id" in result["results"][0]
+                    assert "ip_id" in result["results"][1]
+                    assert "nft_contract" in result["results"][0]
+                    assert "nft_contract" in result["results"][1]
 
     def test_batch_register_successful_with_metadata(
         self,
@@ -3617,46 +3670,31 @@ class TestIPAssetBatchRegister:
         mock_signature_related_methods,
     ):
         with mock_get_ip_id(), mock_is_registered(), mock_signature_related_methods():
-            with patch.object(
-                ip_asset.registration_workflows_client.contract.functions,
-                "registerIp",
-                return_value=type("MockFunction", (), {
-                    "build_transaction": lambda self, opts: {"data": "0x5678"}
-                })(),
+            with patch(
+                "story_protocol_python_sdk.resources.IPAsset.encode_registerIp",
+                return_value=bytes.fromhex("5678"),
             ):
                 with patch.object(
                     ip_asset.web3.eth,
                     "get_transaction_receipt",
-                    return_value={
-                        "logs": [
-                            {
-                                "topics": [ip_asset.web3.keccak(text="IPRegistered(address,uint256,address,uint256,string,string,uint256)")],
-                                "address": ip_asset.ip_asset_registry_client.contract.address,
-                            }
-                        ]
-                    },
+                    return_value={"logs": [ip_registered_log(ADDRESS, ADDRESS, 3)]},
                 ):
-                    with patch.object(
-                        ip_asset.ip_asset_registry_client.contract.events.IPRegistered,
-                        "process_log",
-                        return_value={"args": {"ipId": ADDRESS, "tokenId": 3, "tokenContract": ADDRESS}},
-                    ):
-                        result = ip_asset.batch_register(
-                            args=[
-                                {
-                                    "nft_contract": ADDRESS,
-                                    "token_id": 3,
-                                    "ip_metadata": {
-                                        "ip_metadata_uri": "test_uri",
-                                        "ip_metadata_hash": ZERO_HASH,
-                                    },
+                    result = ip_asset.batch_register(
+                        args=[
+                            {
+                                "nft_contract": ADDRESS,
+                                "token_id": 3,
+                                "ip_metadata": {
+                                    "ip_metadata_uri": "test_uri",
+                                    "ip_metadata_hash": ZERO_HASH,
                                 },
-                            ],
-                        )
-                        assert result["spg_tx_hash"] == TX_HASH.hex()
-                        assert result["tx_hash"] is None
-                        assert len(result["results"]) == 1
-                        assert result["results"][0]["ip_id"] == ADDRESS
+                            },
+                        ],
+                    )
+                    assert result["spg_tx_hash"] == TX_HASH.hex()
+                    assert result["tx_hash"] is None
+                    assert len(result["results"]) == 1
+                    assert result["results"][0]["ip_id"] == ADDRESS
 
     def test_batch_register_mixed_with_and_without_metadata(
         self,
@@ -3666,66 +3704,38 @@ class TestIPAssetBatchRegister:
         mock_signature_related_methods,
     ):
         with mock_get_ip_id(), mock_is_registered(), mock_signature_related_methods():
-            with patch.object(
-                ip_asset.ip_asset_registry_client.contract.functions,
-                "register",
-                return_value=type("MockFunction", (), {
-                    "build_transaction": lambda self, opts: {"data": "0x1234"}
-                })(),
+            with patch(
+                "story_protocol_python_sdk.resources.IPAsset.encode_register",
+                return_value=bytes.fromhex("1234"),
             ):
-                with patch.object(
-                    ip_asset.registration_workflows_client.contract.functions,
-                    "registerIp",
-                    return_value=type("MockFunction", (), {
-                        "build_transaction": lambda self, opts: {"data": "0x5678"}
-                    })(),
+                with patch(
+                    "story_protocol_python_sdk.resources.IPAsset.encode_registerIp",
+                    return_value=bytes.fromhex("5678"),
                 ):
                     with patch.object(
                         ip_asset.web3.eth,
                         "get_transaction_receipt",
                         side_effect=[
-                            {
-                                "logs": [
-                                    {
-                                        "topics": [ip_asset.web3.keccak(text="IPRegistered(address,uint256,address,uint256,string,string,uint256)")],
-                                        "address": ip_asset.ip_asset_registry_client.contract.address,
-                                    }
-                                ]
-                            },
-                            {
-                                "logs": [
-                                    {
-                                        "topics": [ip_asset.web3.keccak(text="IPRegistered(address,uint256,address,uint256,string,string,uint256)")],
-                                        "address": ip_asset.ip_asset_registry_client.contract.address,
-                                    }
-                                ]
-                            },
+                            {"logs": [ip_registered_log(ADDRESS, ADDRESS, 4)]},
+                            {"logs": [ip_registered_log(IP_ID, ADDRESS, 3)]},
                         ],
                     ):
-                        with patch.object(
-                            ip_asset.ip_asset_registry_client.contract.events.IPRegistered,
-                            "process_log",
-                            side_effect=[
-                                {"args": {"ipId": ADDRESS, "tokenId": 4, "tokenContract": ADDRESS}},
-                                {"args": {"ipId": IP_ID, "tokenId": 3, "tokenContract": ADDRESS}},
-                            ],
-                        ):
-                            result = ip_asset.batch_register(
-                                args=[
-                                    {"nft_contract": ADDRESS, "token_id": 4},
-                                    {
-                                        "nft_contract": ADDRESS,
-                                        "token_id": 3,
-                                        "ip_metadata": {
-                                            "ip_metadata_uri": "test_uri",
-                                            "ip_metadata_hash": ZERO_HASH,
-                                        },
+                        result = ip_asset.batch_register(
+                            args=[
+                                {"nft_contract": ADDRESS, "token_id": 4},
+                                {
+                                    "nft_contract": ADDRESS,
+                                    "token_id": 3,
+                                    "ip_metadata": {
+                                        "ip_metadata_uri": "test_uri",
+                                        "ip_metadata_hash": ZERO_HASH,
                                     },
-                                ],
-                            )
-                            assert result["tx_hash"] == TX_HASH.hex()
-                            assert result["spg_tx_hash"] == TX_HASH.hex()
-                            assert len(result["results"]) == 2
+                                },
+                            ],
+                        )
+                        assert result["tx_hash"] == TX_HASH.hex()
+                        assert result["spg_tx_hash"] == TX_HASH.hex()
+                        assert len(result["results"]) == 2
 
     def test_batch_register_encoding_failure(
         self,
@@ -0,0 +1,14 @@
+import pytest
+
+import story_protocol_python_sdk
+
+
+@pytest.mark.parametrize("name", story_protocol_python_sdk.__all__)
+def test_public_names_resolve(name):
+    assert getattr(story_protocol_python_sdk, name) is not None
+    assert name in dir(story_protocol_python_sdk)
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError, match="has no attribute 'NotAName'"):
+        story_protocol_python_sdk.NotAName  # noqa: B018
@@ -0,0 +1,100 @@
+import importlib
+import os
+
+import pytest
+from web3 import Web3
+
+from story_protocol_python_sdk.utils import contract_registry
+from story_protocol_python_sdk.utils.abi_encoding import encode_call
+from tests.unit.fixtures.data import ADDRESS
+
+ABI_PACKAGE_DIR = os.path.dirname(contract_registry.ABI_DIR)
+
+
+def sample_value(param):
+    """Build an SDK-style argument for an ABI parameter: structs as dicts, bytes as hex."""
+    param_type = param["type"]
+    if param_type.endswith("]"):
+        item = {**param, "type": param_type[: param_type.rindex("[")]}
+        return [sample_value(item), sample_value(item)]
+    if param_type == "tuple":
+        return {
+            component["name"]: sample_value(component)
+            for component in param["components"]
+        }
+    if param_type == "address":
+        return ADDRESS
+    if param_type == "bool":
+        return True
+    if param_type == "string":
+        return "story"
+    if param_type == "bytes":
+        return "0x" + "ab" * 33
+    if param_type.startswith("bytes"):
+        return "0x" + "cd" * int(param_type[len("bytes") :])
+    return 7
+
+
+def encoder_cases():
+    for contract in contract_registry.load_config()["contracts"]:
+        name = contract["contract_name"]
+        if not os.path.exists(
+            os.path.join(ABI_PACKAGE_DIR, name, f"{name}_encoders.py")
+        ):
+            continue
+        module = importlib.import_module(
+            f"story_protocol_python_sdk.abi.{name}.{name}_encoders"
+        )
+        seen = {}
+        for item in contract_registry.load_abi(name):
+            if item["type"] != "function" or item["name"] not in contract["functions"]:
+                continue
+            count = seen.get(item["name"], 0)
+            seen[item["name"]] = count + 1
+            python_name = item["name"] + (str(count + 1) if count else "")
+            yield pytest.param(
+                name,
+                item,
+                getattr(module, f"encode_{python_name}"),
+                id=f"{name}.{python_name}",
+            )
+
+
+class TestGeneratedEncoders:
+    @pytest.mark.parametrize(
+        "contract_name, function_abi, encoder", list(encoder_cases())
+    )
+    def test_matches_web3_encoding(self, contract_name, function_abi, encoder):
+        contract = Web3().eth.contract(
+            address=contract_registry.get_contract_address(contract_name),
+            abi=[function_abi],
+        )
+        args = [sample_value(param) for param in function_abi["inputs"]]
+
+        assert Web3.to_hex(encoder(*args)) == contract.encode_abi(
+            function_abi["name"], args=args
+        )
+
+
+class TestEncodeCall:
+    def test_struct_as_tuple(self):
+        selector = bytes.fromhex("12345678")
+        types = ("(address,bytes32)",)
+        specs = (("tuple", (("owner", None), ("hash", "bytes"))),)
+
+        as_dict = encode_call(
+            selector, types, specs, ({"owner": ADDRESS, "hash": "0x" + "00" * 32},)
+        )
+        as_tuple = encode_call(selector, types, specs, ((ADDRESS, bytes(32)),))
+
+        assert as_dict == as_tuple
+        assert as_dict[:4] == selector
+
+    def test_missing_struct_field(self):
+        with pytest.raises(KeyError, match="hash"):
+            encode_call(
+                bytes(4),
+                ("(address,bytes32)",),
+                (("tuple", (("owner", None), ("hash", "bytes"))),),
+                ({"owner": ADDRESS},),
+            )
@@ -0,0 +1,270 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from story_protocol_python_sdk.utils.async_transaction_pipeline import (
+    get_receipt_collector,
+)
+from story_protocol_python_sdk.utils.async_transaction_utils import (
+    async_build_and_send_transaction,
+)
+from story_protocol_python_sdk.utils.nonce_manager import (
+    clear_nonce_managers,
+    get_async_nonce_manager,
+)
+from tests.unit.fixtures.data import ACCOUNT_ADDRESS
+
+
+class FakeAsyncChain:
+    """Sends transactions into a mempool that is only mined on ``mine()``."""
+
+    def __init__(self):
+        self.block_number = 0
+        self.mempool = []
+        self.receipts = {}
+        self.receipt_lookups = 0
+        self.block_receipt_lookups = 0
+
+    async def send_raw_transaction(self, raw_transaction):
+        tx_hash = HexBytes(len(self.mempool) + len(self.receipts) + 1)
+        self.mempool.append(tx_hash)
+        return tx_hash
+
+    async def get_transaction_receipt(self, tx_hash):
+        self.receipt_lookups += 1
+        if tx_hash not in self.receipts:
+            raise TransactionNotFound(f"{tx_hash.hex()} not found")
+        return self.receipts[tx_hash]
+
+    async def get_block_receipts(self, block_number):
+        self.block_receipt_lookups += 1
+        return [
+            receipt
+            for receipt in self.receipts.values()
+            if receipt["blockNumber"] == block_number
+        ]
+
+    async def get_block_number(self):
+        return self.block_number
+
+    def mine(self):
+        self.block_number += 1
+        for tx_hash in self.mempool:
+            self.receipts[tx_hash] = {
+                "status": 1,
+                "transactionHash": tx_hash,
+                "blockNumber": self.block_number,
+            }
+        self.mempool = []
+
+
+@pytest.fixture
+def chain():
+    return FakeAsyncChain()
+
+
+@pytest.fixture
+def web3(chain):
+    web3 = Mock(spec=AsyncWeb3)
+    web3.eth = Mock()
+    web3.eth.get_transaction_count = AsyncMock(return_value=5)
+    web3.eth.send_raw_transaction = AsyncMock(side_effect=chain.send_raw_transaction)
+    web3.eth.get_transaction_receipt = AsyncMock(
+        side_effect=chain.get_transaction_receipt
+    )
+    web3.eth.get_block_receipts = AsyncMock(side_effect=chain.get_block_receipts)
+    type(web3.eth).block_number = property(lambda _: chain.get_block_number())
+    get_receipt_collector(web3).poll_interval = 0.01
+    return web3
+
+
+@pytest.fixture
+def account():
+    account = Mock()
+    account.address = ACCOUNT_ADDRESS
+    account.sign_transaction = Mock(return_value=Mock(raw_transaction=b"signed"))
+    return account
+
+
+@pytest.fixture
+def client_function():
+    return AsyncMock(side_effect=lambda *args: args[-1])
+
+
+@pytest.fixture(autouse=True)
+def clear_managers():
+    clear_nonce_managers()
+    yield
+    clear_nonce_managers()
+
+
+async def mine_when_pending(chain, count):
+    while len(chain.mempool) < count:
+        await asyncio.sleep(0.01)
+    chain.mine()
+
+
+class TestAsyncBuildAndSendTransaction:
+    def test_concurrent_sends_get_consecutive_nonces(
+        self, web3, chain, account, client_function
+    ):
+        async def run():
+            sends = asyncio.gather(
+                *(
+                    async_build_and_send_transaction(web3, account, client_function)
+                    for _ in range(20)
+                )
+            )
+            _, responses = await asyncio.gather(mine_when_pending(chain, 20), sends)
+            return responses
+
+        responses = asyncio.run(run())
+
+        nonces = [call.args[-1]["nonce"] for call in client_function.call_args_list]
+        assert sorted(nonces) == list(range(5, 25))
+        web3.eth.get_transaction_count.assert_awaited_once_with(
+            ACCOUNT_ADDRESS, "pending"
+        )
+        assert all(response["tx_receipt"]["blockNumber"] == 1 for response in responses)
+        assert get_async_nonce_manager(web3, ACCOUNT_ADDRESS).in_flight == 0
+
+    def test_receipts_are_polled_once_per_block(
+        self, web3, chain, account, client_function
+    ):
+        async def run():
+            sends = asyncio.gather(
+                *(
+                    async_build_and_send_transaction(web3, account, client_function)
+                    for _ in range(3)
+                )
+            )
+            while chain.block_receipt_lookups < 1:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.1)
+            assert chain.block_receipt_lookups == 1
+            chain.mine()
+            await sends
+
+        asyncio.run(run())
+
+        assert chain.block_receipt_lookups == 2
+        assert chain.receipt_lookups == 0
+
+    def test_falls_back_to_receipt_lookups(self, web3, chain, account, client_function):
+        web3.eth.get_block_receipts.side_effect = ValueError(
+            "the method eth_getBlockReceipts does not exist"
+        )
+
+        async def run():
+            sends = asyncio.gather(
+                *(
+                    async_build_and_send_transaction(web3, account, client_function)
+                    for _ in range(3)
+                )
+            )
+            await mine_when_pending(chain, 3)
+            return await sends
+
+        responses = asyncio.run(run())
+
+        assert all(response["tx_receipt"]["status"] == 1 for response in responses)
+        assert get_receipt_collector(web3).block_receipts_supported is False
+
+    def test_without_waiting_for_receipt(self, web3, account, client_function):
+        response = asyncio.run(
+            async_build_and_send_transaction(
+                web3,
+                account,
+                client_function,
+                "0xabc",
+                tx_options={"wait_for_receipt": False},
+            )
+        )
+
+        assert response == {"tx_hash": HexBytes(1).hex()}
+        assert client_function.call_args.args[0] == "0xabc"
+        assert get_async_nonce_manager(web3, ACCOUNT_ADDRESS).in_flight == 0
+
+    def test_encoded_tx_data_only_does_not_allocate(
+        self, web3, account, client_function
+    ):
+        async def run():
+            encoded = await async_build_and_send_transaction(
+                web3, account, client_function, tx_options={"encodedTxDataOnly": True}
+            )
+            next_nonce = await get_async_nonce_manager(web3, ACCOUNT_ADDRESS).peek()
+            return encoded, next_nonce
+
+        encoded, next_nonce = asyncio.run(run())
+
+        assert encoded["encodedTxData"]["nonce"] == 5
+        assert next_nonce == 5
+        web3.eth.send_raw_transaction.assert_not_awaited()
+
+    def test_nonce_error_resyncs_and_retries(self, web3, account, client_function):
+        web3.eth.get_transaction_count.side_effect = [5, 9]
+        web3.eth.send_raw_transaction.side_effect = [
+            ValueError("nonce too low"),
+            HexBytes(1),
+        ]
+
+        asyncio.run(
+            async_build_and_send_transaction(
+                web3, account, client_function, tx_options={"wait_for_receipt": False}
+            )
+        )
+
+        nonces = [call.args[-1]["nonce"] for call in client_function.call_args_list]
+        assert nonces == [5, 9]
+
+    def test_failed_send_releases_nonce(self, web3, account, client_function):
+        web3.eth.send_raw_transaction.side_effect = ValueError("execution reverted")
+
+        async def run():
+            with pytest.raises(ValueError, match="execution reverted"):
+                await async_build_and_send_transaction(web3, account, client_function)
+            return await get_async_nonce_manager(web3, ACCOUNT_ADDRESS).peek()
+
+        assert asyncio.run(run()) == 5
+
+    def test_rpc_error_keeps_waiting(self, web3, chain, account, client_function):
+        errors = [ConnectionError("429 Too Many Requests")]
+
+        async def block_number():
+            if errors:
+                raise errors.pop()
+            return chain.block_number
+
+        type(web3.eth).block_number = property(lambda _: block_number())
+
+        async def run():
+            sends = asyncio.gather(
+                *(
+                    async_build_and_send_transaction(web3, account, client_function)
+                    for _ in range(3)
+                )
+            )
+            _, responses = await asyncio.gather(mine_when_pending(chain, 3), sends)
+            return responses
+
+        responses = asyncio.run(run())
+
+        assert all(response["tx_receipt"]["status"] == 1 for response in responses)
+        assert not errors
+        assert get_receipt_collector(web3).failures == 0
+
+    def test_receipt_timeout(self, web3, account, client_function):
+        with pytest.raises(TimeExhausted):
+            asyncio.run(
+                async_build_and_send_transaction(
+                    web3, account, client_function, tx_options={"timeout": 0.05}
+                )
+            )
+
+        assert get_receipt_collector(web3).pending == 0
+        assert get_async_nonce_manager(web3, ACCOUNT_ADDRESS).in_flight == 0
+        assert get_async_nonce_manager(web3, ACCOUNT_ADDRESS)._next_nonce is None
@@ -0,0 +1,231 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+from web3.providers import BaseProvider
+
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import (
+    IPAssetRegistryClient,
+)
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_encoders import (
+    encode_isRegistered,
+)
+from story_protocol_python_sdk.abi.PILicenseTemplate.PILicenseTemplate_client import (
+    PILicenseTemplateClient,
+)
+from story_protocol_python_sdk.story_client import StoryClient
+from story_protocol_python_sdk.utils.batch_reads import (
+    ReadBatch,
+    decode_client_read,
+    read_all,
+)
+from tests.unit.fixtures.data import ADDRESS, CHAIN_ID, IP_ID
+
+REGISTERED = "0x" + encode(["bool"], [True]).hex()
+IP_ID_RESULT = "0x" + encode(["address"], [IP_ID.lower()]).hex()
+
+
+class FakeProvider(BaseProvider):
+    """Answers every call with the next queued result."""
+
+    def __init__(self):
+        super().__init__()
+        self.results = []
+        self.requests = []
+        self.batches = []
+        self.batch_error = None
+
+    def make_request(self, method, params):
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 0, "result": hex(CHAIN_ID)}
+        self.requests.append((method, params))
+        return {
+            "jsonrpc": "2.0",
+            "id": len(self.requests),
+            "result": self.results.pop(0),
+        }
+
+    def make_batch_request(self, batch_requests):
+        self.batches.append(batch_requests)
+        if self.batch_error is not None:
+            return {"jsonrpc": "2.0", "id": None, "error": self.batch_error}
+        return [
+            {"jsonrpc": "2.0", "id": i, **result}
+            for i, result in enumerate(self.results.pop(0))
+        ]
+
+
+PROVIDER = FakeProvider()
+# Built at import time: other test modules patch IPAssetRegistryClient.__new__
+WEB3 = Web3(PROVIDER)
+REGISTRY_CLIENT = IPAssetRegistryClient(WEB3, CHAIN_ID)
+LICENSE_TEMPLATE_CLIENT = PILicenseTemplateClient(WEB3, CHAIN_ID)
+
+
+@pytest.fixture
+def provider():
+    PROVIDER.__init__()
+    return PROVIDER
+
+
+@pytest.fixture
+def registry():
+    return REGISTRY_CLIENT
+
+
+class TestReadBatch:
+    def test_reads_are_sent_as_one_batch(self, provider, registry):
+        provider.results = [[{"result": REGISTERED}, {"result": IP_ID_RESULT}]]
+
+        with ReadBatch(WEB3) as batch:
+            registered = batch.add(registry.isRegistered, IP_ID)
+            ip_id = batch.add(registry.ipId, CHAIN_ID, ADDRESS, 1)
+            assert not registered.done()
+
+        assert registered.result is True
+        assert ip_id.result == IP_ID
+        assert provider.requests == []
+        [calls] = provider.batches
+        assert [method for method, _ in calls] == ["eth_call", "eth_call"]
+        assert calls[0][1] == [
+            {
+                "to": registry.contract.address,
+                "data": "0x" + encode_isRegistered(IP_ID).hex(),
+            },
+            "latest",
+        ]
+
+    def test_large_batches_are_split(self, provider, registry):
+        provider.results = [[{"result": REGISTERED}] * 2, REGISTERED]
+
+        results = read_all(
+            WEB3, [(registry.isRegistered, (IP_ID,))] * 3, max_batch_size=2
+        )
+
+        assert results == [True] * 3
+        assert [len(calls) for calls in provider.batches] == [2]
+        # A lone read gains nothing from a batch
+        assert len(provider.requests) == 1
+
+    def test_failed_read_raises_on_its_result_only(self, provider, registry):
+        provider.results = [
+            [{"result": REGISTERED}, {"error": {"code": 3, "message": "reverted"}}]
+        ]
+
+        batch = ReadBatch(WEB3)
+        ok = batch.add(registry.isRegistered, IP_ID)
+        failed = batch.add(registry.isRegistered, ADDRESS)
+        with pytest.raises(ValueError, match="eth_call failed: reverted"):
+            batch.execute()
+
+        assert ok.result is True
+        with pytest.raises(ValueError, match="reverted"):
+            failed.result
+
+    def test_falls_back_to_single_calls_when_batches_are_rejected(
+        self, provider, registry
+    ):
+        provider.batch_error = {"code": -32600, "message": "batch requests disabled"}
+        provider.results = [REGISTERED] * 4
+
+        batch = ReadBatch(WEB3)
+        results = read_all(WEB3, [(registry.isRegistered, (IP_ID,))] * 2)
+        for _ in range(2):
+            batch.add(registry.isRegistered, IP_ID)
+
+        assert results == [True, True]
+        assert batch.execute() == [True, True]
+        assert batch.batch_supported is False
+        assert len(provider.batches) == 2
+        assert [method for method, _ in provider.requests] == ["eth_call"] * 4
+
+    @pytest.mark.parametrize(
+        "batch_error",
+        [
+            {"code": -32600, "message": "batch size too large"},
+            {"code": -32000, "message": "batch processing timed out"},
+        ],
+    )
+    def test_other_batch_errors_keep_batching(self, provider, registry, batch_error):
+        provider.batch_error = batch_error
+
+        batch = ReadBatch(WEB3)
+        for _ in range(2):
+            batch.add(registry.isRegistered, IP_ID)
+        with pytest.raises(ValueError, match="The batch request failed"):
+            batch.execute()
+
+        assert batch.batch_supported is None
+        assert provider.requests == []
+
+    def test_provider_without_batch_support(self, provider, registry):
+        provider.results = [REGISTERED] * 2
+
+        with patch.object(
+            FakeProvider, "make_batch_request", side_effect=NotImplementedError
+        ):
+            results = read_all(WEB3, [(registry.isRegistered, (IP_ID,))] * 2)
+
+        assert results == [True, True]
+        assert len(provider.requests) == 2
+
+    def test_decoding_matches_call(self, provider):
+        terms = (
+            True,
+            ADDRESS.lower(),
+            10,
+            0,
+            True,
+            False,
+            IP_ID.lower(),
+            b"\x01",
+            19,
+            0,
+            True,
+            True,
+            False,
+            True,
+            100,
+            ADDRESS.lower(),
+            "https://example.com",
+        )
+        data = encode(
+            [
+                "(bool,address,uint256,uint256,bool,bool,address,bytes,uint32,"
+                "uint256,bool,bool,bool,bool,uint256,address,string)"
+            ],
+            [terms],
+        )
+        provider.results = ["0x" + data.hex()]
+        get_license_terms = LICENSE_TEMPLATE_CLIENT.getLicenseTerms
+
+        decoded = decode_client_read(WEB3, get_license_terms, (1,), data)
+
+        assert decoded == get_license_terms(1)
+        assert decoded[1] == ADDRESS
+        assert decoded[6] == IP_ID
+
+    def test_result_before_execution(self, registry):
+        batch = ReadBatch(WEB3)
+        read = batch.add(registry.isRegistered, IP_ID)
+
+        with pytest.raises(ValueError, match="not executed yet"):
+            read.result
+
+    def test_only_generated_client_reads(self, registry):
+        batch = ReadBatch(WEB3)
+
+        with pytest.raises(ValueError, match="is not a read method"):
+            batch.add(registry.build_register_transaction, CHAIN_ID, ADDRESS, 1, {})
+        with pytest.raises(ValueError, match="is not a read method"):
+            batch.add(print)
+
+    def test_story_client_batch_reads(self):
+        client = StoryClient(WEB3, Mock(address=ADDRESS), CHAIN_ID)
+
+        batch = client.batch_reads(max_batch_size=10)
+
+        assert isinstance(batch, ReadBatch)
+        assert batch.web3 is WEB3
+        assert batch.max_batch_size == 10
@@ -0,0 +1,92 @@
+from unittest.mock import Mock, patch
+
+from web3 import Web3
+
+from story_protocol_python_sdk.utils.batch_results import BatchResults
+from story_protocol_python_sdk.utils.receipt_decoder import EventDecoder
+from tests.unit.fixtures.data import (
+    ADDRESS,
+    IP_ID,
+    ip_registered_log,
+    ip_royalty_vault_deployed_log,
+    license_terms_attached_log,
+)
+
+OTHER_IP_ID = "0x2222222222222222222222222222222222222222"
+ROYALTY_VAULT = "0x3333333333333333333333333333333333333333"
+
+
+def batch_results(logs) -> BatchResults:
+    return BatchResults(
+        Mock(to_checksum_address=Web3.to_checksum_address), {"logs": logs}
+    )
+
+
+class TestBatchResults:
+    def test_build(self):
+        batch = batch_results(
+            [
+                ip_registered_log(IP_ID, ADDRESS, 1),
+                license_terms_attached_log(IP_ID, 5),
+                ip_royalty_vault_deployed_log(IP_ID, ROYALTY_VAULT),
+                ip_registered_log(OTHER_IP_ID, ADDRESS, 2),
+                license_terms_attached_log(OTHER_IP_ID, 6),
+                license_terms_attached_log(IP_ID, 7),
+            ]
+        )
+
+        assert batch.build(
+            nft_contract_key="spg_nft_contract",
+            license_terms_ids=True,
+            royalty_vault=True,
+        ) == [
+            {
+                "ip_id": IP_ID,
+                "token_id": 1,
+                "spg_nft_contract": ADDRESS,
+                "license_terms_ids": [5, 7],
+                "royalty_vault": ROYALTY_VAULT,
+            },
+            {
+                "ip_id": OTHER_IP_ID,
+                "token_id": 2,
+                "spg_nft_contract": ADDRESS,
+                "license_terms_ids": [6],
+                "royalty_vault": None,
+            },
+        ]
+        assert batch.build() == [
+            {"ip_id": IP_ID, "token_id": 1, "nft_contract": ADDRESS},
+            {"ip_id": OTHER_IP_ID, "token_id": 2, "nft_contract": ADDRESS},
+        ]
+
+    def test_lookups_ignore_address_case(self):
+        batch = batch_results(
+            [
+                license_terms_attached_log(IP_ID, 5),
+                ip_royalty_vault_deployed_log(IP_ID, ROYALTY_VAULT),
+            ]
+        )
+
+        assert batch.license_terms_ids(IP_ID.lower()) == [5]
+        assert batch.royalty_vault(IP_ID.lower()) == ROYALTY_VAULT
+        assert batch.license_terms_ids(OTHER_IP_ID) == []
+
+    def test_each_log_is_decoded_once(self):
+        ip_ids = [f"0x{index:040x}" for index in range(1, 21)]
+        logs = []
+        for token_id, ip_id in enumerate(ip_ids):
+            logs += [
+                ip_registered_log(ip_id, ADDRESS, token_id),
+                license_terms_attached_log(ip_id, token_id),
+            ]
+
+        with patch.object(
+            EventDecoder, "decode", autospec=True, side_effect=EventDecoder.decode
+        ) as decode:
+            results = batch_results(logs).build(license_terms_ids=True)
+
+        assert [result["license_terms_ids"] for result in results] == [
+            [token_id] for token_id in range(len(ip_ids))
+        ]
+        assert decode.call_count == len(logs)
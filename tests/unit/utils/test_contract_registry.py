@@ -0,0 +1,248 @@
+import json
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+from eth_utils.abi import abi_to_signature
+from web3 import Web3
+
+from story_protocol_python_sdk.abi.IPAccountImpl.IPAccountImpl_client import (
+    IPAccountImplClient,
+)
+from story_protocol_python_sdk.abi.LicensingModule.LicensingModule_client import (
+    LicensingModuleClient,
+)
+from story_protocol_python_sdk.abi.SPGNFTImpl.SPGNFTImpl_client import SPGNFTImplClient
+from story_protocol_python_sdk.utils import contract_registry
+from tests.unit.fixtures.data import ADDRESS
+
+
+@pytest.fixture
+def web3():
+    web3 = Mock(spec=Web3)
+    web3.eth = Mock()
+    web3.eth.contract = Mock(side_effect=lambda **kwargs: Mock(**kwargs))
+    return web3
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    contract_registry.clear_cache()
+    yield
+    contract_registry.clear_cache()
+
+
+class TestLoadAbi:
+    def test_abi_comes_from_bundle(self):
+        with patch.object(contract_registry.json, "load") as mock_json_load:
+            first = contract_registry.load_abi("LicensingModule")
+            second = contract_registry.load_abi("LicensingModule")
+
+        assert first is second
+        assert first is contract_registry.load_abi_bundle()["abis"]["LicensingModule"]
+        mock_json_load.assert_not_called()
+
+    def test_missing_abi(self):
+        with pytest.raises(FileNotFoundError):
+            contract_registry.load_abi("NotAContract")
+
+    def test_falls_back_to_json_without_bundle(self):
+        with patch.object(
+            contract_registry, "ABI_BUNDLE_PATH", "/nonexistent/abi_bundle.pickle"
+        ):
+            abi = contract_registry.load_abi("LicensingModule")
+            topics = contract_registry.get_event_topics("IPAssetRegistry")
+
+        assert "attachLicenseTerms" in {item.get("name") for item in abi}
+        assert (
+            topics[
+                "IPRegistered(address,uint256,address,uint256,string,string,uint256)"
+            ]
+            == "0x02ad3a2e0356b65fdfe4a73c825b78071ae469db35162978518b8c258abb3767"
+        )
+
+
+class TestAbiBundle:
+    @pytest.mark.parametrize(
+        "contract_name",
+        [
+            file_name[: -len(".json")]
+            for file_name in sorted(os.listdir(contract_registry.ABI_DIR))
+            if file_name.endswith(".json")
+        ],
+    )
+    def test_bundle_matches_json(self, contract_name):
+        with open(
+            os.path.join(contract_registry.ABI_DIR, f"{contract_name}.json")
+        ) as abi_file:
+            abi = json.load(abi_file)
+
+        def signatures(abi, abi_type):
+            return {abi_to_signature(item) for item in abi if item["type"] == abi_type}
+
+        bundle = contract_registry.load_abi_bundle()
+        bundled_abi = bundle["abis"][contract_name]
+        for abi_type in ("function", "event", "error"):
+            assert signatures(bundled_abi, abi_type) == signatures(abi, abi_type)
+        assert bundle["function_selectors"][contract_name] == {
+            signature: Web3.keccak(text=signature)[:4].to_0x_hex()
+            for signature in signatures(abi, "function")
+        }
+        assert bundle["event_topics"][contract_name] == {
+            signature: Web3.keccak(text=signature).to_0x_hex()
+            for signature in signatures(abi, "event")
+        }
+
+
+@pytest.fixture
+def config_with_mainnet_override():
+    config = {
+        "contracts": [
+            {
+                "contract_name": "LicensingModule",
+                "contract_address": "0x04fbd8a2e56dd85cfd5500a4a4dfa955b9f1de6f",
+                "chain_addresses": {
+                    "1514": "0x1111111111111111111111111111111111111111"
+                },
+                "functions": [],
+            }
+        ]
+    }
+    with patch.object(contract_registry, "load_config", return_value=config):
+        yield
+
+
+class TestGetContractAddress:
+    def test_address_from_config(self):
+        assert contract_registry.get_contract_address("Multicall3") == (
+            "0xcA11bde05977b3631167028862bE2a173976CA11"
+        )
+
+    def test_address_not_found(self):
+        with pytest.raises(
+            ValueError,
+            match="Contract address for NotAContract not found in config.json",
+        ):
+            contract_registry.get_contract_address("NotAContract")
+
+    def test_addresses_are_checksummed(self, config_with_mainnet_override):
+        assert contract_registry.get_contract_address("LicensingModule") == (
+            "0x04fbd8a2e56dd85CFD5500A4A4DfA955B9f1dE6f"
+        )
+
+    def test_chain_override(self, config_with_mainnet_override):
+        assert contract_registry.get_contract_address("LicensingModule", 1514) == (
+            "0x1111111111111111111111111111111111111111"
+        )
+        assert contract_registry.get_contract_address("LicensingModule", 1315) == (
+            "0x04fbd8a2e56dd85CFD5500A4A4DfA955B9f1dE6f"
+        )
+
+    def test_address_book_is_built_once_per_chain(self):
+        with patch.object(
+            contract_registry.json, "load", wraps=json.load
+        ) as mock_json_load:
+            aeneid = contract_registry.get_address_book(1315)
+            mainnet = contract_registry.get_address_book(1514)
+
+            assert contract_registry.get_address_book(1315) is aeneid
+            assert contract_registry.get_address_book(1514) is mainnet
+        assert mock_json_load.call_count == 1
+
+
+class TestGetContract:
+    def test_contract_is_shared_per_web3(self, web3):
+        first = LicensingModuleClient(web3)
+        second = LicensingModuleClient(web3)
+
+        assert first.contract is second.contract
+        web3.eth.contract.assert_called_once_with(
+            address=contract_registry.get_contract_address("LicensingModule"),
+            abi=contract_registry.load_abi("LicensingModule"),
+        )
+
+    def test_contract_is_not_shared_across_web3(self, web3):
+        other_web3 = Mock(spec=Web3)
+        other_web3.eth = Mock()
+
+        assert (
+            LicensingModuleClient(web3).contract
+            is not LicensingModuleClient(other_web3).contract
+        )
+
+    def test_contract_is_cached_per_chain(self, web3, config_with_mainnet_override):
+        aeneid = LicensingModuleClient(web3, 1315)
+        mainnet = LicensingModuleClient(web3, 1514)
+
+        assert aeneid.contract is not mainnet.contract
+        assert aeneid.contract is LicensingModuleClient(web3, 1315).contract
+        assert mainnet.contract.address == "0x1111111111111111111111111111111111111111"
+
+    def test_impl_contract_is_bound_to_address(self, web3):
+        client = IPAccountImplClient(web3, contract_address=ADDRESS)
+
+        assert client.contract.address == ADDRESS
+        assert client.contract.abi is contract_registry.load_abi("IPAccountImpl")
+
+
+class TestContractPool:
+    def test_impl_contract_is_pooled(self, web3):
+        first = IPAccountImplClient(web3, contract_address=ADDRESS)
+        second = IPAccountImplClient(web3, contract_address=ADDRESS.lower())
+
+        assert first.contract is second.contract
+        assert web3.eth.contract.call_count == 1
+        assert contract_registry.get_contract_pool(web3).stats() == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "max_size": contract_registry.CONTRACT_POOL_SIZE,
+        }
+
+    def test_pool_is_keyed_by_contract_name(self, web3):
+        ip_account = IPAccountImplClient(web3, contract_address=ADDRESS)
+        spg_nft = SPGNFTImplClient(web3, contract_address=ADDRESS)
+
+        assert ip_account.contract is not spg_nft.contract
+        assert spg_nft.contract.abi is contract_registry.load_abi("SPGNFTImpl")
+
+    def test_unbound_contract_is_not_pooled(self, web3):
+        IPAccountImplClient(web3)
+        IPAccountImplClient(web3)
+
+        assert web3.eth.contract.call_count == 2
+        assert len(contract_registry.get_contract_pool(web3)) == 0
+
+    def test_least_recently_used_contract_is_evicted(self, web3):
+        pool = contract_registry.ContractPool(web3, max_size=2)
+        addresses = [f"0x{index:040x}" for index in range(3)]
+
+        first = pool.get("IPAccountImpl", addresses[0])
+        pool.get("IPAccountImpl", addresses[1])
+        assert pool.get("IPAccountImpl", addresses[0]) is first
+        pool.get("IPAccountImpl", addresses[2])
+
+        assert len(pool) == 2
+        assert pool.get("IPAccountImpl", addresses[0]) is first
+        assert pool.stats()["misses"] == 3
+        pool.get("IPAccountImpl", addresses[1])
+        assert pool.stats() == {"hits": 2, "misses": 4, "size": 2, "max_size": 2}
+
+    def test_invalid_pool_size(self, web3):
+        with pytest.raises(
+            ValueError, match="The contract pool size must be at least 1."
+        ):
+            contract_registry.ContractPool(web3, max_size=0)
+
+    def test_clear(self, web3):
+        pool = contract_registry.get_contract_pool(web3)
+        pool.get("IPAccountImpl", ADDRESS)
+
+        pool.clear()
+
+        assert pool.stats() == {
+            "hits": 0,
+            "misses": 0,
+            "size": 0,
+            "max_size": contract_registry.CONTRACT_POOL_SIZE,
+        }
@@ -3,31 +3,26 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pytest import raises
 
-from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import (
-    IPAssetRegistryClient,
+from story_protocol_python_sdk.utils.constants import (
+    MAINNET_CHAIN_ID,
+    MAX_ROYALTY_TOKEN,
 )
-from story_protocol_python_sdk.abi.LicenseRegistry.LicenseRegistry_client import (
-    LicenseRegistryClient,
-)
-from story_protocol_python_sdk.abi.PILicenseTemplate.PILicenseTemplate_client import (
-    PILicenseTemplateClient,
-)
-from story_protocol_python_sdk.utils.constants import MAX_ROYALTY_TOKEN
 from story_protocol_python_sdk.utils.derivative_data import (
     DerivativeData,
     DerivativeDataInput,
 )
 from tests.unit.fixtures.data import ADDRESS, IP_ID
 
+pytestmark = pytest.mark.usefixtures("sequential_derivative_data_reads")
+
 
 @pytest.fixture(scope="module")
 def mock_ip_asset_registry_client():
     """Fixture to mock IPAssetRegistryClient"""
 
     def _mock_ip_registered(is_registered=True):
-        return patch.object(
-            IPAssetRegistryClient,
-            "__new__",
+        return patch(
+            "story_protocol_python_sdk.utils.derivative_data.IPAssetRegistryClient",
             return_value=MagicMock(isRegistered=MagicMock(return_value=is_registered)),
         )
 
@@ -41,9 +36,8 @@ def mock_license_registry_client():
     def _mock_license_registry_client(
         has_ip_attached_license_terms=True, get_royalty_percent=10
     ):
-        return patch.object(
-            LicenseRegistryClient,
-            "__new__",
+        return patch(
+            "story_protocol_python_sdk.utils.derivative_data.LicenseRegistryClient",
             return_value=MagicMock(
                 hasIpAttachedLicenseTerms=MagicMock(
                     return_value=has_ip_attached_license_terms
@@ -63,9 +57,8 @@ def mock_pi_license_template_client():
         mock_instance = MagicMock()
         mock_instance.contract = MagicMock()
         mock_instance.contract.address = ADDRESS
-        return patch.object(
-            PILicenseTemplateClient,
-            "__new__",
+        return patch(
+            "story_protocol_python_sdk.utils.derivative_data.PILicenseTemplateClient",
             return_value=mock_instance,
         )
 
@@ -215,6 +208,67 @@ class TestValidateParentIpIdsAndLicenseTermsIds:
             )
             assert derivative_data.max_revenue_share == MAX_ROYALTY_TOKEN
 
+    def test_validate_all_parents_with_one_aggregate_call(
+        self,
+        mock_web3,
+        mock_ip_asset_registry_client,
+        mock_license_registry_client,
+        sequential_derivative_data_reads,
+    ):
+        with mock_ip_asset_registry_client(), mock_license_registry_client():
+            first = DerivativeData.from_input(
+                web3=mock_web3,
+                input_data=DerivativeDataInput(
+                    parent_ip_ids=[IP_ID, ADDRESS, IP_ID],
+                    license_terms_ids=[1, 2, 3],
+                ),
+            )
+            second = DerivativeData.from_input(
+                web3=mock_web3,
+                input_data=DerivativeDataInput(
+                    parent_ip_ids=[IP_ID], license_terms_ids=[1]
+                ),
+            )
+            mainnet = DerivativeData.from_input(
+                web3=mock_web3,
+                input_data=DerivativeDataInput(
+                    parent_ip_ids=[IP_ID], license_terms_ids=[1]
+                ),
+                chain_id=MAINNET_CHAIN_ID,
+            )
+
+        first_reads = sequential_derivative_data_reads.call_args_list[0].args[1]
+        assert len(first_reads) == 9
+        assert sequential_derivative_data_reads.call_count == 3
+        assert first.license_registry_client is second.license_registry_client
+        assert first.multicall3_client is second.multicall3_client
+        assert mainnet.multicall3_client is not first.multicall3_client
+
+    def test_validate_royalty_percent_read_fails(
+        self,
+        mock_web3,
+        mock_ip_asset_registry_client,
+        mock_license_registry_client,
+        sequential_derivative_data_reads,
+    ):
+        sequential_derivative_data_reads.side_effect = None
+        sequential_derivative_data_reads.return_value = [
+            (True, True),
+            (True, True),
+            (False, None),
+        ]
+        with mock_ip_asset_registry_client(), mock_license_registry_client():
+            with raises(
+                ValueError,
+                match=f"Failed to get the royalty percent of license terms id 2 of the parent ipId {IP_ID}.",
+            ):
+                DerivativeData.from_input(
+                    web3=mock_web3,
+                    input_data=DerivativeDataInput(
+                        parent_ip_ids=[IP_ID], license_terms_ids=[2]
+                    ),
+                )
+
 
 class TestValidateMaxMintingFee:
     def test_validate_max_minting_fee_is_less_than_0(
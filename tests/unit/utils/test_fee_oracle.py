@@ -0,0 +1,202 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from web3 import AsyncWeb3, Web3
+
+from story_protocol_python_sdk.utils.fee_oracle import (
+    AsyncFeeOracle,
+    FeeOracle,
+    FeeStrategy,
+    clear_fee_oracles,
+    resolve_fee_strategy,
+)
+from story_protocol_python_sdk.utils.nonce_manager import clear_nonce_managers
+from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
+from tests.unit.fixtures.data import ACCOUNT_ADDRESS
+
+GWEI = 10**9
+
+FEE_HISTORY = {
+    "oldestBlock": 91,
+    "baseFeePerGas": [10 * GWEI] * 10 + [12 * GWEI],
+    "gasUsedRatio": [0.5, 0.5, 0.5, 0.0, 0.5],
+    "reward": [[1 * GWEI], [3 * GWEI], [2 * GWEI], [0], [5 * GWEI]],
+}
+
+
+@pytest.fixture
+def web3():
+    web3 = Mock(spec=Web3)
+    web3.eth = Mock()
+    web3.eth.block_number = 100
+    web3.eth.fee_history = Mock(return_value=FEE_HISTORY)
+    web3.eth.max_priority_fee = 7 * GWEI
+    web3.eth.get_transaction_count = Mock(return_value=0)
+    web3.eth.send_raw_transaction = Mock(
+        return_value=Mock(hex=Mock(return_value="0x1"))
+    )
+    return web3
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    clear_fee_oracles()
+    clear_nonce_managers()
+    yield
+    clear_fee_oracles()
+    clear_nonce_managers()
+
+
+class TestFeeStrategy:
+    def test_standard_pays_median_tip_of_non_empty_blocks(self, web3):
+        fees = FeeOracle(web3).get_fees("standard")
+
+        assert fees.block_number == 100
+        assert fees.base_fee_per_gas == 12 * GWEI
+        assert fees.max_priority_fee_per_gas == 3 * GWEI
+        assert fees.max_fee_per_gas == 27 * GWEI
+        web3.eth.fee_history.assert_called_once_with(10, 100, [50])
+
+    def test_economy_leaves_less_base_fee_headroom(self, web3):
+        fees = FeeOracle(web3).get_fees("economy")
+
+        assert fees.max_fee_per_gas == 15 * GWEI + fees.max_priority_fee_per_gas
+        web3.eth.fee_history.assert_called_once_with(10, 100, [10])
+
+    def test_percentile_strategy(self, web3):
+        strategy = FeeStrategy.percentile(75)
+
+        FeeOracle(web3).get_fees(strategy)
+
+        assert strategy.name == "p75"
+        web3.eth.fee_history.assert_called_once_with(10, 100, [75])
+
+    def test_falls_back_to_max_priority_fee_without_tips(self, web3):
+        web3.eth.fee_history.return_value = {
+            **FEE_HISTORY,
+            "gasUsedRatio": [0.0] * 5,
+        }
+
+        fees = FeeOracle(web3).get_fees()
+
+        assert fees.max_priority_fee_per_gas == 7 * GWEI
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError, match="Unknown fee strategy: turbo"):
+            resolve_fee_strategy("turbo")
+
+    def test_invalid_percentile(self):
+        with pytest.raises(ValueError, match="between 0 and 100"):
+            FeeStrategy.percentile(101)
+
+
+class TestFeeOracle:
+    def test_fees_are_looked_up_once_per_block(self, web3):
+        oracle = FeeOracle(web3, block_number_max_age=0)
+
+        first = oracle.get_fees()
+        assert oracle.get_fees() is first
+        web3.eth.block_number = 101
+        second = oracle.get_fees()
+
+        assert second.block_number == 101
+        assert web3.eth.fee_history.call_count == 2
+
+    def test_block_number_is_trusted_for_max_age(self, web3):
+        oracle = FeeOracle(web3, block_number_max_age=60)
+        oracle.get_fees()
+        web3.eth.block_number = 101
+
+        assert oracle.get_fees().block_number == 100
+        oracle.invalidate()
+        assert oracle.get_fees().block_number == 101
+
+    def test_async_oracle_shares_one_lookup(self):
+        web3 = Mock(spec=AsyncWeb3)
+        web3.eth = Mock()
+        web3.eth.fee_history = AsyncMock(return_value=FEE_HISTORY)
+        type(web3.eth).block_number = property(lambda _: asyncio.sleep(0, 100))
+        oracle = AsyncFeeOracle(web3)
+
+        async def run():
+            return await asyncio.gather(*(oracle.get_fees() for _ in range(10)))
+
+        estimates = asyncio.run(run())
+
+        assert all(estimate is estimates[0] for estimate in estimates)
+        web3.eth.fee_history.assert_awaited_once()
+
+
+class TestTransactionFees:
+    @pytest.fixture
+    def account(self):
+        account = Mock()
+        account.address = ACCOUNT_ADDRESS
+        return account
+
+    @pytest.fixture
+    def client_function(self):
+        return Mock(side_effect=lambda opts: opts)
+
+    def test_sends_in_one_block_share_one_fee_lookup(
+        self, web3, account, client_function
+    ):
+        for _ in range(5):
+            build_and_send_transaction(
+                web3, account, client_function, tx_options={"wait_for_receipt": False}
+            )
+
+        web3.eth.fee_history.assert_called_once()
+        for call in client_function.call_args_list:
+            assert call.args[-1]["maxFeePerGas"] == 27 * GWEI
+            assert call.args[-1]["maxPriorityFeePerGas"] == 3 * GWEI
+
+    def test_fee_strategy_option(self, web3, account, client_function):
+        build_and_send_transaction(
+            web3,
+            account,
+            client_function,
+            tx_options={"wait_for_receipt": False, "feeStrategy": "fast"},
+        )
+
+        web3.eth.fee_history.assert_called_once_with(10, 100, [90])
+
+    def test_caller_gas_price_skips_lookup(self, web3, account, client_function):
+        web3.to_wei = Mock(side_effect=lambda value, unit: value * GWEI)
+
+        build_and_send_transaction(
+            web3,
+            account,
+            client_function,
+            tx_options={"wait_for_receipt": False, "gasPrice": 20},
+        )
+
+        web3.eth.fee_history.assert_not_called()
+        assert client_function.call_args.args[-1]["gasPrice"] == 20 * GWEI
+        assert "maxFeePerGas" not in client_function.call_args.args[-1]
+
+    def test_replacement_bumps_oracle_fees(self, web3, account, client_function):
+        web3.eth.send_raw_transaction.side_effect = [
+            Exception("transaction underpriced"),
+            Mock(hex=Mock(return_value="0x1")),
+        ]
+
+        with patch("story_protocol_python_sdk.utils.transaction_utils.time.sleep"):
+            build_and_send_transaction(
+                web3, account, client_function, tx_options={"wait_for_receipt": False}
+            )
+
+        opts = client_function.call_args.args[-1]
+        assert opts["maxFeePerGas"] == int(27 * GWEI * 1.2)
+        assert opts["maxPriorityFeePerGas"] == int(3 * GWEI * 1.2)
+        assert "gasPrice" not in opts
+
+    def test_lookup_failure_leaves_fees_to_web3(self, web3, account, client_function):
+        web3.eth.fee_history.side_effect = ValueError("method not found")
+
+        build_and_send_transaction(
+            web3, account, client_function, tx_options={"wait_for_receipt": False}
+        )
+
+        assert "maxFeePerGas" not in client_function.call_args.args[-1]
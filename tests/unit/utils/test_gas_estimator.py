@@ -0,0 +1,181 @@
+from unittest.mock import Mock
+
+import pytest
+from web3 import Web3
+
+from story_protocol_python_sdk.utils.fee_oracle import clear_fee_oracles
+from story_protocol_python_sdk.utils.gas_estimator import (
+    GasEstimateCache,
+    disable_gas_estimate_cache,
+    enable_gas_estimate_cache,
+    get_gas_estimate_cache,
+)
+from story_protocol_python_sdk.utils.nonce_manager import clear_nonce_managers
+from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
+from tests.unit.fixtures.data import ACCOUNT_ADDRESS, ADDRESS
+
+
+class FakeWorkflowsClient:
+    """Records the options each transaction is built with."""
+
+    def __init__(self):
+        self.contract = Mock(address=ADDRESS)
+        self.built = []
+
+    def build_registerIp_transaction(self, nft_contract, ip_metadata, tx_options):
+        self.built.append(tx_options)
+        return tx_options
+
+
+@pytest.fixture
+def web3():
+    web3 = Mock(spec=Web3)
+    web3.eth = Mock()
+    web3.eth.get_transaction_count = Mock(return_value=0)
+    web3.eth.fee_history = Mock(side_effect=ValueError("not supported"))
+    web3.eth.send_raw_transaction = Mock(
+        return_value=Mock(hex=Mock(return_value="0x1"))
+    )
+    web3.eth.wait_for_transaction_receipt = Mock(
+        return_value={"status": 1, "gasUsed": 100_000, "logs": []}
+    )
+    return web3
+
+
+@pytest.fixture
+def account():
+    account = Mock()
+    account.address = ACCOUNT_ADDRESS
+    return account
+
+
+@pytest.fixture
+def client():
+    return FakeWorkflowsClient()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    clear_fee_oracles()
+    clear_nonce_managers()
+    yield
+    clear_fee_oracles()
+    clear_nonce_managers()
+
+
+def register(web3, account, client, metadata_uri="ipfs://a", tx_options=None):
+    return build_and_send_transaction(
+        web3,
+        account,
+        client.build_registerIp_transaction,
+        ADDRESS,
+        {"ipMetadataURI": metadata_uri, "ipMetadataHash": b"\x00" * 32},
+        tx_options=tx_options,
+    )
+
+
+class TestGasEstimateCache:
+    def test_key_ignores_scalar_values(self, client):
+        key = GasEstimateCache.key_for(
+            client.build_registerIp_transaction, (ADDRESS, [1, 2], 7)
+        )
+
+        assert key == GasEstimateCache.key_for(
+            client.build_registerIp_transaction, (ADDRESS, [3, 4], 8)
+        )
+        assert key != GasEstimateCache.key_for(
+            client.build_registerIp_transaction, (ADDRESS, [1, 2, 3], 7)
+        )
+        assert key[:2] == (ADDRESS.lower(), "build_registerIp_transaction")
+
+    def test_unbound_function_has_no_key(self):
+        assert GasEstimateCache.key_for(Mock(), ()) is None
+
+    def test_keeps_largest_usage_with_margin(self):
+        cache = GasEstimateCache(margin=0.5)
+        cache.record(("key",), 100)
+        cache.record(("key",), 80)
+
+        assert cache.gas_limit(("key",)) == 150
+        assert cache.gas_limit(("other",)) is None
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "max_size": 1024}
+
+    def test_evicts_least_recently_used(self):
+        cache = GasEstimateCache(max_size=2)
+        cache.record(("a",), 1)
+        cache.record(("b",), 1)
+        cache.gas_limit(("a",))
+        cache.record(("c",), 1)
+
+        assert cache.gas_limit(("b",)) is None
+        assert len(cache) == 2
+
+    def test_invalid_margin(self):
+        with pytest.raises(ValueError, match="must not be negative"):
+            GasEstimateCache(margin=-0.1)
+
+
+class TestBuildAndSendWithGasCache:
+    def test_disabled_by_default(self, web3, account, client):
+        register(web3, account, client)
+        register(web3, account, client)
+
+        assert get_gas_estimate_cache(web3) is None
+        assert all("gas" not in options for options in client.built)
+
+    def test_repeat_call_skips_estimation(self, web3, account, client):
+        enable_gas_estimate_cache(web3, margin=0.2)
+
+        register(web3, account, client)
+        register(web3, account, client)
+
+        assert "gas" not in client.built[0]
+        assert client.built[1]["gas"] == 120_000
+
+    def test_different_shape_is_estimated(self, web3, account, client):
+        enable_gas_estimate_cache(web3)
+
+        register(web3, account, client)
+        register(web3, account, client, metadata_uri="ipfs://" + "a" * 64)
+
+        assert all("gas" not in options for options in client.built)
+
+    def test_explicit_gas_wins(self, web3, account, client):
+        enable_gas_estimate_cache(web3)
+
+        register(web3, account, client)
+        register(web3, account, client, tx_options={"gas": 42})
+
+        assert client.built[1]["gas"] == 42
+
+    def test_revert_with_cached_limit_resends_with_estimate(
+        self, web3, account, client
+    ):
+        enable_gas_estimate_cache(web3, margin=0)
+        register(web3, account, client)
+        web3.eth.wait_for_transaction_receipt.side_effect = [
+            {"status": 0, "gasUsed": 100_000, "logs": []},
+            {"status": 1, "gasUsed": 130_000, "logs": []},
+        ]
+
+        response = register(web3, account, client)
+
+        assert response["tx_receipt"]["status"] == 1
+        assert [options.get("gas") for options in client.built] == [
+            None,
+            100_000,
+            None,
+        ]
+        assert [options["nonce"] for options in client.built] == [0, 1, 2]
+        web3.eth.wait_for_transaction_receipt.side_effect = None
+        register(web3, account, client)
+        assert client.built[-1]["gas"] == 130_000
+
+    def test_disable(self, web3, account, client):
+        enable_gas_estimate_cache(web3)
+        register(web3, account, client)
+        disable_gas_estimate_cache(web3)
+
+        register(web3, account, client)
+
+        assert "gas" not in client.built[1]
@@ -0,0 +1,166 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from eth_abi import encode
+from eth_utils import keccak, to_bytes, to_checksum_address
+from web3 import AsyncWeb3, Web3
+
+from story_protocol_python_sdk.resources.AsyncIPAsset import AsyncIPAsset
+from story_protocol_python_sdk.resources.IPAsset import IPAsset
+from story_protocol_python_sdk.utils.constants import MAINNET_CHAIN_ID
+from story_protocol_python_sdk.utils.ip_id_derivation import (
+    IpIdDeriver,
+    async_enable_ip_id_derivation,
+    disable_ip_id_derivation,
+    enable_ip_id_derivation,
+    get_ip_id_deriver,
+)
+from tests.unit.fixtures.data import ADDRESS, CHAIN_ID
+
+ERC6551_REGISTRY = "0x000000006551c19487814612e58FE06813775758"
+IP_ACCOUNT_IMPL = "0xc93d49fEdED1A2fbE3B54223Df65f4edB3845eb0"
+SALT = b"\x00" * 31 + b"\x01"
+
+
+def reference_ip_id(chain_id, token_contract, token_id):
+    """ERC6551Registry.account, spelled out."""
+    bytecode = (
+        bytes.fromhex("3d60ad80600a3d3981f3363d3d373d3d3d363d73")
+        + to_bytes(hexstr=IP_ACCOUNT_IMPL)
+        + bytes.fromhex("5af43d82803e903d91602b57fd5bf3")
+        + encode(
+            ["bytes32", "uint256", "address", "uint256"],
+            [SALT, chain_id, token_contract, token_id],
+        )
+    )
+    create2 = b"\xff" + to_bytes(hexstr=ERC6551_REGISTRY) + SALT + keccak(bytecode)
+    return to_checksum_address(keccak(create2)[12:])
+
+
+def registry_client(ip_id=reference_ip_id):
+    client = MagicMock()
+    client.contract.address = ADDRESS
+    client.contract.functions.ERC6551_PUBLIC_REGISTRY.return_value.call.return_value = (
+        ERC6551_REGISTRY
+    )
+    client.contract.functions.IP_ACCOUNT_IMPL.return_value.call.return_value = (
+        IP_ACCOUNT_IMPL
+    )
+    client.contract.functions.IP_ACCOUNT_SALT.return_value.call.return_value = SALT
+    client.ipId = Mock(side_effect=ip_id)
+    return client
+
+
+def async_registry_client():
+    client = MagicMock()
+    client.contract.address = ADDRESS
+    functions = client.contract.functions
+    functions.ERC6551_PUBLIC_REGISTRY.return_value.call = AsyncMock(
+        return_value=ERC6551_REGISTRY
+    )
+    functions.IP_ACCOUNT_IMPL.return_value.call = AsyncMock(
+        return_value=IP_ACCOUNT_IMPL
+    )
+    functions.IP_ACCOUNT_SALT.return_value.call = AsyncMock(return_value=SALT)
+    client.ipId = AsyncMock(side_effect=reference_ip_id)
+    return client
+
+
+@pytest.fixture
+def deriver():
+    return IpIdDeriver(ERC6551_REGISTRY, IP_ACCOUNT_IMPL, "0x" + SALT.hex())
+
+
+class TestIpIdDeriver:
+    def test_derives_the_erc6551_account_address(self, deriver):
+        token_ids = [0, 1, 2**64, 2**256 - 1]
+
+        assert deriver.ip_ids(CHAIN_ID, ADDRESS, token_ids) == [
+            reference_ip_id(CHAIN_ID, ADDRESS, token_id) for token_id in token_ids
+        ]
+        assert deriver.ip_id(1, ADDRESS, 7) == reference_ip_id(1, ADDRESS, 7)
+
+    def test_invalid_salt(self):
+        with pytest.raises(ValueError, match="must be 32 bytes"):
+            IpIdDeriver(ERC6551_REGISTRY, IP_ACCOUNT_IMPL, b"\x01")
+
+    def test_from_registry_checks_one_ip_id_on_chain(self):
+        client = registry_client()
+
+        deriver = IpIdDeriver.from_registry(client, CHAIN_ID)
+
+        assert deriver.ip_account_salt == SALT
+        client.ipId.assert_called_once_with(CHAIN_ID, ADDRESS, 1)
+
+    def test_from_registry_self_check_mismatch(self):
+        client = registry_client(ip_id=lambda *args: ADDRESS)
+
+        with pytest.raises(ValueError, match="does not match the registry's"):
+            IpIdDeriver.from_registry(client, CHAIN_ID)
+
+
+class TestEnableIpIdDerivation:
+    def test_ip_asset_derives_ip_ids_offline(self):
+        web3 = Mock(spec=Web3)
+        web3.is_address = Mock(return_value=True)
+        web3.to_checksum_address = Mock(side_effect=to_checksum_address)
+        ip_asset = IPAsset(web3, Mock(), CHAIN_ID)
+        ip_asset.ip_asset_registry_client = Mock()
+
+        with patch(
+            "story_protocol_python_sdk.utils.ip_id_derivation.IPAssetRegistryClient",
+            return_value=registry_client(),
+        ):
+            deriver = enable_ip_id_derivation(web3, CHAIN_ID)
+            assert enable_ip_id_derivation(web3, CHAIN_ID) is deriver
+
+        assert get_ip_id_deriver(web3, CHAIN_ID) is deriver
+        assert ip_asset._get_ip_id(ADDRESS, 5) == reference_ip_id(CHAIN_ID, ADDRESS, 5)
+        assert ip_asset.get_ip_ids(ADDRESS, [1, 2]) == [
+            reference_ip_id(CHAIN_ID, ADDRESS, token_id) for token_id in (1, 2)
+        ]
+        ip_asset.ip_asset_registry_client.ipId.assert_not_called()
+
+        disable_ip_id_derivation(web3)
+        assert get_ip_id_deriver(web3, CHAIN_ID) is None
+
+    def test_derivers_are_kept_per_chain(self):
+        web3 = Mock(spec=Web3)
+
+        with patch(
+            "story_protocol_python_sdk.utils.ip_id_derivation.IPAssetRegistryClient",
+            side_effect=lambda web3, chain_id: registry_client(),
+        ) as client:
+            deriver = enable_ip_id_derivation(web3, CHAIN_ID)
+            mainnet_deriver = enable_ip_id_derivation(web3, MAINNET_CHAIN_ID)
+
+        assert [call.args[1] for call in client.call_args_list] == [
+            CHAIN_ID,
+            MAINNET_CHAIN_ID,
+        ]
+        assert mainnet_deriver is not deriver
+        assert get_ip_id_deriver(web3, MAINNET_CHAIN_ID) is mainnet_deriver
+
+        disable_ip_id_derivation(web3, MAINNET_CHAIN_ID)
+        assert get_ip_id_deriver(web3, MAINNET_CHAIN_ID) is None
+        assert get_ip_id_deriver(web3, CHAIN_ID) is deriver
+        disable_ip_id_derivation(web3)
+
+    def test_async_ip_asset_derives_ip_ids_offline(self):
+        web3 = Mock(spec=AsyncWeb3)
+        ip_asset = AsyncIPAsset(web3, Mock(), CHAIN_ID)
+        ip_asset.ip_asset_registry_client = Mock(ipId=AsyncMock())
+
+        with patch(
+            "story_protocol_python_sdk.utils.ip_id_derivation.IPAssetRegistryClient",
+            return_value=async_registry_client(),
+        ):
+            deriver = asyncio.run(async_enable_ip_id_derivation(web3, CHAIN_ID))
+
+        assert get_ip_id_deriver(web3, CHAIN_ID) is deriver
+        assert asyncio.run(ip_asset._get_ip_id(ADDRESS, 5)) == reference_ip_id(
+            CHAIN_ID, ADDRESS, 5
+        )
+        ip_asset.ip_asset_registry_client.ipId.assert_not_awaited()
+        disable_ip_id_derivation(web3)
@@ -0,0 +1,174 @@
+from unittest.mock import Mock
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from story_protocol_python_sdk.resources.License import License
+from story_protocol_python_sdk.utils.constants import ZERO_ADDRESS
+from story_protocol_python_sdk.utils.license_terms_cache import (
+    LICENSE_TERMS_REGISTERED_TOPIC,
+    PIL_TERMS_FIELDS,
+    PIL_TERMS_TYPE,
+    LicenseTermsCache,
+    canonical_terms,
+    disable_license_terms_cache,
+    enable_license_terms_cache,
+    get_license_terms_cache,
+)
+from tests.unit.fixtures.data import ADDRESS, CHAIN_ID
+
+TEMPLATE = "0x2E896b0b2Fdb7457499B56AAaA4AE55BCB4Cd316"
+
+
+def pil_terms(default_minting_fee=0, uri=""):
+    return canonical_terms(
+        (True, ZERO_ADDRESS, default_minting_fee, 0, False, False, ZERO_ADDRESS, b"")
+        + (0, 0, True, True, False, True, 0, ADDRESS, uri)
+    )
+
+
+def registered_log(terms_id, terms, address=TEMPLATE):
+    return {
+        "address": address,
+        "topics": [
+            LICENSE_TERMS_REGISTERED_TOPIC,
+            terms_id.to_bytes(32, "big"),
+            bytes(12) + bytes.fromhex(ADDRESS[2:]),
+        ],
+        "data": encode(["bytes"], [encode([PIL_TERMS_TYPE], [terms])]),
+    }
+
+
+class TestLicenseTermsCache:
+    def test_maps_terms_ids_both_ways(self):
+        cache = LicenseTermsCache()
+        terms = pil_terms(uri="ipfs://terms")
+        camel_case_terms = {
+            name: value for (name, _), value in zip(PIL_TERMS_FIELDS, terms)
+        }
+        camel_case_terms["currency"] = ADDRESS.lower()
+
+        cache.put(TEMPLATE.lower(), 5, terms)
+
+        assert cache.get_terms(TEMPLATE, 5) == terms
+        assert cache.get_terms_id(TEMPLATE, camel_case_terms) == 5
+        assert cache.get_terms(ADDRESS, 5) is None
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_unregistered_terms_are_not_cached(self):
+        cache = LicenseTermsCache()
+
+        cache.put(TEMPLATE, 0, pil_terms())
+        cache.put(
+            TEMPLATE,
+            9,
+            (False, ZERO_ADDRESS, 0, 0, False, False, ZERO_ADDRESS, b"")
+            + (0, 0, False, False, False, False, 0, ZERO_ADDRESS, ""),
+        )
+
+        assert cache.get_terms_id(TEMPLATE, pil_terms()) is None
+        assert cache.get_terms(TEMPLATE, 9) is None
+
+    def test_terms_missing_fields_are_a_miss(self):
+        cache = LicenseTermsCache()
+        terms = {"transferable": True, "uri": ""}
+
+        cache.put(TEMPLATE, 5, terms)
+
+        assert cache.get_terms_id(TEMPLATE, terms) is None
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = LicenseTermsCache(max_size=2)
+        cache.put_many(TEMPLATE, [(1, pil_terms(1)), (2, pil_terms(2))])
+        cache.get_terms(TEMPLATE, 1)
+
+        cache.put(TEMPLATE, 3, pil_terms(3))
+
+        assert cache.get_terms(TEMPLATE, 2) is None
+        assert cache.get_terms(TEMPLATE, 1) == pil_terms(1)
+        assert cache.get_terms(TEMPLATE, 3) == pil_terms(3)
+
+    def test_entries_persist_in_sqlite(self, tmp_path):
+        path = str(tmp_path / "license_terms.sqlite")
+        writer = LicenseTermsCache(path=path)
+        writer.put(TEMPLATE, 7, pil_terms(uri="ipfs://seven"))
+        writer.close()
+
+        reader = LicenseTermsCache(max_size=1, path=path)
+
+        assert reader.get_terms_id(TEMPLATE, pil_terms(uri="ipfs://seven")) == 7
+        assert reader.get_terms(TEMPLATE, 7) == pil_terms(uri="ipfs://seven")
+        reader.clear()
+        assert reader.get_terms(TEMPLATE, 7) == pil_terms(uri="ipfs://seven")
+        reader.close()
+
+    def test_warm_from_logs(self):
+        cache = LicenseTermsCache()
+        other_log = {"address": TEMPLATE, "topics": [bytes(32)], "data": b""}
+
+        count = cache.warm_from_logs(
+            [
+                registered_log(1, pil_terms(1)),
+                other_log,
+                registered_log(2, pil_terms(2)),
+            ]
+        )
+
+        assert count == 2
+        assert cache.get_terms_id(TEMPLATE, pil_terms(2)) == 2
+        assert cache.get_terms(TEMPLATE, 1) == pil_terms(1)
+
+
+class TestLicenseWithCache:
+    @pytest.fixture
+    def license(self):
+        web3 = Web3()
+        license = License(web3, Mock(), CHAIN_ID)
+        license.license_template_client = Mock()
+        license.license_template_client.contract.address = TEMPLATE
+        enable_license_terms_cache(web3)
+        yield license
+        disable_license_terms_cache(web3)
+
+    def test_license_terms_are_read_once(self, license: License):
+        license.license_template_client.getLicenseTerms.return_value = pil_terms(4)
+        license.license_template_client.getLicenseTermsId.return_value = 4
+
+        assert license.get_license_terms(4) == pil_terms(4)
+        assert license.get_license_terms(4) == pil_terms(4)
+        assert license._get_license_terms_id(pil_terms(4)) == 4
+
+        license.license_template_client.getLicenseTerms.assert_called_once_with(4)
+        license.license_template_client.getLicenseTermsId.assert_not_called()
+
+    def test_unregistered_terms_are_read_again(self, license: License):
+        license.license_template_client.getLicenseTermsId.return_value = 0
+
+        assert license._get_license_terms_id(pil_terms()) == 0
+        assert license._get_license_terms_id(pil_terms()) == 0
+        assert license.license_template_client.getLicenseTermsId.call_count == 2
+
+    def test_terms_missing_fields_are_read_from_chain(self, license: License):
+        license.license_template_client.getLicenseTermsId.return_value = 6
+
+        assert license._get_license_terms_id({"transferable": True}) == 6
+        license.license_template_client.getLicenseTermsId.assert_called_once_with(
+            {"transferable": True}
+        )
+
+    def test_warm_license_terms_cache(self, license: License):
+        license.web3.eth.get_logs = Mock(return_value=[registered_log(3, pil_terms(3))])
+
+        assert license.warm_license_terms_cache(from_block=100) == 1
+        assert license.get_license_terms(3) == pil_terms(3)
+        license.license_template_client.getLicenseTerms.assert_not_called()
+        assert license.web3.eth.get_logs.call_args.args[0]["fromBlock"] == 100
+
+    def test_warm_license_terms_cache_not_enabled(self, license: License):
+        disable_license_terms_cache(license.web3)
+        assert get_license_terms_cache(license.web3) is None
+
+        with pytest.raises(ValueError, match="license terms cache is not enabled"):
+            license.warm_license_terms_cache()
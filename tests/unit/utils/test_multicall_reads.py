@@ -0,0 +1,115 @@
+from unittest.mock import Mock
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_encoders import (
+    encode_ipId,
+    encode_isRegistered,
+)
+from story_protocol_python_sdk.resources.IPAsset import IPAsset
+from story_protocol_python_sdk.utils.multicall_reads import (
+    aggregate_reads,
+    try_aggregate_reads,
+)
+from tests.unit.fixtures.data import ADDRESS, CHAIN_ID, IP_ID
+
+WEB3 = Web3()
+# Built at import time: other test modules patch IPAssetRegistryClient.__new__
+IP_ASSET = IPAsset(WEB3, Mock(address=ADDRESS), CHAIN_ID)
+REGISTRY_CLIENT = IP_ASSET.ip_asset_registry_client
+
+TRUE = encode(["bool"], [True])
+FALSE = encode(["bool"], [False])
+
+
+def multicall3(*responses):
+    """A Multicall3 client whose aggregate3 calls return ``responses`` in turn."""
+    client = Mock(web3=WEB3)
+    client.contract.functions.aggregate3.return_value.call.side_effect = list(responses)
+    return client
+
+
+def sent_calls(client):
+    return [
+        call.args[0] for call in client.contract.functions.aggregate3.call_args_list
+    ]
+
+
+class TestAggregateReads:
+    def test_reads_are_encoded_and_decoded(self):
+        client = multicall3([(True, TRUE), (True, encode(["address"], [IP_ID]))])
+
+        results = aggregate_reads(
+            client,
+            [
+                (REGISTRY_CLIENT.isRegistered, (IP_ID,)),
+                (REGISTRY_CLIENT.ipId, (CHAIN_ID, ADDRESS, 1)),
+            ],
+        )
+
+        assert results == [True, IP_ID]
+        assert sent_calls(client) == [
+            [
+                {
+                    "target": REGISTRY_CLIENT.contract.address,
+                    "allowFailure": True,
+                    "callData": encode_isRegistered(IP_ID),
+                },
+                {
+                    "target": REGISTRY_CLIENT.contract.address,
+                    "allowFailure": True,
+                    "callData": encode_ipId(CHAIN_ID, ADDRESS, 1),
+                },
+            ]
+        ]
+
+    def test_reads_are_chunked(self):
+        client = multicall3([(True, TRUE)] * 2, [(True, FALSE)])
+
+        results = aggregate_reads(
+            client, [(REGISTRY_CLIENT.isRegistered, (IP_ID,))] * 3, chunk_size=2
+        )
+
+        assert results == [True, True, False]
+        assert [len(calls) for calls in sent_calls(client)] == [2, 1]
+
+    def test_failed_reads(self):
+        reads = [
+            (REGISTRY_CLIENT.isRegistered, (IP_ID,)),
+            (REGISTRY_CLIENT.isRegistered, (ADDRESS,)),
+        ]
+
+        assert try_aggregate_reads(multicall3([(True, TRUE), (False, b"")]), reads) == [
+            (True, True),
+            (False, None),
+        ]
+        with pytest.raises(ValueError, match=rf"isRegistered\({ADDRESS}\) reverted."):
+            aggregate_reads(multicall3([(True, TRUE), (False, b"")]), reads)
+
+
+class TestIPAssetBulkReads:
+    def test_are_registered(self):
+        IP_ASSET.multicall3_client = multicall3([(True, TRUE), (True, FALSE)])
+
+        assert IP_ASSET.are_registered([IP_ID, ADDRESS]) == [True, False]
+        [calls] = sent_calls(IP_ASSET.multicall3_client)
+        assert calls[1]["callData"] == encode_isRegistered(
+            Web3.to_checksum_address(ADDRESS)
+        )
+
+    def test_are_registered_invalid_ip_id(self):
+        with pytest.raises(ValueError, match="invalid IP ID address format: 0x12"):
+            IP_ASSET.are_registered([IP_ID, "0x12"])
+
+    def test_get_ip_ids(self):
+        IP_ASSET.multicall3_client = multicall3(
+            [(True, encode(["address"], [IP_ID]))] * 2
+        )
+
+        assert IP_ASSET.get_ip_ids(ADDRESS, [1, 2]) == [IP_ID, IP_ID]
+        [calls] = sent_calls(IP_ASSET.multicall3_client)
+        assert [call["callData"] for call in calls] == [
+            encode_ipId(CHAIN_ID, ADDRESS, token_id) for token_id in (1, 2)
+        ]
@@ -0,0 +1,152 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from web3 import Web3
+
+from story_protocol_python_sdk.utils.nonce_manager import (
+    NonceManager,
+    clear_nonce_managers,
+    get_nonce_manager,
+)
+from tests.unit.fixtures.data import ACCOUNT_ADDRESS
+
+
+@pytest.fixture
+def web3():
+    web3 = Mock(spec=Web3)
+    web3.eth = Mock()
+    web3.eth.get_transaction_count = Mock(return_value=10)
+    return web3
+
+
+@pytest.fixture
+def nonce_manager(web3):
+    return NonceManager(web3, ACCOUNT_ADDRESS)
+
+
+class TestNonceManager:
+    def test_allocates_locally_after_first_sync(self, web3, nonce_manager):
+        assert [nonce_manager.allocate() for _ in range(3)] == [10, 11, 12]
+        web3.eth.get_transaction_count.assert_called_once_with(
+            ACCOUNT_ADDRESS, "pending"
+        )
+        assert nonce_manager.in_flight == 3
+
+    def test_peek_does_not_allocate(self, nonce_manager):
+        assert nonce_manager.peek() == 10
+        assert nonce_manager.peek() == 10
+        assert nonce_manager.allocate() == 10
+        assert nonce_manager.peek() == 11
+
+    def test_confirm(self, nonce_manager):
+        nonce = nonce_manager.allocate()
+        nonce_manager.allocate()
+
+        nonce_manager.confirm(nonce)
+
+        assert nonce_manager.in_flight == 1
+        assert nonce_manager.allocate() == 12
+
+    def test_release_latest_nonce_reuses_it(self, web3, nonce_manager):
+        nonce_manager.allocate()
+        nonce = nonce_manager.allocate()
+
+        nonce_manager.release(nonce)
+
+        assert nonce_manager.in_flight == 1
+        assert nonce_manager.allocate() == nonce
+        web3.eth.get_transaction_count.assert_called_once()
+
+    def test_release_with_gap_is_reused_first(self, web3, nonce_manager):
+        nonce = nonce_manager.allocate()
+        nonce_manager.allocate()
+
+        nonce_manager.release(nonce)
+
+        assert nonce_manager.peek() == nonce
+        assert [nonce_manager.allocate() for _ in range(2)] == [10, 12]
+        web3.eth.get_transaction_count.assert_called_once()
+
+    def test_release_twice_is_ignored(self, nonce_manager):
+        nonce = nonce_manager.allocate()
+
+        nonce_manager.release(nonce)
+        nonce_manager.release(nonce)
+
+        assert [nonce_manager.allocate() for _ in range(2)] == [10, 11]
+
+    def test_resync(self, web3, nonce_manager):
+        nonce_manager.allocate()
+        web3.eth.get_transaction_count.return_value = 15
+
+        nonce_manager.resync()
+
+        assert nonce_manager.in_flight == 1
+        assert nonce_manager.allocate() == 15
+
+    def test_resync_keeps_nonces_in_flight(self, web3, nonce_manager):
+        held = [nonce_manager.allocate() for _ in range(3)]
+
+        # Not broadcast yet, so the chain still counts 10
+        nonce_manager.resync(held[1])
+
+        assert nonce_manager.in_flight == 2
+        assert [nonce_manager.allocate() for _ in range(2)] == [11, 13]
+        assert web3.eth.get_transaction_count.call_count == 2
+
+    def test_concurrent_allocations_are_unique(self, nonce_manager):
+        nonces = []
+
+        def allocate():
+            for _ in range(100):
+                nonces.append(nonce_manager.allocate())
+
+        threads = [threading.Thread(target=allocate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(nonces) == list(range(10, 810))
+        assert nonce_manager.in_flight == 800
+
+    def test_concurrent_releases_never_duplicate_held_nonces(self, nonce_manager):
+        held = set()
+        duplicates = []
+        lock = threading.Lock()
+
+        def send(worker):
+            for attempt in range(200):
+                nonce = nonce_manager.allocate()
+                with lock:
+                    if nonce in held:
+                        duplicates.append(nonce)
+                    held.add(nonce)
+                time.sleep(0)
+                if (worker + attempt) % 50 == 0:
+                    # Another sender hit a nonce error
+                    nonce_manager.resync()
+                with lock:
+                    held.discard(nonce)
+                # The gas estimate reverted before the broadcast
+                nonce_manager.release(nonce)
+
+        threads = [threading.Thread(target=send, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert duplicates == []
+
+
+class TestGetNonceManager:
+    def test_shared_per_web3_and_address(self, web3):
+        clear_nonce_managers()
+
+        manager = get_nonce_manager(web3, ACCOUNT_ADDRESS)
+
+        assert get_nonce_manager(web3, ACCOUNT_ADDRESS.lower()) is manager
+        assert get_nonce_manager(Mock(spec=Web3), ACCOUNT_ADDRESS) is not manager
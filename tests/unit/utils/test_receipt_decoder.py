@@ -0,0 +1,134 @@
+from unittest.mock import Mock
+
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from story_protocol_python_sdk.utils.contract_registry import load_abi
+from story_protocol_python_sdk.utils.receipt_decoder import (
+    EVENT_SIGNATURES,
+    ReceiptDecoder,
+    decode_receipt,
+    get_event_decoder,
+)
+from tests.unit.fixtures.data import ADDRESS, CHAIN_ID, IP_ID, ip_registered_log
+
+
+def log(event_name, data=b""):
+    return {
+        "topics": [Web3.keccak(text=EVENT_SIGNATURES[event_name])],
+        "data": data,
+    }
+
+
+class TestReceiptDecoder:
+    def test_logs_are_bucketed_by_event(self):
+        logs = [
+            log("IPRegistered", b"1"),
+            log("LicenseTermsAttached", b"2"),
+            {"topics": [Web3.keccak(text="Transfer(address,address,uint256)")]},
+            {"topics": []},
+            log("IPRegistered", b"3"),
+        ]
+
+        decoded = ReceiptDecoder().decode({"logs": logs})
+
+        assert decoded.logs("IPRegistered") == [logs[0], logs[4]]
+        assert decoded.logs("LicenseTermsAttached") == [logs[1]]
+        assert decoded.logs("DisputeRaised") == []
+
+    def test_hex_string_topics(self):
+        ip_registered = {
+            "topics": [Web3.to_hex(Web3.keccak(text=EVENT_SIGNATURES["IPRegistered"]))]
+        }
+
+        assert ReceiptDecoder().decode({"logs": [ip_registered]}).logs(
+            "IPRegistered"
+        ) == [ip_registered]
+
+    def test_events_are_decoded_once(self):
+        receipt = {"logs": [log("IPRegistered"), log("IPRegistered")]}
+        contract_event = Mock()
+        contract_event.process_log.side_effect = [{"args": 1}, {"args": 2}]
+
+        first = decode_receipt(receipt).events("IPRegistered", contract_event)
+        second = decode_receipt(receipt).events("IPRegistered", contract_event)
+
+        assert first == second == [{"args": 1}, {"args": 2}]
+        assert contract_event.process_log.call_count == 2
+
+    def test_recent_receipts_are_remembered(self):
+        decoder = ReceiptDecoder(recent_receipts=1)
+        receipt = {"logs": [log("IPRegistered")]}
+        other_receipt = {"logs": []}
+
+        decoded = decoder.decode(receipt)
+        assert decoder.decode(receipt) is decoded
+
+        receipt["logs"].append(log("IPRegistered"))
+        decoded = decoder.decode(receipt)
+        assert len(decoded.logs("IPRegistered")) == 2
+
+        decoder.decode(other_receipt)
+        assert decoder.decode(receipt) is not decoded
+
+
+class TestEventDecoder:
+    def test_matches_process_log(self):
+        raw_log = {
+            **ip_registered_log(IP_ID, ADDRESS, 7),
+            "logIndex": 0,
+            "transactionIndex": 0,
+            "transactionHash": HexBytes(bytes(32)),
+            "blockHash": HexBytes(bytes(32)),
+            "blockNumber": 1,
+        }
+        contract = Web3().eth.contract(abi=load_abi("IPAssetRegistry"))
+        expected = contract.events.IPRegistered().process_log(raw_log)["args"]
+
+        record = get_event_decoder("IPAssetRegistry", "IPRegistered").decode(raw_log)
+
+        assert record.ipId == IP_ID.lower()
+        assert record.chainId == CHAIN_ID
+        assert record.tokenContract == ADDRESS.lower()
+        assert record.tokenId == 7
+        assert record._asdict() == {
+            name: value.lower() if name in ("ipId", "tokenContract") else value
+            for name, value in expected.items()
+        }
+
+    def test_indexed_and_data_fields(self):
+        decoder = get_event_decoder("LicensingModule", "LicenseTermsAttached")
+        raw_log = {
+            "topics": [
+                Web3.to_hex(decoder.topic),
+                HexBytes(bytes(12) + bytes.fromhex(ADDRESS[2:])),
+                HexBytes(bytes(12) + bytes.fromhex(IP_ID[2:])),
+            ],
+            "data": Web3.to_hex(encode(["address", "uint256"], [ADDRESS, 5])),
+        }
+
+        assert tuple(decoder.decode(raw_log)) == (
+            ADDRESS.lower(),
+            IP_ID.lower(),
+            ADDRESS.lower(),
+            5,
+        )
+
+    def test_other_event(self):
+        decoder = get_event_decoder("LicensingModule", "LicenseTermsAttached")
+
+        with pytest.raises(ValueError, match="not a LicenseTermsAttached event"):
+            decoder.decode(ip_registered_log(IP_ID, ADDRESS, 1))
+        with pytest.raises(ValueError, match="has no Missing event"):
+            get_event_decoder("LicensingModule", "Missing")
+
+    def test_records_are_decoded_once_per_receipt(self):
+        receipt = {"logs": [ip_registered_log(IP_ID, ADDRESS, 1)]}
+        decoder = get_event_decoder("IPAssetRegistry", "IPRegistered")
+
+        records = decode_receipt(receipt).records(decoder)
+
+        assert decode_receipt(receipt).records(decoder) is records
+        assert [record.tokenId for record in records] == [1]
@@ -0,0 +1,207 @@
+from unittest.mock import Mock
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import MethodUnavailable, TimeExhausted, TransactionNotFound
+
+from story_protocol_python_sdk.utils.receipt_watcher import (
+    MAX_POLL_BACKOFF,
+    ReceiptWatcher,
+    disable_receipt_watcher,
+    enable_receipt_watcher,
+    get_receipt_watcher,
+    poll_delay,
+)
+
+
+class FakeChain:
+    """Includes transactions in the next block on ``mine()``."""
+
+    def __init__(self):
+        self.block_number = 0
+        self.receipts = {}
+
+    def mine(self, *tx_hashes):
+        self.block_number += 1
+        for tx_hash in tx_hashes:
+            self.receipts[HexBytes(tx_hash)] = {
+                "status": 1,
+                "transactionHash": HexBytes(tx_hash),
+                "blockNumber": self.block_number,
+            }
+
+    def get_transaction_receipt(self, tx_hash):
+        if tx_hash not in self.receipts:
+            raise TransactionNotFound(f"{tx_hash.hex()} not found")
+        return self.receipts[tx_hash]
+
+    def get_block_receipts(self, block_number):
+        return [
+            receipt
+            for receipt in self.receipts.values()
+            if receipt["blockNumber"] == block_number
+        ]
+
+
+@pytest.fixture
+def chain():
+    return FakeChain()
+
+
+@pytest.fixture
+def web3(chain):
+    web3 = Mock(spec=Web3)
+    web3.eth = Mock()
+    web3.eth.get_transaction_receipt = Mock(side_effect=chain.get_transaction_receipt)
+    web3.eth.get_block_receipts = Mock(side_effect=chain.get_block_receipts)
+    type(web3.eth).block_number = property(lambda _: chain.block_number)
+    return web3
+
+
+@pytest.fixture
+def watcher(web3):
+    return ReceiptWatcher(web3, background=False)
+
+
+class TestReceiptWatcher:
+    def test_many_pending_hashes_cost_one_request_per_block(self, web3, chain, watcher):
+        waiters = [watcher.watch(HexBytes(i)) for i in range(1, 11)]
+        watcher.poll()
+        chain.mine(*range(1, 6))
+        watcher.poll()
+        chain.mine(*range(6, 11))
+        watcher.poll()
+
+        assert all(waiter.done() for waiter in waiters)
+        assert [waiter.result()["blockNumber"] for waiter in waiters] == [1] * 5 + [
+            2
+        ] * 5
+        assert web3.eth.get_block_receipts.call_count == 3
+        web3.eth.get_transaction_receipt.assert_not_called()
+        assert watcher.stats() == {
+            "blocks": 3,
+            "block_receipt_requests": 3,
+            "receipt_requests": 0,
+            "pending": 0,
+        }
+
+    def test_single_hash_is_looked_up_directly(self, web3, chain, watcher):
+        waiter = watcher.watch(HexBytes(1))
+        chain.mine(1)
+        watcher.poll()
+
+        assert waiter.result()["blockNumber"] == 1
+        web3.eth.get_block_receipts.assert_not_called()
+
+    def test_polls_only_on_new_blocks(self, web3, watcher):
+        watcher.watch(HexBytes(1))
+        watcher.poll()
+        watcher.poll()
+
+        assert web3.eth.get_transaction_receipt.call_count == 1
+
+    def test_hash_mined_in_last_scanned_block(self, chain, watcher):
+        for i in (1, 2):
+            watcher.watch(HexBytes(i))
+        chain.mine(1, 2, 3)
+        watcher.poll()
+
+        # Watched after its block was scanned: served from the kept receipts
+        late = watcher.watch(HexBytes(3))
+
+        assert late.done()
+        assert late.result()["blockNumber"] == 1
+
+    def test_hash_mined_before_a_lookup_cycle_is_rescanned(self, web3, chain, watcher):
+        watcher.watch(HexBytes(1))
+        chain.mine(2)
+        watcher.poll()
+
+        waiters = [watcher.watch(HexBytes(i)) for i in (2, 3, 4)]
+        chain.mine(1)
+        watcher.poll()
+
+        assert waiters[0].result()["blockNumber"] == 1
+        assert [call.args for call in web3.eth.get_block_receipts.call_args_list] == [
+            (1,),
+            (2,),
+        ]
+
+    def test_falls_back_when_block_receipts_are_unsupported(self, web3, chain, watcher):
+        web3.eth.get_block_receipts.side_effect = MethodUnavailable(
+            "the method eth_getBlockReceipts does not exist"
+        )
+        waiters = [watcher.watch(HexBytes(i)) for i in (1, 2)]
+        chain.mine(1, 2)
+        watcher.poll()
+        watcher.watch(HexBytes(3))
+        chain.mine(3)
+        watcher.poll()
+
+        assert all(waiter.done() for waiter in waiters)
+        assert watcher.block_receipts_supported is False
+        assert web3.eth.get_block_receipts.call_count == 1
+
+    def test_rpc_error_keeps_pending_waiters(self, web3, chain, watcher):
+        waiters = [watcher.watch(HexBytes(i)) for i in (1, 2)]
+        chain.mine(1, 2)
+        web3.eth.get_block_receipts.side_effect = [
+            ConnectionError("429 Too Many Requests"),
+            chain.get_block_receipts(1),
+        ]
+        watcher.poll()
+
+        assert not any(waiter.done() for waiter in waiters)
+        assert (watcher.pending, watcher.failures) == (2, 1)
+
+        watcher.poll()
+
+        assert [waiter.result()["status"] for waiter in waiters] == [1, 1]
+        assert watcher.failures == 0
+
+    def test_consecutive_rpc_errors_fail_pending_waiters(self, web3):
+        watcher = ReceiptWatcher(web3, background=False, max_failures=2)
+        web3.eth.get_transaction_receipt.side_effect = ConnectionError("node down")
+        waiter = watcher.watch(HexBytes(1))
+        watcher.poll()
+        assert not waiter.done()
+        watcher.poll()
+
+        with pytest.raises(ConnectionError, match="node down"):
+            waiter.result()
+        assert watcher.pending == 0
+
+    def test_poll_delay_backs_off(self):
+        assert [poll_delay(0.5, failures) for failures in range(6)] == [
+            0.5,
+            1,
+            2,
+            4,
+            8,
+            MAX_POLL_BACKOFF,
+        ]
+
+    def test_timeout(self, watcher):
+        with pytest.raises(TimeExhausted):
+            watcher.wait(HexBytes(1), timeout=0.01)
+        assert watcher.pending == 0
+
+    def test_background_thread(self, web3, chain):
+        watcher = ReceiptWatcher(web3, poll_interval=0.01)
+        waiter = watcher.watch(HexBytes(1))
+        chain.mine(1)
+
+        assert waiter.result(timeout=5)["status"] == 1
+
+
+class TestEnableReceiptWatcher:
+    def test_shared_per_web3(self, web3):
+        watcher = enable_receipt_watcher(web3, poll_interval=1)
+
+        assert enable_receipt_watcher(web3, poll_interval=0.1) is watcher
+        assert watcher.poll_interval == 0.1
+        assert get_receipt_watcher(web3) is watcher
+
+        disable_receipt_watcher(web3)
+        assert get_receipt_watcher(web3) is None
@@ -0,0 +1,415 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+import requests
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from story_protocol_python_sdk.utils.async_transaction_utils import (
+    async_build_and_send_transaction,
+)
+from story_protocol_python_sdk.utils.fee_oracle import clear_fee_oracles
+from story_protocol_python_sdk.utils.nonce_manager import clear_nonce_managers
+from story_protocol_python_sdk.utils.retry_policy import (
+    BACKOFF,
+    CONNECTION,
+    FATAL,
+    NONCE_GAP,
+    NONCE_TOO_LOW,
+    RATE_LIMITED,
+    REPLACE,
+    RESYNC_NONCE,
+    TIMEOUT,
+    UNDERPRICED,
+    RetryPolicy,
+    classify_send_error,
+    get_retry_policy,
+    set_retry_policy,
+)
+from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
+from tests.unit.fixtures.data import ACCOUNT_ADDRESS
+
+SLEEP = "story_protocol_python_sdk.utils.transaction_utils.time.sleep"
+
+
+@pytest.fixture
+def web3():
+    web3 = Mock(spec=Web3)
+    web3.eth = Mock()
+    web3.eth.get_transaction_count = Mock(return_value=0)
+    web3.eth.fee_history = Mock(side_effect=ValueError("not supported"))
+    web3.eth.gas_price = 10
+    web3.eth.send_raw_transaction = Mock(return_value=HexBytes(1))
+    web3.eth.wait_for_transaction_receipt = Mock(return_value={"status": 1})
+    return web3
+
+
+@pytest.fixture
+def account():
+    account = Mock()
+    account.address = ACCOUNT_ADDRESS
+    account.sign_transaction = Mock(
+        return_value=Mock(raw_transaction=b"signed", hash=b"\x0a" * 32)
+    )
+    return account
+
+
+@pytest.fixture
+def client_function():
+    return Mock(side_effect=lambda tx_options: dict(tx_options))
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    clear_fee_oracles()
+    clear_nonce_managers()
+    yield
+    clear_fee_oracles()
+    clear_nonce_managers()
+
+
+def sent_options(client_function):
+    return [call.args[-1] for call in client_function.call_args_list]
+
+
+class TestClassifySendError:
+    @pytest.mark.parametrize(
+        "error, kind",
+        [
+            (ValueError("replacement transaction underpriced"), UNDERPRICED),
+            (ValueError("transaction underpriced"), UNDERPRICED),
+            (ValueError("max fee per gas less than block base fee"), UNDERPRICED),
+            (ValueError("nonce too low"), NONCE_TOO_LOW),
+            (ValueError("nonce too high"), NONCE_GAP),
+            (requests.exceptions.ReadTimeout("read timed out"), TIMEOUT),
+            (TimeoutError(), TIMEOUT),
+            (
+                requests.exceptions.HTTPError(
+                    "429 Client Error", response=Mock(status_code=429)
+                ),
+                RATE_LIMITED,
+            ),
+            (ValueError("rate limit exceeded"), RATE_LIMITED),
+            (requests.exceptions.ConnectionError("reset"), CONNECTION),
+            (ValueError("execution reverted"), FATAL),
+        ],
+    )
+    def test_kinds(self, error, kind):
+        assert classify_send_error(error) == kind
+
+
+class TestRetryPolicy:
+    def test_actions(self):
+        policy = RetryPolicy(max_attempts=2)
+
+        assert policy.action(NONCE_TOO_LOW, 1, True) == RESYNC_NONCE
+        assert policy.action(NONCE_TOO_LOW, 1, False) is None
+        assert policy.action(NONCE_GAP, 1, False) is None
+        assert policy.action(UNDERPRICED, 1, True) == REPLACE
+        assert policy.action(UNDERPRICED, 1, True, foreign_nonce=True) == RESYNC_NONCE
+        assert policy.action(UNDERPRICED, 1, False, foreign_nonce=True) == REPLACE
+        assert policy.action(RATE_LIMITED, 1, True) == BACKOFF
+        assert policy.action(FATAL, 1, True) is None
+        assert policy.action(UNDERPRICED, 2, True) is None
+
+    def test_retry_on_limits_kinds(self):
+        policy = RetryPolicy(retry_on=frozenset({UNDERPRICED}))
+
+        assert policy.action(TIMEOUT, 1, True) is None
+
+    def test_delay_backs_off_exponentially_with_jitter(self):
+        policy = RetryPolicy(backoff=1, max_backoff=3, jitter=0.5)
+
+        with patch("random.random", return_value=0.0):
+            assert [policy.delay(attempt) for attempt in (1, 2, 3)] == [1, 2, 3]
+        with patch("random.random", return_value=1.0):
+            assert policy.delay(2) == 1
+
+    def test_cap_fees(self):
+        policy = RetryPolicy(max_fee_per_gas=100)
+
+        assert policy.cap_fees({"maxFeePerGas": 150, "maxPriorityFeePerGas": 20}) == {
+            "maxFeePerGas": 100,
+            "maxPriorityFeePerGas": 20,
+        }
+        assert not policy.outbids({"gasPrice": 100}, {"gasPrice": 100})
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"max_attempts": 0}, "max_attempts must be at least 1."),
+            ({"fee_bump_ratio": 1}, "must be greater than 1."),
+            ({"jitter": 2}, "Jitter must be between 0 and 1"),
+            ({"stuck_timeout": 0}, "stuck_timeout must be positive."),
+        ],
+    )
+    def test_invalid(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            RetryPolicy(**kwargs)
+
+    def test_resolution(self, web3):
+        policy = RetryPolicy(max_attempts=5)
+        set_retry_policy(web3, policy)
+
+        assert get_retry_policy(web3) is policy
+        assert get_retry_policy(web3, {"retryPolicy": RetryPolicy()}) == RetryPolicy()
+        with pytest.raises(ValueError, match="Invalid retry policy"):
+            get_retry_policy(web3, {"retryPolicy": "fast"})
+
+        set_retry_policy(web3, None)
+        assert get_retry_policy(web3).max_attempts == 3
+
+
+class TestBuildAndSendWithRetryPolicy:
+    def test_underpriced_is_replaced_at_once_with_compounding_bumps(
+        self, web3, account, client_function
+    ):
+        web3.eth.send_raw_transaction.side_effect = [
+            ValueError("transaction underpriced"),
+            ValueError("transaction underpriced"),
+            HexBytes(1),
+        ]
+
+        with patch(SLEEP) as sleep:
+            build_and_send_transaction(web3, account, client_function)
+
+        sleep.assert_not_called()
+        options = sent_options(client_function)
+        assert [opts["nonce"] for opts in options] == [0, 0, 0]
+        assert [opts.get("gasPrice") for opts in options] == [None, 12, 14]
+
+    def test_fee_cap_stops_replacements(self, web3, account, client_function):
+        web3.eth.send_raw_transaction.side_effect = ValueError(
+            "transaction underpriced"
+        )
+
+        with pytest.raises(ValueError, match="underpriced"):
+            build_and_send_transaction(
+                web3,
+                account,
+                client_function,
+                tx_options={
+                    "retryPolicy": RetryPolicy(max_attempts=5, max_fee_per_gas=12)
+                },
+            )
+
+        assert [opts.get("gasPrice") for opts in sent_options(client_function)] == [
+            None,
+            12,
+        ]
+
+    def test_foreign_transaction_at_the_nonce_is_not_replaced(
+        self, web3, account, client_function
+    ):
+        web3.eth.send_raw_transaction.side_effect = [
+            ValueError("replacement transaction underpriced"),
+            HexBytes(1),
+        ]
+        # The pending count sees the other transaction once it is resynced
+        web3.eth.get_transaction_count.side_effect = [5, 6]
+
+        with patch(SLEEP):
+            build_and_send_transaction(web3, account, client_function)
+
+        options = sent_options(client_function)
+        assert [opts["nonce"] for opts in options] == [5, 6]
+        assert [opts.get("gasPrice") for opts in options] == [None, None]
+
+    def test_own_transaction_at_the_nonce_is_replaced_after_timeout(
+        self, web3, account, client_function
+    ):
+        web3.eth.send_raw_transaction.side_effect = [
+            requests.exceptions.ReadTimeout("read timed out"),
+            ValueError("replacement transaction underpriced"),
+            HexBytes(1),
+        ]
+
+        with patch(SLEEP):
+            build_and_send_transaction(
+                web3,
+                account,
+                client_function,
+                tx_options={"retryPolicy": RetryPolicy(max_attempts=5)},
+            )
+
+        options = sent_options(client_function)
+        assert [opts["nonce"] for opts in options] == [0, 0]
+        assert [opts.get("gasPrice") for opts in options] == [None, 12]
+
+    def test_transient_errors_back_off(self, web3, account, client_function):
+        web3.eth.send_raw_transaction.side_effect = [
+            requests.exceptions.HTTPError("429", response=Mock(status_code=429)),
+            requests.exceptions.ReadTimeout("read timed out"),
+            HexBytes(1),
+        ]
+
+        with patch(SLEEP) as sleep:
+            build_and_send_transaction(
+                web3,
+                account,
+                client_function,
+                tx_options={"retryPolicy": RetryPolicy(backoff=1, jitter=0)},
+            )
+
+        assert [call.args[0] for call in sleep.call_args_list] == [1, 2]
+        # The same signed transaction is resent
+        assert len(sent_options(client_function)) == 1
+        assert web3.eth.send_raw_transaction.call_count == 3
+
+    def test_mined_send_is_found_after_timeout(self, web3, account, client_function):
+        web3.eth.send_raw_transaction.side_effect = [
+            requests.exceptions.ReadTimeout("read timed out"),
+            ValueError("nonce too low"),
+        ]
+        web3.eth.get_transaction_receipt = Mock(return_value={"status": 1})
+
+        with patch(SLEEP):
+            response = build_and_send_transaction(web3, account, client_function)
+
+        assert response == {"tx_hash": "0a" * 32, "tx_receipt": {"status": 1}}
+        web3.eth.get_transaction_receipt.assert_called_once_with(HexBytes(b"\x0a" * 32))
+        web3.eth.wait_for_transaction_receipt.assert_not_called()
+        assert len(sent_options(client_function)) == 1
+
+    def test_no_resend_under_new_nonce_after_timeout(
+        self, web3, account, client_function
+    ):
+        web3.eth.send_raw_transaction.side_effect = [
+            requests.exceptions.ConnectionError("reset"),
+            ValueError("nonce too low"),
+            HexBytes(1),
+        ]
+        web3.eth.get_transaction_receipt = Mock(
+            side_effect=TransactionNotFound("not found")
+        )
+
+        with patch(SLEEP), pytest.raises(ValueError, match="nonce too low"):
+            build_and_send_transaction(
+                web3,
+                account,
+                client_function,
+                tx_options={"retryPolicy": RetryPolicy(max_attempts=5)},
+            )
+
+        assert len(sent_options(client_function)) == 1
+        assert web3.eth.send_raw_transaction.call_count == 2
+
+    def test_caller_nonce_too_low_is_raised(self, web3, account, client_function):
+        web3.eth.send_raw_transaction.side_effect = ValueError("nonce too low")
+
+        with pytest.raises(ValueError, match="nonce too low"):
+            build_and_send_transaction(
+                web3, account, client_function, tx_options={"nonce": 3}
+            )
+
+        assert len(sent_options(client_function)) == 1
+
+    def test_already_known_resend_uses_signed_hash(
+        self, web3, account, client_function
+    ):
+        web3.eth.send_raw_transaction.side_effect = [
+            requests.exceptions.ReadTimeout("read timed out"),
+            ValueError("already known"),
+        ]
+
+        with patch(SLEEP):
+            response = build_and_send_transaction(
+                web3, account, client_function, tx_options={"wait_for_receipt": False}
+            )
+
+        assert response["tx_hash"] == ("0a" * 32)
+
+    def test_fatal_error_is_raised(self, web3, account, client_function):
+        web3.eth.send_raw_transaction.side_effect = ValueError("execution reverted")
+
+        with pytest.raises(ValueError, match="execution reverted"):
+            build_and_send_transaction(web3, account, client_function)
+
+        assert len(sent_options(client_function)) == 1
+
+    def test_stuck_transaction_is_replaced_by_fee(self, web3, account, client_function):
+        web3.eth.send_raw_transaction.side_effect = [HexBytes(1), HexBytes(2)]
+        web3.eth.wait_for_transaction_receipt.side_effect = [
+            TimeExhausted("pending"),
+            {"status": 1},
+        ]
+        web3.eth.get_transaction_receipt = Mock(
+            side_effect=TransactionNotFound("not found")
+        )
+
+        response = build_and_send_transaction(
+            web3,
+            account,
+            client_function,
+            tx_options={"retryPolicy": RetryPolicy(stuck_timeout=0.01)},
+        )
+
+        assert response["tx_hash"] == HexBytes(2).hex()
+        options = sent_options(client_function)
+        assert [opts["nonce"] for opts in options] == [0, 0]
+        assert options[1]["gasPrice"] == 12
+
+    def test_stuck_transaction_mined_after_replacement(
+        self, web3, account, client_function
+    ):
+        web3.eth.send_raw_transaction.side_effect = [HexBytes(1), HexBytes(2)]
+        web3.eth.wait_for_transaction_receipt.side_effect = TimeExhausted("pending")
+        web3.eth.get_transaction_receipt = Mock(return_value={"status": 1})
+
+        response = build_and_send_transaction(
+            web3,
+            account,
+            client_function,
+            tx_options={"retryPolicy": RetryPolicy(stuck_timeout=0.01)},
+        )
+
+        assert response["tx_hash"] == HexBytes(1).hex()
+        web3.eth.get_transaction_receipt.assert_called_once_with(HexBytes(1))
+
+
+class TestAsyncBuildAndSendWithRetryPolicy:
+    def test_underpriced_is_replaced_at_once(self, account):
+        web3 = Mock(spec=AsyncWeb3)
+        web3.eth = Mock()
+        web3.eth.get_transaction_count = AsyncMock(return_value=0)
+        web3.eth.fee_history = AsyncMock(side_effect=ValueError("not supported"))
+        web3.eth.send_raw_transaction = AsyncMock(
+            side_effect=[ValueError("transaction underpriced"), HexBytes(1)]
+        )
+        type(web3.eth).gas_price = property(lambda _: asyncio.sleep(0, 10))
+        client_function = AsyncMock(side_effect=lambda tx_options: dict(tx_options))
+
+        with patch("asyncio.sleep", wraps=asyncio.sleep) as sleep:
+            response = asyncio.run(
+                async_build_and_send_transaction(
+                    web3,
+                    account,
+                    client_function,
+                    tx_options={"wait_for_receipt": False},
+                )
+            )
+
+        assert response["tx_hash"] == HexBytes(1).hex()
+        assert client_function.call_args.args[-1]["gasPrice"] == 12
+        assert all(call.args[0] == 0 for call in sleep.call_args_list)
+
+    def test_mined_send_is_found_after_timeout(self, account):
+        web3 = Mock(spec=AsyncWeb3)
+        web3.eth = Mock()
+        web3.eth.get_transaction_count = AsyncMock(return_value=0)
+        web3.eth.fee_history = AsyncMock(side_effect=ValueError("not supported"))
+        web3.eth.send_raw_transaction = AsyncMock(
+            side_effect=[TimeoutError(), ValueError("nonce too low")]
+        )
+        web3.eth.get_transaction_receipt = AsyncMock(return_value={"status": 1})
+        client_function = AsyncMock(side_effect=lambda tx_options: dict(tx_options))
+
+        with patch("asyncio.sleep", new=AsyncMock()):
+            response = asyncio.run(
+                async_build_and_send_transaction(web3, account, client_function)
+            )
+
+        assert response == {"tx_hash": "0a" * 32, "tx_receipt": {"status": 1}}
+        client_function.assert_awaited_once()
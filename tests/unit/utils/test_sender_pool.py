@@ -0,0 +1,117 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+from web3 import Web3
+
+from story_protocol_python_sdk.story_client import StoryClient
+from story_protocol_python_sdk.utils.retry_policy import get_retry_interrupt
+from story_protocol_python_sdk.utils.sender_pool import SenderPool
+from tests.unit.fixtures.data import CHAIN_ID
+
+ADDRESSES = [f"0x{i:040x}" for i in (1, 2, 3)]
+
+
+@pytest.fixture
+def web3():
+    return Mock(spec=Web3)
+
+
+@pytest.fixture
+def accounts():
+    return [Mock(address=address) for address in ADDRESSES]
+
+
+@pytest.fixture
+def pool(web3, accounts):
+    pool = SenderPool(web3, accounts, CHAIN_ID, max_in_flight_per_key=2)
+    yield pool
+    pool.close()
+
+
+def sender(client):
+    return client.account.address
+
+
+class TestSenderPool:
+    def test_spreads_calls_over_the_least_loaded_accounts(self, pool):
+        release = threading.Event()
+
+        def blocked(client):
+            release.wait(5)
+            return client.account.address
+
+        futures = [pool.submit(blocked) for _ in range(6)]
+        assert {
+            stats["in_flight"] + stats["backlog"] for stats in pool.stats().values()
+        } == {2}
+        release.set()
+
+        assert sorted(future.result(timeout=5) for future in futures) == sorted(
+            ADDRESSES * 2
+        )
+
+    def test_close_interrupts_backoffs(self, pool):
+        future = pool.submit(lambda client: get_retry_interrupt().wait(30))
+
+        pool.close()
+
+        assert future.result(timeout=5) is True
+
+    def test_owner_pins_the_account(self, pool):
+        futures = [pool.submit(sender, owner=ADDRESSES[2].upper()) for _ in range(3)]
+
+        assert {future.result(timeout=5) for future in futures} == {ADDRESSES[2]}
+
+    def test_owner_resources_run_on_the_pool_owner(self, pool):
+        for address, client in pool.clients.items():
+            client._ip_account = Mock(execute=Mock(return_value=address))
+
+        results = [pool.call("IPAccount.execute", "0xto", 0, "0x") for _ in range(3)]
+
+        assert results == [ADDRESSES[0]] * 3
+        pool.clients[ADDRESSES[0]].IPAccount.execute.assert_called_with("0xto", 0, "0x")
+
+    def test_resource_path_runs_on_the_chosen_client(self, pool):
+        for address, client in pool.clients.items():
+            client._ip_asset = Mock(register=Mock(return_value={"sender": address}))
+
+        result = pool.call("IPAsset.register", "0xnft", 1, owner=ADDRESSES[1])
+
+        assert result == {"sender": ADDRESSES[1]}
+
+    def test_stats(self, pool):
+        pool.call(sender, owner=ADDRESSES[0])
+        with pytest.raises(ValueError, match="boom"):
+            pool.call(Mock(side_effect=ValueError("boom")), owner=ADDRESSES[0])
+
+        stats = pool.stats()
+        assert stats[ADDRESSES[0]]["completed"] == 1
+        assert stats[ADDRESSES[0]]["failed"] == 1
+        assert stats[ADDRESSES[0]]["throughput"] > 0
+        assert stats[ADDRESSES[1]] == {
+            "completed": 0,
+            "failed": 0,
+            "in_flight": 0,
+            "backlog": 0,
+            "throughput": 0.0,
+        }
+
+    def test_unknown_owner(self, pool):
+        with pytest.raises(ValueError, match="is not an account of the sender pool"):
+            pool.submit(sender, owner="0x" + "f" * 40)
+
+    def test_invalid_call_path(self, pool):
+        with pytest.raises(ValueError, match="Expected 'Resource.method'"):
+            pool.submit("register")
+
+    def test_duplicate_account(self, web3, accounts):
+        with pytest.raises(ValueError, match="is in the pool twice"):
+            SenderPool(web3, [accounts[0], accounts[0]], CHAIN_ID)
+
+    def test_story_client_pool_is_owned_by_its_account(self, web3, accounts):
+        client = StoryClient(web3, accounts[0], CHAIN_ID)
+
+        with client.sender_pool(accounts[1:]) as pool:
+            assert pool.owner == ADDRESSES[0]
+            assert list(pool.clients) == ADDRESSES
@@ -0,0 +1,314 @@
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Web3
+
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_client import (
+    IPAssetRegistryClient,
+)
+from story_protocol_python_sdk.abi.IPAssetRegistry.IPAssetRegistry_encoders import (
+    encode_register,
+)
+from story_protocol_python_sdk.abi.RegistrationWorkflows.RegistrationWorkflows_client import (
+    RegistrationWorkflowsClient,
+)
+from story_protocol_python_sdk.utils.transaction_batcher import (
+    TransactionBatcher,
+    encode_client_call,
+    match_event,
+)
+from tests.unit.fixtures.data import ACCOUNT_ADDRESS, ADDRESS, CHAIN_ID
+
+METADATA = {
+    "ipMetadataURI": "",
+    "ipMetadataHash": b"\x00" * 32,
+    "nftMetadataURI": "",
+    "nftMetadataHash": b"\x00" * 32,
+}
+
+
+class FakeSender:
+    """Stands in for build_and_send_transaction and records every batch."""
+
+    def __init__(self):
+        self.batches = []
+        self.status = 1
+        self.lock = threading.Lock()
+
+    def __call__(self, web3, account, client_function, calls, tx_options=None):
+        with self.lock:
+            self.batches.append((client_function, calls, tx_options))
+            tx_hash = f"0x{len(self.batches):064x}"
+        return {
+            "tx_hash": tx_hash,
+            "tx_receipt": {
+                "status": self.status,
+                "logs": [],
+                "transactionHash": HexBytes(tx_hash),
+            },
+        }
+
+
+WEB3 = Web3()
+REGISTRY_CLIENT = IPAssetRegistryClient(WEB3, CHAIN_ID)
+WORKFLOWS_CLIENT = RegistrationWorkflowsClient(WEB3, CHAIN_ID)
+
+
+@pytest.fixture
+def web3():
+    return WEB3
+
+
+@pytest.fixture
+def registry_client():
+    return REGISTRY_CLIENT
+
+
+@pytest.fixture
+def workflows_client():
+    return WORKFLOWS_CLIENT
+
+
+@pytest.fixture
+def sender():
+    sender = FakeSender()
+    with patch(
+        "story_protocol_python_sdk.utils.transaction_batcher.build_and_send_transaction",
+        sender,
+    ):
+        yield sender
+
+
+@pytest.fixture
+def account():
+    account = Mock()
+    account.address = ACCOUNT_ADDRESS
+    return account
+
+
+def register(batcher, registry_client, token_id, **kwargs):
+    return batcher.submit(
+        registry_client.build_register_transaction,
+        CHAIN_ID,
+        ADDRESS,
+        token_id,
+        **kwargs,
+    )
+
+
+def ip_asset(registered_ip_ids=()):
+    """An IPAsset whose register encodes with the real clients."""
+    ip_asset = Mock()
+    ip_asset.ip_asset_registry_client = REGISTRY_CLIENT
+    ip_asset.registration_workflows_client = WORKFLOWS_CLIENT
+
+    def register(nft_contract, token_id, ip_metadata=None, **kwargs):
+        assert kwargs["tx_options"] == {"encodedTxDataOnly": True}
+        return {
+            "encoded_tx_data": Web3.to_hex(
+                encode_register(CHAIN_ID, nft_contract, token_id)
+            ),
+            "has_metadata": ip_metadata is not None,
+            "ip_id": f"ip-{token_id}",
+        }
+
+    ip_asset.register.side_effect = register
+    ip_asset.is_registered.side_effect = lambda ip_id: ip_id in registered_ip_ids
+    ip_asset._parse_tx_ip_registered_event.return_value = [
+        {"ip_id": f"ip-{token_id}", "token_id": token_id} for token_id in (3, 2, 1)
+    ]
+    return ip_asset
+
+
+class TestEncodeClientCall:
+    def test_uses_generated_encoder(self, registry_client):
+        assert encode_client_call(
+            registry_client.build_register_transaction, (CHAIN_ID, ADDRESS, 1)
+        ) == encode_register(CHAIN_ID, ADDRESS, 1)
+
+    def test_rejects_other_functions(self, registry_client):
+        with pytest.raises(ValueError, match="is not a build_\\*_transaction method"):
+            encode_client_call(registry_client.ipId, (CHAIN_ID, ADDRESS, 1))
+
+
+class TestTransactionBatcher:
+    def test_flushes_on_size(self, web3, account, registry_client, sender):
+        with TransactionBatcher(
+            web3, account, CHAIN_ID, max_calls=3, max_delay=60
+        ) as batcher:
+            futures = [register(batcher, registry_client, i) for i in range(3)]
+            results = [future.result(timeout=5) for future in futures]
+
+        assert len(sender.batches) == 1
+        client_function, calls, _ = sender.batches[0]
+        assert client_function.__name__ == "build_aggregate3_transaction"
+        assert calls == [
+            {
+                "target": registry_client.contract.address,
+                "allowFailure": False,
+                "callData": encode_register(CHAIN_ID, ADDRESS, i),
+            }
+            for i in range(3)
+        ]
+        assert [result["index"] for result in results] == [0, 1, 2]
+        assert len({result["tx_hash"] for result in results}) == 1
+
+    def test_flushes_on_delay(self, web3, account, registry_client, sender):
+        batcher = TransactionBatcher(web3, account, CHAIN_ID, max_delay=0.01)
+
+        result = register(batcher, registry_client, 1).result(timeout=5)
+
+        assert result["index"] == 0
+        assert batcher.pending == 0
+        batcher.close()
+
+    def test_flushes_on_gas(self, web3, account, registry_client, sender):
+        with TransactionBatcher(
+            web3, account, CHAIN_ID, max_gas=100, max_delay=60
+        ) as batcher:
+            for i in range(3):
+                register(batcher, registry_client, i, gas=60)
+
+        assert [len(calls) for _, calls, _ in sender.batches] == [1, 1, 1]
+
+    def test_workflow_calls_use_the_contract_multicall(
+        self, web3, account, registry_client, workflows_client, sender
+    ):
+        with TransactionBatcher(web3, account, CHAIN_ID, max_delay=60) as batcher:
+            register(batcher, registry_client, 1)
+            batcher.submit(
+                workflows_client.build_mintAndRegisterIp_transaction,
+                ADDRESS,
+                ACCOUNT_ADDRESS,
+                METADATA,
+                True,
+            )
+            batcher.submit(
+                workflows_client.build_mintAndRegisterIp_transaction,
+                ADDRESS,
+                ACCOUNT_ADDRESS,
+                METADATA,
+                True,
+            )
+
+        routes = {
+            client_function.__name__: calls
+            for client_function, calls, _ in sender.batches
+        }
+        assert len(routes["build_aggregate3_transaction"]) == 1
+        assert len(routes["build_multicall_transaction"]) == 2
+        assert all(
+            isinstance(call, bytes) for call in routes["build_multicall_transaction"]
+        )
+
+    def test_parse_gets_each_caller_its_own_event(
+        self, web3, account, registry_client, sender
+    ):
+        def parse_events(tx_receipt):
+            return [
+                {"ip_id": f"ip-{token_id}", "token_id": token_id} for token_id in (2, 1)
+            ]
+
+        with TransactionBatcher(web3, account, CHAIN_ID, max_delay=60) as batcher:
+            futures = [
+                register(
+                    batcher,
+                    registry_client,
+                    token_id,
+                    parse=match_event(parse_events, token_id=token_id),
+                )
+                for token_id in (1, 2)
+            ]
+
+        assert [future.result()["ip_id"] for future in futures] == ["ip-1", "ip-2"]
+
+    def test_reverted_batch_fails_every_call(
+        self, web3, account, registry_client, sender
+    ):
+        sender.status = 0
+        with TransactionBatcher(web3, account, CHAIN_ID, max_delay=60) as batcher:
+            futures = [register(batcher, registry_client, i) for i in range(2)]
+
+        for future in futures:
+            with pytest.raises(ValueError, match="reverted"):
+                future.result()
+
+    def test_concurrent_submitters_share_batches(
+        self, web3, account, registry_client, sender
+    ):
+        futures = []
+        with TransactionBatcher(
+            web3, account, CHAIN_ID, max_calls=10, max_delay=60
+        ) as batcher:
+            threads = [
+                threading.Thread(
+                    target=lambda i=i: futures.append(
+                        register(batcher, registry_client, i)
+                    )
+                )
+                for i in range(20)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert sorted(len(calls) for _, calls, _ in sender.batches) == [10, 10]
+        assert all(future.result()["tx_hash"] for future in futures)
+
+    def test_rejects_submit_after_close(self, web3, account, registry_client, sender):
+        batcher = TransactionBatcher(web3, account, CHAIN_ID)
+        batcher.close()
+
+        with pytest.raises(ValueError, match="The batcher is closed."):
+            register(batcher, registry_client, 1)
+
+    def test_rejects_fire_and_forget_options(self, web3, account):
+        with pytest.raises(ValueError, match="must wait for their receipts"):
+            TransactionBatcher(
+                web3, account, CHAIN_ID, tx_options={"wait_for_receipt": False}
+            )
+
+    def test_unknown_route(self, web3, account, registry_client, sender):
+        with TransactionBatcher(web3, account, CHAIN_ID) as batcher:
+            with pytest.raises(ValueError, match="has no multicall"):
+                register(batcher, registry_client, 1, route="multicall")
+
+    def test_submit_register_routes_by_metadata(self, web3, account, sender):
+        resource = ip_asset()
+        with TransactionBatcher(web3, account, CHAIN_ID, max_delay=60) as batcher:
+            futures = [
+                batcher.submit_register(resource, ADDRESS, 1),
+                batcher.submit_register(resource, ADDRESS, 2, ip_metadata={}),
+                batcher.submit_register(resource, ADDRESS, 3),
+            ]
+
+        routes = {
+            client_function.__name__: calls
+            for client_function, calls, _ in sender.batches
+        }
+        assert routes["build_aggregate3_transaction"] == [
+            {
+                "target": REGISTRY_CLIENT.contract.address,
+                "allowFailure": False,
+                "callData": encode_register(CHAIN_ID, ADDRESS, token_id),
+            }
+            for token_id in (1, 3)
+        ]
+        assert routes["build_multicall_transaction"] == [
+            encode_register(CHAIN_ID, ADDRESS, 2)
+        ]
+        results = [future.result() for future in futures]
+        assert [result["ip_id"] for result in results] == ["ip-1", "ip-2", "ip-3"]
+        assert results[0]["tx_hash"] == results[2]["tx_hash"] != results[1]["tx_hash"]
+
+    def test_submit_register_skips_registered_ips(self, web3, account, sender):
+        with TransactionBatcher(web3, account, CHAIN_ID, max_delay=60) as batcher:
+            future = batcher.submit_register(
+                ip_asset(registered_ip_ids={"ip-1"}), ADDRESS, 1
+            )
+
+        assert future.result() == {"tx_hash": None, "ip_id": "ip-1"}
+        assert sender.batches == []
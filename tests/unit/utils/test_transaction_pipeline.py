@@ -0,0 +1,287 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from story_protocol_python_sdk.utils.nonce_manager import clear_nonce_managers
+from story_protocol_python_sdk.utils.receipt_watcher import (
+    ReceiptWatcher,
+    disable_receipt_watcher,
+    enable_receipt_watcher,
+)
+from story_protocol_python_sdk.utils.retry_policy import RetryPolicy, set_retry_policy
+from story_protocol_python_sdk.utils.transaction_pipeline import (
+    TransactionPipeline,
+    wait_for_transaction_receipt,
+)
+from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
+from tests.unit.fixtures.data import ACCOUNT_ADDRESS
+
+
+class FakeChain:
+    """Sends transactions into a mempool that is only mined on ``mine()``."""
+
+    def __init__(self):
+        self.block_number = 0
+        self.mempool = []
+        self.receipts = {}
+        self.receipt_lookups = 0
+        self.block_receipt_lookups = 0
+        self.lock = threading.Lock()
+
+    def send_raw_transaction(self, raw_transaction):
+        with self.lock:
+            tx_hash = HexBytes(len(self.mempool) + len(self.receipts) + 1)
+            self.mempool.append(tx_hash)
+            return tx_hash
+
+    def get_transaction_receipt(self, tx_hash):
+        self.receipt_lookups += 1
+        with self.lock:
+            if tx_hash not in self.receipts:
+                raise TransactionNotFound(f"{tx_hash.hex()} not found")
+            return self.receipts[tx_hash]
+
+    def get_block_receipts(self, block_number):
+        self.block_receipt_lookups += 1
+        with self.lock:
+            return [
+                receipt
+                for receipt in self.receipts.values()
+                if receipt["blockNumber"] == block_number
+            ]
+
+    def mine(self):
+        with self.lock:
+            self.block_number += 1
+            for tx_hash in self.mempool:
+                self.receipts[tx_hash] = {
+                    "status": 1,
+                    "transactionHash": tx_hash,
+                    "blockNumber": self.block_number,
+                }
+            self.mempool = []
+
+
+@pytest.fixture
+def chain():
+    return FakeChain()
+
+
+@pytest.fixture
+def web3(chain):
+    web3 = Mock(spec=Web3)
+    web3.eth = Mock()
+    web3.eth.get_transaction_count = Mock(return_value=5)
+    web3.eth.send_raw_transaction = Mock(side_effect=chain.send_raw_transaction)
+    web3.eth.get_transaction_receipt = Mock(side_effect=chain.get_transaction_receipt)
+    web3.eth.get_block_receipts = Mock(side_effect=chain.get_block_receipts)
+    type(web3.eth).block_number = property(lambda _: chain.block_number)
+    return web3
+
+
+@pytest.fixture
+def account():
+    account = Mock()
+    account.address = ACCOUNT_ADDRESS
+    account.sign_transaction = Mock(return_value=Mock(raw_transaction=b"signed"))
+    return account
+
+
+@pytest.fixture(autouse=True)
+def clear_managers():
+    clear_nonce_managers()
+    yield
+    clear_nonce_managers()
+
+
+@pytest.fixture
+def register(web3, account):
+    """An SDK-style write: send a transaction, then parse its receipt."""
+    client_function = Mock(side_effect=lambda tx_options: tx_options)
+
+    def register(token_id, fail=False):
+        if fail:
+            raise ValueError(f"Failed to register {token_id}")
+        response = build_and_send_transaction(web3, account, client_function)
+        return {
+            "tx_hash": response["tx_hash"],
+            "token_id": token_id,
+            "block_number": response["tx_receipt"]["blockNumber"],
+        }
+
+    register.client_function = client_function
+    return register
+
+
+def wait_until(condition):
+    for _ in range(500):
+        if condition():
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("condition not met")
+
+
+class TestTransactionPipeline:
+    def test_submits_back_to_back_and_collects_parsed_results(
+        self, web3, chain, register
+    ):
+        pipeline = TransactionPipeline(web3, poll_interval=0.01)
+
+        handles = [pipeline.submit(register, token_id) for token_id in range(3)]
+
+        assert len(chain.mempool) == 3
+        assert not any(handle.done() for handle in handles)
+        assert [
+            call[0][0]["nonce"] for call in register.client_function.call_args_list
+        ] == [5, 6, 7]
+
+        chain.mine()
+        results = pipeline.collect(timeout=5)
+
+        assert [result["token_id"] for result in results] == [0, 1, 2]
+        assert {result["block_number"] for result in results} == {1}
+        assert [result["tx_hash"] for result in results] == [
+            handle.tx_hash for handle in handles
+        ]
+        web3.eth.get_transaction_count.assert_called_once()
+
+    def test_receipts_are_fetched_once_per_block(self, web3, chain, register):
+        watcher = ReceiptWatcher(web3, background=False)
+        pipeline = TransactionPipeline(web3, watcher=watcher)
+        pipeline.submit(register, 1)
+        pipeline.submit(register, 2)
+
+        watcher.poll()
+        watcher.poll()
+        assert chain.block_receipt_lookups == 1
+
+        chain.mine()
+        watcher.poll()
+        pipeline.collect(timeout=5)
+        assert chain.block_receipt_lookups == 2
+        assert chain.receipt_lookups == 0
+
+    def test_background_watcher_waits_for_new_blocks(self, web3, chain, register):
+        pipeline = TransactionPipeline(web3, poll_interval=0.01)
+        pipeline.submit(register, 1)
+        pipeline.submit(register, 2)
+        wait_until(lambda: chain.receipt_lookups + chain.block_receipt_lookups > 0)
+        threading.Event().wait(0.05)
+        lookups = chain.receipt_lookups + chain.block_receipt_lookups
+
+        threading.Event().wait(0.1)
+        assert chain.receipt_lookups + chain.block_receipt_lookups == lookups
+
+        chain.mine()
+        results = pipeline.collect(timeout=5)
+        assert {result["block_number"] for result in results} == {1}
+
+    def test_failed_call(self, web3, chain, register):
+        pipeline = TransactionPipeline(web3, poll_interval=0.01)
+        pipeline.submit(register, 1)
+        failed = pipeline.submit(register, 2, fail=True)
+        chain.mine()
+
+        results = pipeline.collect(timeout=5, return_exceptions=True)
+
+        assert results[0]["token_id"] == 1
+        assert isinstance(results[1], ValueError)
+        assert failed.tx_hash is None
+        with pytest.raises(ValueError, match="Failed to register 2"):
+            pipeline.collect(timeout=5)
+
+    def test_receipt_timeout(self, web3, account):
+        pipeline = TransactionPipeline(web3, poll_interval=0.01)
+
+        handle = pipeline.submit(
+            build_and_send_transaction,
+            web3,
+            account,
+            Mock(return_value={}),
+            tx_options={"timeout": 0.05},
+        )
+
+        with pytest.raises(TimeExhausted):
+            handle.result(timeout=5)
+
+    def test_context_manager_collects(self, web3, chain, register):
+        with TransactionPipeline(web3, poll_interval=0.01) as pipeline:
+            handle = pipeline.submit(register, 1)
+            chain.mine()
+
+        assert handle.done()
+        assert handle.result()["token_id"] == 1
+        with pytest.raises(RuntimeError):
+            pipeline.submit(register, 2)
+
+    def test_max_workers_bounds_running_calls(self, web3, chain, register):
+        pipeline = TransactionPipeline(web3, poll_interval=0.01, max_workers=2)
+        pipeline.submit(register, 1)
+        pipeline.submit(register, 2)
+
+        third = threading.Thread(target=pipeline.submit, args=(register, 3))
+        third.start()
+        threading.Event().wait(0.05)
+        assert len(chain.mempool) == 2
+
+        chain.mine()
+        third.join(timeout=5)
+        assert len(chain.mempool) == 1
+        chain.mine()
+        results = pipeline.collect(timeout=5)
+        pipeline.close()
+
+        assert [result["token_id"] for result in results] == [1, 2, 3]
+        assert [result["block_number"] for result in results] == [1, 1, 2]
+
+    def test_invalid_max_workers(self, web3):
+        with pytest.raises(ValueError, match="max_workers must be at least 1."):
+            TransactionPipeline(web3, max_workers=0)
+
+
+class TestWaitForTransactionReceipt:
+    def test_outside_pipeline_uses_web3(self):
+        web3 = Mock(spec=Web3)
+        web3.eth = Mock()
+
+        receipt = wait_for_transaction_receipt(web3, HexBytes(1), 10)
+
+        web3.eth.wait_for_transaction_receipt.assert_called_once_with(
+            HexBytes(1), timeout=10
+        )
+        assert receipt is web3.eth.wait_for_transaction_receipt.return_value
+
+    def test_outside_pipeline_uses_enabled_watcher(self, web3, chain):
+        enable_receipt_watcher(web3, poll_interval=0.01)
+        tx_hash = chain.send_raw_transaction(b"signed")
+        chain.mine()
+
+        try:
+            receipt = wait_for_transaction_receipt(web3, tx_hash, 5)
+        finally:
+            disable_receipt_watcher(web3)
+
+        assert receipt["transactionHash"] == tx_hash
+        web3.eth.wait_for_transaction_receipt.assert_not_called()
+
+    def test_close_interrupts_backoffs(self, web3, register):
+        web3.eth.send_raw_transaction.side_effect = requests.exceptions.ReadTimeout(
+            "read timed out"
+        )
+        set_retry_policy(web3, RetryPolicy(backoff=30, max_backoff=30))
+        pipeline = TransactionPipeline(web3, poll_interval=0.01)
+        threading.Timer(0.1, pipeline.close).start()
+
+        start = time.monotonic()
+        handle = pipeline.submit(register, 1)
+
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            handle.result(timeout=5)
+        assert time.monotonic() - start < 5
+        assert web3.eth.send_raw_transaction.call_count == 1
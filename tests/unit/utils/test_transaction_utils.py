@@ -1,8 +1,12 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from web3.exceptions import TimeExhausted
 
+from story_protocol_python_sdk.utils.nonce_manager import (
+    clear_nonce_managers,
+    get_nonce_manager,
+)
 from story_protocol_python_sdk.utils.transaction_utils import build_and_send_transaction
 
 
@@ -16,6 +20,7 @@ class TestBuildAndSendTransaction:
         mock_web3.eth.reset_mock()
         mock_account.reset_mock()
         mock_web3.to_wei = Mock(side_effect=lambda value, unit: value * 1000000000)
+        clear_nonce_managers()
 
     @pytest.fixture
     def mock_client_function(self):
@@ -64,7 +69,7 @@ class TestBuildAndSendTransaction:
         )
 
         mock_web3.eth.get_transaction_count.assert_called_once_with(
-            mock_account.address
+            mock_account.address, "pending"
         )
         mock_client_function.assert_called_once()
         call_args = mock_client_function.call_args[0][-1]
@@ -254,7 +259,7 @@ class TestBuildAndSendTransaction:
         )
 
         mock_web3.eth.get_transaction_count.assert_called_once_with(
-            mock_account.address
+            mock_account.address, "pending"
         )
         mock_client_function.assert_called_once()
         call_args = mock_client_function.call_args[0][-1]
@@ -531,3 +536,169 @@ class TestBuildAndSendTransaction:
         mock_web3.eth.wait_for_transaction_receipt.assert_called_once_with(
             mock_web3.eth.send_raw_transaction.return_value, timeout=0.5
         )
+
+
+class TestNonceManagement:
+    """Test suite for nonce allocation in build_and_send_transaction."""
+
+    @pytest.fixture(autouse=True)
+    def setup_mocks(self, mock_web3, mock_account):
+        mock_web3.reset_mock()
+        mock_web3.eth.reset_mock()
+        mock_account.reset_mock()
+        mock_account.sign_transaction.return_value = Mock(raw_transaction=b"signed_tx")
+        clear_nonce_managers()
+        with patch.object(
+            mock_web3.eth, "get_transaction_count", Mock(return_value=25)
+        ), patch.object(
+            mock_web3.eth,
+            "send_raw_transaction",
+            Mock(return_value=Mock(hex=Mock(return_value="0xhash"))),
+        ), patch.object(
+            mock_web3.eth,
+            "wait_for_transaction_receipt",
+            Mock(return_value={"status": 1}),
+        ):
+            yield
+        clear_nonce_managers()
+
+    @pytest.fixture
+    def mock_client_function(self):
+        return Mock(return_value={"to": "0xabc", "data": "0x123"})
+
+    def sent_nonces(self, mock_client_function):
+        return [call[0][-1]["nonce"] for call in mock_client_function.call_args_list]
+
+    def test_consecutive_sends_allocate_nonces_locally(
+        self, mock_web3, mock_account, mock_client_function
+    ):
+        for _ in range(3):
+            build_and_send_transaction(
+                mock_web3, mock_account, mock_client_function, tx_options={}
+            )
+
+        assert self.sent_nonces(mock_client_function) == [25, 26, 27]
+        mock_web3.eth.get_transaction_count.assert_called_once_with(
+            mock_account.address, "pending"
+        )
+        assert get_nonce_manager(mock_web3, mock_account.address).in_flight == 0
+
+    def test_nonce_too_low_resyncs_and_retries(
+        self, mock_web3, mock_account, mock_client_function
+    ):
+        build_and_send_transaction(
+            mock_web3, mock_account, mock_client_function, tx_options={}
+        )
+        mock_web3.eth.get_transaction_count.return_value = 40
+        mock_web3.eth.send_raw_transaction.side_effect = [
+            Exception("nonce too low"),
+            Mock(hex=Mock(return_value="0xhash")),
+        ]
+
+        with patch(
+            "story_protocol_python_sdk.utils.transaction_utils.time.sleep"
+        ) as mock_sleep:
+            result = build_and_send_transaction(
+                mock_web3, mock_account, mock_client_function, tx_options={}
+            )
+
+        assert result["tx_hash"] == "0xhash"
+        assert self.sent_nonces(mock_client_function) == [25, 26, 40]
+        mock_sleep.assert_not_called()
+        assert "gasPrice" not in mock_client_function.call_args[0][-1]
+
+    def test_underpriced_retries_same_nonce_with_higher_gas(
+        self, mock_web3, mock_account, mock_client_function
+    ):
+        mock_web3.eth.gas_price = 10
+        mock_web3.eth.send_raw_transaction.side_effect = [
+            Exception("transaction underpriced"),
+            Mock(hex=Mock(return_value="0xhash")),
+        ]
+
+        with patch("story_protocol_python_sdk.utils.transaction_utils.time.sleep"):
+            build_and_send_transaction(
+                mock_web3, mock_account, mock_client_function, tx_options={}
+            )
+
+        assert self.sent_nonces(mock_client_function) == [25, 25]
+        assert mock_client_function.call_args[0][-1]["gasPrice"] == 12
+
+    def test_failed_send_releases_nonce(
+        self, mock_web3, mock_account, mock_client_function
+    ):
+        mock_client_function.side_effect = [
+            Exception("execution reverted"),
+            {"to": "0xabc", "data": "0x123"},
+        ]
+
+        with pytest.raises(Exception, match="execution reverted"):
+            build_and_send_transaction(
+                mock_web3, mock_account, mock_client_function, tx_options={}
+            )
+        build_and_send_transaction(
+            mock_web3, mock_account, mock_client_function, tx_options={}
+        )
+
+        assert self.sent_nonces(mock_client_function) == [25, 25]
+        assert get_nonce_manager(mock_web3, mock_account.address).in_flight == 0
+
+    def test_fire_and_forget_nonces_are_not_tracked(
+        self, mock_web3, mock_account, mock_client_function
+    ):
+        for _ in range(3):
+            build_and_send_transaction(
+                mock_web3,
+                mock_account,
+                mock_client_function,
+                tx_options={"wait_for_receipt": False},
+            )
+
+        assert self.sent_nonces(mock_client_function) == [25, 26, 27]
+        assert get_nonce_manager(mock_web3, mock_account.address).in_flight == 0
+
+    def test_receipt_timeout_resyncs_nonce(
+        self, mock_web3, mock_account, mock_client_function
+    ):
+        mock_web3.eth.wait_for_transaction_receipt.side_effect = TimeExhausted(
+            "dropped"
+        )
+
+        with pytest.raises(TimeExhausted):
+            build_and_send_transaction(
+                mock_web3, mock_account, mock_client_function, tx_options={}
+            )
+        mock_web3.eth.wait_for_transaction_receipt.side_effect = None
+        build_and_send_transaction(
+            mock_web3, mock_account, mock_client_function, tx_options={}
+        )
+
+        # The dropped nonce is sent again instead of queueing behind it
+        assert self.sent_nonces(mock_client_function) == [25, 25]
+        assert mock_web3.eth.get_transaction_count.call_count == 2
+
+    def test_custom_nonce_bypasses_nonce_manager(
+        self, mock_web3, mock_account, mock_client_function
+    ):
+        build_and_send_transaction(
+            mock_web3, mock_account, mock_client_function, tx_options={"nonce": 7}
+        )
+
+        assert self.sent_nonces(mock_client_function) == [7]
+        mock_web3.eth.get_transaction_count.assert_not_called()
+        assert get_nonce_manager(mock_web3, mock_account.address).in_flight == 0
+
+    def test_encoded_tx_data_only_does_not_allocate(
+        self, mock_web3, mock_account, mock_client_function
+    ):
+        build_and_send_transaction(
+            mock_web3,
+            mock_account,
+            mock_client_function,
+            tx_options={"encodedTxDataOnly": True},
+        )
+        build_and_send_transaction(
+            mock_web3, mock_account, mock_client_function, tx_options={}
+        )
+
+        assert self.sent_nonces(mock_client_function) == [25, 25]
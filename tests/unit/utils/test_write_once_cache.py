@@ -0,0 +1,178 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from story_protocol_python_sdk.abi.SPGNFTImpl.SPGNFTImpl_client import SPGNFTImplClient
+from story_protocol_python_sdk.resources.AsyncRoyalty import AsyncRoyalty
+from story_protocol_python_sdk.resources.NFTClient import NFTClient
+from story_protocol_python_sdk.resources.Royalty import Royalty
+from story_protocol_python_sdk.utils.constants import ZERO_ADDRESS
+from story_protocol_python_sdk.utils.write_once_cache import (
+    MINT_FEE_TOKEN_TTL,
+    WriteOnceCache,
+    async_cached_read,
+    cached_read,
+    disable_write_once_cache,
+    enable_write_once_cache,
+    get_write_once_cache,
+)
+from tests.unit.fixtures.data import ADDRESS, CHAIN_ID, IP_ID
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def web3_cache(mock_web3, clock):
+    cache = enable_write_once_cache(mock_web3)
+    cache._clock = clock
+    yield cache
+    disable_write_once_cache(mock_web3)
+
+
+class TestWriteOnceCache:
+    def test_set_values_are_kept_forever(self, clock):
+        cache = WriteOnceCache(clock=clock)
+        load = Mock(return_value=ADDRESS)
+
+        assert cache.get(("vault", IP_ID), load) == ADDRESS
+        clock.now = 10**9
+        assert cache.get(("vault", IP_ID), load) == ADDRESS
+
+        load.assert_called_once()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_unset_values_expire(self, clock):
+        cache = WriteOnceCache(negative_ttl=5, clock=clock)
+        load = Mock(side_effect=[ZERO_ADDRESS, ZERO_ADDRESS, ADDRESS])
+
+        def is_set(value):
+            return value != ZERO_ADDRESS
+
+        assert cache.get(("vault", IP_ID), load, is_set) == ZERO_ADDRESS
+        clock.now = 4
+        assert cache.get(("vault", IP_ID), load, is_set) == ZERO_ADDRESS
+        clock.now = 5
+        assert cache.get(("vault", IP_ID), load, is_set) == ZERO_ADDRESS
+        clock.now = 11
+        assert cache.get(("vault", IP_ID), load, is_set) == ADDRESS
+        assert load.call_count == 3
+
+    def test_positive_ttl(self, clock):
+        cache = WriteOnceCache(clock=clock)
+        cache.store(("mintFeeToken", ADDRESS), ZERO_ADDRESS, positive_ttl=60)
+
+        clock.now = 59
+        assert cache.lookup(("mintFeeToken", ADDRESS)) == (True, ZERO_ADDRESS)
+        clock.now = 60
+        assert cache.lookup(("mintFeeToken", ADDRESS)) == (False, None)
+
+    def test_least_recently_used_values_are_evicted(self):
+        cache = WriteOnceCache(max_size=2)
+        cache.store(("a",), 1)
+        cache.store(("b",), 2)
+        cache.lookup(("a",))
+
+        cache.store(("c",), 3)
+
+        assert cache.lookup(("b",)) == (False, None)
+        assert cache.lookup(("a",)) == (True, 1)
+
+    def test_invalidate(self):
+        cache = WriteOnceCache()
+        cache.store(("a",), 1)
+        cache.store(("b",), 2)
+
+        cache.invalidate(("a",))
+        assert cache.lookup(("a",)) == (False, None)
+        cache.invalidate()
+        assert cache.lookup(("b",)) == (False, None)
+
+    def test_get_async(self, clock):
+        cache = WriteOnceCache(clock=clock)
+        load = AsyncMock(return_value=ADDRESS)
+
+        assert asyncio.run(cache.get_async(("token", IP_ID), load)) == ADDRESS
+        assert asyncio.run(cache.get_async(("token", IP_ID), load)) == ADDRESS
+
+        load.assert_awaited_once()
+
+    def test_cached_read_without_cache_reads_the_chain(self, mock_web3):
+        load = Mock(return_value=ADDRESS)
+        async_load = AsyncMock(return_value=ADDRESS)
+
+        assert cached_read(mock_web3, ("token", IP_ID), load) == ADDRESS
+        assert cached_read(mock_web3, ("token", IP_ID), load) == ADDRESS
+        assert (
+            asyncio.run(async_cached_read(mock_web3, ("token", IP_ID), async_load))
+            == ADDRESS
+        )
+
+        assert load.call_count == 2
+        async_load.assert_awaited_once()
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError, match="negative_ttl must not be negative."):
+            WriteOnceCache(negative_ttl=-1)
+        with pytest.raises(ValueError, match="max_size must be at least 1."):
+            WriteOnceCache(max_size=0)
+
+
+class TestResourcesWithWriteOnceCache:
+    def test_royalty_vault_address_is_read_once(
+        self, mock_web3, mock_account, web3_cache
+    ):
+        royalty = Royalty(mock_web3, mock_account, CHAIN_ID)
+        royalty.ip_asset_registry_client = Mock()
+        royalty.royalty_module_client = Mock()
+        royalty.royalty_module_client.ipRoyaltyVaults.return_value = ADDRESS
+
+        assert royalty.get_royalty_vault_address(IP_ID) == ADDRESS
+        assert royalty.get_royalty_vault_address(IP_ID.lower()) == ADDRESS
+
+        royalty.ip_asset_registry_client.isRegistered.assert_called_once()
+        royalty.royalty_module_client.ipRoyaltyVaults.assert_called_once()
+
+    def test_missing_royalty_vault_is_read_again(
+        self, mock_web3, mock_account, web3_cache, clock
+    ):
+        royalty = AsyncRoyalty(mock_web3, mock_account, CHAIN_ID)
+        royalty.ip_asset_registry_client = Mock(isRegistered=AsyncMock())
+        royalty.royalty_module_client = Mock(
+            ipRoyaltyVaults=AsyncMock(side_effect=[ZERO_ADDRESS, ADDRESS])
+        )
+
+        assert asyncio.run(royalty.get_royalty_vault_address(IP_ID)) == ZERO_ADDRESS
+        assert asyncio.run(royalty.get_royalty_vault_address(IP_ID)) == ZERO_ADDRESS
+        clock.now = web3_cache.negative_ttl
+        assert asyncio.run(royalty.get_royalty_vault_address(IP_ID)) == ADDRESS
+        assert asyncio.run(royalty.get_royalty_vault_address(IP_ID)) == ADDRESS
+
+        assert royalty.royalty_module_client.ipRoyaltyVaults.await_count == 2
+
+    def test_mint_fee_token_expires(self, mock_web3, mock_account, web3_cache, clock):
+        nft_client = NFTClient(mock_web3, mock_account, CHAIN_ID)
+
+        with patch.object(
+            SPGNFTImplClient, "mintFeeToken", return_value=ADDRESS
+        ) as mint_fee_token:
+            assert nft_client.get_mint_fee_token(ADDRESS) == ADDRESS
+            assert nft_client.get_mint_fee_token(ADDRESS) == ADDRESS
+            clock.now = MINT_FEE_TOKEN_TTL
+            assert nft_client.get_mint_fee_token(ADDRESS) == ADDRESS
+
+        assert mint_fee_token.call_count == 2
+
+    def test_disabled_by_default(self, mock_web3):
+        assert get_write_once_cache(mock_web3) is None